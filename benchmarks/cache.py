@@ -0,0 +1,113 @@
+"""
+Cache benchmark for the LRU cache
+
+Call a cached function with keys drawn from a Zipf-like distribution, so a few keys
+are hot and most are cold, and report the time per call and the hit ratio of LRUCache,
+compared with `functools.lru_cache` and with a cache on `collections.OrderedDict`; all
+caches evict the least recently used keys, so they all hit the same keys. The keys are
+drawn from a fixed seed:
+
+    python benchmarks/cache.py [--maxsizes 100,10000] [--keys KEYS] [--calls CALLS]
+                               [--seed SEED]
+"""
+from __future__ import annotations
+
+import argparse
+import functools
+import random
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List
+
+from data_structures.linked_list.cache import LRUCache
+
+
+def ordered_dict_cache(maxsize: int) -> Callable[[Callable], Callable]:
+    """
+    The textbook LRU cache on an OrderedDict, as a decorator
+
+    :param maxsize:
+    :type maxsize: int
+    :return:
+    :rtype: Callable[[Callable], Callable]
+    """
+
+    def decorator(function: Callable) -> Callable:
+        cache: OrderedDict = OrderedDict()
+
+        def wrapper(key: Any) -> Any:
+            try:
+                value: Any = cache[key]
+            except KeyError:
+                value = cache[key] = function(key)
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+                return value
+            cache.move_to_end(key)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+CACHES: Dict[str, Callable[[int], Callable[[Callable], Callable]]] = {
+    "functools.lru_cache": lambda maxsize: functools.lru_cache(maxsize=maxsize),
+    "OrderedDict": ordered_dict_cache,
+    "LRUCache": LRUCache,
+}
+
+
+def zipf_keys(keys: int, calls: int, seed: int) -> List[int]:
+    """
+    Draw the keys of the calls, the key of rank r drawn with a weight of 1 / r
+
+    :param keys: The number of distinct keys
+    :type keys: int
+    :param calls:
+    :type calls: int
+    :param seed:
+    :type seed: int
+    :return:
+    :rtype: List[int]
+    """
+    weights: List[float] = [1 / rank for rank in range(1, keys + 1)]
+    return random.Random(seed).choices(range(keys), weights, k=calls)
+
+
+def main() -> None:
+    """
+    Print the time per call and the hit ratio of every cache and maximum size
+
+    :return:
+    :rtype: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--maxsizes", default="100,10000")
+    parser.add_argument("--keys", type=int, default=100_000)
+    parser.add_argument("--calls", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    keys: List[int] = zipf_keys(args.keys, args.calls, args.seed)
+    print(f"{'cache':<22}{'maxsize':>10}{'per call (ns)':>16}{'hit ratio':>12}")
+    for maxsize in (int(maxsize) for maxsize in args.maxsizes.split(",")):
+        for name, make in CACHES.items():
+            misses: List[int] = []
+            function: Callable = make(maxsize)(misses.append)
+
+            begin: float = time.perf_counter()
+            for key in keys:
+                function(key)
+            seconds: float = time.perf_counter() - begin
+
+            hit_ratio: float = 1 - len(misses) / len(keys)
+            print(
+                f"{name:<22}{maxsize:>10}{seconds / len(keys) * 1e9:>16.0f}"
+                f"{hit_ratio:>12.3f}",
+                flush=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""
+Multi-threaded throughput benchmark for the concurrent linked lists
+
+Start a number of threads sharing one linked list, every thread inserts and removes
+after a node of its own region of the linked list, and optionally searches for a value
+in its region, then report the operations per second of all threads together; the
+concurrent linked lists, locking node by node, are compared with SinglyLinkedList
+behind one lock of the whole linked list:
+
+    python benchmarks/concurrency.py [--threads 1,2,4,8] [--size SIZE]
+                                     [--operations OPERATIONS] [--search-ratio RATIO]
+                                     [--repeat REPEAT]
+
+With the GIL only one thread runs Python code at a time, so the node locks only add
+their cost; threads working in different regions run in parallel on a free-threaded
+build of CPython.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+from data_structures.linked_list.concurrent import (
+    ConcurrentDoublyLinkedList,
+    ConcurrentSinglyLinkedList,
+)
+from data_structures.linked_list.singly import SinglyLinkedList
+
+
+class GlobalLock:
+    """
+    A linked list behind one lock, every operation takes the lock of the whole linked
+    list, the way the linked lists are shared without the concurrent variants
+    """
+
+    def __init__(self, linked_list: SinglyLinkedList):
+        """
+
+        :param linked_list:
+        :type linked_list: SinglyLinkedList
+        """
+        self.linked_list: SinglyLinkedList = linked_list
+        self.lock: threading.Lock = threading.Lock()
+
+    def __iter__(self):
+        """
+        Iterate the nodes of the linked list without the lock, for the setup only
+
+        :return:
+        """
+        return iter(self.linked_list)
+
+    def insert_after(self, value: Any, node: Any) -> None:
+        """
+
+        :param value:
+        :type value: Any
+        :param node:
+        :type node: Any
+        :return:
+        :rtype: None
+        """
+        with self.lock:
+            self.linked_list.insert_after(value, node)
+
+    def remove_after(self, node: Any) -> None:
+        """
+
+        :param node:
+        :type node: Any
+        :return:
+        :rtype: None
+        """
+        with self.lock:
+            self.linked_list.remove_after(node)
+
+    def search(self, value: Any) -> Any:
+        """
+
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: Any
+        """
+        with self.lock:
+            return self.linked_list.search(value)
+
+
+STRUCTURES: Dict[str, Callable[[range], Any]] = {
+    "SinglyLinkedList+lock": lambda values: GlobalLock(SinglyLinkedList(*values)),
+    "ConcurrentSinglyLinkedList": ConcurrentSinglyLinkedList.from_iterable,
+    "ConcurrentDoublyLinkedList": ConcurrentDoublyLinkedList.from_iterable,
+}
+
+
+def worker(
+        linked_list: Any,
+        anchor: Any,
+        region: List[int],
+        operations: int,
+        search_ratio: float,
+        seed: int,
+        start: threading.Barrier,
+) -> None:
+    """
+    Run the operations of one thread: insert and remove after the anchor node, or
+    search for a value of the region
+
+    :param linked_list:
+    :type linked_list: Any
+    :param anchor: The node of the region the nodes are inserted and removed after
+    :type anchor: Any
+    :param region: The values of the region searched for
+    :type region: List[int]
+    :param operations:
+    :type operations: int
+    :param search_ratio: The ratio of the operations searching
+    :type search_ratio: float
+    :param seed:
+    :type seed: int
+    :param start: The barrier all threads start at
+    :type start: threading.Barrier
+    :return:
+    :rtype: None
+    """
+    random_: random.Random = random.Random(seed)
+    insert_after, remove_after = linked_list.insert_after, linked_list.remove_after
+    search = linked_list.search
+    start.wait()
+    for _ in range(operations // 2):
+        if random_.random() < search_ratio:
+            search(random_.choice(region))
+            search(random_.choice(region))
+        else:
+            insert_after(-1, anchor)
+            remove_after(anchor)
+
+
+def throughput(
+        build: Callable[[range], Any],
+        threads: int,
+        size: int,
+        operations: int,
+        search_ratio: float,
+) -> float:
+    """
+    Return the operations per second of the given number of threads sharing one linked
+    list of the given size, every thread working in a region of its own
+
+    :param build:
+    :type build: Callable[[range], Any]
+    :param threads:
+    :type threads: int
+    :param size:
+    :type size: int
+    :param operations: The number of operations per thread
+    :type operations: int
+    :param search_ratio:
+    :type search_ratio: float
+    :return:
+    :rtype: float
+    """
+    linked_list: Any = build(range(size))
+    nodes: List[Any] = list(linked_list)
+    width: int = size // threads
+
+    start: threading.Barrier = threading.Barrier(threads + 1)
+    workers: List[threading.Thread] = [
+        threading.Thread(
+            target=worker,
+            args=(
+                linked_list,
+                nodes[thread * width],
+                list(range(thread * width, (thread + 1) * width)),
+                operations,
+                search_ratio,
+                thread,
+                start,
+            ),
+        )
+        for thread in range(threads)
+    ]
+    for thread in workers:
+        thread.start()
+
+    start.wait()
+    begin: float = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return threads * operations / (time.perf_counter() - begin)
+
+
+def main() -> None:
+    """
+    Print the operations per second of every structure at every number of threads
+
+    :return:
+    :rtype: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--threads", default="1,2,4,8")
+    parser.add_argument("--size", type=int, default=1000)
+    parser.add_argument("--operations", type=int, default=20_000)
+    parser.add_argument("--search-ratio", type=float, default=0.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    gil: bool = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL {'enabled' if gil else 'disabled'}, operations per second:")
+
+    thread_counts: List[int] = [int(threads) for threads in args.threads.split(",")]
+    print(f"{'':<28}" + "".join(f"{threads:>14}" for threads in thread_counts))
+    for name, build in STRUCTURES.items():
+        row: str = f"{name:<28}"
+        for threads in thread_counts:
+            best: float = max(
+                throughput(build, threads, args.size, args.operations, args.search_ratio)
+                for _ in range(args.repeat)
+            )
+            row += f"{best:>14,.0f}"
+        print(row, flush=True)
+
+
+if __name__ == "__main__":
+    main()
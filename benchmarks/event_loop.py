@@ -0,0 +1,104 @@
+"""
+Event loop latency benchmark for the asynchronous iteration of the linked lists
+
+Walk a DoublyLinkedList inside an event loop, with `for` and with `async for` at
+several batch sizes, while a ticker coroutine asks to be woken up at a fixed interval,
+and report the time of the walk and how late the ticker is woken up; a walk with `for`
+holds the event loop until the last node, so the lateness grows with the size of the
+linked list, while `async for` bounds it by the time of one batch:
+
+    python benchmarks/event_loop.py [--size SIZE] [--batch-sizes 64,256,...]
+                                    [--interval SECONDS]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import List, Optional, Tuple
+
+from data_structures.linked_list.doubly import DoublyLinkedList
+
+
+async def tick(interval: float, lateness: List[float]) -> None:
+    """
+    Sleep for the given interval again and again, and record how late every wakeup is
+
+    :param interval:
+    :type interval: float
+    :param lateness:
+    :type lateness: List[float]
+    :return:
+    :rtype: None
+    """
+    while True:
+        begin: float = time.perf_counter()
+        await asyncio.sleep(interval)
+        lateness.append(time.perf_counter() - begin - interval)
+
+
+async def walk(
+        linked_list: DoublyLinkedList, batch_size: Optional[int], interval: float
+) -> Tuple[float, List[float]]:
+    """
+    Walk the given linked list alongside the ticker, with `for` if the batch size is
+    None, otherwise with `async for`
+
+    :param linked_list:
+    :type linked_list: DoublyLinkedList
+    :param batch_size:
+    :type batch_size: Optional[int]
+    :param interval:
+    :type interval: float
+    :return: The time of the walk and the lateness of the wakeups of the ticker
+    :rtype: Tuple[float, List[float]]
+    """
+    lateness: List[float] = []
+    ticker = asyncio.ensure_future(tick(interval, lateness))
+    await asyncio.sleep(interval)
+
+    begin: float = time.perf_counter()
+    if batch_size is None:
+        for _ in linked_list:
+            pass
+    else:
+        async for _ in linked_list.async_iter(batch_size):
+            pass
+    elapsed: float = time.perf_counter() - begin
+
+    await asyncio.sleep(interval * 2)  # let the ticker record the last wakeup
+    ticker.cancel()
+    return elapsed, lateness
+
+
+def main() -> None:
+    """
+    Print the time of the walk and the lateness of the ticker for every batch size
+
+    :return:
+    :rtype: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--batch-sizes", default="64,256,1024,4096")
+    parser.add_argument("--interval", type=float, default=0.001)
+    args = parser.parse_args()
+
+    linked_list = DoublyLinkedList.from_iterable(range(args.size))
+    batch_sizes: List[Optional[int]] = [None]
+    batch_sizes += [int(batch_size) for batch_size in args.batch_sizes.split(",")]
+
+    print(f"size: {args.size}, interval of the ticker: {args.interval * 1000:.1f} ms")
+    print(f"{'iteration':<24}{'walk (s)':>12}{'max late (ms)':>16}{'p99 late (ms)':>16}")
+    for batch_size in batch_sizes:
+        elapsed, lateness = asyncio.run(walk(linked_list, batch_size, args.interval))
+        lateness.sort()
+        name: str = "for" if batch_size is None else f"async for, {batch_size}"
+        print(
+            f"{name:<24}{elapsed:>12.4f}{lateness[-1] * 1000:>16.2f}"
+            f"{lateness[int(len(lateness) * 0.99)] * 1000:>16.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Freezing benchmark for the singly linked list
+
+Build a reference linked list of integers, make it immutable, and time reading it: a
+singly linked list of SecureSinglyNode frozen node by node, whose every read goes
+through a property, against a singly linked list of SinglyNode frozen as a whole by
+`freeze`, whose nodes are read straight from their attributes. The time to freeze, to
+sum the values and to search for the last value is reported:
+
+    python benchmarks/frozen.py [--sizes 1000,100000,1000000] [--repeat REPEAT]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from functools import partial
+from typing import Any, Callable, Dict, List
+
+from data_structures.linked_list.nodes import SecureSinglyNode
+from data_structures.linked_list.singly import SinglyLinkedList
+
+
+class SecureSinglyLinkedList(SinglyLinkedList):
+    """
+    SinglyLinkedList of SecureSinglyNode, the nodes are created unfrozen to be linked
+    """
+
+    node_class = partial(SecureSinglyNode, frozen=False)
+
+
+def freeze_nodes(linked_list: SinglyLinkedList) -> None:
+    """
+    Freeze every node of the given linked list
+
+    :param linked_list:
+    :type linked_list: SinglyLinkedList
+    :return:
+    :rtype: None
+    """
+    for node in linked_list:
+        node.freeze()
+
+
+def total(linked_list: SinglyLinkedList) -> int:
+    """
+    Sum the values of the given linked list
+
+    :param linked_list:
+    :type linked_list: SinglyLinkedList
+    :return:
+    :rtype: int
+    """
+    return sum(linked_list.values())
+
+
+WAYS: Dict[str, Callable[[range], SinglyLinkedList]] = {
+    "frozen nodes": SecureSinglyLinkedList.from_iterable,
+    "frozen list": SinglyLinkedList.from_iterable,
+}
+
+FREEZE: Dict[str, Callable[[SinglyLinkedList], None]] = {
+    "frozen nodes": freeze_nodes,
+    "frozen list": SinglyLinkedList.freeze,
+}
+
+
+def best(function: Callable[[], Any], repeat: int) -> float:
+    """
+    Return the best time in seconds of calling the given function
+
+    :param function:
+    :type function: Callable[[], Any]
+    :param repeat:
+    :type repeat: int
+    :return:
+    :rtype: float
+    """
+    times: List[float] = []
+    for _ in range(repeat):
+        begin: float = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - begin)
+    return min(times)
+
+
+def main() -> None:
+    """
+    Print the time to freeze, to sum and to search every size of linked list frozen
+    both ways
+
+    :return:
+    :rtype: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="1000,100000,1000000")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'way':<14}{'size':>10}{'freeze (ms)':>14}{'sum (ms)':>12}"
+        f"{'search (ms)':>14}"
+    )
+    for size in (int(size) for size in args.sizes.split(",")):
+        for way, build in WAYS.items():
+            linked_list: SinglyLinkedList = build(range(size))
+            freeze: float = best(partial(FREEZE[way], linked_list), args.repeat)
+            summing: float = best(partial(total, linked_list), args.repeat)
+            search: float = best(partial(linked_list.search, size - 1), args.repeat)
+            print(
+                f"{way:<14}{size:>10}{freeze * 1000:>14.3f}{summing * 1000:>12.2f}"
+                f"{search * 1000:>14.2f}",
+                flush=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
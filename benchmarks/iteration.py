@@ -0,0 +1,180 @@
+"""
+Iteration benchmark for the linked lists
+
+Compare the generator based iteration of the linked lists with the class based
+iterators they used before, and with iterating the values directly:
+
+    python benchmarks/iteration.py [--size SIZE] [--repeat REPEAT]
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+from collections.abc import Iterator
+from typing import Any, Callable, List, Optional, Tuple
+
+from data_structures.linked_list import LinkedList
+from data_structures.linked_list.doubly import DoublyLinkedList
+from data_structures.linked_list.nodes import SinglyNode
+from data_structures.linked_list.singly import CircularSinglyLinkedList, SinglyLinkedList
+
+
+class ClassIterator(Iterator):  # pylint: disable=too-few-public-methods
+    """
+    The class based iterator used by SinglyLinkedList and DoublyLinkedList before
+    """
+
+    def __init__(self, linked_list: LinkedList):
+        self.linked_list = linked_list
+        self.cursor: Optional[SinglyNode] = self.linked_list.head
+
+    def __next__(self) -> SinglyNode:
+        if self.cursor:
+            cursor: Optional[SinglyNode] = self.cursor
+            self.cursor = cursor.next
+            return cursor
+        raise StopIteration
+
+
+class ClassSearchIterator(ClassIterator):  # pylint: disable=too-few-public-methods
+    """
+    The class based search iterator used by SinglyLinkedList and DoublyLinkedList before
+    """
+
+    def __init__(self, linked_list: LinkedList, value: Any):
+        super().__init__(linked_list)
+        self.value = value
+
+    def __next__(self) -> SinglyNode:
+        while True:
+            current: Optional[SinglyNode] = self.cursor
+            try:
+                self.cursor = current.next
+            except AttributeError:
+                raise StopIteration
+            if current.value == self.value:
+                return current
+            if current.next is None:
+                raise StopIteration
+
+
+class ClassCircularIterator(Iterator):  # pylint: disable=too-few-public-methods
+    """
+    The class based iterator used by CircularSinglyLinkedList before
+    """
+
+    def __init__(self, linked_list: CircularSinglyLinkedList):
+        self.head = linked_list.head
+        self.cursor = self.head
+        self._stop_iteration: bool = not self.head
+
+    def __next__(self) -> SinglyNode:
+        if self._stop_iteration:
+            raise StopIteration
+        cursor = self.cursor
+        self.cursor = cursor.next
+        if cursor.next is self.head:
+            self._stop_iteration = True
+        return cursor
+
+
+def best_of(
+        before: Callable[[], Any], after: Callable[[], Any], repeat: int
+) -> Tuple[float, float]:
+    """
+    Return the best time in seconds of running each statement once, the statements are
+    run alternately after one warm-up run to let the interpreter specialize the code
+
+    :param before:
+    :type before: Callable[[], Any]
+    :param after:
+    :type after: Callable[[], Any]
+    :param repeat:
+    :type repeat: int
+    :return:
+    :rtype: Tuple[float, float]
+    """
+    before()
+    after()
+    before_times: List[float] = []
+    after_times: List[float] = []
+    for _ in range(repeat):
+        before_times.append(timeit.timeit(before, number=1))
+        after_times.append(timeit.timeit(after, number=1))
+    return min(before_times), min(after_times)
+
+
+def drain(iterator: Iterator) -> None:
+    """
+    Consume the given iterator
+
+    :param iterator:
+    :type iterator: Iterator
+    :return:
+    :rtype: None
+    """
+    for _ in iterator:
+        pass
+
+
+def main() -> None:
+    """
+    Print the time of every iteration path before and after the generators
+
+    :return:
+    :rtype: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    values = range(args.size)
+    missing = -1
+    singly = SinglyLinkedList.from_iterable(values)
+    circular = CircularSinglyLinkedList.from_iterable(values)
+    doubly = DoublyLinkedList.from_iterable(values)
+
+    cases: List[Tuple[str, Callable[[], Any], Callable[[], Any]]] = []
+    for name, linked_list in (("SinglyLinkedList", singly), ("DoublyLinkedList", doubly)):
+        cases += [
+            (
+                f"{name} iter",
+                lambda linked_list=linked_list: drain(ClassIterator(linked_list)),
+                lambda linked_list=linked_list: drain(iter(linked_list)),
+            ),
+            (
+                f"{name} search_iter",
+                lambda linked_list=linked_list: drain(
+                    ClassSearchIterator(linked_list, missing)
+                ),
+                lambda linked_list=linked_list: drain(linked_list.search_iter(missing)),
+            ),
+            (
+                f"{name} values",
+                lambda linked_list=linked_list: [
+                    node.value for node in ClassIterator(linked_list)
+                ],
+                lambda linked_list=linked_list: list(linked_list.values()),
+            ),
+        ]
+    cases.append(
+        (
+            "CircularSinglyLinkedList iter",
+            lambda: drain(ClassCircularIterator(circular)),
+            lambda: drain(iter(circular)),
+        )
+    )
+
+    print(f"size: {args.size}")
+    print(f"{'operation':<36}{'class (s)':>12}{'generator (s)':>16}{'speedup':>10}")
+    for name, before, after in cases:
+        before_time, after_time = best_of(before, after, args.repeat)
+        print(
+            f"{name:<36}{before_time:>12.4f}{after_time:>16.4f}"
+            f"{before_time / after_time:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Loading benchmark for the memory-mapped linked list
+
+Write a linked list of the given size to a file once, then compare the time to get a
+usable linked list back, and to search it for a missing value: MappedLinkedList maps
+the file and reads nothing else, while SinglyLinkedList is rebuilt from the values
+pickled in a file:
+
+    python benchmarks/mapped.py [--size SIZE] [--codec json|pickle|str]
+                                [--repeat REPEAT]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import pickle
+import tempfile
+import time
+from typing import Any, Callable, List, Tuple
+
+from data_structures.linked_list.mapped import MappedLinkedList
+from data_structures.linked_list.singly import SinglyLinkedList
+
+
+def best(function: Callable[[], Any], repeat: int) -> Tuple[float, Any]:
+    """
+    Return the best time in seconds of calling the given function, and its last result
+
+    :param function:
+    :type function: Callable[[], Any]
+    :param repeat:
+    :type repeat: int
+    :return:
+    :rtype: Tuple[float, Any]
+    """
+    times: List[float] = []
+    result: Any = None
+    for _ in range(repeat):
+        begin: float = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - begin)
+    return min(times), result
+
+
+def load_pickled(path: str) -> SinglyLinkedList:
+    """
+    Rebuild a singly linked list from the values pickled in the given file
+
+    :param path:
+    :type path: str
+    :return:
+    :rtype: SinglyLinkedList
+    """
+    with open(path, "rb") as file:
+        return SinglyLinkedList.from_iterable(pickle.load(file))
+
+
+def main() -> None:
+    """
+    Print the time to open and to search both linked lists
+
+    :return:
+    :rtype: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--codec", default="str")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    values: List[Any] = [
+        str(value) if args.codec == "str" else value for value in range(args.size)
+    ]
+    missing: Any = "missing" if args.codec == "str" else -1
+
+    with tempfile.TemporaryDirectory() as directory:
+        mapped_path: str = os.path.join(directory, "mapped")
+        pickled_path: str = os.path.join(directory, "pickled")
+        MappedLinkedList.dump(values, mapped_path, args.codec)
+        with open(pickled_path, "wb") as file:
+            pickle.dump(values, file, protocol=pickle.HIGHEST_PROTOCOL)
+        del values
+
+        print(
+            f"size: {args.size}, codec: {args.codec}, "
+            f"{os.path.getsize(mapped_path):,} bytes mapped, "
+            f"{os.path.getsize(pickled_path):,} bytes pickled"
+        )
+        print(f"{'structure':<20}{'open (s)':>12}{'search (s)':>12}")
+        for name, load in (
+                (
+                        "MappedLinkedList",
+                        # the file is written just above, its pickles are trusted
+                        lambda: MappedLinkedList(mapped_path, allow_pickle=True),
+                ),
+                ("SinglyLinkedList", lambda: load_pickled(pickled_path)),
+        ):
+            open_time, linked_list = best(load, args.repeat)
+            search_time, _ = best(
+                lambda linked_list=linked_list: linked_list.search(missing), args.repeat
+            )
+            print(f"{name:<20}{open_time:>12.6f}{search_time:>12.4f}", flush=True)
+            if isinstance(linked_list, MappedLinkedList):
+                linked_list.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Memory benchmark for the node classes used in linked lists
+
+Compare the bytes per node of the slotted node classes with the same classes carrying
+a per-instance `__dict__`, which is how the nodes were laid out before `__slots__`:
+
+    python benchmarks/memory_nodes.py [--size SIZE]
+"""
+from __future__ import annotations
+
+import argparse
+import tracemalloc
+from typing import Any, Callable, List, Optional, Tuple
+
+from data_structures.linked_list.nodes import DoublyNode, SecureSinglyNode, SinglyNode
+
+
+class DictSinglyNode:  # pylint: disable=too-few-public-methods
+    """
+    SinglyNode with a per-instance `__dict__`
+    """
+
+    def __init__(self, value: Any, next_: Optional[DictSinglyNode] = None):
+        self.value = value
+        self.next = next_
+
+
+class DictSecureSinglyNode:  # pylint: disable=too-few-public-methods
+    """
+    SecureSinglyNode with a per-instance `__dict__`
+    """
+
+    def __init__(self, value: Any, next_: Optional[DictSecureSinglyNode] = None):
+        self._value = value
+        self._next = next_
+        self.frozen = True
+
+
+class DictDoublyNode:  # pylint: disable=too-few-public-methods
+    """
+    DoublyNode with a per-instance `__dict__`
+    """
+
+    def __init__(self, value: Any, previous: Optional[DictDoublyNode] = None):
+        self.value = value
+        self.previous = previous
+        self.next = None
+        if previous:
+            previous.next = self
+
+
+def bytes_per_node(build: Callable[[int], Any], size: int) -> float:
+    """
+    Measure the memory allocated by build(size) divided by size
+
+    :param build: The callable creating a chain of the given size
+    :type build: Callable[[int], Any]
+    :param size: The number of nodes
+    :type size: int
+    :return:
+    :rtype: float
+    """
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    chain = build(size)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del chain
+    return (after - before) / size
+
+
+def singly(node_class: type) -> Callable[[int], Any]:
+    """
+    Return a builder of a chain of the given singly node class
+
+    :param node_class:
+    :type node_class: type
+    :return:
+    :rtype: Callable[[int], Any]
+    """
+
+    def build(size: int) -> Any:
+        head = None
+        for _ in range(size):
+            head = node_class(None, head)
+        return head
+
+    return build
+
+
+def doubly(node_class: type) -> Callable[[int], Any]:
+    """
+    Return a builder of a chain of the given doubly node class
+
+    :param node_class:
+    :type node_class: type
+    :return:
+    :rtype: Callable[[int], Any]
+    """
+
+    def build(size: int) -> Any:
+        head = node = node_class(None)
+        for _ in range(size - 1):
+            node = node_class(None, node)
+        return head
+
+    return build
+
+
+def main() -> None:
+    """
+    Print the bytes per node before and after `__slots__` for every node class
+
+    :return:
+    :rtype: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=100_000)
+    args = parser.parse_args()
+
+    cases: List[Tuple[str, Callable[[int], Any], Callable[[int], Any]]] = [
+        ("SinglyNode", singly(DictSinglyNode), singly(SinglyNode)),
+        (
+            "SecureSinglyNode",
+            singly(DictSecureSinglyNode),
+            singly(lambda value, next_: SecureSinglyNode(value, next_, frozen=False)),
+        ),
+        ("DoublyNode", doubly(DictDoublyNode), doubly(DoublyNode)),
+    ]
+
+    print(f"{'node class':<20}{'__dict__':>12}{'__slots__':>12}{'ratio':>8}")
+    for name, before, after in cases:
+        dict_bytes = bytes_per_node(before, args.size)
+        slots_bytes = bytes_per_node(after, args.size)
+        print(
+            f"{name:<20}{dict_bytes:>12.1f}{slots_bytes:>12.1f}"
+            f"{dict_bytes / slots_bytes:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
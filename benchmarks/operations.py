@@ -0,0 +1,387 @@
+"""
+Scaling benchmark for every public operation of the linked lists
+
+Run each operation of SinglyLinkedList, CircularSinglyLinkedList, DoublyLinkedList,
+UnrolledLinkedList and NumericLinkedList, if numpy is installed, at growing sizes, with
+`list` and `collections.deque` as baselines, and report the time and the peak memory of
+one operation, so the growth of every operation with the size is visible:
+
+    python benchmarks/operations.py [--sizes 10,100,...] [--operations pop,tail,...]
+                                    [--structures SinglyLinkedList,list,...]
+                                    [--min-time SECONDS] [--repeat REPEAT] [--csv PATH]
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import gc
+import time
+import tracemalloc
+from collections import deque
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from data_structures.linked_list.doubly import DoublyLinkedList
+from data_structures.linked_list.singly import CircularSinglyLinkedList, SinglyLinkedList
+from data_structures.linked_list.unrolled import UnrolledLinkedList
+
+try:
+    from data_structures.linked_list.numeric import NumericLinkedList
+except ImportError:  # numpy is an optional dependency
+    NumericLinkedList = None
+
+MISSING = -1
+
+Operation = Callable[[Any, int], Any]
+
+
+def drain(iterable: Any) -> None:
+    """
+    Consume the given iterable
+
+    :param iterable:
+    :type iterable: Any
+    :return:
+    :rtype: None
+    """
+    for _ in iterable:
+        pass
+
+
+def rotate(sequence: Any, k: int) -> None:
+    """
+    Rotate the given deque, or list, k steps to the right
+
+    :param sequence:
+    :type sequence: Any
+    :param k:
+    :type k: int
+    :return:
+    :rtype: None
+    """
+    if isinstance(sequence, deque):
+        sequence.rotate(k)
+    elif k % len(sequence):
+        k %= len(sequence)
+        sequence[:] = sequence[-k:] + sequence[:-k]
+
+
+# every operation takes the structure and its size, and runs once; an operation shrinking
+# the structure is marked in SHRINKING, so it is not run more times than the size
+LINKED_LIST_OPERATIONS: Dict[str, Operation] = {
+    "append": lambda linked_list, n: linked_list.append(n),
+    "appendleft": lambda linked_list, n: linked_list.appendleft(n),
+    "extend": lambda linked_list, n: linked_list.extend(range(100)),
+    "extendleft": lambda linked_list, n: linked_list.extendleft(range(100)),
+    "concat": lambda linked_list, n: linked_list.concat(
+        type(linked_list).from_iterable(range(100))
+    ),
+    "from_iterable": lambda linked_list, n: type(linked_list).from_iterable(range(n)),
+    "insert_after": lambda linked_list, n: linked_list.insert_after(n, linked_list.head),
+    "remove_after": lambda linked_list, n: linked_list.remove_after(linked_list.head),
+    "pop": lambda linked_list, n: linked_list.pop(),
+    "popleft": lambda linked_list, n: linked_list.popleft(),
+    "len": lambda linked_list, n: len(linked_list),
+    "tail": lambda linked_list, n: linked_list.tail,
+    "is_tail": lambda linked_list, n: linked_list.is_tail(linked_list.head),
+    "contains": lambda linked_list, n: linked_list.tail in linked_list,
+    "search": lambda linked_list, n: linked_list.search(MISSING),
+    "search_iter": lambda linked_list, n: drain(linked_list.search_iter(MISSING)),
+    "replace": lambda linked_list, n: linked_list.replace(MISSING, MISSING),
+    "remove_if": lambda linked_list, n: linked_list.remove_if(
+        lambda value: value == MISSING
+    ),
+    "remove_values": lambda linked_list, n: linked_list.remove_values((MISSING,)),
+    "iter": lambda linked_list, n: drain(linked_list),
+    "values": lambda linked_list, n: drain(linked_list.values()),
+    "reversed": lambda linked_list, n: drain(reversed(linked_list)),
+    "reverse": lambda linked_list, n: linked_list.reverse(),
+    "rotate": lambda linked_list, n: linked_list.rotate(1),
+    "rotate_third": lambda linked_list, n: linked_list.rotate(n // 3),
+}
+
+SEQUENCE_OPERATIONS: Dict[str, Operation] = {
+    "append": lambda sequence, n: sequence.append(n),
+    "appendleft": lambda sequence, n: (
+        sequence.appendleft(n) if isinstance(sequence, deque) else sequence.insert(0, n)
+    ),
+    "extend": lambda sequence, n: sequence.extend(range(100)),
+    "concat": lambda sequence, n: sequence.extend(type(sequence)(range(100))),
+    "extendleft": lambda sequence, n: (
+        sequence.extendleft(range(100))
+        if isinstance(sequence, deque)
+        else sequence.__setitem__(slice(0, 0), reversed(range(100)))
+    ),
+    "from_iterable": lambda sequence, n: type(sequence)(range(n)),
+    "insert_after": lambda sequence, n: sequence.insert(1, n),
+    "remove_after": lambda sequence, n: sequence.__delitem__(1),
+    "pop": lambda sequence, n: sequence.pop(),
+    "popleft": lambda sequence, n: (
+        sequence.popleft() if isinstance(sequence, deque) else sequence.pop(0)
+    ),
+    "len": lambda sequence, n: len(sequence),
+    "tail": lambda sequence, n: sequence[-1],
+    "contains": lambda sequence, n: MISSING in sequence,
+    "search": lambda sequence, n: MISSING in sequence,
+    "iter": lambda sequence, n: drain(sequence),
+    "reversed": lambda sequence, n: drain(reversed(sequence)),
+    "reverse": lambda sequence, n: sequence.reverse(),
+    "rotate": lambda sequence, n: rotate(sequence, 1),
+    "rotate_third": lambda sequence, n: rotate(sequence, n // 3),
+}
+
+SHRINKING = {"pop", "popleft", "remove_after"}
+
+# the method an operation needs, if it is not named after the method
+METHODS: Dict[str, str] = {"rotate_third": "rotate"}
+
+
+def linked_list_operations(linked_list_class: type) -> Dict[str, Operation]:
+    """
+    Return the operations of LINKED_LIST_OPERATIONS which the given linked list class
+    has, an operation named after a method is skipped if the class lacks the method
+
+    :param linked_list_class:
+    :type linked_list_class: type
+    :return:
+    :rtype: Dict[str, Operation]
+    """
+    return {
+        name: operation
+        for name, operation in LINKED_LIST_OPERATIONS.items()
+        if name in {"contains", "iter", "len", "reversed"}
+        or hasattr(linked_list_class, METHODS.get(name, name))
+    }
+
+
+STRUCTURES: Dict[str, Tuple[Callable[[range], Any], Dict[str, Operation]]] = {
+    linked_list_class.__name__: (
+        linked_list_class.from_iterable,
+        linked_list_operations(linked_list_class),
+    )
+    for linked_list_class in (
+        SinglyLinkedList,
+        CircularSinglyLinkedList,
+        DoublyLinkedList,
+        UnrolledLinkedList,
+        NumericLinkedList,
+    )
+    if linked_list_class is not None
+}
+STRUCTURES["list"] = (list, SEQUENCE_OPERATIONS)
+STRUCTURES["deque"] = (deque, SEQUENCE_OPERATIONS)
+
+
+class Result(NamedTuple):
+    """
+    The measurement of one operation on one structure at one size
+    """
+
+    operation: str
+    structure: str
+    size: int
+    seconds: float
+    peak_bytes: int
+
+
+def measure_time(
+        build: Callable[[range], Any],
+        operation: Operation,
+        size: int,
+        max_number: int,
+        min_time: float,
+        repeat: int,
+) -> float:
+    """
+    Return the best time in seconds of one operation, the operation is run on a freshly
+    built structure until min_time is spent or max_number runs are done, with the
+    garbage collector disabled as timeit does
+
+    :param build:
+    :type build: Callable[[range], Any]
+    :param operation:
+    :type operation: Operation
+    :param size:
+    :type size: int
+    :param max_number:
+    :type max_number: int
+    :param min_time:
+    :type min_time: float
+    :param repeat:
+    :type repeat: int
+    :return:
+    :rtype: float
+    """
+    best: float = float("inf")
+    for _ in range(repeat):
+        structure = build(range(size))
+        number: int = 0
+        gc.disable()
+        try:
+            start: float = time.perf_counter()
+            elapsed: float = 0.0
+            while number < max_number and elapsed < min_time:
+                operation(structure, size)
+                number += 1
+                elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        best = min(best, elapsed / number)
+        del structure
+    return best
+
+
+def measure_memory(build: Callable[[range], Any], operation: Operation, size: int) -> int:
+    """
+    Return the peak memory in bytes allocated by one operation on a freshly built
+    structure
+
+    :param build:
+    :type build: Callable[[range], Any]
+    :param operation:
+    :type operation: Operation
+    :param size:
+    :type size: int
+    :return:
+    :rtype: int
+    """
+    structure = build(range(size))
+    tracemalloc.start()
+    try:
+        current, _ = tracemalloc.get_traced_memory()
+        result = operation(structure, size)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak - current
+
+
+def run(
+        sizes: List[int],
+        operations: Optional[List[str]],
+        structures: List[str],
+        min_time: float,
+        repeat: int,
+) -> List[Result]:
+    """
+    Measure every operation on every structure at every size
+
+    :param sizes:
+    :type sizes: List[int]
+    :param operations: The operations to measure, or None for all of them
+    :type operations: Optional[List[str]]
+    :param structures:
+    :type structures: List[str]
+    :param min_time:
+    :type min_time: float
+    :param repeat:
+    :type repeat: int
+    :return:
+    :rtype: List[Result]
+    """
+    results: List[Result] = []
+    for name in operations or LINKED_LIST_OPERATIONS:
+        for structure in structures:
+            build, structure_operations = STRUCTURES[structure]
+            operation: Optional[Operation] = structure_operations.get(name)
+            if operation is None:
+                continue
+            for size in sizes:
+                max_number: int = max(1, size // 2) if name in SHRINKING else 1_000_000
+                results.append(
+                    Result(
+                        name,
+                        structure,
+                        size,
+                        measure_time(
+                            build, operation, size, max_number, min_time, repeat
+                        ),
+                        measure_memory(build, operation, size),
+                    )
+                )
+    return results
+
+
+def print_results(results: List[Result], sizes: List[int]) -> None:
+    """
+    Print one table per operation, one row per structure and one column per size
+
+    :param results:
+    :type results: List[Result]
+    :param sizes:
+    :type sizes: List[int]
+    :return:
+    :rtype: None
+    """
+    table: Dict[str, Dict[str, Dict[int, Result]]] = {}
+    for result in results:
+        table.setdefault(result.operation, {}).setdefault(result.structure, {})[
+            result.size
+        ] = result
+
+    for operation, rows in table.items():
+        print(f"\n{operation}: time per operation (µs) / peak memory (KiB)")
+        print(f"{'':<26}" + "".join(f"{size:>22,}" for size in sizes))
+        for structure, row in rows.items():
+            cells: List[str] = []
+            for size in sizes:
+                result = row[size]
+                cells.append(
+                    f"{result.seconds * 1e6:>12.2f} /{result.peak_bytes / 1024:>8.1f}"
+                )
+            print(f"{structure:<26}" + "".join(f"{cell:>22}" for cell in cells))
+
+
+def main() -> None:
+    """
+    Parse the arguments, run the benchmark and report the results
+
+    :return:
+    :rtype: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        default="10,100,1000,10000,100000,1000000",
+        help="comma separated sizes",
+    )
+    parser.add_argument(
+        "--operations",
+        help="comma separated operations, all of them by default: "
+             + ",".join(LINKED_LIST_OPERATIONS),
+    )
+    parser.add_argument(
+        "--structures",
+        default=",".join(STRUCTURES),
+        help="comma separated structures, all of them by default",
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.05,
+        help="the minimal time in seconds to run an operation repeatedly",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--csv", help="also write the results to this CSV file")
+    args = parser.parse_args()
+
+    sizes: List[int] = [int(size) for size in args.sizes.split(",")]
+    results: List[Result] = run(
+        sizes,
+        args.operations.split(",") if args.operations else None,
+        args.structures.split(","),
+        args.min_time,
+        args.repeat,
+    )
+
+    print_results(results, sizes)
+
+    if args.csv:
+        with open(args.csv, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(Result._fields)
+            writer.writerows(results)
+
+
+if __name__ == "__main__":
+    main()
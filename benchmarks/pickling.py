@@ -0,0 +1,137 @@
+"""
+Pickling benchmark for the linked lists
+
+Pickle and unpickle linked lists of integers at several sizes and report the bytes and
+the time of a round trip; the linked lists are pickled as the flat sequence of their
+values, with protocol 4, and with protocol 5 as by `to_bytes`, where numeric values are
+packed into one buffer written in-band or sent out-of-band. A `list` of
+the same values is pickled as the lower bound:
+
+    python benchmarks/pickling.py [--sizes 1000,100000,1000000] [--repeat REPEAT]
+"""
+from __future__ import annotations
+
+import argparse
+import pickle
+import time
+from functools import partial
+from typing import Any, Callable, Dict, List, Tuple
+
+from data_structures.linked_list.doubly import DoublyLinkedList
+from data_structures.linked_list.singly import SinglyLinkedList
+
+try:
+    from data_structures.linked_list.numeric import NumericLinkedList
+except ImportError:  # numpy is an optional dependency
+    NumericLinkedList = None
+
+STRUCTURES: Dict[str, Callable[[range], Any]] = {
+    "list": list,
+    "SinglyLinkedList": SinglyLinkedList.from_iterable,
+    "DoublyLinkedList": DoublyLinkedList.from_iterable,
+}
+if NumericLinkedList is not None:
+    STRUCTURES["NumericLinkedList"] = lambda values: NumericLinkedList.from_iterable(
+        values, dtype="int64"
+    )
+
+
+def pickle_4(structure: Any) -> Tuple[int, Any]:
+    """
+    Round trip the given structure through `pickle.dumps` with protocol 4
+
+    :param structure:
+    :type structure: Any
+    :return: The number of bytes and the structure unpickled
+    :rtype: Tuple[int, Any]
+    """
+    data: bytes = pickle.dumps(structure, protocol=4)
+    return len(data), pickle.loads(data)
+
+
+def in_band(structure: Any) -> Tuple[int, Any]:
+    """
+    Round trip the given structure with protocol 5, the buffers written in-band
+
+    :param structure:
+    :type structure: Any
+    :return: The number of bytes and the structure unpickled
+    :rtype: Tuple[int, Any]
+    """
+    data: bytes = pickle.dumps(structure, protocol=5)
+    return len(data), pickle.loads(data)
+
+
+def out_of_band(structure: Any) -> Tuple[int, Any]:
+    """
+    Round trip the given structure with protocol 5, the buffers sent out-of-band
+
+    :param structure:
+    :type structure: Any
+    :return: The number of bytes, the buffers included, and the structure unpickled
+    :rtype: Tuple[int, Any]
+    """
+    buffers: List[pickle.PickleBuffer] = []
+    data: bytes = pickle.dumps(structure, protocol=5, buffer_callback=buffers.append)
+    size: int = len(data) + sum(buffer.raw().nbytes for buffer in buffers)
+    return size, pickle.loads(data, buffers=buffers)
+
+
+WAYS: Dict[str, Callable[[Any], Tuple[int, Any]]] = {
+    "protocol 4": pickle_4,
+    "in-band": in_band,
+    "out-of-band": out_of_band,
+}
+
+
+def best(function: Callable[[], Any], repeat: int) -> Tuple[float, Any]:
+    """
+    Return the best time in seconds of calling the given function, and its last result
+
+    :param function:
+    :type function: Callable[[], Any]
+    :param repeat:
+    :type repeat: int
+    :return:
+    :rtype: Tuple[float, Any]
+    """
+    times: List[float] = []
+    result: Any = None
+    for _ in range(repeat):
+        begin: float = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - begin)
+    return min(times), result
+
+
+def main() -> None:
+    """
+    Print the bytes and the time of a round trip for every structure, size and way of
+    pickling
+
+    :return:
+    :rtype: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="1000,100000,1000000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        f"{'structure':<20}{'size':>10}{'way':>14}{'bytes':>14}"
+        f"{'round trip (ms)':>18}"
+    )
+    for size in (int(size) for size in args.sizes.split(",")):
+        for name, build in STRUCTURES.items():
+            structure: Any = build(range(size))
+            for way, round_trip in WAYS.items():
+                seconds, (length, _) = best(partial(round_trip, structure), args.repeat)
+                print(
+                    f"{name:<20}{size:>10}{way:>14}{length:>14,}"
+                    f"{seconds * 1000:>18.2f}",
+                    flush=True,
+                )
+
+
+if __name__ == "__main__":
+    main()
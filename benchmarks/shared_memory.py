@@ -0,0 +1,126 @@
+"""
+Process pool benchmark for the shared array linked list
+
+Pass a linked list to every task of a `ProcessPoolExecutor`, each task searching it for
+a value, and report the bytes pickled per task and the time per task; the other linked
+lists are pickled with all their values for every task, while SharedArrayLinkedList
+only pickles the name of its shared memory, which the worker attaches to:
+
+    python benchmarks/shared_memory.py [--sizes 1000,100000] [--tasks TASKS]
+                                       [--workers WORKERS]
+"""
+from __future__ import annotations
+
+import argparse
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict
+
+from data_structures.linked_list.arrays import ArraySinglyLinkedList
+from data_structures.linked_list.shared import SharedArrayLinkedList
+from data_structures.linked_list.singly import SinglyLinkedList
+
+MISSING = -1
+
+STRUCTURES: Dict[str, Callable[[range], Any]] = {
+    "SinglyLinkedList": SinglyLinkedList.from_iterable,
+    "ArraySinglyLinkedList": ArraySinglyLinkedList.from_iterable,
+    "SharedArrayLinkedList": lambda values: SharedArrayLinkedList.from_iterable(
+        values, typecode="q", capacity=len(values)
+    ),
+}
+
+
+def search(linked_list: Any, value: Any) -> bool:
+    """
+    The task run by the workers
+
+    :param linked_list:
+    :type linked_list: Any
+    :param value:
+    :type value: Any
+    :return:
+    :rtype: bool
+    """
+    return linked_list.search(value) is not None
+
+
+def run(executor: ProcessPoolExecutor, linked_list: Any, tasks: int) -> None:
+    """
+    Search the given linked list in the given number of tasks
+
+    :param executor:
+    :type executor: ProcessPoolExecutor
+    :param linked_list:
+    :type linked_list: Any
+    :param tasks:
+    :type tasks: int
+    :return:
+    :rtype: None
+    """
+    for _ in executor.map(search, [linked_list] * tasks, [MISSING] * tasks):
+        pass
+
+
+def per_task(
+        executor: ProcessPoolExecutor, linked_list: Any, tasks: int, workers: int
+) -> float:
+    """
+    Return the time in seconds per task of searching the given linked list in the
+    workers, after one task per worker to warm up
+
+    :param executor:
+    :type executor: ProcessPoolExecutor
+    :param linked_list:
+    :type linked_list: Any
+    :param tasks:
+    :type tasks: int
+    :param workers:
+    :type workers: int
+    :return:
+    :rtype: float
+    """
+    run(executor, linked_list, workers)
+    begin: float = time.perf_counter()
+    run(executor, linked_list, tasks)
+    return (time.perf_counter() - begin) / tasks
+
+
+def main() -> None:
+    """
+    Print the bytes pickled and the time of one task for every structure and size
+
+    :return:
+    :rtype: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="1000,100000")
+    parser.add_argument("--tasks", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    print(f"{'structure':<24}{'size':>10}{'pickled (bytes)':>18}{'per task (ms)':>16}")
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        executor.map(abs, range(args.workers))  # start the workers
+        for size in (int(size) for size in args.sizes.split(",")):
+            for name, build in STRUCTURES.items():
+                linked_list: Any = build(range(size))
+                row: str = f"{name:<24}{size:>10}"
+                try:
+                    row += f"{len(pickle.dumps(linked_list)):>18,}"
+                    seconds: float = per_task(
+                        executor, linked_list, args.tasks, args.workers
+                    )
+                    row += f"{seconds * 1000:>16.2f}"
+                except RecursionError:  # the nodes are pickled recursively
+                    row += f"{'RecursionError':>18}"
+                finally:
+                    if isinstance(linked_list, SharedArrayLinkedList):
+                        linked_list.close()
+                        linked_list.unlink()
+                print(row, flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Ordered lookup benchmark for the skip list
+
+Build a SkipList of random keys, then time inserting, searching, flooring and ranging
+over it, compared with `bisect` on a sorted `list` and with the linear
+SinglyLinkedList.search; the keys and the levels of the skip list are drawn from fixed
+seeds, so every run builds the same skip list:
+
+    python benchmarks/skip_list.py [--sizes 1000,100000,...] [--lookups LOOKUPS]
+                                   [--probability PROBABILITY] [--seed SEED]
+"""
+from __future__ import annotations
+
+import argparse
+import bisect
+import random
+import time
+from typing import Any, Callable, Dict, List
+
+from data_structures.linked_list.singly import SinglyLinkedList
+from data_structures.linked_list.skip import SkipList
+
+# the keys are drawn from range(size * SPREAD), so a range of RANGE_WIDTH keys holds
+# about RANGE_WIDTH / SPREAD values
+SPREAD = 10
+RANGE_WIDTH = 1000
+
+# the linear search visits the whole list, so it runs this many lookups at most
+LINEAR_LOOKUPS = 20
+
+
+def per_operation(operation: Callable[[Any], Any], keys: List[int]) -> float:
+    """
+    Return the time in µs of running the operation once on every key, divided by the
+    number of keys
+
+    :param operation:
+    :type operation: Callable[[Any], Any]
+    :param keys:
+    :type keys: List[int]
+    :return:
+    :rtype: float
+    """
+    start: float = time.perf_counter()
+    for key in keys:
+        operation(key)
+    return (time.perf_counter() - start) / len(keys) * 1e6
+
+
+def skip_list_operations(skip_list: SkipList) -> Dict[str, Callable[[Any], Any]]:
+    """
+    Return the operations on the skip list
+
+    :param skip_list:
+    :type skip_list: SkipList
+    :return:
+    :rtype: Dict[str, Callable[[Any], Any]]
+    """
+    return {
+        "search": skip_list.search,
+        "floor": skip_list.floor,
+        "range": lambda key: list(skip_list.range_iter(key, key + RANGE_WIDTH)),
+        "insert": skip_list.insert,
+    }
+
+
+def sorted_list_operations(sorted_list: List[int]) -> Dict[str, Callable[[Any], Any]]:
+    """
+    Return the operations on the sorted list with bisect
+
+    :param sorted_list:
+    :type sorted_list: List[int]
+    :return:
+    :rtype: Dict[str, Callable[[Any], Any]]
+    """
+    bisect_left = bisect.bisect_left
+    bisect_right = bisect.bisect_right
+    return {
+        "search": lambda key: sorted_list[bisect_left(sorted_list, key)] == key,
+        "floor": lambda key: sorted_list[bisect_right(sorted_list, key) - 1],
+        "range": lambda key: sorted_list[
+            bisect_left(sorted_list, key): bisect_left(sorted_list, key + RANGE_WIDTH)
+        ],
+        "insert": lambda key: bisect.insort(sorted_list, key),
+    }
+
+
+def main() -> None:
+    """
+    Print the time per operation of the skip list and of the baselines at every size
+
+    :return:
+    :rtype: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000,1000000")
+    parser.add_argument("--lookups", type=int, default=10_000)
+    parser.add_argument("--probability", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'operation (µs)':<16}{'size':>12}{'SkipList':>12}{'bisect':>12}{'linear':>12}")
+    for size in (int(size) for size in args.sizes.split(",")):
+        random_: random.Random = random.Random(args.seed)
+        keys: List[int] = random_.sample(range(size * SPREAD), size)
+        lookups: List[int] = [random_.choice(keys) for _ in range(args.lookups)]
+        inserts: List[int] = [
+            random_.randrange(size * SPREAD) for _ in range(args.lookups)
+        ]
+
+        skip_list: SkipList = SkipList.from_iterable(
+            keys, probability=args.probability, seed=args.seed
+        )
+        sorted_list: List[int] = sorted(keys)
+        singly: SinglyLinkedList = SinglyLinkedList.from_iterable(sorted_list)
+
+        skip_operations = skip_list_operations(skip_list)
+        sorted_operations = sorted_list_operations(sorted_list)
+        for name in skip_operations:
+            operation_keys: List[int] = inserts if name == "insert" else lookups
+            linear: str = (
+                f"{per_operation(singly.search, lookups[:LINEAR_LOOKUPS]):>12.2f}"
+                if name == "search"
+                else f"{'-':>12}"
+            )
+            print(
+                f"{name:<16}{size:>12,}"
+                f"{per_operation(skip_operations[name], operation_keys):>12.2f}"
+                f"{per_operation(sorted_operations[name], operation_keys):>12.2f}"
+                f"{linear}",
+                flush=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
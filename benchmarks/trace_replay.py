@@ -0,0 +1,147 @@
+"""
+Trace replay benchmark for the cache policies
+
+Replay a trace of keys against every cache policy at several maximum sizes: every key
+is looked up by `get` and put on a miss, as a read-through cache does, and the hit
+ratio, the evictions and the lookups per second are reported. The trace file holds one
+access per line, the key is the first field of the line, the empty lines and the lines
+starting with "#" are skipped. Without a trace file, a synthetic trace is drawn from a
+fixed seed: keys of a Zipf-like distribution, with a full scan of cold keys every
+`--scan-every` accesses, as a periodic table scan does:
+
+    python benchmarks/trace_replay.py [TRACE] [--maxsizes 100,1000]
+                                      [--accesses ACCESSES] [--keys KEYS]
+                                      [--scan-every SCAN_EVERY] [--scan SCAN]
+                                      [--seed SEED]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Dict, Hashable, List, Type
+
+from data_structures.linked_list.cache import ARCCache, Cache, LFUCache, LRUCache
+
+POLICIES: Dict[str, Type[Cache]] = {
+    "LRUCache": LRUCache,
+    "LFUCache": LFUCache,
+    "ARCCache": ARCCache,
+}
+
+# the value put for a key is the key itself, never this one
+_MISSING = object()
+
+
+def read_trace(path: str) -> List[str]:
+    """
+    Read the keys of the given trace file
+
+    :param path:
+    :type path: str
+    :return:
+    :rtype: List[str]
+    """
+    keys: List[str] = []
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            fields: List[str] = line.split()
+            if fields and not fields[0].startswith("#"):
+                keys.append(fields[0])
+    return keys
+
+
+def synthetic_trace(
+        accesses: int, keys: int, scan_every: int, scan: int, seed: int
+) -> List[int]:
+    """
+    Draw a trace of keys, the key of rank r drawn with a weight of 1 / r, interrupted
+    every `scan_every` accesses by a scan of `scan` keys never used before
+
+    :param accesses: The number of accesses drawn, the scans excluded
+    :type accesses: int
+    :param keys: The number of distinct keys drawn
+    :type keys: int
+    :param scan_every:
+    :type scan_every: int
+    :param scan:
+    :type scan: int
+    :param seed:
+    :type seed: int
+    :return:
+    :rtype: List[int]
+    """
+    weights: List[float] = [1 / rank for rank in range(1, keys + 1)]
+    drawn: List[int] = random.Random(seed).choices(range(keys), weights, k=accesses)
+    trace: List[int] = []
+    cold: int = keys
+    for start in range(0, accesses, scan_every):
+        trace.extend(drawn[start: start + scan_every])
+        trace.extend(range(cold, cold + scan))
+        cold += scan
+    return trace
+
+
+def replay(cache: Cache, trace: List[Hashable]) -> float:
+    """
+    Replay the given trace against the given cache, return the time in seconds
+
+    :param cache:
+    :type cache: Cache
+    :param trace:
+    :type trace: List[Hashable]
+    :return:
+    :rtype: float
+    """
+    get, put = cache.get, cache.put
+    begin: float = time.perf_counter()
+    for key in trace:
+        if get(key, _MISSING) is _MISSING:
+            put(key, key)
+    return time.perf_counter() - begin
+
+
+def main() -> None:
+    """
+    Print the hit ratio, the evictions and the lookups per second of every policy and
+    maximum size
+
+    :return:
+    :rtype: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("trace", nargs="?")
+    parser.add_argument("--maxsizes", default="100,1000")
+    parser.add_argument("--accesses", type=int, default=1_000_000)
+    parser.add_argument("--keys", type=int, default=10_000)
+    parser.add_argument("--scan-every", type=int, default=50_000)
+    parser.add_argument("--scan", type=int, default=5_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    trace: List[Hashable] = (
+        read_trace(args.trace)
+        if args.trace
+        else synthetic_trace(
+            args.accesses, args.keys, args.scan_every, args.scan, args.seed
+        )
+    )
+    source: str = args.trace or "synthetic"
+    print(f"trace: {source}, {len(trace):,} accesses, {len(set(trace)):,} keys")
+    print(
+        f"{'policy':<12}{'maxsize':>10}{'hit ratio':>12}{'evictions':>12}"
+        f"{'ops/s':>14}"
+    )
+    for maxsize in (int(maxsize) for maxsize in args.maxsizes.split(",")):
+        for name, policy in POLICIES.items():
+            cache: Cache = policy(maxsize)
+            seconds: float = replay(cache, trace)
+            print(
+                f"{name:<12}{maxsize:>10}{cache.hit_ratio:>12.4f}"
+                f"{cache.evictions:>12,}{len(trace) / seconds:>14,.0f}",
+                flush=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,26 @@ class LinkedListIndexError(DataStructureError):
     """
 
 
+class LinkedListSizeError(DataStructureError):
+    """
+    When the size counter of a linked list in debug mode does not match the number of
+    nodes in the linked list, this exception raises
+    """
+
+
+class LinkedListFullError(DataStructureError):
+    """
+    When a node is added to a linked list of a fixed capacity with all slots in use,
+    this exception raises
+    """
+
+
+class LinkedListReadOnlyError(DataStructureError):
+    """
+    When a read-only linked list is attempted to modify, this exception raises
+    """
+
+
 # BinaryNode used in BinaryTree
 
 
@@ -3,22 +3,151 @@ This module contains the following linked lists:
 
  * Singly Linked List
  * Doubly Linked List
+ * Array Singly Linked List
+ * Shared Array Linked List
+ * Mapped Linked List
+ * Unrolled Linked List
+ * Skip List
+ * Concurrent Linked List
 """
 from __future__ import annotations
 
+import asyncio
+import pickle
+import sys
 from abc import ABCMeta, abstractmethod
+from array import array
 from collections.abc import Collection, Reversible
-from typing import Any, Optional
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from data_structures.exceptions import LinkedListReadOnlyError, LinkedListSizeError
+
+_LinkedList = TypeVar("_LinkedList", bound="LinkedList")
+
+# the default of a lookup, a value no mapping can hold
+_MISSING: Any = object()
+
+# the typecodes of the arrays packing the values all of one type when pickled
+_TYPECODES: Dict[type, str] = {int: "q", float: "d"}
+
+
+def _pack_values(values: List[Any], protocol: int) -> Any:
+    """
+    Pack the values of a linked list to be pickled: with pickle protocol 5 or newer,
+    values all of type int fitting in 64 bits, or all of type float, are packed into an
+    array given to pickle as a PickleBuffer, which can be sent out-of-band; any other
+    values are pickled as a flat list
+
+    :param values:
+    :type values: List[Any]
+    :param protocol:
+    :type protocol: int
+    :return: The list of values, or the typecode, the byte order and the buffer
+    :rtype: Any
+    """
+    if protocol < 5 or not values:
+        return values
+    kind: type = type(values[0])
+    typecode: Optional[str] = _TYPECODES.get(kind)
+    # pylint: disable=unidiomatic-typecheck
+    if typecode is None or not all(type(value) is kind for value in values):
+        return values
+    try:
+        packed: array = array(typecode, values)
+    except OverflowError:  # an int out of 64 bits
+        return values
+    return typecode, sys.byteorder, pickle.PickleBuffer(packed)
+
+
+def _unpack_values(payload: Any) -> Iterable[Any]:
+    """
+    Unpack the values packed by `_pack_values`
+
+    :param payload:
+    :type payload: Any
+    :return:
+    :rtype: Iterable[Any]
+    """
+    if not isinstance(payload, tuple):
+        return payload
+    typecode, byteorder, buffer = payload
+    values: array = array(typecode)
+    values.frombytes(memoryview(buffer).cast("B"))
+    if byteorder != sys.byteorder:
+        values.byteswap()
+    return values
+
+
+def _unpickle(cls: Type[Any], payload: Any, kwargs: Dict[str, Any]) -> Any:
+    """
+    Rebuild a linked list of the given class from the values pickled by its
+    `__reduce_ex__`, the nodes are created and linked again one after another
+
+    :param cls:
+    :type cls: Type[Any]
+    :param payload:
+    :type payload: Any
+    :param kwargs:
+    :type kwargs: Dict[str, Any]
+    :return:
+    :rtype: Any
+    """
+    return cls.from_iterable(_unpack_values(payload), **kwargs)
 
 
-class Node(metaclass=ABCMeta):  # pylint: disable=too-few-public-methods
+class BaseNode(metaclass=ABCMeta):  # pylint: disable=too-few-public-methods
+    """
+    The base of all Node classes, with the `value` and `next` of a node but no slot
+    for them, so a handle reading them from the storage of its linked list, e.g. an
+    array or a file, derives from it without carrying two unused slots
+
+    A handle is registered as a virtual subclass of Node, so it is a Node as well
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    @abstractmethod
+    def after_node(cls, value: Any, node: BaseNode) -> BaseNode:
+        """
+        Create a node with the given value, and after the given node
+
+        :param value: The value that the node contains
+        :type value: Any
+        :param node: The node which `next` points to this node
+        :type node: BaseNode
+        :return: The node created
+        :rtype: BaseNode
+        """
+
+
+class Node(BaseNode):  # pylint: disable=too-few-public-methods
     """
     The most simple Node class, only contains `value` and `next` properties, and there
     is no any security mechanism for node properties modification
 
     Any enhanced Node class should inherit this class
+
+    The attributes are declared in `__slots__`, so a node carries no per-instance
+    `__dict__`; any subclass should declare its own `__slots__` to keep nodes compact
     """
 
+    __slots__ = ("value", "next")
+
     def __init__(self, value: Any, next_: Optional[Node] = None):
         """
 
@@ -45,20 +174,52 @@ class Node(metaclass=ABCMeta):  # pylint: disable=too-few-public-methods
         """
 
 
-class LinkedList(Collection, Reversible, metaclass=ABCMeta):
+class LinkedList(  # pylint: disable=too-many-public-methods
+        Collection, Reversible, metaclass=ABCMeta
+):
     """
     The abstract class of Linked List
+
+    The length of a linked list is kept in a size counter updated by every method
+    changing the structure of the linked list. When `debug` is set to True, on the
+    class or on an instance, the counter is checked against a real traversal every time
+    the length is requested, so code editing the nodes directly can be caught.
+
+    A linked list created with `indexed=True` keeps a hash index from every value to
+    the nodes holding it, updated by every method adding, removing or replacing nodes,
+    so `search`, `search_iter`, `contains_value` and `__contains__` run in Ο(1) or Ο(k)
+    instead of scanning. The values must be hashable, the matching nodes are found in
+    the order they were added, and a value changed directly on a node, instead of by
+    `replace`, is not seen by the index.
+
+    A linked list can be iterated with `async for` inside an event loop, control is
+    given back to the event loop every `async_batch_size` nodes, so walking a long
+    linked list does not block the other coroutines.
+
+    A linked list is pickled as the flat sequence of its values and linked again when
+    unpickled, so a linked list of any length can be pickled, copied by `copy`, or sent
+    to another process; `to_bytes` uses pickle protocol 5, with which numeric values
+    are packed into one buffer that can be sent out-of-band.
     """
 
-    def __init__(self, *args):
+    debug: bool = False
+
+    # the number of nodes iterated by `async for` between two yields to the event loop
+    async_batch_size: int = 256
+
+    def __init__(self, *args, indexed: bool = False):
         """
 
         :param args:
+        :param indexed: Keep a hash index from values to nodes
+        :type indexed: bool
         """
         self.head: Optional[Node] = None
+        self._tail: Optional[Node] = None
+        self._size: int = 0
+        self._index: Optional[Dict[Any, Dict[Node, None]]] = {} if indexed else None
         self._init(*args)
 
-    @abstractmethod
     def _init(self, *args) -> None:
         """
         Initial this linked list with the given arguments
@@ -67,6 +228,243 @@ class LinkedList(Collection, Reversible, metaclass=ABCMeta):
         :return:
         :rtype: None
         """
+        self.extend(args)
+
+    @classmethod
+    def from_iterable(
+            cls: Type[_LinkedList], iterable: Iterable[Any], **kwargs
+    ) -> _LinkedList:
+        """
+        Create a linked list from the given iterable, which is consumed lazily, so a
+        generator of any length can be used without unpacking it into arguments
+
+        :param iterable:
+        :type iterable: Iterable[Any]
+        :param kwargs: The keyword arguments of the linked list class, e.g. `indexed`
+        :return:
+        :rtype: LinkedList
+        """
+        linked_list = cls(**kwargs)
+        linked_list.extend(iterable)
+        return linked_list
+
+    def _pickle_kwargs(self) -> Dict[str, Any]:
+        """
+        The keyword arguments to create an empty linked list like this one when
+        unpickled
+
+        :return:
+        :rtype: Dict[str, Any]
+        """
+        return {"indexed": True} if self._index is not None else {}
+
+    def _pickle_values(self, protocol: int) -> Any:
+        """
+        The values of this linked list in link order, packed to be pickled
+
+        :param protocol:
+        :type protocol: int
+        :return:
+        :rtype: Any
+        """
+        return _pack_values(list(self.values()), protocol)
+
+    def __reduce_ex__(self, protocol: int) -> Tuple[Callable, Tuple[Any, ...]]:
+        """
+        Pickle this linked list as the flat sequence of its values instead of the graph
+        of its nodes, which pickle would follow recursively along `next` up to the
+        recursion limit; the nodes are linked again when unpickled, so the nodes of the
+        copy are new ones, and `copy.copy` and `copy.deepcopy` create a new linked list
+
+        Complexity:
+          - Space: Θ(n), Ο(n), Ω(n)
+          - Time: Θ(n), Ο(n), Ω(n)
+
+        :param protocol:
+        :type protocol: int
+        :return:
+        :rtype: Tuple[Callable, Tuple[Any, ...]]
+        """
+        return (
+            _unpickle,
+            (type(self), self._pickle_values(protocol), self._pickle_kwargs()),
+        )
+
+    def to_bytes(
+            self, buffer_callback: Optional[Callable[[pickle.PickleBuffer], Any]] = None
+    ) -> bytes:
+        """
+        Serialize this linked list with pickle protocol 5; numeric values, all int or
+        all float, are packed into one buffer, which is passed to the given callback to
+        be sent out-of-band without being copied into the bytes returned, or written
+        in-band if no callback is given
+
+        Complexity:
+          - Space: Θ(n), Ο(n), Ω(n)
+          - Time: Θ(n), Ο(n), Ω(n)
+
+        :param buffer_callback: Called with every buffer sent out-of-band, e.g.
+                                `buffers.append`
+        :type buffer_callback: Optional[Callable[[pickle.PickleBuffer], Any]]
+        :return:
+        :rtype: bytes
+        """
+        return pickle.dumps(self, protocol=5, buffer_callback=buffer_callback)
+
+    @classmethod
+    def from_bytes(
+            cls: Type[_LinkedList],
+            data: Any,
+            buffers: Optional[Iterable[Any]] = None,
+    ) -> _LinkedList:
+        """
+        Deserialize a linked list serialized by `to_bytes`
+
+        Complexity:
+          - Space: Θ(n), Ο(n), Ω(n)
+          - Time: Θ(n), Ο(n), Ω(n)
+
+        :param data: The bytes returned by `to_bytes`
+        :type data: Any
+        :param buffers: The buffers sent out-of-band, in the order they were passed to
+                        the callback
+        :type buffers: Optional[Iterable[Any]]
+        :return:
+        :rtype: LinkedList
+        :raise TypeError: If the data is not a linked list of this class
+        """
+        linked_list: Any = pickle.loads(data, buffers=buffers)
+        if not isinstance(linked_list, cls):
+            raise TypeError(
+                f"the data is a {type(linked_list).__name__}, not a {cls.__name__}"
+            )
+        return linked_list
+
+    @property
+    def indexed(self) -> bool:
+        """
+        Whether this linked list keeps a hash index from values to nodes
+
+        :return:
+        :rtype: bool
+        """
+        return self._index is not None
+
+    def _index_add(self, node: Node) -> None:
+        """
+        Add the given node to the hash index, this method must be called before the
+        node is linked, so an unhashable value leaves this linked list unchanged
+
+        :param node:
+        :type node: Node
+        :return:
+        :rtype: None
+        """
+        self._index.setdefault(node.value, {})[node] = None
+
+    def _index_discard(self, node: Node) -> None:
+        """
+        Remove the given node from the hash index
+
+        :param node:
+        :type node: Node
+        :return:
+        :rtype: None
+        """
+        bucket: Dict[Node, None] = self._index[node.value]
+        del bucket[node]
+        if not bucket:
+            del self._index[node.value]
+
+    def _index_lookup(self, value: Any) -> List[Node]:
+        """
+        Return a copy of the nodes holding the given value in the hash index
+
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: List[Node]
+        """
+        try:
+            return list(self._index.get(value, ()))
+        except TypeError:  # an unhashable value cannot be in the index
+            return []
+
+    def _take(
+            self: _LinkedList, other: _LinkedList
+    ) -> Tuple[Optional[Node], Optional[Node], int]:
+        """
+        Take all nodes of the given linked list, which is left empty, the nodes are
+        added to the hash index of this linked list if there is one, and their head,
+        tail and number are returned to be linked by the caller
+
+        :param other:
+        :type other: LinkedList
+        :return: The head, the tail and the number of the nodes taken
+        :rtype: Tuple[Optional[Node], Optional[Node], int]
+        :raise TypeError: If the given linked list is not of the same kind
+        :raise ValueError: If the given linked list is this linked list
+        :raise LinkedListReadOnlyError: If the given linked list is frozen
+        """
+        if not (isinstance(other, type(self)) or isinstance(self, type(other))):
+            raise TypeError(
+                f"cannot concatenate {type(other).__name__} to {type(self).__name__}"
+            )
+        if other is self:
+            raise ValueError("cannot concatenate a linked list to itself")
+        if getattr(other, "frozen", False):  # a frozen linked list cannot be emptied
+            raise LinkedListReadOnlyError(f"{type(other).__name__} is frozen")
+
+        if self._index is not None:
+            indexed: List[Node] = []
+            try:
+                for node in other:
+                    self._index_add(node)
+                    indexed.append(node)
+            except TypeError:  # an unhashable value, leave both linked lists unchanged
+                for node in indexed:
+                    self._index_discard(node)
+                raise
+
+        # both linked lists are of the same kind, the state of the other one is moved
+        # pylint: disable=protected-access
+        taken: Tuple[Optional[Node], Optional[Node], int] = (
+            other.head,
+            other._tail,
+            other._size,
+        )
+        other.head = other._tail = None
+        other._size = 0
+        if other._index is not None:
+            other._index = {}
+        return taken
+
+    def _split_off(
+            self: _LinkedList, head: Optional[Node], tail: Optional[Node], size: int
+    ) -> _LinkedList:
+        """
+        Create a linked list of the same type from the given nodes, which are already
+        unlinked from this linked list, and move their entries of the hash index to it
+
+        :param head:
+        :type head: Optional[Node]
+        :param tail:
+        :type tail: Optional[Node]
+        :param size:
+        :type size: int
+        :return:
+        :rtype: LinkedList
+        """
+        linked_list = type(self)(indexed=self._index is not None)
+        # the linked list is created of the type of this one, its state is set here
+        # pylint: disable=protected-access
+        linked_list.head, linked_list._tail, linked_list._size = head, tail, size
+        self._size -= size
+        if self._index is not None:
+            for node in linked_list:
+                self._index_discard(node)
+                linked_list._index_add(node)
+        return linked_list
 
     def __bool__(self) -> bool:
         """
@@ -84,6 +482,12 @@ class LinkedList(Collection, Reversible, metaclass=ABCMeta):
         :return:
         :rtype: bool
         """
+        if self._index is not None:
+            try:
+                return item in self._index.get(item.value, ())
+            except (AttributeError, TypeError):  # not a node, or an unhashable value
+                return False
+
         for node in self:
             if item is node:
                 return True
@@ -98,17 +502,37 @@ class LinkedList(Collection, Reversible, metaclass=ABCMeta):
         :return:
         """
 
+    def __aiter__(self) -> AsyncGenerator[Node, None]:
+        """
+        Return an asynchronous iterator of this linked list, see `async_iter`
+
+        :return:
+        :rtype: AsyncGenerator[Node, None]
+        """
+        return self.async_iter()
+
     def __len__(self) -> int:
         """
         Return the length of this linked list
 
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1), or Θ(n) in debug mode
+
         :return:
         :rtype: int
-        """
-        length = 0
-        for _ in self:
-            length += 1
-        return length
+        :raise LinkedListSizeError: In debug mode, if the size counter does not match
+                                    the number of nodes
+        """
+        if self.debug:
+            length = 0
+            for _ in self:
+                length += 1
+            if length != self._size:
+                raise LinkedListSizeError(
+                    f"size counter is {self._size}, but {length} nodes are linked"
+                )
+        return self._size
 
     @abstractmethod
     def __reversed__(self):
@@ -121,17 +545,17 @@ class LinkedList(Collection, Reversible, metaclass=ABCMeta):
     @property
     def tail(self) -> Optional[Node]:
         """
-        The tail node of this singly linked list
+        The tail node of this linked list, the reference is kept up to date by all
+        methods changing the structure of this linked list
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1)
 
         :return:
         :rtype: Optional[Node}
         """
-        node: Optional[Node] = None
-
-        for node in self:
-            pass
-
-        return node
+        return self._tail
 
     @abstractmethod
     def append(self, value: Any) -> None:
@@ -143,6 +567,23 @@ class LinkedList(Collection, Reversible, metaclass=ABCMeta):
         :rtype: None
         """
 
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """
+        Append the values of the given iterable after the tail of this linked list
+
+        Complexity:
+          - Space: Θ(k), Ο(k), Ω(k)
+          - Time: Θ(k), Ο(k), Ω(k)
+
+        :param iterable:
+        :type iterable: Iterable[Any]
+        :return:
+        :rtype: None
+        """
+        append = self.append
+        for value in iterable:
+            append(value)
+
     def is_head(self, node: Node) -> bool:
         """
         Check if the given node is the head of this singly linked list
@@ -183,6 +624,166 @@ class LinkedList(Collection, Reversible, metaclass=ABCMeta):
         :rtype: Optional[Node]
         """
 
+    def replace(self, old: Any, new: Any, max_: Optional[int] = None) -> None:
+        """
+        In-place replace the node old value with the given new one
+
+        Complexity:
+          - Space: Θ(n), Ο(n), Ω(1)
+          - Time: Θ(n), Ο(n), Ω(1), or Θ(k) with the hash index and no max_
+
+        :param old: The old value to be replaced
+        :type old: Any
+        :param new: The new value to replace the old one
+        :type new: Any
+        :param max_: if max is not provided all of nodes equaled to old will be changed to new
+        :type max_: Optional[int]
+        :return: This method is a in-place change and returns None
+        :rtype: None
+        """
+        if self._index is not None and max_ is None:
+            for node in self._index_lookup(old):
+                self._index_discard(node)
+                node.value = new
+                self._index_add(node)
+            return
+
+        for node in self:
+            if max_ == 0:
+                break
+
+            if node.value == old:
+                if self._index is not None:
+                    self._index_discard(node)
+                    node.value = new
+                    self._index_add(node)
+                else:
+                    node.value = new
+
+            if max_ is None:
+                continue
+            else:
+                max_ -= 1
+
+    def replace_many(
+            self, mapping: Mapping[Any, Any], max_: Optional[int] = None
+    ) -> None:
+        """
+        In-place replace the values of the nodes found in the given mapping with the
+        values they are mapped to, in one pass with a dict lookup per node, so a value
+        is replaced at most once even if it is mapped to another key of the mapping
+
+        Complexity:
+          - Space: Θ(1), or Θ(k) with the hash index and no max_
+          - Time: Θ(n), or Θ(m + k) with the hash index and no max_, m is the size of
+            the mapping and k the number of the nodes replaced
+
+        :param mapping: The mapping from old values to new values
+        :type mapping: Mapping[Any, Any]
+        :param max_: if max is not provided all of nodes are checked, otherwise only the
+                     first max_ nodes
+        :type max_: Optional[int]
+        :return: This method is a in-place change and returns None
+        :rtype: None
+        """
+        if self._index is not None and max_ is None:
+            # look all nodes up before replacing, a new value may be another old value
+            replacements: List[Tuple[Node, Any]] = [
+                (node, new)
+                for old, new in mapping.items()
+                for node in self._index_lookup(old)
+            ]
+            for node, new in replacements:
+                self._index_discard(node)
+                node.value = new
+                self._index_add(node)
+            return
+
+        get = mapping.get
+        for node in self:
+            if max_ == 0:
+                break
+            if max_ is not None:
+                max_ -= 1
+
+            try:
+                new: Any = get(node.value, _MISSING)
+            except TypeError:  # an unhashable value cannot be in the mapping
+                continue
+            if new is _MISSING:
+                continue
+
+            if self._index is not None:
+                self._index_discard(node)
+                node.value = new
+                self._index_add(node)
+            else:
+                node.value = new
+
+    def replace_if(
+            self, predicate: Callable[[Any], bool], func: Callable[[Any], Any]
+    ) -> None:
+        """
+        In-place replace the value of every node matching the given predicate with the
+        value returned by func for it, in one pass
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(n), Ο(n), Ω(n)
+
+        :param predicate: The function checking a value to be replaced
+        :type predicate: Callable[[Any], bool]
+        :param func: The function returning the new value for an old value
+        :type func: Callable[[Any], Any]
+        :return: This method is a in-place change and returns None
+        :rtype: None
+        """
+        for node in self:
+            if predicate(node.value):
+                if self._index is not None:
+                    self._index_discard(node)
+                    node.value = func(node.value)
+                    self._index_add(node)
+                else:
+                    node.value = func(node.value)
+
+    @abstractmethod
+    def remove_if(self, predicate: Callable[[Any], bool]) -> int:
+        """
+        Remove all nodes whose value the given predicate returns True for, in one pass
+
+        :param predicate:
+        :type predicate: Callable[[Any], bool]
+        :return: The number of nodes removed
+        :rtype: int
+        """
+
+    def remove_values(self, values: Iterable[Any]) -> int:
+        """
+        Remove all nodes holding any of the given values, in one pass with a set lookup
+        per node
+
+        Complexity:
+          - Space: Θ(m), m is the number of the given values
+          - Time: Θ(m + n)
+
+        :param values: The hashable values to be removed
+        :type values: Iterable[Any]
+        :return: The number of nodes removed
+        :rtype: int
+        """
+        targets: Set[Any] = set(values)
+        if not targets:
+            return 0
+
+        def predicate(value: Any) -> bool:
+            try:
+                return value in targets
+            except TypeError:  # an unhashable value cannot be in the set
+                return False
+
+        return self.remove_if(predicate)
+
     @abstractmethod
     def reverse(self) -> None:
         """
@@ -199,13 +800,31 @@ class LinkedList(Collection, Reversible, metaclass=ABCMeta):
         :return:
         :rtype: Optional[Node]
         """
-
-        for node in self:
-            if node.value == value:
-                return node
+        for node in self.search_iter(value):
+            return node
 
         return None
 
+    def contains_value(self, value: Any) -> bool:
+        """
+        Check if any node of this linked list holds the given value
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1) with the hash index, otherwise Θ(n), Ο(n), Ω(1)
+
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: bool
+        """
+        if self._index is not None:
+            try:
+                return value in self._index
+            except TypeError:  # an unhashable value cannot be in the index
+                return False
+        return self.search(value) is not None
+
     @abstractmethod
     def search_iter(self, value: Any):
         """
@@ -214,3 +833,46 @@ class LinkedList(Collection, Reversible, metaclass=ABCMeta):
         :type value: Any
         :return:
         """
+
+    def values(self) -> Generator[Any, None, None]:
+        """
+        Iterate the values of this linked list without the node wrapper
+
+        :return:
+        :rtype: Generator[Any, None, None]
+        """
+        for node in self:
+            yield node.value
+
+    async def async_iter(
+            self, batch_size: Optional[int] = None
+    ) -> AsyncGenerator[Node, None]:
+        """
+        Iterate the nodes of this linked list asynchronously, control is given back to
+        the event loop after every batch of nodes; the nodes are iterated by `__iter__`,
+        so the other coroutines can change this linked list between two batches as far
+        as the iteration of the linked list allows a change while iterating
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(n), Ο(n), Ω(n), with n / batch_size yields to the event loop
+
+        :param batch_size: The number of nodes between two yields to the event loop,
+                           `async_batch_size` if not provided
+        :type batch_size: Optional[int]
+        :return:
+        :rtype: AsyncGenerator[Node, None]
+        :raise ValueError: If the batch size is less than 1
+        """
+        if batch_size is None:
+            batch_size = self.async_batch_size
+        if batch_size < 1:
+            raise ValueError(f"batch size must be at least 1, not {batch_size}")
+
+        count: int = 0
+        for node in self:
+            yield node
+            count += 1
+            if count == batch_size:
+                count = 0
+                await asyncio.sleep(0)
@@ -0,0 +1,448 @@
+"""
+The linked list keeping its nodes in parallel arrays instead of node objects
+
+ * Array Singly Linked List
+"""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Reversible
+from typing import Any, Callable, Dict, Generator, List, Optional
+
+from data_structures.exceptions import LinkedListIndexError
+from data_structures.linked_list import LinkedList
+from data_structures.linked_list.nodes import ArrayNode, SinglyNode
+
+NIL: int = -1
+
+
+class ArraySinglyLinkedList(LinkedList, Reversible):
+    """
+    The singly linked list with the same methods as SinglyLinkedList, but the values
+    and the next links of all nodes are kept in two parallel arrays:
+
+    * `value_slots` - a list of the values
+    * `next_slots` - an array of signed 64-bit integers, the index of the next slot, or
+      -1 for the tail
+
+    The slots of removed nodes are chained into a free list through `next_slots` and
+    reused by the following inserts, so the arrays only grow when there is no free slot.
+    The nodes returned by this linked list are ArrayNode handles to the slots.
+    """
+
+    def __init__(  # pylint: disable=super-init-not-called
+            self, *args, indexed: bool = False, capacity: int = 0
+    ):
+        """
+
+        :param args:
+        :param indexed: Keep a hash index from values to nodes
+        :type indexed: bool
+        :param capacity: The number of slots to preallocate
+        :type capacity: int
+        """
+        self.value_slots: List[Any] = [None] * capacity
+        self.next_slots: array = array("q", range(1, capacity + 1))
+        if capacity:
+            self.next_slots[-1] = NIL
+
+        self.head_index: int = NIL
+        self.tail_index: int = NIL
+        self.free_index: int = 0 if capacity else NIL
+        self._size: int = 0
+        self._index: Optional[Dict[Any, Dict[ArrayNode, None]]] = (
+            {} if indexed else None
+        )
+
+        self._init(*args)
+
+    def __bool__(self) -> bool:
+        """
+        if this linked list is empty return False, otherwise return True
+
+        :return:
+        :rtype: bool
+        """
+        return self.head_index != NIL
+
+    def __contains__(self, item) -> bool:
+        """
+        Check if the given node handle refers to a slot in use by this linked list
+
+        :param item:
+        :return:
+        :rtype: bool
+        """
+        if not isinstance(item, ArrayNode) or item.linked_list is not self:
+            return False
+
+        next_slots: array = self.next_slots
+        cursor: int = self.head_index
+        while cursor != NIL:
+            if cursor == item.index:
+                return True
+            cursor = next_slots[cursor]
+        return False
+
+    def __iter__(self) -> Generator[ArrayNode, None, None]:
+        """
+        Iterate the nodes of this linked list, the next slot is fetched before the
+        current node is yielded
+
+        :return:
+        :rtype: Generator[ArrayNode, None, None]
+        """
+        next_slots: array = self.next_slots
+        cursor: int = self.head_index
+        while cursor != NIL:
+            next_: int = int(next_slots[cursor])
+            yield ArrayNode(self, cursor)
+            cursor = next_
+
+    def __reversed__(self) -> Generator[ArrayNode, None, None]:
+        """
+        Iterate the nodes of this linked list from the tail, the indices of the nodes
+        are collected into an array of machine integers first
+
+        :return:
+        :rtype: Generator[ArrayNode, None, None]
+        """
+        indices: array = array("q")
+        next_slots: array = self.next_slots
+        cursor: int = self.head_index
+        while cursor != NIL:
+            indices.append(cursor)
+            cursor = next_slots[cursor]
+
+        for index in reversed(indices):
+            yield ArrayNode(self, index)
+
+    @property
+    def head(self) -> Optional[ArrayNode]:
+        """
+        The head node of this linked list
+
+        :return:
+        :rtype: Optional[ArrayNode]
+        """
+        return None if self.head_index == NIL else ArrayNode(self, self.head_index)
+
+    @property
+    def tail(self) -> Optional[ArrayNode]:
+        """
+        The tail node of this linked list
+
+        :return:
+        :rtype: Optional[ArrayNode]
+        """
+        return None if self.tail_index == NIL else ArrayNode(self, self.tail_index)
+
+    def _allocate(self, value: Any) -> int:
+        """
+        Take a slot from the free list, or grow the arrays if there is no free slot,
+        and add the slot to the hash index if there is one
+
+        :param value:
+        :type value: Any
+        :return: The index of the slot
+        :rtype: int
+        """
+        index: int = self.free_index
+        if index == NIL:
+            index = len(self.value_slots)
+            self.value_slots.append(value)
+            self.next_slots.append(NIL)
+        else:
+            self.free_index = int(self.next_slots[index])
+            self.value_slots[index] = value
+            self.next_slots[index] = NIL
+
+        if self._index is not None:
+            try:
+                self._index_add(ArrayNode(self, index))
+            except TypeError:  # an unhashable value, give the slot back
+                self._release(index)
+                raise
+        return index
+
+    def _release(self, index: int) -> None:
+        """
+        Put the given slot back to the free list
+
+        :param index:
+        :type index: int
+        :return:
+        :rtype: None
+        """
+        self.value_slots[index] = None
+        self.next_slots[index] = self.free_index
+        self.free_index = index
+
+    def append(self, value: Any) -> None:
+        """
+        Append a node after the tail of this linked list
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1) amortized
+
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: None
+        """
+        index: int = self._allocate(value)
+        if self.tail_index == NIL:
+            self.head_index = index
+        else:
+            self.next_slots[self.tail_index] = index
+        self.tail_index = index
+        self._size += 1
+
+    def insert_after(self, value: Any, node: Optional[ArrayNode] = None) -> None:
+        """
+        If after_node is not provided, the given value will be insert to the beginning
+        of this linked list
+
+        :param value:
+        :type value: Any
+        :param node:
+        :type node: Optional[ArrayNode]
+        :return:
+        :rtype: None
+        """
+        index: int = self._allocate(value)
+        if node:
+            self.next_slots[index] = self.next_slots[node.index]
+            self.next_slots[node.index] = index
+            if node.index == self.tail_index:
+                self.tail_index = index
+        else:
+            self.next_slots[index] = self.head_index
+            self.head_index = index
+            if self.tail_index == NIL:
+                self.tail_index = index
+        self._size += 1
+
+    def is_head(self, node: ArrayNode) -> bool:
+        """
+        Check if the given node is the head of this linked list
+
+        :param node:
+        :type node: ArrayNode
+        :return:
+        :rtype: bool
+        """
+        return node == self.head
+
+    def is_tail(self, node: ArrayNode) -> bool:
+        """
+        Check if the given node is the tail of this linked list
+
+        :param node:
+        :type node: ArrayNode
+        :return:
+        :rtype: bool
+        """
+        return node == self.tail
+
+    def pop(self) -> SinglyNode:
+        """
+        Pop the last node of this linked list, the slot is released and reused, so the
+        value is returned in a detached SinglyNode
+
+        :return:
+        :rtype: SinglyNode
+        """
+        if not self:
+            raise LinkedListIndexError
+
+        tail: int = self.tail_index
+        if self.head_index == tail:
+            self.head_index = self.tail_index = NIL
+        else:
+            next_slots: array = self.next_slots
+            cursor: int = self.head_index
+            while next_slots[cursor] != tail:
+                cursor = int(next_slots[cursor])
+            next_slots[cursor] = NIL
+            self.tail_index = cursor
+
+        node: SinglyNode = SinglyNode(self.value_slots[tail])
+        if self._index is not None:
+            self._index_discard(ArrayNode(self, tail))
+        self._release(tail)
+        self._size -= 1
+        return node
+
+    def remove_after(self, node: Optional[ArrayNode] = None) -> None:
+        """
+        Remove one node after the give node
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1)
+
+        :param node: If after_node is not provided, the first node of this linked list
+                     will be removed
+        :type node: Optional[ArrayNode]
+        :return:
+        :rtype: None
+        """
+        if not self:  # for empty linked list nothing happens
+            return
+
+        next_slots: array = self.next_slots
+        if node is None:  # remove the first node
+            index: int = self.head_index
+            self.head_index = int(next_slots[index])
+            if self.head_index == NIL:
+                self.tail_index = NIL
+        else:
+            index = int(next_slots[node.index])
+            if index == NIL:
+                # the give node is the last node in linked list, nothing is removed
+                return
+            next_slots[node.index] = next_slots[index]
+            if index == self.tail_index:
+                self.tail_index = node.index
+
+        if self._index is not None:
+            self._index_discard(ArrayNode(self, index))
+        self._release(index)
+        self._size -= 1
+
+    def remove_if(self, predicate: Callable[[Any], bool]) -> int:
+        """
+        Remove all nodes whose value the given predicate returns True for, in one pass,
+        the slots are released and reused
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(n), Ο(n), Ω(n)
+
+        :param predicate:
+        :type predicate: Callable[[Any], bool]
+        :return: The number of nodes removed
+        :rtype: int
+        """
+        value_slots = self.value_slots
+        next_slots = self.next_slots
+        previous: int = NIL
+        cursor: int = self.head_index
+        removed: int = 0
+        try:
+            while cursor != NIL:
+                next_: int = int(next_slots[cursor])
+                if predicate(value_slots[cursor]):
+                    if self._index is not None:
+                        self._index_discard(ArrayNode(self, cursor))
+                    if previous == NIL:
+                        self.head_index = next_
+                    else:
+                        next_slots[previous] = next_
+                    self._release(cursor)
+                    removed += 1
+                else:
+                    previous = cursor
+                cursor = next_
+            self.tail_index = previous
+        finally:  # keep the size counter right even if the predicate raises
+            self._size -= removed
+        return removed
+
+    def replace(self, old: Any, new: Any, max_: Optional[int] = None) -> None:
+        """
+        In-place replace the node old value with the given new one
+
+        :param old: The old value to be replaced
+        :type old: Any
+        :param new: The new value to replace the old one
+        :type new: Any
+        :param max_: if max is not provided all of nodes equaled to old will be changed to new
+        :type max_: Optional[int]
+        :return: This method is a in-place change and returns None
+        :rtype: None
+        """
+        if self._index is not None and max_ is None:
+            for node in self._index_lookup(old):
+                self._index_discard(node)
+                node.value = new
+                self._index_add(node)
+            return
+
+        value_slots: List[Any] = self.value_slots
+        next_slots: array = self.next_slots
+        cursor: int = self.head_index
+        while cursor != NIL:
+            if max_ == 0:
+                break
+
+            if value_slots[cursor] == old:
+                if self._index is not None:
+                    node: ArrayNode = ArrayNode(self, cursor)
+                    self._index_discard(node)
+                    value_slots[cursor] = new
+                    self._index_add(node)
+                else:
+                    value_slots[cursor] = new
+
+            if max_ is not None:
+                max_ -= 1
+
+            cursor = next_slots[cursor]
+
+    def reverse(self) -> None:
+        """
+        In-place reverse
+
+        :return:
+        :rtype: None
+        """
+        next_slots: array = self.next_slots
+        previous: int = NIL
+        cursor: int = self.head_index
+        while cursor != NIL:
+            next_: int = int(next_slots[cursor])
+            next_slots[cursor] = previous
+            previous, cursor = cursor, next_
+
+        self.head_index, self.tail_index = self.tail_index, self.head_index
+
+    def search_iter(self, value: Any) -> Generator[ArrayNode, None, None]:
+        """
+        Search for a given value, return a iterator
+
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: Generator[ArrayNode, None, None]
+        """
+        if self._index is not None:
+            yield from self._index_lookup(value)
+            return
+
+        value_slots: List[Any] = self.value_slots
+        next_slots: array = self.next_slots
+        cursor: int = self.head_index
+        while cursor != NIL:
+            if value_slots[cursor] == value:
+                next_: int = int(next_slots[cursor])
+                yield ArrayNode(self, cursor)
+                cursor = next_
+            else:
+                cursor = int(next_slots[cursor])
+
+    def values(self) -> Generator[Any, None, None]:
+        """
+        Iterate the values of this linked list without the node wrapper
+
+        :return:
+        :rtype: Generator[Any, None, None]
+        """
+        value_slots: List[Any] = self.value_slots
+        next_slots: array = self.next_slots
+        cursor: int = self.head_index
+        while cursor != NIL:
+            yield value_slots[cursor]
+            cursor = next_slots[cursor]
@@ -0,0 +1,1080 @@
+"""
+The caches built on the linked lists
+
+ * LRU Cache
+ * LFU Cache
+ * ARC Cache
+"""
+from __future__ import annotations
+
+import functools
+from abc import ABCMeta, abstractmethod
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Hashable,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from data_structures.linked_list.doubly import DoublyLinkedList
+from data_structures.linked_list.nodes import DoublyNode
+
+# the default of a lookup, a value no cache can hold
+_MISSING: Any = object()
+
+# the separator of the positional and the keyword arguments in a key
+_KWARGS_MARK: Tuple[Any, ...] = (object(),)
+
+
+class CacheInfo(NamedTuple):
+    """
+    The statistics of a cache, the same fields as the ones of `functools.lru_cache`
+    """
+
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+def _make_key(
+        args: Tuple[Any, ...], kwargs: Dict[str, Any], typed: bool
+) -> Tuple[Any, ...]:
+    """
+    Make the key of a call from its arguments, as `functools.lru_cache` does
+
+    :param args:
+    :type args: Tuple[Any, ...]
+    :param kwargs:
+    :type kwargs: Dict[str, Any]
+    :param typed: Cache the arguments of different types separately
+    :type typed: bool
+    :return:
+    :rtype: Tuple[Any, ...]
+    """
+    key: Tuple[Any, ...] = args
+    if kwargs:
+        key += _KWARGS_MARK + tuple(kwargs.items())
+    if typed:
+        key += tuple(type(value) for value in args)
+        key += tuple(type(value) for value in kwargs.values())
+    return key
+
+
+class Cache(metaclass=ABCMeta):
+    """
+    The abstract class of the caches, every cache keeps its entries in the nodes of
+    doubly linked lists, with a dict from the keys to the nodes, and decides which
+    entry to evict by its own policy
+
+    All caches count the hits and the misses of `get` and the evictions of `put`, see
+    `info` and `hit_ratio`, and decorate a function as `functools.lru_cache` does, see
+    `wrap`. A cache is not thread-safe, the calls of a decorated function sharing it
+    from several threads must hold a lock.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 128):
+        """
+
+        :param maxsize: The maximum size of this cache, or None for no limit
+        :type maxsize: Optional[int]
+        :raise ValueError: If the maximum size is negative
+        """
+        if maxsize is not None and maxsize < 0:
+            raise ValueError(f"maxsize must not be negative, got {maxsize}")
+
+        self._maxsize: Optional[int] = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def __repr__(self) -> str:
+        """
+
+        :return:
+        :rtype: str
+        """
+        return (
+            f"<{type(self).__name__} maxsize={self._maxsize} size={self.size} "
+            f"hits={self.hits} misses={self.misses} evictions={self.evictions}>"
+        )
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """
+        Return the number of entries in this cache
+
+        :return:
+        :rtype: int
+        """
+
+    @abstractmethod
+    def __contains__(self, key: Hashable) -> bool:
+        """
+        Check if the given key is cached, without counting a hit or a miss and without
+        changing the order of the entries
+
+        :param key:
+        :type key: Hashable
+        :return:
+        :rtype: bool
+        """
+
+    @abstractmethod
+    def __iter__(self) -> Generator[Hashable, None, None]:
+        """
+        Iterate the keys of this cache, the first to be evicted first
+
+        :return:
+        :rtype: Generator[Hashable, None, None]
+        """
+
+    @property
+    def maxsize(self) -> Optional[int]:
+        """
+        The maximum size of this cache, None for no limit
+
+        :return:
+        :rtype: Optional[int]
+        """
+        return self._maxsize
+
+    @property
+    def size(self) -> int:
+        """
+        The size of this cache, compared with the maximum size
+
+        :return:
+        :rtype: int
+        """
+        return len(self)
+
+    @property
+    def hit_ratio(self) -> float:
+        """
+        The ratio of the hits to the lookups by `get`, 0.0 before any lookup
+
+        :return:
+        :rtype: float
+        """
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def info(self) -> CacheInfo:
+        """
+        Return the statistics of this cache
+
+        :return:
+        :rtype: CacheInfo
+        """
+        return CacheInfo(self.hits, self.misses, self._maxsize, len(self))
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the value of the given key and record the use of the key, or the
+        default if the key is not cached; a hit or a miss is counted
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1)
+
+        :param key:
+        :type key: Hashable
+        :param default:
+        :type default: Any
+        :return:
+        :rtype: Any
+        """
+        value: Any = self._get(key)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    @abstractmethod
+    def _get(self, key: Hashable) -> Any:
+        """
+        Return the value of the given key and record the use of the key by the policy
+        of this cache, or `_MISSING` if the key is not cached
+
+        :param key:
+        :type key: Hashable
+        :return:
+        :rtype: Any
+        """
+
+    @abstractmethod
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the value of the given key, or the default if the key is not cached,
+        without counting a hit or a miss and without changing the order of the entries
+
+        :param key:
+        :type key: Hashable
+        :param default:
+        :type default: Any
+        :return:
+        :rtype: Any
+        """
+
+    @abstractmethod
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Cache the value of the given key, evicting the entries chosen by the policy of
+        this cache if it is full
+
+        :param key:
+        :type key: Hashable
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: None
+        """
+
+    @abstractmethod
+    def pop(self, key: Hashable, default: Any = _MISSING) -> Any:
+        """
+        Remove the given key from this cache and return its value, e.g. to invalidate
+        an entry, without counting an eviction
+
+        :param key:
+        :type key: Hashable
+        :param default: The value returned if the key is not cached
+        :type default: Any
+        :return:
+        :rtype: Any
+        :raise KeyError: If the key is not cached and no default is given
+        """
+
+    @abstractmethod
+    def _clear(self) -> None:
+        """
+        Remove all entries of this cache
+
+        :return:
+        :rtype: None
+        """
+
+    def clear(self) -> None:
+        """
+        Remove all entries of this cache and reset the statistics
+
+        :return:
+        :rtype: None
+        """
+        self._clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def wrap(self, function: Callable[..., Any], typed: bool = False) -> Callable:
+        """
+        Wrap the given function to cache its results in this cache, keyed by the
+        arguments, which must be hashable, as `functools.lru_cache` does; the wrapper
+        has the attributes of the one of `functools.lru_cache`:
+
+        * `cache_info()` and `cache_clear()`, from `info` and `clear`
+        * `cache_parameters()`, the maximum size and `typed`
+
+        and some more to look into and to change the cache:
+
+        * `cache` - this cache
+        * `invalidate(*args, **kwargs)` - remove the result of the given arguments,
+          return whether one was cached
+
+        :param function:
+        :type function: Callable[..., Any]
+        :param typed: Cache the arguments of different types separately, e.g. 1 and 1.0
+        :type typed: bool
+        :return:
+        :rtype: Callable
+        """
+
+        def wrapper(*args, **kwargs) -> Any:
+            key: Tuple[Any, ...] = (
+                _make_key(args, kwargs, typed) if kwargs or typed else args
+            )
+            value: Any = self.get(key, _MISSING)
+            if value is _MISSING:
+                value = function(*args, **kwargs)
+                self.put(key, value)
+            return value
+
+        def invalidate(*args, **kwargs) -> bool:
+            key: Tuple[Any, ...] = _make_key(args, kwargs, typed)
+            if key not in self:
+                return False
+            self.pop(key)
+            return True
+
+        wrapper.cache = self
+        wrapper.cache_info = self.info
+        wrapper.cache_clear = self.clear
+        wrapper.cache_parameters = lambda: {"maxsize": self._maxsize, "typed": typed}
+        wrapper.invalidate = invalidate
+        return functools.update_wrapper(wrapper, function)
+
+    def __call__(self, function: Callable[..., Any]) -> Callable:
+        """
+        Decorate the given function with this cache, see `wrap`
+
+        :param function:
+        :type function: Callable[..., Any]
+        :return:
+        :rtype: Callable
+        """
+        return self.wrap(function)
+
+
+class LRUCache(Cache):
+    """
+    A least recently used cache, built on DoublyLinkedList and a dict
+
+    Every entry is held by a node of a doubly linked list, from the least recently used
+    at the head to the most recently used at the tail, and the dict maps the keys to
+    the nodes; a hit moves the node to the tail and an eviction pops the head, so
+    `get`, `put` and `pop` run in Ο(1) whatever the number of entries.
+
+    The size of the cache is the number of its entries, or the sum of the weights of
+    its values if a `weigher` is given, e.g. `len` or `sys.getsizeof`; the least
+    recently used entries are evicted until the size is at most `maxsize`, and a value
+    weighing more than `maxsize` is not cached.
+
+    A scan of more keys than `maxsize`, each used once, evicts all entries, see
+    LFUCache and ARCCache for the caches resisting it.
+    """
+
+    def __init__(
+            self,
+            maxsize: Optional[int] = 128,
+            weigher: Optional[Callable[[Any], int]] = None,
+    ):
+        """
+
+        :param maxsize: The maximum size of this cache, or None for no limit
+        :type maxsize: Optional[int]
+        :param weigher: Return the weight of a value, every value weighs 1 if not
+                        provided
+        :type weigher: Optional[Callable[[Any], int]]
+        :raise ValueError: If the maximum size is negative
+        """
+        super().__init__(maxsize)
+        self._weigher: Optional[Callable[[Any], int]] = weigher
+        self._weight: int = 0
+        # the entries are (key, value, weight) tuples, the least recently used first
+        self._entries: DoublyLinkedList = DoublyLinkedList()
+        self._nodes: Dict[Hashable, DoublyNode] = {}
+
+    def __len__(self) -> int:
+        """
+        Return the number of entries in this cache
+
+        :return:
+        :rtype: int
+        """
+        return len(self._nodes)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """
+        Check if the given key is cached, without counting a hit or a miss and without
+        changing the order of the entries
+
+        :param key:
+        :type key: Hashable
+        :return:
+        :rtype: bool
+        """
+        return key in self._nodes
+
+    def __iter__(self) -> Generator[Hashable, None, None]:
+        """
+        Iterate the keys of this cache from the least recently used
+
+        :return:
+        :rtype: Generator[Hashable, None, None]
+        """
+        for entry in self._entries.values():
+            yield entry[0]
+
+    @property
+    def size(self) -> int:
+        """
+        The size of this cache, the number of entries, or the sum of the weights of the
+        values if a weigher is given
+
+        :return:
+        :rtype: int
+        """
+        return self._weight
+
+    def _get(self, key: Hashable) -> Any:
+        """
+        Return the value of the given key and mark it as the most recently used
+
+        :param key:
+        :type key: Hashable
+        :return:
+        :rtype: Any
+        """
+        node: Optional[DoublyNode] = self._nodes.get(key)
+        if node is None:
+            return _MISSING
+        self._entries.move_to_end(node)
+        return node.value[1]
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the value of the given key, or the default if the key is not cached,
+        without counting a hit or a miss and without changing the order of the entries
+
+        :param key:
+        :type key: Hashable
+        :param default:
+        :type default: Any
+        :return:
+        :rtype: Any
+        """
+        node: Optional[DoublyNode] = self._nodes.get(key)
+        return default if node is None else node.value[1]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Cache the value of the given key as the most recently used, then evict the least
+        recently used entries until the size is at most the maximum size
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1), amortized over the evictions
+
+        :param key:
+        :type key: Hashable
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: None
+        :raise ValueError: If the weigher returns a negative weight
+        """
+        weight: int = 1 if self._weigher is None else self._weigher(value)
+        if weight < 0:
+            raise ValueError(f"a weight must not be negative, got {weight}")
+
+        if self._maxsize is not None and weight > self._maxsize:
+            self.pop(key, None)  # the value cached before is stale
+            return
+
+        node: Optional[DoublyNode] = self._nodes.get(key)
+        if node is not None:
+            self._weight -= node.value[2]
+            node.value = (key, value, weight)
+            self._entries.move_to_end(node)
+        elif self._weigher is None and len(self._nodes) == self._maxsize:
+            # the cache is full, the node of the entry evicted is reused for this one
+            node = self._entries.head
+            del self._nodes[node.value[0]]
+            self._weight -= 1
+            self.evictions += 1
+            node.value = (key, value, weight)
+            self._nodes[key] = node
+            self._entries.move_to_end(node)
+        else:
+            self._entries.append((key, value, weight))
+            self._nodes[key] = self._entries.tail
+        self._weight += weight
+
+        if self._maxsize is not None:
+            while self._weight > self._maxsize:
+                self._evict()
+
+    def _evict(self) -> None:
+        """
+        Evict the least recently used entry
+
+        :return:
+        :rtype: None
+        """
+        key, _, weight = self._entries.popleft().value
+        del self._nodes[key]
+        self._weight -= weight
+        self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = _MISSING) -> Any:
+        """
+        Remove the given key from this cache and return its value, e.g. to invalidate
+        an entry, without counting an eviction
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1)
+
+        :param key:
+        :type key: Hashable
+        :param default: The value returned if the key is not cached
+        :type default: Any
+        :return:
+        :rtype: Any
+        :raise KeyError: If the key is not cached and no default is given
+        """
+        node: Optional[DoublyNode] = self._nodes.pop(key, None)
+        if node is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        self._entries.remove_node(node)
+        self._weight -= node.value[2]
+        return node.value[1]
+
+    def _clear(self) -> None:
+        """
+        Remove all entries of this cache
+
+        :return:
+        :rtype: None
+        """
+        self._entries = DoublyLinkedList()
+        self._nodes.clear()
+        self._weight = 0
+
+
+class LFUCache(Cache):
+    """
+    A least frequently used cache, built on DoublyLinkedList and a dict, with the Ο(1)
+    frequency buckets of Shah, Mitra and Matani
+
+    The buckets are the nodes of a doubly linked list, in increasing order of
+    frequency, and every bucket holds a doubly linked list of the entries used that
+    many times, the least recently used first; a hit moves the entry to the bucket of
+    the next frequency, created after its bucket if missing, and an eviction pops the
+    least recently used entry of the first bucket, so `get`, `put` and `pop` run in
+    Ο(1) whatever the number of entries. The nodes of the entries are moved between
+    the buckets, not created again.
+
+    The keys of a scan are used once, so they stay in the bucket of frequency 1 and are
+    evicted before the entries used more often. The frequencies never decrease, so the
+    entries once popular stay until they are removed by `pop` or `clear`.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 128):
+        """
+
+        :param maxsize: The maximum number of entries, or None for no limit
+        :type maxsize: Optional[int]
+        :raise ValueError: If the maximum size is negative
+        """
+        super().__init__(maxsize)
+        # the buckets are (frequency, entries) tuples, the entries are (key, value,
+        # bucket) tuples
+        self._buckets: DoublyLinkedList = DoublyLinkedList()
+        self._nodes: Dict[Hashable, DoublyNode] = {}
+
+    def __len__(self) -> int:
+        """
+        Return the number of entries in this cache
+
+        :return:
+        :rtype: int
+        """
+        return len(self._nodes)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """
+        Check if the given key is cached, without counting a hit or a miss and without
+        changing the frequency of the key
+
+        :param key:
+        :type key: Hashable
+        :return:
+        :rtype: bool
+        """
+        return key in self._nodes
+
+    def __iter__(self) -> Generator[Hashable, None, None]:
+        """
+        Iterate the keys of this cache from the least frequently used, the least
+        recently used first among the keys of the same frequency
+
+        :return:
+        :rtype: Generator[Hashable, None, None]
+        """
+        for _, entries in self._buckets.values():
+            for entry in entries.values():
+                yield entry[0]
+
+    def frequency(self, key: Hashable) -> int:
+        """
+        Return the number of uses of the given key since it was cached, 0 if the key is
+        not cached
+
+        :param key:
+        :type key: Hashable
+        :return:
+        :rtype: int
+        """
+        node: Optional[DoublyNode] = self._nodes.get(key)
+        return 0 if node is None else node.value[2].value[0]
+
+    def _touch(self, node: DoublyNode, value: Any) -> None:
+        """
+        Move the node of the given entry to the bucket of the next frequency, with the
+        given value
+
+        :param node:
+        :type node: DoublyNode
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: None
+        """
+        key, _, bucket = node.value
+        frequency, entries = bucket.value
+        next_bucket: Optional[DoublyNode] = bucket.next
+        if next_bucket is None or next_bucket.value[0] != frequency + 1:
+            if len(entries) == 1:  # the entry is alone, its bucket is moved up
+                bucket.value = (frequency + 1, entries)
+                node.value = (key, value, bucket)
+                return
+            self._buckets.insert_after((frequency + 1, DoublyLinkedList()), bucket)
+            next_bucket = bucket.next
+
+        entries.remove_node(node)
+        if not entries:
+            self._buckets.remove_node(bucket)
+        node.value = (key, value, next_bucket)
+        next_entries: DoublyLinkedList = next_bucket.value[1]
+        next_entries.insert_after(node, next_entries.tail)
+
+    def _get(self, key: Hashable) -> Any:
+        """
+        Return the value of the given key and count one more use of it
+
+        :param key:
+        :type key: Hashable
+        :return:
+        :rtype: Any
+        """
+        node: Optional[DoublyNode] = self._nodes.get(key)
+        if node is None:
+            return _MISSING
+        value: Any = node.value[1]
+        self._touch(node, value)
+        return value
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the value of the given key, or the default if the key is not cached,
+        without counting a hit or a miss and without changing the frequency of the key
+
+        :param key:
+        :type key: Hashable
+        :param default:
+        :type default: Any
+        :return:
+        :rtype: Any
+        """
+        node: Optional[DoublyNode] = self._nodes.get(key)
+        return default if node is None else node.value[1]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Cache the value of the given key, a key already cached counts one more use, a
+        new key is cached with a frequency of 1 after the least recently used entry of
+        the first bucket is evicted if this cache is full
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1)
+
+        :param key:
+        :type key: Hashable
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: None
+        """
+        node: Optional[DoublyNode] = self._nodes.get(key)
+        if node is not None:
+            self._touch(node, value)
+            return
+        if self._maxsize == 0:
+            return
+        if len(self._nodes) == self._maxsize:
+            self._evict()
+
+        bucket: Optional[DoublyNode] = self._buckets.head
+        if bucket is None or bucket.value[0] != 1:
+            self._buckets.insert_after((1, DoublyLinkedList()))
+            bucket = self._buckets.head
+        entries: DoublyLinkedList = bucket.value[1]
+        entries.append((key, value, bucket))
+        self._nodes[key] = entries.tail
+
+    def _evict(self) -> None:
+        """
+        Evict the least recently used entry of the least frequently used ones
+
+        :return:
+        :rtype: None
+        """
+        bucket: DoublyNode = self._buckets.head
+        entries: DoublyLinkedList = bucket.value[1]
+        del self._nodes[entries.popleft().value[0]]
+        if not entries:
+            self._buckets.popleft()
+        self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = _MISSING) -> Any:
+        """
+        Remove the given key from this cache and return its value, e.g. to invalidate
+        an entry, without counting an eviction
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1)
+
+        :param key:
+        :type key: Hashable
+        :param default: The value returned if the key is not cached
+        :type default: Any
+        :return:
+        :rtype: Any
+        :raise KeyError: If the key is not cached and no default is given
+        """
+        node: Optional[DoublyNode] = self._nodes.pop(key, None)
+        if node is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        _, value, bucket = node.value
+        entries: DoublyLinkedList = bucket.value[1]
+        entries.remove_node(node)
+        if not entries:
+            self._buckets.remove_node(bucket)
+        return value
+
+    def _clear(self) -> None:
+        """
+        Remove all entries of this cache
+
+        :return:
+        :rtype: None
+        """
+        self._buckets = DoublyLinkedList()
+        self._nodes.clear()
+
+
+class ARCCache(Cache):  # pylint: disable=too-many-instance-attributes
+    """
+    An adaptive replacement cache, the ARC of Megiddo and Modha, built on
+    DoublyLinkedList and a dict
+
+    The entries used once since they were cached are kept in the recency list, the
+    entries used again in the frequency list, both from the least recently used, and
+    the keys evicted from them, without their values, in a ghost list each; a hit moves
+    the entry to the end of the frequency list, and a key put again while in a ghost
+    list goes to the frequency list and moves the target size of the recency list,
+    `target`, toward the list which would have hit. The least recently used entry of
+    the recency list is evicted while the list is longer than its target, otherwise the
+    one of the frequency list.
+
+    The keys of a scan are used once, so they pass through the recency list, while the
+    entries used again stay in the frequency list. The four lists are doubly linked
+    lists and one dict maps the keys to their nodes in any of them, so `get`, `put` and
+    `pop` run in Ο(1); the ghost lists keep up to `maxsize` keys more.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        """
+
+        :param maxsize: The maximum number of entries
+        :type maxsize: int
+        :raise ValueError: If the maximum size is None or negative
+        """
+        if maxsize is None:
+            raise ValueError(f"{type(self).__name__} needs a maximum size")
+        super().__init__(maxsize)
+        # the target size of the recency list, between 0 and the maximum size
+        self._target: float = 0.0
+        # the entries are (key, value, list) tuples, the value of a ghost is None
+        self._recent: DoublyLinkedList = DoublyLinkedList()
+        self._frequent: DoublyLinkedList = DoublyLinkedList()
+        self._recent_ghosts: DoublyLinkedList = DoublyLinkedList()
+        self._frequent_ghosts: DoublyLinkedList = DoublyLinkedList()
+        self._nodes: Dict[Hashable, DoublyNode] = {}
+
+    def __len__(self) -> int:
+        """
+        Return the number of entries in this cache, the ghosts are not counted
+
+        :return:
+        :rtype: int
+        """
+        return len(self._recent) + len(self._frequent)
+
+    def _cached(self, node: Optional[DoublyNode]) -> bool:
+        """
+        Check if the given node, of the dict, holds an entry and not a ghost
+
+        :param node:
+        :type node: Optional[DoublyNode]
+        :return:
+        :rtype: bool
+        """
+        return node is not None and (
+            node.value[2] is self._recent or node.value[2] is self._frequent
+        )
+
+    def __contains__(self, key: Hashable) -> bool:
+        """
+        Check if the given key is cached, without counting a hit or a miss and without
+        changing the order of the entries
+
+        :param key:
+        :type key: Hashable
+        :return:
+        :rtype: bool
+        """
+        return self._cached(self._nodes.get(key))
+
+    def __iter__(self) -> Generator[Hashable, None, None]:
+        """
+        Iterate the keys of the recency list and then of the frequency list, both from
+        the least recently used
+
+        :return:
+        :rtype: Generator[Hashable, None, None]
+        """
+        for entries in (self._recent, self._frequent):
+            for entry in entries.values():
+                yield entry[0]
+
+    @property
+    def target(self) -> float:
+        """
+        The target size of the recency list, adapted by the keys found in the ghost
+        lists
+
+        :return:
+        :rtype: float
+        """
+        return self._target
+
+    def _move(self, node: DoublyNode, entries: DoublyLinkedList, value: Any) -> None:
+        """
+        Move the given node to the end of the given list, with the given value
+
+        :param node:
+        :type node: DoublyNode
+        :param entries:
+        :type entries: DoublyLinkedList
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: None
+        """
+        key, _, source = node.value
+        node.value = (key, value, entries)
+        if source is entries:
+            entries.move_to_end(node)
+        else:
+            source.remove_node(node)
+            entries.insert_after(node, entries.tail)
+
+    def _drop(self, entries: DoublyLinkedList) -> None:
+        """
+        Forget the least recently used key of the given list
+
+        :param entries:
+        :type entries: DoublyLinkedList
+        :return:
+        :rtype: None
+        """
+        del self._nodes[entries.popleft().value[0]]
+
+    def _replace(self, frequent_ghost: bool) -> None:
+        """
+        Evict the least recently used entry of the recency list if it is longer than
+        its target, otherwise the one of the frequency list, the key is kept in the
+        ghost list of the list
+
+        :param frequent_ghost: Whether the key being put is in the frequency ghost list
+        :type frequent_ghost: bool
+        :return:
+        :rtype: None
+        """
+        recent: int = len(self._recent)
+        if recent and (
+                recent > self._target
+                or (frequent_ghost and recent == self._target)
+                or not self._frequent
+        ):
+            self._move(self._recent.head, self._recent_ghosts, None)
+        else:
+            self._move(self._frequent.head, self._frequent_ghosts, None)
+        self.evictions += 1
+
+    def _get(self, key: Hashable) -> Any:
+        """
+        Return the value of the given key and move it to the end of the frequency list
+
+        :param key:
+        :type key: Hashable
+        :return:
+        :rtype: Any
+        """
+        node: Optional[DoublyNode] = self._nodes.get(key)
+        if not self._cached(node):
+            return _MISSING
+        value: Any = node.value[1]
+        self._move(node, self._frequent, value)
+        return value
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the value of the given key, or the default if the key is not cached,
+        without counting a hit or a miss and without changing the order of the entries
+
+        :param key:
+        :type key: Hashable
+        :param default:
+        :type default: Any
+        :return:
+        :rtype: Any
+        """
+        node: Optional[DoublyNode] = self._nodes.get(key)
+        return node.value[1] if self._cached(node) else default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Cache the value of the given key: a key cached or in a ghost list goes to the
+        end of the frequency list, a key in a ghost list adapts the target size of the
+        recency list first, and a new key goes to the end of the recency list; an entry
+        is evicted if this cache is full, and the oldest ghost dropped if the ghost
+        lists are full
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1)
+
+        :param key:
+        :type key: Hashable
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: None
+        """
+        maxsize: int = self._maxsize
+        if not maxsize:
+            return
+
+        node: Optional[DoublyNode] = self._nodes.get(key)
+        if node is not None:
+            entries: DoublyLinkedList = node.value[2]
+            if entries is self._recent_ghosts:
+                self._target = min(
+                    maxsize,
+                    self._target
+                    + max(len(self._frequent_ghosts) / len(self._recent_ghosts), 1),
+                )
+            elif entries is self._frequent_ghosts:
+                self._target = max(
+                    0,
+                    self._target
+                    - max(len(self._recent_ghosts) / len(self._frequent_ghosts), 1),
+                )
+            if not self._cached(node) and len(self) >= maxsize:
+                self._replace(entries is self._frequent_ghosts)
+            self._move(node, self._frequent, value)
+            return
+
+        # the keys of the recency lists, and of all lists
+        recent: int = len(self._recent) + len(self._recent_ghosts)
+        total: int = recent + len(self._frequent) + len(self._frequent_ghosts)
+        if recent >= maxsize:
+            if len(self._recent) < maxsize:
+                self._drop(self._recent_ghosts)
+                if len(self) >= maxsize:
+                    self._replace(False)
+            else:  # the recency list fills this cache, no ghost is kept
+                self._drop(self._recent)
+                self.evictions += 1
+        elif total >= maxsize:
+            if total >= 2 * maxsize:
+                self._drop(self._frequent_ghosts)
+            if len(self) >= maxsize:
+                self._replace(False)
+
+        self._recent.append((key, value, self._recent))
+        self._nodes[key] = self._recent.tail
+
+    def pop(self, key: Hashable, default: Any = _MISSING) -> Any:
+        """
+        Remove the given key from this cache and return its value, e.g. to invalidate
+        an entry, without counting an eviction and without keeping a ghost
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1)
+
+        :param key:
+        :type key: Hashable
+        :param default: The value returned if the key is not cached
+        :type default: Any
+        :return:
+        :rtype: Any
+        :raise KeyError: If the key is not cached and no default is given
+        """
+        node: Optional[DoublyNode] = self._nodes.get(key)
+        if not self._cached(node):
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        del self._nodes[key]
+        _, value, entries = node.value
+        entries.remove_node(node)
+        return value
+
+    def _clear(self) -> None:
+        """
+        Remove all entries and all ghosts of this cache
+
+        :return:
+        :rtype: None
+        """
+        self._target = 0.0
+        self._recent = DoublyLinkedList()
+        self._frequent = DoublyLinkedList()
+        self._recent_ghosts = DoublyLinkedList()
+        self._frequent_ghosts = DoublyLinkedList()
+        self._nodes.clear()
+
+
+def lru_cache(
+        maxsize: Any = 128,
+        typed: bool = False,
+        weigher: Optional[Callable[[Any], int]] = None,
+) -> Any:
+    """
+    Decorate a function with a new LRUCache, a drop-in replacement of
+    `functools.lru_cache`, used as `@lru_cache`, `@lru_cache()` or
+    `@lru_cache(maxsize, typed)`, see `Cache.wrap` for the attributes of the wrapper
+
+    :param maxsize: The maximum size of the cache, None for no limit, or the function
+                    decorated if used as `@lru_cache`
+    :type maxsize: Any
+    :param typed: Cache the arguments of different types separately, e.g. 1 and 1.0
+    :type typed: bool
+    :param weigher: Return the weight of a result, every result weighs 1 if not
+                    provided
+    :type weigher: Optional[Callable[[Any], int]]
+    :return: The wrapper, or the decorator if the function is not given
+    :rtype: Any
+    """
+    if callable(maxsize):  # used as @lru_cache
+        return LRUCache().wrap(maxsize, typed)
+
+    def decorator(function: Callable[..., Any]) -> Callable:
+        return LRUCache(maxsize, weigher).wrap(function, typed)
+
+    return decorator
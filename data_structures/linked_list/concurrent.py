@@ -0,0 +1,1083 @@
+"""
+The linked lists safe to share between threads, with a lock on every node
+
+ * Concurrent Singly Linked List
+ * Concurrent Doubly Linked List
+"""
+from __future__ import annotations
+
+import functools
+import threading
+from contextlib import contextmanager, nullcontext
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from data_structures.exceptions import LinkedListIndexError
+from data_structures.linked_list import LinkedList
+from data_structures.linked_list.doubly import DoublyLinkedList
+from data_structures.linked_list.nodes import (
+    DoublyNode,
+    LockedDoublyNode,
+    LockedSinglyNode,
+    SinglyNode,
+)
+from data_structures.linked_list.singly import SinglyLinkedList
+
+_LockedNode = Union[LockedSinglyNode, LockedDoublyNode]
+_Method = TypeVar("_Method", bound=Callable[..., Any])
+
+
+def _exclusive(method: _Method) -> _Method:
+    """
+    Wrap the given method of a linked list to run with the locks of all nodes held, for
+    the operations changing the whole linked list at once
+
+    :param method:
+    :type method: Callable
+    :return:
+    :rtype: Callable
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.locked():
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class _LockCoupling(LinkedList):  # pylint: disable=abstract-method
+    """
+    The locking shared by the concurrent linked lists
+
+    Every node carries a lock guarding its links, and `head` is guarded by a lock of
+    the linked list standing for the node before the head. The locks are always taken
+    from the head towards the tail, so no two threads wait for each other:
+
+    * inserting or removing after a node takes the lock of that node and of the node
+      removed, so threads changing different regions run in parallel
+    * `search`, `pop` and `remove_if` walk hand over hand, the lock of the next node is
+      taken before the lock of the current node is released, so no node is inserted
+      or removed between them while they are compared
+    * the iterations take the lock of one node at a time to read its link and hold no
+      lock while yielding; a node removed meanwhile keeps its link, so the iteration
+      carries on in the linked list
+    * the tail is guarded by the lock of the tail node, or of the head when this linked
+      list is empty, the size counter and the hash index by locks of their own
+    * a new node is added to the hash index once it is linked, before its lock is
+      released, so a node found in the index is in this linked list, see `_publishing`
+    * the operations changing the whole linked list, such as `reverse` and `concat`,
+      run with the locks of all nodes held, see `locked`
+
+    The locks are re-entrant, so a thread holding them can still call any operation.
+    """
+
+    node_class: Type[_LockedNode]
+
+    def __init__(self, *args, indexed: bool = False):
+        """
+
+        :param args:
+        :param indexed: Keep a hash index from values to nodes
+        :type indexed: bool
+        """
+        self._head_lock: threading.RLock = threading.RLock()
+        self._size_lock: threading.Lock = threading.Lock()
+        self._index_lock: threading.Lock = threading.Lock()
+        super().__init__(*args, indexed=indexed)
+
+    def _resize(self, delta: int) -> None:
+        """
+        Add the given number to the size counter
+
+        :param delta:
+        :type delta: int
+        :return:
+        :rtype: None
+        """
+        with self._size_lock:
+            self._size += delta
+
+    def _index_add(self, node: _LockedNode) -> None:
+        """
+        Add the given node to the hash index, with the lock of the index held
+
+        :param node:
+        :type node: Union[LockedSinglyNode, LockedDoublyNode]
+        :return:
+        :rtype: None
+        """
+        with self._index_lock:
+            super()._index_add(node)
+
+    def _index_discard(self, node: _LockedNode) -> None:
+        """
+        Remove the given node from the hash index, with the lock of the index held
+
+        :param node:
+        :type node: Union[LockedSinglyNode, LockedDoublyNode]
+        :return:
+        :rtype: None
+        """
+        with self._index_lock:
+            super()._index_discard(node)
+
+    def _index_lookup(self, value: Any) -> List[_LockedNode]:
+        """
+        Return a copy of the nodes holding the given value in the hash index, with the
+        lock of the index held
+
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: List[Union[LockedSinglyNode, LockedDoublyNode]]
+        """
+        with self._index_lock:
+            return super()._index_lookup(value)
+
+    def _link(self, previous: _LockedNode, node: _LockedNode) -> None:
+        """
+        Link the given node after the given previous node, neither of them is shared
+
+        :param previous:
+        :type previous: Union[LockedSinglyNode, LockedDoublyNode]
+        :param node:
+        :type node: Union[LockedSinglyNode, LockedDoublyNode]
+        :return:
+        :rtype: None
+        """
+        previous.next = node
+
+    def _chain(
+            self, iterable: Iterable[Any]
+    ) -> Tuple[Optional[_LockedNode], Optional[_LockedNode], int]:
+        """
+        Link the values of the given iterable into a chain of new nodes, not shared
+        until it is linked into this linked list, see `_publishing`
+
+        :param iterable:
+        :type iterable: Iterable[Any]
+        :return: The head, the tail and the number of the nodes
+        :rtype: Tuple[Optional[_LockedNode], Optional[_LockedNode], int]
+        """
+        node_class: Type[_LockedNode] = self.node_class
+        head: Optional[_LockedNode] = None
+        tail: Optional[_LockedNode] = None
+        size: int = 0
+        for value in iterable:
+            node: _LockedNode = node_class(value)
+            if tail is None:
+                head = node
+            else:
+                self._link(tail, node)
+            tail = node
+            size += 1
+        return head, tail, size
+
+    @contextmanager
+    def _publishing(
+            self, head: _LockedNode, size: int
+    ) -> Generator[None, None, None]:
+        """
+        Hold the locks of the given number of new nodes from the given head while they
+        are linked into this linked list, and add them to the hash index if there is
+        one before the locks are released
+
+        The index gives the nodes out to other threads without any lock, so a node is
+        only indexed once it is linked, and no thread changes the links around the new
+        nodes before they are indexed. The values are hashed before the nodes are
+        linked, so an unhashable value leaves this linked list unchanged.
+
+        :param head:
+        :type head: Union[LockedSinglyNode, LockedDoublyNode]
+        :param size:
+        :type size: int
+        :return:
+        :rtype: Generator[None, None, None]
+        :raise TypeError: If a value is unhashable
+        """
+        if self._index is None:
+            yield
+            return
+
+        nodes: List[_LockedNode] = []
+        try:
+            node: _LockedNode = head
+            for _ in range(size):
+                node.lock.acquire()
+                nodes.append(node)
+                hash(node.value)
+                node = node.next
+            yield
+            for node in nodes:
+                self._index_add(node)
+        finally:
+            for node in reversed(nodes):
+                node.lock.release()
+
+    @contextmanager
+    def _tail_locked(self) -> Generator[Optional[_LockedNode], None, None]:
+        """
+        Hold the lock guarding the tail, the lock of the tail node or of the head if
+        this linked list is empty, and give the tail, which stays the tail until the
+        lock is released
+
+        :return:
+        :rtype: Generator[Optional[_LockedNode], None, None]
+        """
+        while True:
+            tail: Optional[_LockedNode] = self._tail
+            with self._head_lock if tail is None else tail.lock:
+                if tail is self._tail:
+                    yield tail
+                    return
+
+    @contextmanager
+    def locked(self) -> Generator[None, None, None]:
+        """
+        Hold the locks of all nodes of this linked list, taken from the head, so the
+        operations of this thread run alone in this linked list until the context
+        exits, and the operations of other threads wait
+
+        Complexity:
+          - Space: Θ(n)
+          - Time: Θ(n)
+
+        :return:
+        :rtype: Generator[None, None, None]
+        """
+        locks: List[Any] = [self._head_lock]
+        self._head_lock.acquire()  # pylint: disable=consider-using-with
+        try:
+            node: Optional[_LockedNode] = self.head
+            while node is not None:
+                node.lock.acquire()
+                locks.append(node.lock)
+                node = node.next
+            yield
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    def __iter__(self) -> Generator[_LockedNode, None, None]:
+        """
+        Iterate the nodes of this linked list, the next node is read under the lock of
+        the current node before the current node is yielded
+
+        :return:
+        :rtype: Generator[_LockedNode, None, None]
+        """
+        with self._head_lock:
+            node: Optional[_LockedNode] = self.head
+        while node is not None:
+            with node.lock:
+                next_: Optional[_LockedNode] = node.next
+            yield node
+            node = next_
+
+    def values(self) -> Generator[Any, None, None]:
+        """
+        Iterate the values of this linked list without the node wrapper
+
+        :return:
+        :rtype: Generator[Any, None, None]
+        """
+        for node in self:
+            yield node.value
+
+    def search(self, value: Any) -> Optional[_LockedNode]:
+        """
+        Search for a given value hand over hand, return immediately when the first node
+        is found
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(n), Ο(n), Ω(1), or Θ(1) with the hash index
+
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: Optional[_LockedNode]
+        """
+        if self._index is not None:
+            for node in self._index_lookup(value):
+                return node
+            return None
+
+        lock: Any = self._head_lock
+        lock.acquire()  # pylint: disable=consider-using-with
+        try:
+            node: Optional[_LockedNode] = self.head
+            while node is not None:
+                node.lock.acquire()
+                lock.release()
+                lock = node.lock
+                if node.value == value:
+                    return node
+                node = node.next
+            return None
+        finally:
+            lock.release()
+
+    def search_iter(self, value: Any) -> Generator[_LockedNode, None, None]:
+        """
+        Search for a given value, return a iterator
+
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: Generator[_LockedNode, None, None]
+        """
+        if self._index is not None:
+            yield from self._index_lookup(value)
+            return
+
+        for node in self:
+            if node.value == value:
+                yield node
+
+    def concat(self, other: LinkedList) -> None:
+        """
+        Move all nodes of the given concurrent linked list after the tail of this one,
+        with the locks of all nodes of both linked lists held; the two linked lists are
+        locked in a fixed order, so concatenating them into each other at the same time
+        does not deadlock
+
+        :param other:
+        :type other: LinkedList
+        :return:
+        :rtype: None
+        :raise TypeError: If the given linked list is not of the same kind
+        :raise ValueError: If the given linked list is this linked list
+        """
+        if not isinstance(other, _LockCoupling):
+            raise TypeError(
+                f"cannot concat {type(other).__name__} to {type(self).__name__}"
+            )
+
+        first, second = sorted((self, other), key=id)
+        with first.locked(), second.locked():
+            super().concat(other)  # pylint: disable=no-member
+
+    def remove_values(self, values: Iterable[Any]) -> int:
+        """
+        Remove all nodes holding any of the given values, in one pass hand over hand
+        with a set lookup per node
+
+        :param values: The hashable values to be removed
+        :type values: Iterable[Any]
+        :return: The number of nodes removed
+        :rtype: int
+        """
+        return LinkedList.remove_values(self, values)
+
+
+class ConcurrentSinglyLinkedList(_LockCoupling, SinglyLinkedList):
+    """
+    The singly linked list safe to share between threads, every node has a lock of its
+    own, so threads inserting and removing in different regions of the linked list run
+    in parallel instead of waiting for one lock of the whole linked list, see
+    `_LockCoupling` for the locking
+
+    The nodes are LockedSinglyNode, or a subclass set as `node_class`.
+    """
+
+    node_class: Type[LockedSinglyNode] = LockedSinglyNode
+
+    def append(self, value: Any) -> None:
+        """
+        Append a node after the tail of this singly linked list, with the lock of the
+        tail held
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1)
+
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: None
+        """
+        self._check_frozen()
+        node: LockedSinglyNode = self.node_class(value)
+        with self._tail_locked() as tail, self._publishing(node, 1):
+            if tail is None:
+                self.head = node
+            else:
+                tail.next = node
+            self._tail = node
+        self._resize(1)
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """
+        Append the values of the given iterable after the tail of this singly linked
+        list, the nodes are linked into a chain first, and the chain is linked after
+        the tail at once
+
+        Complexity:
+          - Space: Θ(k), Ο(k), Ω(k)
+          - Time: Θ(k), Ο(k), Ω(k)
+
+        :param iterable:
+        :type iterable: Iterable[Any]
+        :return:
+        :rtype: None
+        """
+        self._check_frozen()
+        head, tail, size = self._chain(iterable)
+        if head is None:
+            return
+
+        with self._tail_locked() as last, self._publishing(head, size):
+            if last is None:
+                self.head = head
+            else:
+                last.next = head
+            self._tail = tail
+        self._resize(size)
+
+    def insert_after(
+            self,
+            value: Union[LockedSinglyNode, Any],
+            node: Optional[LockedSinglyNode] = None,
+    ) -> None:
+        """
+        Insert the given value after the given node, with the lock of the node held, or
+        before the head if the node is not provided
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1)
+
+        :param value:
+        :type value: Union[LockedSinglyNode, Any]
+        :param node:
+        :type node: Optional[LockedSinglyNode]
+        :return:
+        :rtype: None
+        :raise TypeError: If the given value is a node without a lock
+        :raise LinkedListIndexError: If the given node has been removed
+        """
+        self._check_frozen()
+        if isinstance(value, SinglyNode):
+            if not isinstance(value, LockedSinglyNode):
+                raise TypeError(f"{type(value).__name__} has no lock")
+        else:
+            value = self.node_class(value)
+
+        lock: Any = self._head_lock if node is None else node.lock
+        with lock, self._publishing(value, 1):
+            if node is None:
+                value.next, self.head = self.head, value
+                if value.next is None:
+                    self._tail = value
+            elif node.unlinked:
+                raise LinkedListIndexError(f"{node!r} has been removed")
+            else:
+                value.next, node.next = node.next, value
+                if node is self._tail:
+                    self._tail = value
+            value.unlinked = False
+        self._resize(1)
+
+    def _remove_next(
+            self, node: Optional[LockedSinglyNode]
+    ) -> Optional[LockedSinglyNode]:
+        """
+        Remove the node after the given node, or the head if the node is not provided,
+        with the locks of both nodes held
+
+        :param node:
+        :type node: Optional[LockedSinglyNode]
+        :return: The node removed, or None if there is no node after the given node
+        :rtype: Optional[LockedSinglyNode]
+        :raise LinkedListIndexError: If the given node has been removed
+        """
+        with self._head_lock if node is None else node.lock:
+            if node is not None and node.unlinked:
+                raise LinkedListIndexError(f"{node!r} has been removed")
+            removed: Optional[LockedSinglyNode] = (
+                self.head if node is None else node.next
+            )
+            if removed is None:
+                return None
+
+            with removed.lock:
+                if node is None:
+                    self.head = removed.next
+                else:
+                    node.next = removed.next
+                if removed is self._tail:
+                    self._tail = node
+                removed.unlinked = True
+                if self._index is not None:
+                    self._index_discard(removed)
+        self._resize(-1)
+        return removed
+
+    def remove_after(self, node: Optional[LockedSinglyNode] = None) -> None:
+        """
+        Remove one node after the give node, with the locks of the given node and of the
+        node removed held
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1), or Θ(n) in debug mode
+
+        :param node: If after_node is not provided, the first node of this singly linked
+                     list will be removed
+        :type node: Optional[LockedSinglyNode]
+        :return:
+        :rtype: None
+        :raise LinkedListIndexError: If the given node has been removed, or in debug
+                                     mode, if it is not in this singly linked list
+        """
+        self._check_frozen()
+        if self.debug and node is not None and not any(node is node_ for node_ in self):
+            raise LinkedListIndexError(f"{node!r} is not in the singly linked list")
+        self._remove_next(node)
+
+    def pop(self) -> LockedSinglyNode:
+        """
+        Pop the last node of this singly linked list, walking to it hand over hand
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(n), Ο(n), Ω(n)
+
+        :return:
+        :rtype: LockedSinglyNode
+        """
+        self._check_frozen()
+        lock: Any = self._head_lock
+        lock.acquire()  # pylint: disable=consider-using-with
+        try:
+            node: Optional[LockedSinglyNode] = self.head
+            if node is None:
+                raise LinkedListIndexError
+
+            previous: Optional[LockedSinglyNode] = None
+            node.lock.acquire()
+            try:
+                while node.next is not None:
+                    next_: LockedSinglyNode = node.next
+                    next_.lock.acquire()
+                    lock.release()
+                    lock, previous, node = node.lock, node, next_
+
+                if previous is None:
+                    self.head = None
+                else:
+                    previous.next = None
+                self._tail = previous
+                node.unlinked = True
+                if self._index is not None:
+                    self._index_discard(node)
+            finally:
+                node.lock.release()
+        finally:
+            lock.release()
+
+        self._resize(-1)
+        return node
+
+    def remove_if(self, predicate: Callable[[Any], bool]) -> int:
+        """
+        Remove all nodes whose value the given predicate returns True for, in one pass
+        hand over hand, the predicate is called with the locks of the node and of the
+        node before it held
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(n), Ο(n), Ω(n)
+
+        :param predicate:
+        :type predicate: Callable[[Any], bool]
+        :return: The number of nodes removed
+        :rtype: int
+        """
+        self._check_frozen()
+        removed: int = 0
+        lock: Any = self._head_lock
+        lock.acquire()  # pylint: disable=consider-using-with
+        try:
+            previous: Optional[LockedSinglyNode] = None
+            node: Optional[LockedSinglyNode] = self.head
+            while node is not None:
+                with node.lock:
+                    next_: Optional[LockedSinglyNode] = node.next
+                    if predicate(node.value):
+                        if previous is None:
+                            self.head = next_
+                        else:
+                            previous.next = next_
+                        if node is self._tail:
+                            self._tail = previous
+                        node.unlinked = True
+                        if self._index is not None:
+                            self._index_discard(node)
+                        removed += 1
+                        node = next_
+                        continue
+                    # keep the lock of the node, it is the previous node from now on
+                    node.lock.acquire()
+                lock.release()
+                lock, previous, node = node.lock, node, next_
+        finally:
+            lock.release()
+            self._resize(-removed)
+        return removed
+
+    def reversed_iter(self, levels: int = 2) -> Generator[LockedSinglyNode, None, None]:
+        """
+        Iterate the nodes of this singly linked list from the tail, the nodes are
+        collected with the locks of all nodes held, then yielded without any lock
+
+        Complexity:
+          - Space: Θ(n)
+          - Time: Θ(levels * n)
+
+        :param levels: The number of levels to split this linked list
+        :type levels: int
+        :return:
+        :rtype: Generator[LockedSinglyNode, None, None]
+        """
+        with self.locked():
+            nodes: List[LockedSinglyNode] = list(super().reversed_iter(levels))
+        yield from nodes
+
+    split_after = _exclusive(SinglyLinkedList.split_after)
+    reverse = _exclusive(SinglyLinkedList.reverse)
+    replace = _exclusive(SinglyLinkedList.replace)
+    replace_many = _exclusive(SinglyLinkedList.replace_many)
+    replace_if = _exclusive(SinglyLinkedList.replace_if)
+
+
+class ConcurrentDoublyLinkedList(_LockCoupling, DoublyLinkedList):
+    """
+    The doubly linked list safe to share between threads, every node has a lock of its
+    own, so threads inserting and removing in different regions of the linked list run
+    in parallel instead of waiting for one lock of the whole linked list, see
+    `_LockCoupling` for the locking
+
+    The `previous` link of a node is changed with the locks of the node and of the node
+    before it held, so it is read under either of them. The nodes are
+    LockedDoublyNode, or a subclass set as `node_class`.
+    """
+
+    node_class: Type[LockedDoublyNode] = LockedDoublyNode
+
+    def _link(self, previous: LockedDoublyNode, node: LockedDoublyNode) -> None:
+        """
+        Link the given node after the given previous node, both ways
+
+        :param previous:
+        :type previous: LockedDoublyNode
+        :param node:
+        :type node: LockedDoublyNode
+        :return:
+        :rtype: None
+        """
+        previous.next, node.previous = node, previous
+
+    def __reversed__(self) -> Generator[LockedDoublyNode, None, None]:
+        """
+        Iterate the nodes of this doubly linked list from the tail, the previous node is
+        read under the lock of the current node before the current node is yielded
+
+        :return:
+        :rtype: Generator[LockedDoublyNode, None, None]
+        """
+        node: Optional[LockedDoublyNode] = self._tail
+        while node is not None:
+            with node.lock:
+                previous: Optional[LockedDoublyNode] = node.previous
+            yield node
+            node = previous
+
+    def append(self, value: Any) -> None:
+        """
+        Append a node after the tail of this doubly linked list, with the lock of the
+        tail held
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1)
+
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: None
+        """
+        node: LockedDoublyNode = self.node_class(value)
+        with self._tail_locked() as tail, self._publishing(node, 1):
+            if tail is None:
+                self.head = node
+            else:
+                tail.next, node.previous = node, tail
+            self._tail = node
+        self._resize(1)
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """
+        Append the values of the given iterable after the tail of this doubly linked
+        list, the nodes are linked into a chain first, and the chain is linked after
+        the tail at once
+
+        Complexity:
+          - Space: Θ(k), Ο(k), Ω(k)
+          - Time: Θ(k), Ο(k), Ω(k)
+
+        :param iterable:
+        :type iterable: Iterable[Any]
+        :return:
+        :rtype: None
+        """
+        head, tail, size = self._chain(iterable)
+        if head is None:
+            return
+
+        with self._tail_locked() as last, self._publishing(head, size):
+            if last is None:
+                self.head = head
+            else:
+                last.next, head.previous = head, last
+            self._tail = tail
+        self._resize(size)
+
+    def _insert_first(self, node: LockedDoublyNode) -> None:
+        """
+        Link the given node before the head, with the locks of the head held
+
+        :param node:
+        :type node: LockedDoublyNode
+        :return:
+        :rtype: None
+        """
+        with self._head_lock, self._publishing(node, 1):
+            head: Optional[LockedDoublyNode] = self.head
+            if head is None:
+                self.head = self._tail = node
+            else:
+                with head.lock:
+                    node.next, head.previous = head, node
+                    self.head = node
+            node.unlinked = False
+        self._resize(1)
+
+    def appendleft(self, value: Any) -> None:
+        """
+        Append a node before the head of this doubly linked list, with the locks of the
+        head held
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1)
+
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: None
+        """
+        self._insert_first(self.node_class(value))
+
+    def insert_after(
+            self,
+            value: Union[LockedDoublyNode, Any],
+            node: Optional[LockedDoublyNode] = None,
+    ) -> None:
+        """
+        Insert the given value after the given node, with the locks of the node and of
+        the node after it held, or before the head if the node is not provided
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1)
+
+        :param value:
+        :type value: Union[LockedDoublyNode, Any]
+        :param node:
+        :type node: Optional[LockedDoublyNode]
+        :return:
+        :rtype: None
+        :raise TypeError: If the given value is a node without a lock
+        :raise LinkedListIndexError: If the given node has been removed
+        """
+        if isinstance(value, DoublyNode):
+            if not isinstance(value, LockedDoublyNode):
+                raise TypeError(f"{type(value).__name__} has no lock")
+        else:
+            value = self.node_class(value)
+
+        if node is None:
+            self._insert_first(value)
+            return
+
+        with node.lock, self._publishing(value, 1):
+            if node.unlinked:
+                raise LinkedListIndexError(f"{node!r} has been removed")
+
+            next_: Optional[LockedDoublyNode] = node.next
+            with nullcontext() if next_ is None else next_.lock:
+                value.previous, value.next = node, next_
+                node.next = value
+                if next_ is None:
+                    self._tail = value
+                else:
+                    next_.previous = value
+            value.unlinked = False
+        self._resize(1)
+
+    def _remove_next(
+            self, node: Optional[LockedDoublyNode]
+    ) -> Optional[LockedDoublyNode]:
+        """
+        Remove the node after the given node, or the head if the node is not provided,
+        with the locks of the given node, of the node removed and of the node after it
+        held
+
+        :param node:
+        :type node: Optional[LockedDoublyNode]
+        :return: The node removed, or None if there is no node after the given node
+        :rtype: Optional[LockedDoublyNode]
+        :raise LinkedListIndexError: If the given node has been removed
+        """
+        with self._head_lock if node is None else node.lock:
+            if node is not None and node.unlinked:
+                raise LinkedListIndexError(f"{node!r} has been removed")
+            removed: Optional[LockedDoublyNode] = (
+                self.head if node is None else node.next
+            )
+            if removed is None:
+                return None
+
+            with removed.lock:
+                next_: Optional[LockedDoublyNode] = removed.next
+                with nullcontext() if next_ is None else next_.lock:
+                    if node is None:
+                        self.head = next_
+                    else:
+                        node.next = next_
+                    if next_ is None:
+                        self._tail = node
+                    else:
+                        next_.previous = node
+                removed.unlinked = True
+                if self._index is not None:
+                    self._index_discard(removed)
+        self._resize(-1)
+        return removed
+
+    def remove_after(self, node: Optional[LockedDoublyNode] = None) -> None:
+        """
+        Remove one node after the give node, with the locks of the given node, of the
+        node removed and of the node after it held
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1)
+
+        :param node: If after_node is not provided, the first node of this doubly linked
+                     list will be removed
+        :type node: Optional[LockedDoublyNode]
+        :return:
+        :rtype: None
+        :raise LinkedListIndexError: If the given node has been removed
+        """
+        self._remove_next(node)
+
+    def remove_node(self, node: LockedDoublyNode) -> None:
+        """
+        Remove the given node of this doubly linked list, the lock of the node before it
+        is taken first, and checked to be still linked to the node before the lock of
+        the node is taken, or the locks are taken again; the node before read without a
+        lock may have moved after the node, by reverse or rotate, so both locks are
+        only held in the order of the links
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1) without contention
+
+        :param node:
+        :type node: LockedDoublyNode
+        :return:
+        :rtype: None
+        :raise LinkedListIndexError: If the given node has been removed, or is not in
+                                     this doubly linked list, as the head or the tail
+                                     of another one
+        """
+        while True:
+            if node.unlinked:
+                raise LinkedListIndexError(f"{node!r} has been removed")
+            previous: Optional[LockedDoublyNode] = node.previous
+            with self._head_lock if previous is None else previous.lock:
+                if previous is None:
+                    if self.head is not node:
+                        # the node before the head is linked with the head lock held
+                        if node.previous is not None:
+                            continue
+                        if node.unlinked:
+                            raise LinkedListIndexError(f"{node!r} has been removed")
+                        raise LinkedListIndexError(
+                            f"{node!r} is not in this doubly linked list"
+                        )
+                elif previous.unlinked or previous.next is not node:
+                    continue
+
+                with node.lock:
+                    # the tail is changed with the lock of the tail node, held here
+                    if node.next is None and node is not self._tail:
+                        raise LinkedListIndexError(
+                            f"{node!r} is not in this doubly linked list"
+                        )
+                    self._remove_next(previous)
+                    return
+
+    def popleft(self) -> LockedDoublyNode:
+        """
+        Pop the first node of this doubly linked list
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1)
+
+        :return:
+        :rtype: LockedDoublyNode
+        """
+        node: Optional[LockedDoublyNode] = self._remove_next(None)
+        if node is None:  # this doubly linked list is empty
+            raise LinkedListIndexError
+        return node
+
+    def pop(self) -> LockedDoublyNode:
+        """
+        Pop the last node of this doubly linked list, with the locks of the node before
+        the tail and of the tail held; the node before the tail is read without a lock,
+        so it is checked to still be linked to the tail before the lock of the tail is
+        taken, or the locks are taken again
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1) without contention
+
+        :return:
+        :rtype: LockedDoublyNode
+        """
+        while True:
+            tail: Optional[LockedDoublyNode] = self._tail
+            if tail is None:
+                with self._head_lock:
+                    if self._tail is None:  # this doubly linked list is empty
+                        raise LinkedListIndexError
+                continue
+
+            previous: Optional[LockedDoublyNode] = tail.previous
+            with self._head_lock if previous is None else previous.lock:
+                if previous is None:
+                    if self.head is not tail:
+                        continue
+                elif previous.unlinked or previous.next is not tail:
+                    continue
+
+                with tail.lock:
+                    if tail.next is not None:  # a node has been appended
+                        continue
+                    if previous is None:
+                        self.head = None
+                    else:
+                        previous.next = None
+                    self._tail = previous
+                    tail.unlinked = True
+                    if self._index is not None:
+                        self._index_discard(tail)
+            self._resize(-1)
+            return tail
+
+    def remove_if(self, predicate: Callable[[Any], bool]) -> int:
+        """
+        Remove all nodes whose value the given predicate returns True for, in one pass
+        hand over hand, the predicate is called with the locks of the node and of the
+        node before it held
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(n), Ο(n), Ω(n)
+
+        :param predicate:
+        :type predicate: Callable[[Any], bool]
+        :return: The number of nodes removed
+        :rtype: int
+        """
+        removed: int = 0
+        lock: Any = self._head_lock
+        lock.acquire()  # pylint: disable=consider-using-with
+        try:
+            previous: Optional[LockedDoublyNode] = None
+            node: Optional[LockedDoublyNode] = self.head
+            while node is not None:
+                with node.lock:
+                    next_: Optional[LockedDoublyNode] = node.next
+                    if predicate(node.value):
+                        with nullcontext() if next_ is None else next_.lock:
+                            if previous is None:
+                                self.head = next_
+                            else:
+                                previous.next = next_
+                            if next_ is None:
+                                self._tail = previous
+                            else:
+                                next_.previous = previous
+                        node.unlinked = True
+                        if self._index is not None:
+                            self._index_discard(node)
+                        removed += 1
+                        node = next_
+                        continue
+                    # keep the lock of the node, it is the previous node from now on
+                    node.lock.acquire()
+                lock.release()
+                lock, previous, node = node.lock, node, next_
+        finally:
+            lock.release()
+            self._resize(-removed)
+        return removed
+
+    @_exclusive
+    def move_to_end(self, node: LockedDoublyNode, last: bool = True) -> None:
+        """
+        Move the given node to the tail of this doubly linked list, or to the head if
+        `last` is False, with the locks of all nodes held
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(n) to acquire the locks
+
+        :param node:
+        :type node: LockedDoublyNode
+        :param last: Move the node to the tail, otherwise to the head
+        :type last: bool
+        :return:
+        :rtype: None
+        :raise LinkedListIndexError: If the given node has been removed
+        """
+        if node.unlinked:
+            raise LinkedListIndexError(f"{node!r} has been removed")
+        DoublyLinkedList.move_to_end(self, node, last)
+
+    extendleft = _exclusive(DoublyLinkedList.extendleft)
+    rotate = _exclusive(DoublyLinkedList.rotate)
+    split_after = _exclusive(DoublyLinkedList.split_after)
+    reverse = _exclusive(DoublyLinkedList.reverse)
+    replace = _exclusive(DoublyLinkedList.replace)
+    replace_many = _exclusive(DoublyLinkedList.replace_many)
+    replace_if = _exclusive(DoublyLinkedList.replace_if)
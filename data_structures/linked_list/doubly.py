@@ -1,153 +1,545 @@
 from __future__ import annotations
 
-from collections.abc import Iterator, Reversible
-from typing import Any, Optional
+from collections.abc import Reversible
+from typing import Any, Callable, Dict, Generator, Iterable, Optional, Type, Union
 
 from data_structures.exceptions import LinkedListIndexError
 from data_structures.linked_list import LinkedList
 from data_structures.linked_list.nodes import DoublyNode
 
 
-class DoublyLinkedListIterator(Iterator):
+class DoublyLinkedList(LinkedList, Reversible):
     """
+    This is the doubly linked list, every node links to both its previous and next
+    nodes
 
+    The nodes are created from `node_class`, which can be overridden by a subclass to
+    use any other DoublyNode class
     """
 
-    def __init__(self, doubly_linked_list: DoublyLinkedList):
-        """
-
-        :param doubly_linked_list:
-        :type doubly_linked_list: DoublyLinkedList
-        """
-        self.doubly_linked_list = doubly_linked_list
-        self.current: Optional[DoublyNode] = self.doubly_linked_list.head
+    node_class: Type[DoublyNode] = DoublyNode
 
-    def __next__(self) -> DoublyNode:
+    def __iter__(self) -> Generator[DoublyNode, None, None]:
         """
+        Iterate the nodes of this doubly linked list, the next node is fetched before
+        the current one is yielded, so the current node can be relinked or removed
 
         :return:
-        :rtype: Node
+        :rtype: Generator[DoublyNode, None, None]
         """
-        if self.current is not None:
-            current: Optional[DoublyNode] = self.current
-            self.current = current.next
-            return current
-        else:
-            raise StopIteration
+        node: Optional[DoublyNode] = self.head
+        while node is not None:
+            next_: Optional[DoublyNode] = node.next
+            yield node
+            node = next_
 
+    def __reversed__(self) -> Generator[DoublyNode, None, None]:
+        """
+        Iterate the nodes of this doubly linked list from the tail, the previous node is
+        fetched before the current one is yielded
 
-class DoublyLinkedListReversedIterator(DoublyLinkedListIterator):
-    """
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1) to start, Θ(n) to iterate all nodes
 
-    """
-
-    def __init__(self, doubly_linked_list: DoublyLinkedList):
+        :return:
+        :rtype: Generator[DoublyNode, None, None]
         """
+        node: Optional[DoublyNode] = self._tail
+        while node is not None:
+            previous: Optional[DoublyNode] = node.previous
+            yield node
+            node = previous
 
-        :param doubly_linked_list:
-        :type doubly_linked_list: DoublyLinkedList
+    def append(self, value: Any) -> None:
         """
-        super().__init__(doubly_linked_list)
+        Append a node after the tail of this doubly linked list
 
-        node: Optional[DoublyNode] = None
-        for node in self.doubly_linked_list:
-            pass
-        else:
-            self.current = node
-
-    def __next__(self) -> DoublyNode:
-        """
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1)
 
+        :param value:
+        :type value: Any
         :return:
-        :rtype: DoublyNode
+        :rtype: None
         """
-        if self.current is not None:
-            current: Optional[DoublyNode] = self.current
-            self.current = current.previous
-            return current
+        node: DoublyNode = self.node_class(value)
+        if self._index is not None:
+            self._index_add(node)
+
+        if self:
+            node.previous, self._tail.next = self._tail, node
         else:
-            raise StopIteration
+            self.head = node
+        self._tail = node
+        self._size += 1
 
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """
+        Append the values of the given iterable after the tail of this doubly linked
+        list, the iterable is consumed lazily and the nodes are linked in one loop
 
-class DoublyLinkedListSearchIterator(DoublyLinkedListIterator):
-    """
+        Complexity:
+          - Space: Θ(k), Ο(k), Ω(k)
+          - Time: Θ(k), Ο(k), Ω(k)
 
-    """
-
-    def __init__(self, doubly_linked_list: DoublyLinkedList, value: Any):
+        :param iterable:
+        :type iterable: Iterable[Any]
+        :return:
+        :rtype: None
+        """
+        if self._index is not None:  # index every node before it is linked
+            LinkedList.extend(self, iterable)
+            return
+
+        node_class: Type[DoublyNode] = self.node_class
+        values = iter(iterable)
+        tail: Optional[DoublyNode] = self._tail
+        size: int = self._size
+
+        try:
+            if tail is None:
+                for value in values:
+                    self.head = tail = node_class(value)
+                    size += 1
+                    break
+            for value in values:
+                tail = node_class(value, tail)
+                size += 1
+        finally:  # keep this doubly linked list consistent if the iterable raises
+            self._tail = tail
+            self._size = size
+
+    def appendleft(self, value: Any) -> None:
         """
+        Append a node before the head of this doubly linked list
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1)
 
-        :param doubly_linked_list:
-        :type doubly_linked_list: SinglyLinkedList
         :param value:
         :type value: Any
+        :return:
+        :rtype: None
         """
-        super().__init__(doubly_linked_list)
-        self.value = value
+        node: DoublyNode = self.node_class(value)
+        if self._index is not None:
+            self._index_add(node)
 
-    def __next__(self) -> DoublyNode:
+        if self:
+            node.next, self.head.previous = self.head, node
+        else:
+            self._tail = node
+        self.head = node
+        self._size += 1
+
+    def extendleft(self, iterable: Iterable[Any]) -> None:
         """
+        Append the values of the given iterable before the head of this doubly linked
+        list one by one, so they end up in reversed order as `deque.extendleft` does
+
+        Complexity:
+          - Space: Θ(k), Ο(k), Ω(k)
+          - Time: Θ(k), Ο(k), Ω(k)
 
+        :param iterable:
+        :type iterable: Iterable[Any]
         :return:
-        :rtype: Node
+        :rtype: None
+        """
+        if self._index is not None:  # index every node before it is linked
+            appendleft = self.appendleft
+            for value in iterable:
+                appendleft(value)
+            return
+
+        node_class: Type[DoublyNode] = self.node_class
+        values = iter(iterable)
+        head: Optional[DoublyNode] = self.head
+        size: int = self._size
+
+        try:
+            if head is None:
+                for value in values:
+                    self._tail = head = node_class(value)
+                    size += 1
+                    break
+            for value in values:
+                head = node_class(value, None, head)
+                size += 1
+        finally:  # keep this doubly linked list consistent if the iterable raises
+            self.head = head
+            self._size = size
+
+    def rotate(self, k: int = 1) -> None:
         """
-        while True:
-            current: Optional[DoublyNode] = self.current
-            try:
-                self.current = current.next
-            except AttributeError:  # if the singly linked list is empty
-                raise StopIteration
-            if current.value == self.value:
-                return current
-            if current.next is None:
-                raise StopIteration
+        Rotate this doubly linked list k steps to the right, or to the left if k is
+        negative, as `deque.rotate` does: the nodes are not moved, the list is closed
+        into a ring and opened again before the new head, which is reached from the
+        nearer end
 
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(min(k, n - k))
 
-class DoublyLinkedList(LinkedList, Reversible):
-    def _init(self, *args) -> None:
-        if args:
-            self.head = DoublyNode(value=args[0])
-            current_node = self.head
-            for i in args[1:]:
-                current_node = DoublyNode(i, previous=current_node)
+        :param k:
+        :type k: int
+        :return:
+        :rtype: None
+        """
+        size: int = self._size
+        if size <= 1:
+            return
+        k %= size
+        if not k:
+            return
+
+        # the new head is the kth node from the tail
+        if k <= size - k:
+            new_head: DoublyNode = self._tail
+            for _ in range(k - 1):
+                new_head = new_head.previous
+        else:
+            new_head = self.head
+            for _ in range(size - k):
+                new_head = new_head.next
+
+        self._tail.next, self.head.previous = self.head, self._tail
+        new_tail: DoublyNode = new_head.previous
+        new_tail.next = new_head.previous = None
+        self.head, self._tail = new_head, new_tail
 
-    def __iter__(self) -> DoublyLinkedListIterator:
+    def concat(self, other: DoublyLinkedList) -> None:
         """
+        Move all nodes of the given doubly linked list after the tail of this one, the
+        given linked list is left empty
 
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), or Θ(k) with the hash index
+
+        :param other:
+        :type other: DoublyLinkedList
         :return:
-        :rtype: DoublyLinkedListIterator
+        :rtype: None
+        """
+        head, tail, size = self._take(other)
+        if head is None:
+            return
+
+        if self._tail is None:
+            self.head = head
+        else:
+            self._tail.next, head.previous = head, self._tail
+        self._tail = tail
+        self._size += size
+
+    def split_after(self, node: Optional[DoublyNode] = None) -> DoublyLinkedList:
+        """
+        Move the nodes after the given node into a new doubly linked list, the links
+        are cut in Θ(1), and the size of both lists is found by counting from the given
+        node towards both ends at once, so only the shorter side is walked
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(min(k, n - k)), k is the number of the nodes moved
+
+        :param node: If node is not provided, all nodes are moved
+        :type node: Optional[DoublyNode]
+        :return: The new doubly linked list
+        :rtype: DoublyLinkedList
         """
-        return DoublyLinkedListIterator(self)
+        if node is None:
+            head: Optional[DoublyNode] = self.head
+            size: int = self._size
+        else:
+            head = node.next
+            forward: Optional[DoublyNode] = head
+            backward: Optional[DoublyNode] = node
+            count: int = 0
+            while forward is not None and backward is not None:
+                forward, backward = forward.next, backward.previous
+                count += 1
+            size = count if forward is None else self._size - count
+
+        if head is None:
+            return self._split_off(None, None, 0)
+
+        tail: DoublyNode = self._tail
+        if node is None:
+            self.head = None
+        else:
+            node.next = head.previous = None
+        self._tail = node
+        return self._split_off(head, tail, size)
 
-    def __reversed__(self) -> DoublyLinkedListReversedIterator:
+    def insert_after(
+            self, value: Union[DoublyNode, Any], node: Optional[DoublyNode] = None
+    ) -> None:
         """
+        Insert the given value after the given node, or before the head if the node is
+        not provided; a node not linked in any linked list, e.g. one removed by
+        `remove_node`, is linked as it is instead of creating a node, so a node can be
+        moved from one doubly linked list to another
+
+        The given node is trusted to be in this doubly linked list.
 
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1)
+
+        :param value:
+        :type value: Union[DoublyNode, Any]
+        :param node:
+        :type node: Optional[DoublyNode]
         :return:
-        :rtype: DoublyLinkedListReversedIterator
+        :rtype: None
         """
-        return DoublyLinkedListReversedIterator(self)
-
-    def append(self, value: Any) -> None:
-        if self:
-            DoublyNode.after_node(value, self.tail)
+        if not isinstance(value, DoublyNode):
+            value = self.node_class(value)
+        if self._index is not None:
+            self._index_add(value)
+
+        next_: Optional[DoublyNode] = self.head if node is None else node.next
+        value.previous, value.next = node, next_
+        if node is None:
+            self.head = value
+        else:
+            node.next = value
+        if next_ is None:
+            self._tail = value
         else:
-            self.head = DoublyNode(value)
+            next_.previous = value
+        self._size += 1
 
     def pop(self) -> Optional[DoublyNode]:
+        """
+        Pop the last node of this doubly linked list
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1)
+
+        :return:
+        :rtype: DoublyNode
+        """
         if not self:  # this doubly linked list is empty
             raise LinkedListIndexError
-        elif len(self) == 1:
+
+        if self._index is not None:
+            self._index_discard(self._tail)
+        self._size -= 1
+        if self.head is self._tail:
             node = self.head
-            self.head = None
+            self.head = self._tail = None
             return node
         else:
-            tail = self.tail
+            tail = self._tail
 
             new_tail = tail.previous
             new_tail.next = None
+            self._tail = new_tail
+            tail.previous = None
 
             return tail
 
+    def popleft(self) -> DoublyNode:
+        """
+        Pop the first node of this doubly linked list
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1)
+
+        :return:
+        :rtype: DoublyNode
+        """
+        if not self:  # this doubly linked list is empty
+            raise LinkedListIndexError
+
+        head: DoublyNode = self.head
+        if self._index is not None:
+            self._index_discard(head)
+        self._size -= 1
+        if head is self._tail:
+            self.head = self._tail = None
+        else:
+            new_head = head.next
+            new_head.previous = None
+            self.head = new_head
+
+        return head
+
+    def _unlink(self, node: DoublyNode) -> None:
+        """
+        Unlink the given node from its neighbours, the hash index and the size counter
+        are left to the caller
+
+        The `previous` link of the node is cleared, so the node is not taken as linked
+        any more, see `_check_linked`, and its `next` link is kept, so an iteration
+        holding it carries on.
+
+        :param node:
+        :type node: DoublyNode
+        :return:
+        :rtype: None
+        """
+        previous: Optional[DoublyNode] = node.previous
+        next_: Optional[DoublyNode] = node.next
+        if previous is None:
+            self.head = next_
+        else:
+            previous.next = next_
+        if next_ is None:
+            self._tail = previous
+        else:
+            next_.previous = previous
+        node.previous = None
+
+    def _check_linked(self, node: DoublyNode) -> None:
+        """
+        Check the given node is linked in this doubly linked list by its links, or by a
+        traversal in debug mode
+
+        A node removed from a doubly linked list has no `previous` link, and a node
+        without a `previous` or `next` link must be the head or the tail of this doubly
+        linked list, so the nodes removed, and the ends of another doubly linked list,
+        are caught in Θ(1); a node inside another doubly linked list is only caught by
+        the traversal.
+
+        :param node:
+        :type node: DoublyNode
+        :return:
+        :rtype: None
+        :raise LinkedListIndexError: If the given node is not in this doubly linked list
+        """
+        linked: bool = (node.previous is not None or node is self.head) and (
+            node.next is not None or node is self._tail
+        )
+        if not linked or (self.debug and not any(node is node_ for node_ in self)):
+            raise LinkedListIndexError(f"{node!r} is not in this doubly linked list")
+
+    def move_to_end(self, node: DoublyNode, last: bool = True) -> None:
+        """
+        Move the given node to the tail of this doubly linked list, or to the head if
+        `last` is False, as `OrderedDict.move_to_end` does; the node is relinked without
+        a traversal and without creating a node, so a node kept as a handle, e.g. the
+        entry of a cache, is moved wherever it is
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1), or Θ(n) in debug mode
+
+        :param node:
+        :type node: DoublyNode
+        :param last: Move the node to the tail, otherwise to the head
+        :type last: bool
+        :return:
+        :rtype: None
+        :raise LinkedListIndexError: If the given node has been removed, or is not in
+                                     this doubly linked list, see `_check_linked`
+        """
+        self._check_linked(node)
+        if node is (self._tail if last else self.head):
+            return
+
+        self._unlink(node)
+        if last:
+            node.previous, node.next = self._tail, None
+            self._tail.next = node
+            self._tail = node
+        else:
+            node.previous, node.next = None, self.head
+            self.head.previous = node
+            self.head = node
+
+    def remove_node(self, node: DoublyNode) -> None:
+        """
+        Remove the given node of this doubly linked list, the node is unlinked from its
+        neighbours without a traversal, so a node kept as a handle can be removed
+        wherever it is
+
+        The `previous` link of the node removed is cleared and its `next` link is kept,
+        so an iteration holding it carries on. Removing a node removed from a doubly
+        linked list, by any method, or the head or the tail of another doubly linked
+        list, raises an error; in debug mode the node is checked to be in this doubly
+        linked list by a traversal, see `_check_linked`.
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1), or Θ(n) in debug mode
+
+        :param node:
+        :type node: DoublyNode
+        :return:
+        :rtype: None
+        :raise LinkedListIndexError: If the given node is not in this doubly linked list
+        """
+        self._check_linked(node)
+
+        if self._index is not None:
+            self._index_discard(node)
+        self._unlink(node)
+        self._size -= 1
+
+    def remove_if(self, predicate: Callable[[Any], bool]) -> int:
+        """
+        Remove all nodes whose value the given predicate returns True for, in one pass
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(n), Ο(n), Ω(n)
+
+        :param predicate:
+        :type predicate: Callable[[Any], bool]
+        :return: The number of nodes removed
+        :rtype: int
+        """
+        index: Optional[Dict[Any, Dict[DoublyNode, None]]] = self._index
+        node: Optional[DoublyNode] = self.head
+        removed: int = 0
+        try:
+            while node is not None:
+                next_: Optional[DoublyNode] = node.next
+                if predicate(node.value):
+                    if index is not None:
+                        self._index_discard(node)
+                    self._unlink(node)
+                    removed += 1
+                node = next_
+        finally:  # keep the size counter right even if the predicate raises
+            self._size -= removed
+        return removed
+
+    def remove_values(self, values: Iterable[Any]) -> int:
+        """
+        Remove all nodes holding any of the given values, with the hash index only the
+        nodes holding them are visited, as every node can be unlinked on its own
+
+        Complexity:
+          - Space: Θ(m), m is the number of the given values
+          - Time: Θ(m + n), or Θ(m + k) with the hash index, k is the number of the
+            nodes removed
+
+        :param values: The hashable values to be removed
+        :type values: Iterable[Any]
+        :return: The number of nodes removed
+        :rtype: int
+        """
+        if self._index is None:
+            return super().remove_values(values)
+
+        removed: int = 0
+        for value in set(values):
+            for node in self._index_lookup(value):
+                self._index_discard(node)
+                self._unlink(node)
+                self._size -= 1
+                removed += 1
+        return removed
+
     def reverse(self) -> None:
         """
         In-place reverse
@@ -155,19 +547,42 @@ class DoublyLinkedList(LinkedList, Reversible):
         :return:
         :rtype: None
         """
-        tail = self.tail
+        tail = self._tail
         for node in self:
             node.next, node.previous = node.previous, node.next
 
-        self.head = tail
+        self.head, self._tail = tail, self.head
 
-    def search_iter(self, value: Any) -> DoublyLinkedListSearchIterator:
+    def search_iter(self, value: Any) -> Generator[DoublyNode, None, None]:
         """
         Search for a given value, return a iterator
 
         :param value:
         :type value: Any
         :return:
-        :rtype: Generator[Node, None, None]
+        :rtype: Generator[DoublyNode, None, None]
+        """
+        if self._index is not None:
+            yield from self._index_lookup(value)
+            return
+
+        node: Optional[DoublyNode] = self.head
+        while node is not None:
+            if node.value == value:
+                next_: Optional[DoublyNode] = node.next
+                yield node
+                node = next_
+            else:
+                node = node.next
+
+    def values(self) -> Generator[Any, None, None]:
+        """
+        Iterate the values of this doubly linked list without the node wrapper
+
+        :return:
+        :rtype: Generator[Any, None, None]
         """
-        return DoublyLinkedListSearchIterator(self, value)
+        node: Optional[DoublyNode] = self.head
+        while node is not None:
+            yield node.value
+            node = node.next
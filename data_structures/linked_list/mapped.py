@@ -0,0 +1,501 @@
+"""
+The read-only linked list mapped into memory from a file
+
+ * Mapped Linked List
+
+The file holds one linked list in three parts, all integers are little-endian:
+
+* a header of 48 bytes - the magic `b"PDSLLMAP"`, the version of the format and the
+  codec of the values as unsigned 32-bit integers, then the index of the head record,
+  the index of the tail record, the number of nodes and the offset of the value heap in
+  the file as signed 64-bit integers
+* the records of the nodes, 24 bytes each - the index of the next record, or -1 for the
+  tail, and the offset in the value heap and the length of the encoded value, as
+  signed 64-bit integers
+* the value heap - the encoded values one after another
+"""
+from __future__ import annotations
+
+import json
+import mmap
+import pickle
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+from collections.abc import Reversible
+from typing import Any, Callable, Dict, Generator, Iterable, NoReturn, Optional, Tuple
+
+from data_structures.exceptions import LinkedListReadOnlyError
+from data_structures.linked_list import LinkedList
+from data_structures.linked_list.nodes import MappedNode
+
+MAGIC: bytes = b"PDSLLMAP"
+VERSION: int = 1
+NIL: int = -1
+
+_HEADER: struct.Struct = struct.Struct("<8sIIqqqq")
+_RECORD: struct.Struct = struct.Struct("<qqq")
+_NEXT: struct.Struct = struct.Struct("<q")
+
+# the number of bytes of records written to the file at once by `dump`
+_BUFFER_SIZE: int = 1 << 16
+
+
+def _encode_bytes(value: Any) -> bytes:
+    """
+
+    :param value:
+    :type value: Any
+    :return:
+    :rtype: bytes
+    :raise TypeError: If the value is not bytes-like
+    """
+    return bytes(memoryview(value))
+
+
+def _decode_str(data: memoryview) -> str:
+    """
+
+    :param data:
+    :type data: memoryview
+    :return:
+    :rtype: str
+    """
+    return str(data, "utf-8")
+
+
+def _encode_json(value: Any) -> bytes:
+    """
+
+    :param value:
+    :type value: Any
+    :return:
+    :rtype: bytes
+    :raise TypeError: If the value is not serializable to JSON
+    """
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _decode_json(data: memoryview) -> Any:
+    """
+
+    :param data:
+    :type data: memoryview
+    :return:
+    :rtype: Any
+    """
+    return json.loads(str(data, "utf-8"))
+
+
+# the codecs of the values by name: the code in the header, the encoder and the decoder
+CODECS: Dict[str, Tuple[int, Callable[[Any], bytes], Callable[[memoryview], Any]]] = {
+    "pickle": (0, pickle.dumps, pickle.loads),
+    "bytes": (1, _encode_bytes, bytes),
+    "str": (2, str.encode, _decode_str),
+    "json": (3, _encode_json, _decode_json),
+}
+
+# the codecs whose values are decoded to be compared, their encoding is not unique
+_DECODED: Tuple[str, ...] = ("pickle", "json")
+
+
+class MappedLinkedList(  # pylint: disable=too-many-instance-attributes
+        LinkedList, Reversible
+):
+    """
+    The read-only singly linked list kept in a file, see the module for the format,
+    written by `dump` and opened through `mmap`, so opening it only reads the header,
+    whatever the size of the file, and the pages of the file are loaded by the
+    operating system when a traversal reaches them
+
+    The nodes returned by this linked list are MappedNode handles to the records, the
+    links are read from the file and the values decoded from it on demand. The values
+    are encoded by one of `CODECS`:
+
+    * "json" - the default, values of JSON, i.e. None, booleans, numbers, strings, and
+      lists and dicts of them, a tuple is read back as a list; a search decodes every
+      value to compare it
+    * "bytes" - bytes-like values, a search compares the bytes in the file
+    * "str" - strings encoded in UTF-8, a search compares the bytes in the file
+    * "pickle" - any picklable value, a search decodes every value to compare it
+
+    The codecs other than "pickle" only read data. Unpickling a value can run any code
+    the file asks for, so "pickle" must only be used for files of a trusted source, and
+    a file of this codec is refused unless `allow_pickle` is set when it is opened.
+
+    This linked list implements the iteration and the search of LinkedList, any method
+    changing it raises LinkedListReadOnlyError. The file is mapped until `close` is
+    called, or the end of a `with` block. The records are read in place as machine
+    integers on a little-endian machine, as nearly all are; on a big-endian machine they
+    are copied and swapped to the byte order of the machine when the file is opened.
+    """
+
+    def __init__(  # pylint: disable=super-init-not-called
+            self, path: str, allow_pickle: bool = False
+    ):
+        """
+
+        :param path: The path of a file written by `dump`
+        :type path: str
+        :param allow_pickle: Whether to open a file of the codec "pickle", only for a
+                             file of a trusted source
+        :type allow_pickle: bool
+        :raise ValueError: If the file is not a mapped linked list of a known version,
+                           or its codec is "pickle" and `allow_pickle` is not set
+        """
+        with open(path, "rb") as file:
+            self._mmap: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if len(self._mmap) < _HEADER.size:
+                raise ValueError(f"{path!r} is not a mapped linked list")
+            magic, version, code, head, tail, size, heap = _HEADER.unpack_from(
+                self._mmap
+            )
+            if magic != MAGIC:
+                raise ValueError(f"{path!r} is not a mapped linked list")
+            if version != VERSION:
+                raise ValueError(f"version {version} of {path!r} is not supported")
+            codecs: Dict[int, str] = {codec[0]: name for name, codec in CODECS.items()}
+            if code not in codecs:
+                raise ValueError(f"codec {code} of {path!r} is not supported")
+            if codecs[code] == "pickle" and not allow_pickle:
+                raise ValueError(
+                    f"{path!r} holds pickled values, only open it with allow_pickle "
+                    "if it is trusted"
+                )
+        except ValueError:
+            self._mmap.close()
+            raise
+
+        self._codec: str = codecs[code]
+        self.path: str = path
+        self.head_index: int = head
+        self.tail_index: int = tail
+        self._size: int = size
+        self._index: None = None
+
+        self._buffer: memoryview = memoryview(self._mmap)
+        # the fields of every record are three consecutive integers
+        self._records: memoryview = self._buffer[_HEADER.size: heap].cast("q")
+        if sys.byteorder != "little":  # the integers of the file are little-endian
+            records: array = array("q", self._records)
+            records.byteswap()
+            self._records.release()
+            self._records = memoryview(records)
+        self._heap: memoryview = self._buffer[heap:]
+
+    @classmethod
+    def dump(cls, iterable: Iterable[Any], path: str, codec: str = "json") -> None:
+        """
+        Write the values of the given iterable, e.g. a linked list of any kind, to a
+        file of the given path in link order, the iterable is consumed lazily and the
+        encoded values are kept in a temporary file until the records are written
+
+        Complexity:
+          - Space: Θ(1) in memory, Θ(n) on disk
+          - Time: Θ(n), Ο(n), Ω(n)
+
+        :param iterable: The values, or a linked list whose values are written
+        :type iterable: Iterable[Any]
+        :param path:
+        :type path: str
+        :param codec: The name of a codec of `CODECS`, "pickle" only for a file read
+                      back by a trusted reader
+        :type codec: str
+        :return:
+        :rtype: None
+        :raise ValueError: If the codec is unknown
+        """
+        if codec not in CODECS:
+            raise ValueError(f"codec must be one of {sorted(CODECS)}, not {codec!r}")
+        code, encode, _ = CODECS[codec]
+        if isinstance(iterable, LinkedList):
+            iterable = iterable.values()
+
+        pack: Callable[..., bytes] = _RECORD.pack
+        with open(path, "wb") as file, tempfile.TemporaryFile() as heap:
+            file.write(bytes(_HEADER.size))
+            records: bytearray = bytearray()
+            offset: int = 0
+            count: int = 0
+            for value in iterable:
+                data: bytes = encode(value)
+                heap.write(data)
+                count += 1
+                records += pack(count, offset, len(data))
+                offset += len(data)
+                if len(records) >= _BUFFER_SIZE:
+                    file.write(records)
+                    records.clear()
+            file.write(records)
+
+            if count:  # the last record links to no record
+                file.seek(_HEADER.size + (count - 1) * _RECORD.size)
+                file.write(_NEXT.pack(NIL))
+            heap_offset: int = _HEADER.size + count * _RECORD.size
+            file.seek(heap_offset)
+            heap.seek(0)
+            shutil.copyfileobj(heap, file)
+
+            file.seek(0)
+            file.write(
+                _HEADER.pack(
+                    MAGIC,
+                    VERSION,
+                    code,
+                    0 if count else NIL,
+                    count - 1 if count else NIL,
+                    count,
+                    heap_offset,
+                )
+            )
+
+    def __reduce_ex__(self, protocol: int) -> Tuple[Callable, Tuple[str, bool]]:
+        """
+        Pickle the path of the file instead of the values, the file is mapped again
+        when unpickled, with pickled values allowed if they were for this linked list
+
+        :param protocol:
+        :type protocol: int
+        :return:
+        :rtype: Tuple[Callable, Tuple[str, bool]]
+        """
+        return type(self), (self.path, self._codec == "pickle")
+
+    def __enter__(self) -> MappedLinkedList:
+        """
+
+        :return:
+        :rtype: MappedLinkedList
+        """
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """
+
+        :param exc_info:
+        :return:
+        :rtype: None
+        """
+        self.close()
+
+    def __del__(self) -> None:
+        """
+        Release the views before the map is closed when garbage collected
+
+        :return:
+        :rtype: None
+        """
+        if hasattr(self, "_buffer"):
+            self.close()
+
+    def close(self) -> None:
+        """
+        Unmap the file, this linked list cannot be used any more
+
+        :return:
+        :rtype: None
+        """
+        for view in (self._records, self._heap, self._buffer):
+            view.release()
+        self._mmap.close()
+
+    @property
+    def codec(self) -> str:
+        """
+        The name of the codec of the values
+
+        :return:
+        :rtype: str
+        """
+        return self._codec
+
+    @property
+    def head(self) -> Optional[MappedNode]:
+        """
+        The head node of this linked list
+
+        :return:
+        :rtype: Optional[MappedNode]
+        """
+        return None if self.head_index == NIL else MappedNode(self, self.head_index)
+
+    @property
+    def tail(self) -> Optional[MappedNode]:
+        """
+        The tail node of this linked list
+
+        :return:
+        :rtype: Optional[MappedNode]
+        """
+        return None if self.tail_index == NIL else MappedNode(self, self.tail_index)
+
+    def is_head(self, node: MappedNode) -> bool:
+        """
+        Check if the given node is the head of this linked list
+
+        :param node:
+        :type node: MappedNode
+        :return:
+        :rtype: bool
+        """
+        return node == self.head
+
+    def is_tail(self, node: MappedNode) -> bool:
+        """
+        Check if the given node is the tail of this linked list
+
+        :param node:
+        :type node: MappedNode
+        :return:
+        :rtype: bool
+        """
+        return node == self.tail
+
+    def next_index(self, index: int) -> int:
+        """
+        Return the index of the record after the given record, or -1 for the tail
+
+        :param index:
+        :type index: int
+        :return:
+        :rtype: int
+        """
+        return self._records[3 * index]
+
+    def value_at(self, index: int) -> Any:
+        """
+        Decode the value of the given record from the file
+
+        :param index:
+        :type index: int
+        :return:
+        :rtype: Any
+        """
+        offset: int = self._records[3 * index + 1]
+        return CODECS[self._codec][2](
+            self._heap[offset: offset + self._records[3 * index + 2]]
+        )
+
+    def __contains__(self, item) -> bool:
+        """
+        Check if the given node handle refers to a record linked in this linked list
+
+        :param item:
+        :return:
+        :rtype: bool
+        """
+        if not isinstance(item, MappedNode) or item.linked_list is not self:
+            return False
+
+        records: memoryview = self._records
+        cursor: int = self.head_index
+        while cursor != NIL:
+            if cursor == item.index:
+                return True
+            cursor = records[3 * cursor]
+        return False
+
+    def __iter__(self) -> Generator[MappedNode, None, None]:
+        """
+        Iterate the nodes of this linked list
+
+        :return:
+        :rtype: Generator[MappedNode, None, None]
+        """
+        records: memoryview = self._records
+        cursor: int = self.head_index
+        while cursor != NIL:
+            yield MappedNode(self, cursor)
+            cursor = records[3 * cursor]
+
+    def __reversed__(self) -> Generator[MappedNode, None, None]:
+        """
+        Iterate the nodes of this linked list from the tail, the indices of the records
+        are collected into an array of machine integers first
+
+        :return:
+        :rtype: Generator[MappedNode, None, None]
+        """
+        indices: array = array("q")
+        records: memoryview = self._records
+        cursor: int = self.head_index
+        while cursor != NIL:
+            indices.append(cursor)
+            cursor = records[3 * cursor]
+
+        for index in reversed(indices):
+            yield MappedNode(self, index)
+
+    def search_iter(self, value: Any) -> Generator[MappedNode, None, None]:
+        """
+        Search for a given value, return a iterator; with the codec "bytes" or "str" the
+        given value is encoded once and compared with the bytes in the file, otherwise
+        every value is decoded, as equal values may be encoded differently
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(n), Ο(n), Ω(n)
+
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: Generator[MappedNode, None, None]
+        """
+        _, encode, decode = CODECS[self._codec]
+        records: memoryview = self._records
+        heap: memoryview = self._heap
+        cursor: int = self.head_index
+
+        if self._codec in _DECODED:
+            while cursor != NIL:
+                offset: int = records[3 * cursor + 1]
+                if decode(heap[offset: offset + records[3 * cursor + 2]]) == value:
+                    yield MappedNode(self, cursor)
+                cursor = records[3 * cursor]
+            return
+
+        try:
+            data: bytes = encode(value)
+        except (TypeError, UnicodeEncodeError):  # no value of the codec equals it
+            return
+        length: int = len(data)
+        while cursor != NIL:
+            if records[3 * cursor + 2] == length:
+                offset = records[3 * cursor + 1]
+                if heap[offset: offset + length] == data:
+                    yield MappedNode(self, cursor)
+            cursor = records[3 * cursor]
+
+    def values(self) -> Generator[Any, None, None]:
+        """
+        Iterate the values of this linked list without the node wrapper, every value is
+        decoded from the file
+
+        :return:
+        :rtype: Generator[Any, None, None]
+        """
+        decode: Callable[[memoryview], Any] = CODECS[self._codec][2]
+        records: memoryview = self._records
+        heap: memoryview = self._heap
+        cursor: int = self.head_index
+        while cursor != NIL:
+            offset: int = records[3 * cursor + 1]
+            yield decode(heap[offset: offset + records[3 * cursor + 2]])
+            cursor = records[3 * cursor]
+
+    def _read_only(self, *_args, **_kwargs) -> NoReturn:
+        """
+        Refuse any change of this linked list
+
+        :return:
+        :rtype: NoReturn
+        :raise LinkedListReadOnlyError: Always
+        """
+        raise LinkedListReadOnlyError(f"{type(self).__name__} is read-only")
+
+    append = extend = pop = reverse = _read_only
+    remove_if = remove_values = replace = replace_many = replace_if = _read_only
@@ -3,9 +3,11 @@ The node classes used in various Linked List classes
 """
 from __future__ import annotations
 
-from typing import Any, Optional
+import threading
+from typing import Any, List, Optional
 
 from data_structures.exceptions import NodeFrozenError
+from data_structures.linked_list import BaseNode as _BaseNode
 from data_structures.linked_list import Node as _Node
 
 
@@ -17,6 +19,8 @@ class SinglyNode(_Node):  # pylint: disable=too-few-public-methods
     Any enhanced SinglyNode class should inherit this class
     """
 
+    __slots__ = ()
+
     @classmethod
     def after_node(cls, value: Any, node: SinglyNode) -> SinglyNode:
         """
@@ -39,6 +43,12 @@ class SecureSinglyNode(SinglyNode):
     changed
     """
 
+    __slots__ = ("frozen",)
+
+    # the slots of Node, hidden behind the properties checking `frozen`
+    _value = _Node.value  # pylint: disable=no-member
+    _next = _Node.next  # pylint: disable=no-member
+
     def __init__(
             self,
             value: Any,
@@ -153,6 +163,8 @@ class DoublyNode(_Node):  # pylint: disable=too-few-public-methods
     Any enhanced DoublyNode class should inherit this class
     """
 
+    __slots__ = ("previous",)
+
     def __init__(
             self,
             value: Any,
@@ -192,3 +204,347 @@ class DoublyNode(_Node):  # pylint: disable=too-few-public-methods
         :rtype: DoublyNode
         """
         return cls(value, node)
+
+
+class LockedSinglyNode(SinglyNode):  # pylint: disable=too-few-public-methods
+    """
+    The node of a concurrent singly linked list, a SinglyNode with a re-entrant lock
+    guarding its `next` link, and an `unlinked` flag set when the node is removed from
+    its linked list; a removed node keeps its `next` link, so an iteration standing on
+    it carries on in the linked list
+    """
+
+    __slots__ = ("lock", "unlinked")
+
+    def __init__(self, value: Any, next_: Optional[LockedSinglyNode] = None):
+        """
+
+        :param value:
+        :type value: Any
+        :param next_:
+        :type next_: Optional[LockedSinglyNode]
+        """
+        super().__init__(value, next_)
+        self.lock: threading.RLock = threading.RLock()
+        self.unlinked: bool = False
+
+
+class LockedDoublyNode(DoublyNode):  # pylint: disable=too-few-public-methods
+    """
+    The node of a concurrent doubly linked list, a DoublyNode with a re-entrant lock
+    guarding its `next` link and, together with the lock of the node before it, its
+    `previous` link, and an `unlinked` flag set when the node is removed from its
+    linked list
+    """
+
+    __slots__ = ("lock", "unlinked")
+
+    def __init__(
+            self,
+            value: Any,
+            previous: Optional[LockedDoublyNode] = None,
+            next_: Optional[LockedDoublyNode] = None,
+    ):
+        """
+
+        :param value:
+        :type value: Any
+        :param previous:
+        :type previous: Optional[LockedDoublyNode]
+        :param next_:
+        :type next_: Optional[LockedDoublyNode]
+        """
+        super().__init__(value, previous, next_)
+        self.lock: threading.RLock = threading.RLock()
+        self.unlinked: bool = False
+
+
+class SkipNode(SinglyNode):
+    """
+    The node of a skip list, a SinglyNode with a list of forward links, one per level:
+    `forward[0]` is the `next` node at the lowest level, the level of the singly linked
+    list of all nodes, and `forward[level]` skips to the next node tall enough to have
+    the level
+    """
+
+    __slots__ = ("forward",)
+
+    def __init__(self, value: Any, next_: Optional[SkipNode] = None, height: int = 1):
+        """
+
+        :param value:
+        :type value: Any
+        :param next_: The next node at the lowest level
+        :type next_: Optional[SkipNode]
+        :param height: The number of levels of this node
+        :type height: int
+        """
+        self.forward: List[Optional[SkipNode]] = [None] * height
+        super().__init__(value, next_)
+
+    @property
+    def next(self) -> Optional[SkipNode]:
+        """
+        The next node at the lowest level
+
+        :return:
+        :rtype: Optional[SkipNode]
+        """
+        return self.forward[0]
+
+    @next.setter
+    def next(self, node: Optional[SkipNode]) -> None:
+        """
+
+        :param node:
+        :type node: Optional[SkipNode]
+        :return:
+        :rtype: None
+        """
+        self.forward[0] = node
+
+    @classmethod
+    def after_node(cls, value: Any, node: SkipNode) -> SkipNode:
+        """
+        Create a node of one level with the given value, and insert it after the given
+        node at the lowest level
+
+        :param value: The value that the node contains
+        :type value: Any
+        :param node: The node which `next` points to this node
+        :type node: SkipNode
+        :return: The node created
+        :rtype: SkipNode
+        """
+        node.next = cls(value, node.next)
+        return node.next
+
+
+class UnrolledNode(_Node):  # pylint: disable=too-few-public-methods
+    """
+    The node of an unrolled linked list, which holds a block of values instead of one
+    value: the `value` of an unrolled node is the list of the values in the block
+    """
+
+    __slots__ = ()
+
+    def __init__(
+            self,
+            value: Optional[List[Any]] = None,
+            next_: Optional[UnrolledNode] = None,
+    ):
+        """
+        Create a node with the given block of values and next node
+
+        :param value: The list of values in the block
+        :type value: Optional[List[Any]]
+        :param next_:
+        :type next_: Optional[UnrolledNode]
+        """
+        super().__init__([] if value is None else value, next_)
+
+    @classmethod
+    def after_node(cls, value: List[Any], node: UnrolledNode) -> UnrolledNode:
+        """
+        Create a node with the given block of values, and insert it after the given
+        node
+
+        :param value: The list of values in the block
+        :type value: List[Any]
+        :param node: The node which `next` points to this node
+        :type node: UnrolledNode
+        :return: The node created
+        :rtype: UnrolledNode
+        """
+        node.next = cls(value, node.next)
+        return node.next
+
+
+@_Node.register
+class ArrayNode(_BaseNode):  # pylint: disable=too-few-public-methods
+    """
+    A handle to one slot of an array backed linked list, the `value` and `next`
+    properties read and write the arrays of the linked list directly
+
+    Two handles are equal when they refer to the same slot of the same linked list. A
+    handle to a removed node is invalid, because its slot is reused by the next insert
+
+    A handle only keeps the linked list and the index of the slot, it derives from the
+    slot-free BaseNode instead of Node
+    """
+
+    __slots__ = ("linked_list", "index")
+
+    def __init__(self, linked_list: Any, index: int):
+        """
+        Create a handle to the given slot of the given linked list
+
+        :param linked_list:
+        :type linked_list: ArraySinglyLinkedList
+        :param index:
+        :type index: int
+        """
+        self.linked_list = linked_list
+        self.index: int = index
+
+    @classmethod
+    def after_node(cls, value: Any, node: ArrayNode) -> ArrayNode:
+        """
+        Create a node with the given value, and after the given node
+
+        :param value: The value that the node contains
+        :type value: Any
+        :param node: The node which `next` points to this node
+        :type node: ArrayNode
+        :return: The node created
+        :rtype: ArrayNode
+        """
+        node.linked_list.insert_after(value, node)
+        return node.next
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ArrayNode):
+            return NotImplemented
+        return self.linked_list is other.linked_list and self.index == other.index
+
+    def __hash__(self) -> int:
+        return hash((id(self.linked_list), self.index))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.value!r}, index={self.index})"
+
+    @property
+    def next(self) -> Optional[ArrayNode]:
+        """
+
+        :return:
+        :rtype: Optional[ArrayNode]
+        """
+        index: int = self.linked_list.next_slots[self.index]
+        return None if index < 0 else ArrayNode(self.linked_list, index)
+
+    @next.setter
+    def next(self, next_: Optional[ArrayNode]) -> None:
+        """
+
+        :param next_:
+        :type next_: Optional[ArrayNode]
+        :return:
+        :rtype: None
+        """
+        self.linked_list.next_slots[self.index] = -1 if next_ is None else next_.index
+
+    @property
+    def value(self) -> Any:
+        """
+
+        :return:
+        :rtype: Any
+        """
+        return self.linked_list.value_slots[self.index]
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        """
+
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: None
+        """
+        self.linked_list.value_slots[self.index] = value
+
+
+@_Node.register
+class MappedNode(_BaseNode):  # pylint: disable=too-few-public-methods
+    """
+    A read-only handle to one record of a memory-mapped linked list, the `value` is
+    decoded from the file every time it is read, and neither `value` nor `next` can be
+    changed
+
+    Two handles are equal when they refer to the same record of the same linked list,
+    and, like ArrayNode, a handle derives from the slot-free BaseNode
+    """
+
+    __slots__ = ("linked_list", "index")
+
+    def __init__(self, linked_list: Any, index: int):
+        """
+        Create a handle to the given record of the given linked list
+
+        :param linked_list:
+        :type linked_list: MappedLinkedList
+        :param index:
+        :type index: int
+        """
+        self.linked_list = linked_list
+        self.index: int = index
+
+    @classmethod
+    def after_node(cls, value: Any, node: MappedNode) -> MappedNode:
+        """
+        A memory-mapped linked list is read-only, no node can be created after a node
+
+        :param value:
+        :type value: Any
+        :param node:
+        :type node: MappedNode
+        :return:
+        :rtype: MappedNode
+        :raise NodeFrozenError: Always
+        """
+        raise NodeFrozenError
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, MappedNode):
+            return NotImplemented
+        return self.linked_list is other.linked_list and self.index == other.index
+
+    def __hash__(self) -> int:
+        return hash((id(self.linked_list), self.index))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.value!r}, index={self.index})"
+
+    @property
+    def next(self) -> Optional[MappedNode]:
+        """
+
+        :return:
+        :rtype: Optional[MappedNode]
+        """
+        index: int = self.linked_list.next_index(self.index)
+        return None if index < 0 else MappedNode(self.linked_list, index)
+
+    @next.setter
+    def next(self, next_: Optional[MappedNode]) -> None:
+        """
+
+        :param next_:
+        :type next_: Optional[MappedNode]
+        :return:
+        :rtype: None
+        :raise NodeFrozenError: Always
+        """
+        raise NodeFrozenError
+
+    @property
+    def value(self) -> Any:
+        """
+
+        :return:
+        :rtype: Any
+        """
+        return self.linked_list.value_at(self.index)
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        """
+
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: None
+        :raise NodeFrozenError: Always
+        """
+        raise NodeFrozenError
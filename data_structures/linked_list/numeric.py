@@ -0,0 +1,652 @@
+"""
+The array linked list keeping numeric values and links in NumPy arrays
+
+ * Numeric Linked List
+
+NumPy is an optional dependency of this package, install it with the `numpy` extra to
+use this module.
+"""
+from __future__ import annotations
+
+from itertools import chain
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+)
+
+import numpy as np
+
+from data_structures.linked_list.arrays import NIL, ArraySinglyLinkedList
+from data_structures.linked_list.nodes import ArrayNode, SinglyNode
+
+# the number of values converted to Python objects at once by `values`
+CHUNK_SIZE: int = 4096
+
+
+class NumericLinkedList(ArraySinglyLinkedList):
+    """
+    The array singly linked list for numeric values, `value_slots` is a NumPy array of
+    the given dtype and `next_slots` a NumPy array of int64, both growing by doubling,
+    so the scans run as vectorized operations instead of comparing Python objects one
+    at a time:
+
+    * `search`, `search_iter`, `positions`, `replace` and `remove_values` compare all
+      values at once
+    * `sum`, `min` and `max` reduce all values at once
+    * `to_numpy` returns all values in link order
+
+    A scan needs the slots in link order. As long as the nodes are only appended, or
+    popped from the tail, the nodes are kept in the first slots in order and the values
+    are scanned as a view of `value_slots`; any other change of the links makes the
+    next scan walk the links once and cache the order until the links change again,
+    and `compact` moves the nodes back to the first slots in order.
+
+    This linked list has no hash index, the vectorized scans take its place.
+    """
+
+    def __init__(  # pylint: disable=super-init-not-called
+            self, *args, dtype: Any = np.float64, capacity: int = 0
+    ):
+        """
+
+        :param args:
+        :param dtype: The NumPy dtype of the values
+        :type dtype: Any
+        :param capacity: The number of slots to preallocate
+        :type capacity: int
+        """
+        self.value_slots: np.ndarray = np.zeros(capacity, dtype=dtype)
+        self.next_slots: np.ndarray = np.full(capacity, NIL, dtype=np.int64)
+
+        self.head_index: int = NIL
+        self.tail_index: int = NIL
+        self.free_index: int = NIL
+        self._size: int = 0
+        self._index: None = None
+
+        # the number of slots ever allocated, the slots after it are not in use
+        self._used: int = 0
+        # whether the nodes are the first slots in link order
+        self._contiguous: bool = True
+        # the slots in link order, cached until the links change
+        self._order: Optional[np.ndarray] = None
+
+        self._init(*args)
+
+    def _grow(self, capacity: int) -> None:
+        """
+        Grow the arrays to the given number of slots
+
+        :param capacity:
+        :type capacity: int
+        :return:
+        :rtype: None
+        """
+        value_slots: np.ndarray = np.zeros(capacity, dtype=self.value_slots.dtype)
+        value_slots[: self._used] = self.value_slots[: self._used]
+        next_slots: np.ndarray = np.full(capacity, NIL, dtype=np.int64)
+        next_slots[: self._used] = self.next_slots[: self._used]
+        self.value_slots, self.next_slots = value_slots, next_slots
+
+    def _allocate(self, value: Any) -> int:
+        """
+        Take a slot from the free list, or the next slot never used, and double the
+        arrays if all slots are in use
+
+        :param value:
+        :type value: Any
+        :return: The index of the slot
+        :rtype: int
+        """
+        index: int = self.free_index
+        if index == NIL:
+            index = self._used
+            if index == len(self.value_slots):
+                self._grow(max(8, 2 * index))
+            self._used += 1
+        else:
+            self.free_index = int(self.next_slots[index])
+
+        self.value_slots[index] = value
+        self.next_slots[index] = NIL
+        return index
+
+    def _release(self, index: int) -> None:
+        """
+        Put the given slot back to the free list
+
+        :param index:
+        :type index: int
+        :return:
+        :rtype: None
+        """
+        self.value_slots[index] = 0
+        self.next_slots[index] = self.free_index
+        self.free_index = index
+
+    def _link_order(self) -> np.ndarray:
+        """
+        Return the slots in link order, a view of the first slots if the nodes are in
+        order there, otherwise the links are walked once and the order is cached
+
+        Complexity:
+          - Space: Θ(n), or Θ(1) if the nodes are contiguous
+          - Time: Θ(n) to walk the links, Θ(1) if the nodes are contiguous or the order
+            is cached
+
+        :return:
+        :rtype: np.ndarray
+        """
+        if self._contiguous:
+            return np.arange(self._size)
+        if self._order is None:
+            order: List[int] = [NIL] * self._size
+            next_slots: List[int] = self.next_slots.tolist()
+            cursor: int = self.head_index
+            for position in range(self._size):
+                order[position] = cursor
+                cursor = next_slots[cursor]
+            self._order = np.array(order, dtype=np.int64)
+        return self._order
+
+    def _slots(self, positions: Any) -> Any:
+        """
+        Return the slots of the nodes at the given positions in link order
+
+        :param positions: A position or an array of positions
+        :type positions: Any
+        :return:
+        :rtype: Any
+        """
+        if self._contiguous:
+            return positions
+        return self._link_order()[positions]
+
+    def _live_values(self) -> np.ndarray:
+        """
+        Return the values in link order, a view of `value_slots` if the nodes are
+        contiguous, otherwise a copy
+
+        :return:
+        :rtype: np.ndarray
+        """
+        if self._contiguous:
+            return self.value_slots[: self._size]
+        return self.value_slots[self._link_order()]
+
+    def _links_changed(self) -> None:
+        """
+        Forget the link order, the nodes are no longer known to be contiguous
+
+        :return:
+        :rtype: None
+        """
+        self._contiguous = False
+        self._order = None
+
+    def append(self, value: Any) -> None:
+        """
+        Append a node after the tail of this numeric linked list
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1) amortized
+          - Time: Θ(1), Ο(1), Ω(1) amortized
+
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: None
+        """
+        super().append(value)
+        if self._contiguous and self.tail_index == self._size - 1:
+            return
+        self._links_changed()
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """
+        Append the values of the given iterable after the tail of this numeric linked
+        list, the values are converted into an array at once and copied to the slots
+        never used, which are linked in one vectorized step
+
+        Complexity:
+          - Space: Θ(k), Ο(k), Ω(k)
+          - Time: Θ(k), Ο(k), Ω(k)
+
+        :param iterable:
+        :type iterable: Iterable[Any]
+        :return:
+        :rtype: None
+        """
+        values: np.ndarray = (
+            np.asarray(iterable, dtype=self.value_slots.dtype)
+            if isinstance(iterable, np.ndarray) and iterable.ndim == 1
+            else np.fromiter(iterable, dtype=self.value_slots.dtype)
+        )
+        count: int = len(values)
+        if not count:
+            return
+
+        if self._contiguous:  # the free slots are the ones after the nodes, reuse them
+            self._used = self._size
+            self.free_index = NIL
+
+        start: int = self._used
+        stop: int = start + count
+        if stop > len(self.value_slots):
+            self._grow(max(stop, 2 * len(self.value_slots)))
+
+        self.value_slots[start:stop] = values
+        self.next_slots[start: stop - 1] = np.arange(start + 1, stop)
+        self.next_slots[stop - 1] = NIL
+        if self.tail_index == NIL:
+            self.head_index = start
+        else:
+            self.next_slots[self.tail_index] = start
+        self.tail_index = stop - 1
+        self._used = stop
+
+        if not (self._contiguous and start == self._size):
+            self._links_changed()
+        self._size += count
+
+    def insert_after(self, value: Any, node: Optional[ArrayNode] = None) -> None:
+        """
+        If after_node is not provided, the given value will be insert to the beginning
+        of this numeric linked list
+
+        :param value:
+        :type value: Any
+        :param node:
+        :type node: Optional[ArrayNode]
+        :return:
+        :rtype: None
+        """
+        super().insert_after(value, node)
+        self._links_changed()
+
+    def pop(self) -> SinglyNode:
+        """
+        Pop the last node of this numeric linked list, the value is returned as a Python
+        number in a detached SinglyNode; popping from contiguous nodes keeps them
+        contiguous and takes Θ(1)
+
+        :return:
+        :rtype: SinglyNode
+        """
+        if not self._contiguous or self._size <= 1:
+            node: SinglyNode = super().pop()
+            node.value = node.value.item()
+            self._links_changed()
+            if not self:
+                self._contiguous = True
+            return node
+
+        tail: int = self.tail_index
+        node = SinglyNode(self.value_slots[tail].item())
+        self.tail_index = tail - 1
+        self.next_slots[tail - 1] = NIL
+        self._release(tail)
+        self._size -= 1
+        return node
+
+    def remove_after(self, node: Optional[ArrayNode] = None) -> None:
+        """
+        Remove one node after the give node
+
+        :param node: If after_node is not provided, the first node of this numeric
+                     linked list will be removed
+        :type node: Optional[ArrayNode]
+        :return:
+        :rtype: None
+        """
+        super().remove_after(node)
+        self._links_changed()
+        if not self:
+            self._contiguous = True
+
+    def _remove_matches(self, matches: np.ndarray) -> int:
+        """
+        Remove the nodes at the positions in link order where the given mask is True,
+        the nodes kept are relinked and the slots removed are released in vectorized
+        steps
+
+        :param matches: A boolean array with one item for every node in link order
+        :type matches: np.ndarray
+        :return: The number of nodes removed
+        :rtype: int
+        """
+        removed: int = int(np.count_nonzero(matches))
+        if not removed:
+            return 0
+
+        order: np.ndarray = self._link_order()
+        kept: np.ndarray = order[~matches]
+        released: np.ndarray = order[matches]
+        next_slots: np.ndarray = self.next_slots
+
+        # push the slots removed to the free list in link order
+        self.value_slots[released] = 0
+        next_slots[released[:-1]] = released[1:]
+        next_slots[released[-1]] = self.free_index
+        self.free_index = int(released[0])
+
+        self._size -= removed
+        if not len(kept):
+            self.head_index = self.tail_index = NIL
+            self._contiguous = True
+            self._order = None
+            return removed
+
+        next_slots[kept[:-1]] = kept[1:]
+        next_slots[kept[-1]] = NIL
+        self.head_index, self.tail_index = int(kept[0]), int(kept[-1])
+        if not (self._contiguous and self.tail_index == len(kept) - 1):
+            # the nodes kept are no longer the first slots, but their order is known
+            self._contiguous = False
+            self._order = kept
+        return removed
+
+    def remove_if(self, predicate: Callable[[Any], bool]) -> int:
+        """
+        Remove all nodes whose value the given predicate returns True for, the predicate
+        is called with the values as Python numbers before any node is removed
+
+        Complexity:
+          - Space: Θ(n)
+          - Time: Θ(n), Ο(n), Ω(n)
+
+        :param predicate:
+        :type predicate: Callable[[Any], bool]
+        :return: The number of nodes removed
+        :rtype: int
+        """
+        matches: np.ndarray = np.fromiter(
+            map(predicate, self._live_values().tolist()), dtype=bool, count=self._size
+        )
+        return self._remove_matches(matches)
+
+    def remove_values(self, values: Iterable[Any]) -> int:
+        """
+        Remove all nodes holding any of the given values, all values are matched at
+        once
+
+        Complexity:
+          - Space: Θ(m + n)
+          - Time: Θ((m + n) log m) vectorized
+
+        :param values:
+        :type values: Iterable[Any]
+        :return: The number of nodes removed
+        :rtype: int
+        """
+        values = list(values)
+        targets: np.ndarray = np.asarray(values)
+        if targets.dtype.kind not in "biuf":  # not numbers, match them one by one
+            return super().remove_values(values)
+        return self._remove_matches(np.isin(self._live_values(), targets))
+
+    def reverse(self) -> None:
+        """
+        In-place reverse
+
+        :return:
+        :rtype: None
+        """
+        super().reverse()
+        if self._size > 1:
+            self._links_changed()
+
+    def compact(self) -> None:
+        """
+        Move the nodes to the first slots in link order and drop the free slots, so the
+        following scans read a view of `value_slots` without walking the links; the
+        handles to the nodes of this linked list are invalid afterwards
+
+        Complexity:
+          - Space: Θ(n)
+          - Time: Θ(n)
+
+        :return:
+        :rtype: None
+        """
+        if self._contiguous and self.free_index == NIL and self._used == self._size:
+            return
+
+        size: int = self._size
+        if size:
+            self.value_slots[:size] = self._live_values()
+            self.next_slots[: size - 1] = np.arange(1, size)
+            self.next_slots[size - 1:] = NIL
+            self.head_index, self.tail_index = 0, size - 1
+        else:  # an empty linked list only drops its free slots
+            self.head_index = self.tail_index = NIL
+        self.free_index = NIL
+        self._used = size
+        self._contiguous = True
+        self._order = None
+
+    def positions(self, value: Any) -> np.ndarray:
+        """
+        Return the positions in link order of all nodes equal to the given value
+
+        Complexity:
+          - Space: Θ(n)
+          - Time: Θ(n) vectorized
+
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: np.ndarray
+        """
+        return np.flatnonzero(self._live_values() == value)
+
+    def search(self, value: Any) -> Optional[ArrayNode]:
+        """
+        Search for a given value, return the first node found
+
+        Complexity:
+          - Space: Θ(n)
+          - Time: Θ(n) vectorized
+
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: Optional[ArrayNode]
+        """
+        matches: np.ndarray = self._live_values() == value
+        if not matches.any():
+            return None
+        return ArrayNode(self, int(self._slots(matches.argmax())))
+
+    def search_iter(self, value: Any) -> Generator[ArrayNode, None, None]:
+        """
+        Search for a given value, return a iterator of the nodes found, the values are
+        compared at once before the first node is yielded
+
+        Complexity:
+          - Space: Θ(n)
+          - Time: Θ(n) vectorized
+
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: Generator[ArrayNode, None, None]
+        """
+        for slot in self._slots(self.positions(value)).tolist():
+            yield ArrayNode(self, slot)
+
+    def contains_value(self, value: Any) -> bool:
+        """
+        Check if any node of this numeric linked list holds the given value
+
+        Complexity:
+          - Space: Θ(n)
+          - Time: Θ(n) vectorized
+
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: bool
+        """
+        return bool((self._live_values() == value).any())
+
+    def replace(self, old: Any, new: Any, max_: Optional[int] = None) -> None:
+        """
+        In-place replace the node old value with the given new one, all values are
+        compared and replaced at once
+
+        Complexity:
+          - Space: Θ(n)
+          - Time: Θ(n) vectorized
+
+        :param old: The old value to be replaced
+        :type old: Any
+        :param new: The new value to replace the old one
+        :type new: Any
+        :param max_: if max is not provided all of nodes equaled to old will be changed to
+                     new, otherwise only the first max_ nodes are checked
+        :type max_: Optional[int]
+        :return: This method is a in-place change and returns None
+        :rtype: None
+        """
+        size: int = self._size if max_ is None else max(0, min(max_, self._size))
+        if self._contiguous:
+            values: np.ndarray = self.value_slots[:size]
+            values[values == old] = new
+        else:
+            slots: np.ndarray = self._link_order()[:size]
+            self.value_slots[slots[self.value_slots[slots] == old]] = new
+
+    def replace_many(
+            self, mapping: Mapping[Any, Any], max_: Optional[int] = None
+    ) -> None:
+        """
+        In-place replace the values found in the given mapping with the values they are
+        mapped to, the keys are sorted once and all values are looked up at once by a
+        binary search; a mapping with keys not comparable with numbers is applied node
+        by node
+
+        Complexity:
+          - Space: Θ(n + m)
+          - Time: Θ((n + m) log m) vectorized, m is the size of the mapping
+
+        :param mapping: The mapping from old values to new values
+        :type mapping: Mapping[Any, Any]
+        :param max_: if max is not provided all of values are checked, otherwise only
+                     the first max_ values
+        :type max_: Optional[int]
+        :return: This method is a in-place change and returns None
+        :rtype: None
+        """
+        if not mapping:
+            return
+
+        size: int = self._size if max_ is None else max(0, min(max_, self._size))
+        slots: Optional[np.ndarray] = (
+            None if self._contiguous else self._link_order()[:size]
+        )
+        values: np.ndarray = (
+            self.value_slots[:size] if slots is None else self.value_slots[slots]
+        )
+        keys: np.ndarray = np.array(list(mapping.keys()))
+        if keys.dtype.kind not in "biuf":  # keys not comparable with numbers
+            super().replace_many(mapping, max_)
+            return
+
+        order: np.ndarray = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        found: np.ndarray = np.searchsorted(keys, values).clip(max=len(keys) - 1)
+        matches: np.ndarray = keys[found] == values
+
+        news: np.ndarray = np.array(
+            list(mapping.values()), dtype=self.value_slots.dtype
+        )[order]
+        if slots is None:
+            values[matches] = news[found[matches]]
+        else:
+            self.value_slots[slots[matches]] = news[found[matches]]
+
+    def sum(self) -> Any:
+        """
+        Return the sum of the values in link order
+
+        :return:
+        :rtype: Any
+        """
+        return self._live_values().sum().item()
+
+    def min(self) -> Any:
+        """
+        Return the smallest value
+
+        :return:
+        :rtype: Any
+        :raise ValueError: If this numeric linked list is empty
+        """
+        if not self._size:
+            raise ValueError("min() of an empty linked list")
+        return self._live_values().min().item()
+
+    def max(self) -> Any:
+        """
+        Return the largest value
+
+        :return:
+        :rtype: Any
+        :raise ValueError: If this numeric linked list is empty
+        """
+        if not self._size:
+            raise ValueError("max() of an empty linked list")
+        return self._live_values().max().item()
+
+    def _pickle_kwargs(self) -> Dict[str, Any]:
+        """
+        The keyword arguments to create an empty numeric linked list of the same dtype
+        when unpickled
+
+        :return:
+        :rtype: Dict[str, Any]
+        """
+        return {"dtype": self.value_slots.dtype}
+
+    def _pickle_values(self, protocol: int) -> np.ndarray:
+        """
+        The values of this numeric linked list in link order as one array, which NumPy
+        pickles as a buffer sent out-of-band with pickle protocol 5
+
+        :param protocol:
+        :type protocol: int
+        :return:
+        :rtype: np.ndarray
+        """
+        return self.to_numpy()
+
+    def to_numpy(self) -> np.ndarray:
+        """
+        Return a copy of the values in link order
+
+        :return:
+        :rtype: np.ndarray
+        """
+        return self._live_values().copy()
+
+    def values(self) -> Iterator[Any]:
+        """
+        Iterate the values of this numeric linked list as Python numbers, converted in
+        chunks of CHUNK_SIZE values and chained at the C level
+
+        :return:
+        :rtype: Iterator[Any]
+        """
+        values: np.ndarray = self._live_values()
+        return chain.from_iterable(
+            values[start: start + CHUNK_SIZE].tolist()
+            for start in range(0, len(values), CHUNK_SIZE)
+        )
@@ -0,0 +1,265 @@
+"""
+The queues built on the linked lists
+
+ * Async Linked Queue
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable, Optional
+
+from data_structures.exceptions import LinkedListIndexError
+from data_structures.linked_list.doubly import DoublyLinkedList
+from data_structures.linked_list.nodes import DoublyNode
+
+
+class AsyncLinkedQueue:
+    """
+    A first in, first out queue for the coroutines of one event loop, built on
+    DoublyLinkedList, with the interface of `asyncio.Queue`
+
+    Every item is held by a node of a doubly linked list, `put` returns the node, so a
+    queued item can be removed in Ο(1) by `remove`, e.g. when the request it stands for
+    is cancelled. The coroutines waiting in `get` and `put` are kept in doubly linked
+    lists of their own, so a cancelled waiter is removed in Ο(1) too.
+
+    A queue with a `maxsize` greater than 0 holds at most `maxsize` items, `put` waits
+    for a free place, so a fast producer is held back to the pace of the consumers.
+
+    Every item put is an unfinished task until a consumer calls `task_done` for it, or
+    it is removed by `remove`, and `join` waits until no task is unfinished.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        """
+
+        :param maxsize: The maximum number of items, or 0 for no limit
+        :type maxsize: int
+        """
+        self._maxsize: int = maxsize
+        self._items: DoublyLinkedList = DoublyLinkedList()
+        self._getters: DoublyLinkedList = DoublyLinkedList()
+        self._putters: DoublyLinkedList = DoublyLinkedList()
+        self._unfinished_tasks: int = 0
+        # created by `join` in the running event loop, and set when no task is left
+        self._finished: Optional[asyncio.Event] = None
+
+    def __repr__(self) -> str:
+        """
+
+        :return:
+        :rtype: str
+        """
+        return (
+            f"<{type(self).__name__} maxsize={self._maxsize} "
+            f"qsize={len(self._items)} tasks={self._unfinished_tasks}>"
+        )
+
+    def __len__(self) -> int:
+        """
+        Return the number of items in this queue
+
+        :return:
+        :rtype: int
+        """
+        return len(self._items)
+
+    @property
+    def maxsize(self) -> int:
+        """
+        The maximum number of items in this queue, 0 for no limit
+
+        :return:
+        :rtype: int
+        """
+        return self._maxsize
+
+    def qsize(self) -> int:
+        """
+        Return the number of items in this queue
+
+        :return:
+        :rtype: int
+        """
+        return len(self._items)
+
+    def empty(self) -> bool:
+        """
+        Return True if this queue is empty, otherwise return False
+
+        :return:
+        :rtype: bool
+        """
+        return not self._items
+
+    def full(self) -> bool:
+        """
+        Return True if this queue holds `maxsize` items, otherwise return False
+
+        :return:
+        :rtype: bool
+        """
+        return 0 < self._maxsize <= len(self._items)
+
+    @staticmethod
+    def _wakeup_next(waiters: DoublyLinkedList) -> None:
+        """
+        Wake up the first waiter which is still waiting
+
+        :param waiters:
+        :type waiters: DoublyLinkedList
+        :return:
+        :rtype: None
+        """
+        while waiters:
+            future: asyncio.Future = waiters.popleft().value
+            if not future.done():
+                future.set_result(None)
+                break
+
+    async def _wait(
+            self, waiters: DoublyLinkedList, blocked: Callable[[], bool]
+    ) -> None:
+        """
+        Wait in the given waiters until woken up by `_wakeup_next`, a waiter cancelled
+        is removed from the waiters, or passes its wakeup on if it had one already
+
+        :param waiters:
+        :type waiters: DoublyLinkedList
+        :param blocked: Return True while the waiters cannot go on
+        :type blocked: Callable[[], bool]
+        :return:
+        :rtype: None
+        """
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        waiters.append(future)
+        node: DoublyNode = waiters.tail
+        try:
+            await future
+        except BaseException:
+            future.cancel()  # the future may not be done yet
+            try:
+                waiters.remove_node(node)
+            except LinkedListIndexError:  # it has been woken up already
+                pass
+            if not blocked() and not future.cancelled():
+                self._wakeup_next(waiters)
+            raise
+
+    def put_nowait(self, value: Any) -> DoublyNode:
+        """
+        Put the given value at the end of this queue without waiting
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1)
+
+        :param value:
+        :type value: Any
+        :return: The node holding the value, to be removed by `remove`
+        :rtype: DoublyNode
+        :raise asyncio.QueueFull: If this queue is full
+        """
+        if self.full():
+            raise asyncio.QueueFull
+        self._items.append(value)
+        self._unfinished_tasks += 1
+        self._wakeup_next(self._getters)
+        return self._items.tail
+
+    async def put(self, value: Any) -> DoublyNode:
+        """
+        Put the given value at the end of this queue, wait for a free place if this
+        queue is full
+
+        :param value:
+        :type value: Any
+        :return: The node holding the value, to be removed by `remove`
+        :rtype: DoublyNode
+        """
+        while self.full():
+            await self._wait(self._putters, self.full)
+        return self.put_nowait(value)
+
+    def get_nowait(self) -> Any:
+        """
+        Remove and return the value at the front of this queue without waiting
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1)
+
+        :return:
+        :rtype: Any
+        :raise asyncio.QueueEmpty: If this queue is empty
+        """
+        if not self._items:
+            raise asyncio.QueueEmpty
+        node: DoublyNode = self._items.popleft()
+        self._wakeup_next(self._putters)
+        return node.value
+
+    async def get(self) -> Any:
+        """
+        Remove and return the value at the front of this queue, wait for a value if
+        this queue is empty
+
+        :return:
+        :rtype: Any
+        """
+        while self.empty():
+            await self._wait(self._getters, self.empty)
+        return self.get_nowait()
+
+    def remove(self, node: DoublyNode) -> None:
+        """
+        Remove the item held by the given node, which is returned by `put`, from this
+        queue wherever it is, a place is freed for a waiting `put`, and the task of the
+        item is done, as no consumer gets it
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1)
+
+        :param node:
+        :type node: DoublyNode
+        :return:
+        :rtype: None
+        :raise LinkedListIndexError: If the item has been got or removed already
+        """
+        self._items.remove_node(node)
+        self._wakeup_next(self._putters)
+        self.task_done()
+
+    def task_done(self) -> None:
+        """
+        Mark a task got from this queue as done, once all tasks are done the coroutines
+        waiting in `join` go on
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1)
+
+        :return:
+        :rtype: None
+        :raise ValueError: If it is called more times than the items put
+        """
+        if self._unfinished_tasks <= 0:
+            raise ValueError("task_done() called too many times")
+        self._unfinished_tasks -= 1
+        if self._unfinished_tasks == 0 and self._finished is not None:
+            self._finished.set()
+            self._finished = None
+
+    async def join(self) -> None:
+        """
+        Wait until every item put in this queue has been got and marked done by
+        `task_done`, or removed
+
+        :return:
+        :rtype: None
+        """
+        if self._unfinished_tasks:
+            if self._finished is None:
+                self._finished = asyncio.Event()
+            await self._finished.wait()
@@ -0,0 +1,463 @@
+"""
+The array linked list keeping its slots in shared memory, to be read by other processes
+without copying
+
+ * Shared Array Linked List
+"""
+from __future__ import annotations
+
+import functools
+import os
+from array import array
+from contextlib import contextmanager, nullcontext
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Callable, Generator, Iterable, Optional, Tuple, TypeVar
+
+from data_structures.exceptions import LinkedListFullError
+from data_structures.linked_list.arrays import NIL, ArraySinglyLinkedList
+
+_Method = TypeVar("_Method", bound=Callable[..., Any])
+
+# the fields of the header of the shared memory, each one a signed 64-bit integer
+_HEAD, _TAIL, _FREE, _SIZE, _CAPACITY, _TYPECODE = range(6)
+_HEADER_SIZE: int = 6 * 8
+
+# the typecodes of the array module for fixed-width numbers
+TYPECODES: str = "bBhHiIlLqQfd"
+
+
+def _attach_memory(name: str) -> shared_memory.SharedMemory:
+    """
+    Open the shared memory of the given name without tracking it, otherwise a process
+    with a resource tracker of its own removes the shared memory when it exits
+
+    :param name:
+    :type name: str
+    :return:
+    :rtype: shared_memory.SharedMemory
+    """
+    try:
+        return shared_memory.SharedMemory(  # pylint: disable=unexpected-keyword-arg
+            name=name, track=False
+        )
+    except TypeError:  # the argument track is new in Python 3.13
+        memory: shared_memory.SharedMemory = shared_memory.SharedMemory(name=name)
+        if os.name == "posix":
+            # pylint: disable=protected-access
+            resource_tracker.unregister(memory._name, "shared_memory")
+        return memory
+
+
+def _write(method: _Method) -> _Method:
+    """
+    Wrap the given method of a shared array linked list to run with its lock held, for
+    the operations changing the slots
+
+    :param method:
+    :type method: Callable
+    :return:
+    :rtype: Callable
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.locked():
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class SharedArrayLinkedList(  # pylint: disable=too-many-instance-attributes
+        ArraySinglyLinkedList
+):
+    """
+    The array singly linked list keeping its slots in one block of
+    `multiprocessing.shared_memory`, so other processes attach to the same slots by the
+    name of the block instead of receiving a copy of every node:
+
+    * a header of six signed 64-bit integers - the indices of the head, the tail and the
+      first free slot, the size, the capacity and the typecode
+    * `next_slots` - the index of the next slot of every slot, as in
+      ArraySinglyLinkedList
+    * `value_slots` - the value of every slot, a fixed-width number of the typecode of
+      the array module, e.g. "d" for a float or "q" for a signed 64-bit integer
+
+    The slots are memoryviews of the shared memory, so every process reads the links
+    and the values written by any other process. The number of slots is fixed when the
+    linked list is created, adding a node with all slots in use raises an error. The
+    values must fit in the typecode, and there is no hash index.
+
+    Pickling the linked list only pickles the name of the block, so it can be passed to
+    the tasks of a `ProcessPoolExecutor` as it is, and the worker attaches to the block
+    when the task is unpickled; `attach` does the same given the name.
+
+    Writing is meant for one process, e.g. the parent. If several processes write, or
+    one process writes while others read, pass a lock of `multiprocessing`, and the same
+    lock to `attach`: every method changing the slots holds the lock, and a reader holds
+    it with `locked` around a traversal. A lock can only be passed to other processes
+    when they are started, e.g. in the initializer of a `ProcessPoolExecutor`.
+
+    The creator owns the block: `close` detaches a process from the block, and the
+    creator removes it with `unlink`, or both at the end of a `with` block.
+    """
+
+    def __init__(  # pylint: disable=super-init-not-called
+            self,
+            *args,
+            typecode: str = "d",
+            capacity: int = 1024,
+            name: Optional[str] = None,
+            lock: Any = None,
+    ):
+        """
+
+        :param args:
+        :param typecode: The typecode of the values, one of `TYPECODES`
+        :type typecode: str
+        :param capacity: The fixed number of slots
+        :type capacity: int
+        :param name: The name of the block of shared memory, a random name if not
+                     provided
+        :type name: Optional[str]
+        :param lock: A lock of `multiprocessing` held by the methods writing the slots
+        :type lock: Any
+        :raise ValueError: If the typecode is not of a fixed-width number or the capacity
+                           is less than 1
+        """
+        if len(typecode) != 1 or typecode not in TYPECODES:
+            raise ValueError(f"typecode must be one of {TYPECODES!r}, not {typecode!r}")
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, not {capacity}")
+
+        size: int = _HEADER_SIZE + capacity * (8 + array(typecode).itemsize)
+        self._map(
+            shared_memory.SharedMemory(name=name, create=True, size=size),
+            lock,
+            owner=True,
+            layout=(capacity, typecode),
+        )
+
+        # all slots are chained into the free list
+        self.next_slots[:] = array("q", range(1, capacity + 1))
+        self.next_slots[-1] = NIL
+        self.head_index = self.tail_index = NIL
+        self.free_index = 0
+        self._size = 0
+
+        try:
+            self._init(*args)
+        except BaseException:  # no linked list is returned to remove the block later
+            self.close()
+            self.unlink()
+            raise
+
+    def _map(
+            self,
+            memory: shared_memory.SharedMemory,
+            lock: Any,
+            owner: bool,
+            layout: Optional[Tuple[int, str]] = None,
+    ) -> None:
+        """
+        Map the header and the slots onto the given shared memory, the capacity and the
+        typecode are written to the header if the layout is given, otherwise read from
+        it
+
+        :param memory:
+        :type memory: shared_memory.SharedMemory
+        :param lock:
+        :type lock: Any
+        :param owner: Whether this linked list created the shared memory
+        :type owner: bool
+        :param layout: The capacity and the typecode of a new linked list
+        :type layout: Optional[Tuple[int, str]]
+        :return:
+        :rtype: None
+        """
+        self._memory: shared_memory.SharedMemory = memory
+        self._lock: Any = lock
+        self._owner: bool = owner
+        self._index: None = None
+
+        self._header: memoryview = memory.buf[:_HEADER_SIZE].cast("q")
+        if layout is not None:
+            self._header[_CAPACITY], self._header[_TYPECODE] = layout[0], ord(layout[1])
+        capacity: int = self._header[_CAPACITY]
+
+        offset: int = _HEADER_SIZE + capacity * 8
+        self.next_slots: memoryview = memory.buf[_HEADER_SIZE:offset].cast("q")
+        typecode: str = chr(self._header[_TYPECODE])
+        self.value_slots: memoryview = memory.buf[
+            offset: offset + capacity * array(typecode).itemsize
+        ].cast(typecode)
+
+    @classmethod
+    def attach(cls, name: str, lock: Any = None) -> SharedArrayLinkedList:
+        """
+        Attach to the shared array linked list of the given name, created by this or any
+        other process, the slots are shared, not copied
+
+        :param name: The name of the block of shared memory
+        :type name: str
+        :param lock: The lock the linked list is created with, if any
+        :type lock: Any
+        :return:
+        :rtype: SharedArrayLinkedList
+        :raise FileNotFoundError: If there is no block of the given name
+        """
+        linked_list: SharedArrayLinkedList = cls.__new__(cls)
+        linked_list._map(_attach_memory(name), lock, owner=False)
+        return linked_list
+
+    def __reduce_ex__(self, protocol: int) -> Tuple[Callable, Tuple[str, Any]]:
+        """
+        Pickle the name of the block of shared memory instead of the slots, the linked
+        list is attached to again when unpickled
+
+        :param protocol:
+        :type protocol: int
+        :return:
+        :rtype: Tuple[Callable, Tuple[str, Any]]
+        """
+        return type(self).attach, (self.name, self._lock)
+
+    def __enter__(self) -> SharedArrayLinkedList:
+        """
+
+        :return:
+        :rtype: SharedArrayLinkedList
+        """
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """
+        Close this linked list, and remove the shared memory if this linked list
+        created it
+
+        :param exc_info:
+        :return:
+        :rtype: None
+        """
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    def __del__(self) -> None:
+        """
+        Release the views before the shared memory is closed when garbage collected
+
+        :return:
+        :rtype: None
+        """
+        if hasattr(self, "_memory"):
+            self.close()
+
+    @property
+    def name(self) -> str:
+        """
+        The name of the block of shared memory, which other processes attach to
+
+        :return:
+        :rtype: str
+        """
+        return self._memory.name
+
+    @property
+    def typecode(self) -> str:
+        """
+        The typecode of the values
+
+        :return:
+        :rtype: str
+        """
+        return chr(self._header[_TYPECODE])
+
+    @property
+    def capacity(self) -> int:
+        """
+        The fixed number of slots
+
+        :return:
+        :rtype: int
+        """
+        return self._header[_CAPACITY]
+
+    @property
+    def head_index(self) -> int:
+        """
+
+        :return:
+        :rtype: int
+        """
+        return self._header[_HEAD]
+
+    @head_index.setter
+    def head_index(self, index: int) -> None:
+        """
+
+        :param index:
+        :type index: int
+        :return:
+        :rtype: None
+        """
+        self._header[_HEAD] = index
+
+    @property
+    def tail_index(self) -> int:
+        """
+
+        :return:
+        :rtype: int
+        """
+        return self._header[_TAIL]
+
+    @tail_index.setter
+    def tail_index(self, index: int) -> None:
+        """
+
+        :param index:
+        :type index: int
+        :return:
+        :rtype: None
+        """
+        self._header[_TAIL] = index
+
+    @property
+    def free_index(self) -> int:
+        """
+
+        :return:
+        :rtype: int
+        """
+        return self._header[_FREE]
+
+    @free_index.setter
+    def free_index(self, index: int) -> None:
+        """
+
+        :param index:
+        :type index: int
+        :return:
+        :rtype: None
+        """
+        self._header[_FREE] = index
+
+    @property
+    def _size(self) -> int:
+        """
+        The size counter, kept in the header so all processes see the same length
+
+        :return:
+        :rtype: int
+        """
+        return self._header[_SIZE]
+
+    @_size.setter
+    def _size(self, size: int) -> None:
+        """
+
+        :param size:
+        :type size: int
+        :return:
+        :rtype: None
+        """
+        self._header[_SIZE] = size
+
+    @contextmanager
+    def locked(self) -> Generator[None, None, None]:
+        """
+        Hold the lock of this linked list, if there is one, within the `with` block, so
+        no other process writes the slots meanwhile
+
+        :return:
+        :rtype: Generator[None, None, None]
+        """
+        with nullcontext() if self._lock is None else self._lock:
+            yield
+
+    def close(self) -> None:
+        """
+        Detach this process from the shared memory, the linked list cannot be used any
+        more in this process, while the other processes keep using it
+
+        :return:
+        :rtype: None
+        """
+        for view in (self._header, self.next_slots, self.value_slots):
+            view.release()
+        self._memory.close()
+
+    def unlink(self) -> None:
+        """
+        Remove the shared memory once all processes have closed it, only the process
+        creating the linked list should call this method
+
+        :return:
+        :rtype: None
+        """
+        if os.name == "posix":  # it is untracked if attached from the same tracker
+            # pylint: disable=protected-access
+            resource_tracker.register(self._memory._name, "shared_memory")
+        self._memory.unlink()
+
+    def _allocate(self, value: Any) -> int:
+        """
+        Take a slot from the free list, the value is written first, so a value not
+        fitting the typecode leaves this linked list unchanged
+
+        :param value:
+        :type value: Any
+        :return: The index of the slot
+        :rtype: int
+        :raise LinkedListFullError: If all slots are in use
+        """
+        index: int = self.free_index
+        if index == NIL:
+            raise LinkedListFullError(f"all {self.capacity} slots are in use")
+
+        self.value_slots[index] = value
+        self.free_index = self.next_slots[index]
+        self.next_slots[index] = NIL
+        return index
+
+    def _release(self, index: int) -> None:
+        """
+        Put the given slot back to the free list
+
+        :param index:
+        :type index: int
+        :return:
+        :rtype: None
+        """
+        self.value_slots[index] = 0
+        self.next_slots[index] = self.free_index
+        self.free_index = index
+
+    @_write
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """
+        Append the values of the given iterable after the tail of this linked list, with
+        the lock held once for all of them
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(k), Ο(k), Ω(k)
+
+        :param iterable:
+        :type iterable: Iterable[Any]
+        :return:
+        :rtype: None
+        :raise LinkedListFullError: If all slots are in use
+        """
+        for value in iterable:  # the lock is not reentrant, append is not called
+            ArraySinglyLinkedList.append(self, value)
+
+    append = _write(ArraySinglyLinkedList.append)
+    insert_after = _write(ArraySinglyLinkedList.insert_after)
+    remove_after = _write(ArraySinglyLinkedList.remove_after)
+    remove_if = _write(ArraySinglyLinkedList.remove_if)
+    replace = _write(ArraySinglyLinkedList.replace)
+    replace_many = _write(ArraySinglyLinkedList.replace_many)
+    replace_if = _write(ArraySinglyLinkedList.replace_if)
+    reverse = _write(ArraySinglyLinkedList.reverse)
+    pop = _write(ArraySinglyLinkedList.pop)
@@ -6,146 +6,330 @@ The linked list with only one link property node
 """
 from __future__ import annotations
 
-from collections.abc import Iterator, Reversible
-from typing import Any, List, Optional, Union
-
-from data_structures.exceptions import LinkedListIndexError
+import math
+from collections.abc import Reversible
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from data_structures.exceptions import LinkedListIndexError, LinkedListReadOnlyError
 from data_structures.linked_list import LinkedList
 from data_structures.linked_list.nodes import SinglyNode
 
 
-class SinglyLinkedListIterator(Iterator):  # pylint: disable=too-few-public-methods
+def _reversed_segment(
+        node: Optional[SinglyNode], count: int, levels: int = 2
+) -> Generator[SinglyNode, None, None]:
     """
-    Iterator for Singly Linked List
+    Iterate the given number of nodes starting from the given node in reversed order
+
+    The segment is split into about count^(1/levels) parts, the first node of each part
+    is remembered as a checkpoint in one pass, and the parts are reversed one by one
+    from the last checkpoint, each of them split again with one level less. A single
+    level collects the whole segment into a list.
+
+    Complexity:
+      - Space: Θ(levels * count^(1/levels))
+      - Time: Θ(levels * count)
+
+    :param node: The first node of the segment
+    :type node: Optional[SinglyNode]
+    :param count: The number of nodes in the segment
+    :type count: int
+    :param levels: The number of levels to split the segment
+    :type levels: int
+    :return:
+    :rtype: Generator[SinglyNode, None, None]
     """
+    if levels <= 1 or count <= 2:
+        block: List[SinglyNode] = []
+        for _ in range(count):
+            block.append(node)
+            node = node.next
+        yield from reversed(block)
+        return
+
+    step: int = max(1, math.ceil(count ** ((levels - 1) / levels)))
+
+    checkpoints: List[Tuple[SinglyNode, int]] = []
+    remaining: int = count
+    while remaining > 0:
+        length: int = min(step, remaining)
+        checkpoints.append((node, length))
+        remaining -= length
+        if remaining:
+            for _ in range(length):
+                node = node.next
+
+    for node, length in reversed(checkpoints):
+        yield from _reversed_segment(node, length, levels - 1)
 
-    def __init__(self, singly_linked_list: SinglyLinkedList):
-        """
-
-        :param singly_linked_list:
-        :type singly_linked_list: SinglyLinkedList
-        """
-        self.singly_linked_list = singly_linked_list
-        self.cursor: Optional[SinglyNode] = self.singly_linked_list.head
 
-    def __next__(self) -> SinglyNode:
-        """
+class SinglyLinkedList(LinkedList, Reversible):
+    """
+    This is the simple singly linked list:
 
-        :return:
-        :rtype: SinglyNode
-        """
-        if self.cursor:
-            cursor: Optional[SinglyNode] = self.cursor
-            self.cursor = cursor.next
-            return cursor
-        raise StopIteration
+    * have one head pointer and one tail pointer
 
+    The nodes are created from `node_class`, which can be overridden by a subclass to
+    use any other SinglyNode class
 
-class SinglyLinkedListReversedIterator(  # pylint: disable=too-few-public-methods
-        SinglyLinkedListIterator
-):
-    """
-    Reversed Iterator for Singly Linked List
+    A singly linked list can be frozen as a whole by `freeze`, then every method
+    changing it raises LinkedListReadOnlyError, while the nodes are still read
+    straight from their attributes. A frozen singly linked list stays frozen when it
+    is pickled or copied.
     """
 
-    def __init__(self, singly_linked_list: SinglyLinkedList):
-        """
+    node_class: Type[SinglyNode] = SinglyNode
 
-        :param singly_linked_list:
-        :type singly_linked_list: SinglyLinkedList
-        """
-        super(SinglyLinkedListReversedIterator, self).__init__(singly_linked_list)
+    # set on an instance by freeze, checked by every method changing this linked list
+    _frozen: bool = False
 
-        self._reversed_singly_linked_list: SinglyLinkedList = SinglyLinkedList()
+    @property
+    def frozen(self) -> bool:
+        """
+        Whether this singly linked list is frozen, see freeze
 
-        _: Optional[SinglyNode] = None
-        node: Optional[SinglyNode] = None
+        :return:
+        :rtype: bool
+        """
+        return self._frozen
 
-        for i in self.singly_linked_list:
-            node = SinglyNode(i.value)
-            node.next = _
+    def freeze(self) -> None:
+        """
+        Freeze this singly linked list, any method changing it raises
+        LinkedListReadOnlyError until `unfreeze` is called
 
-        self._reversed_singly_linked_list.head = node
-        self.cursor = node
+        Only the flag of this linked list is set, so the nodes stay plain SinglyNode
+        instances, read without the property of SecureSinglyNode on every access. The
+        nodes are not frozen themselves: a node changed directly is not caught, which
+        a SecureSinglyNode as `node_class` still does node by node with its own
+        `freeze` and `unfreeze`.
 
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1)
 
-class SinglyLinkedListSearchIterator(  # pylint: disable=too-few-public-methods
-        SinglyLinkedListIterator
-):
-    """
-    Search Iterator for Singly Linked List
-    """
+        :return:
+        :rtype: None
+        """
+        self._frozen = True
 
-    def __init__(self, singly_linked_list: SinglyLinkedList, value: Any):
+    def unfreeze(self) -> None:
         """
+        Unfreeze this singly linked list, it can be changed again
 
-        :param singly_linked_list:
-        :type singly_linked_list: SinglyLinkedList
-        :param value:
-        :type value: Any
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1)
+
+        :return:
+        :rtype: None
         """
-        super(SinglyLinkedListSearchIterator, self).__init__(singly_linked_list)
-        self.value = value
+        self._frozen = False
 
-    def __next__(self) -> SinglyNode:
+    def _check_frozen(self) -> None:
         """
+        Refuse any change of this singly linked list when it is frozen
 
         :return:
-        :rtype: SinglyNode
+        :rtype: None
+        :raise LinkedListReadOnlyError: If this singly linked list is frozen
         """
-        while True:
-            current: Optional[SinglyNode] = self.cursor
-            try:
-                self.cursor = current.next
-            except AttributeError:  # if the singly linked list is empty
-                raise StopIteration
-            if current.value == self.value:
-                return current
-            if current.next is None:
-                raise StopIteration
+        if self._frozen:
+            raise LinkedListReadOnlyError(f"{type(self).__name__} is frozen")
 
+    @classmethod
+    def from_iterable(
+            cls, iterable: Iterable[Any], frozen: bool = False, **kwargs
+    ) -> SinglyLinkedList:
+        """
+        Create a singly linked list from the given iterable, see
+        LinkedList.from_iterable, and freeze it once all nodes are linked if `frozen`
+        is True, as a reference list only read after it is loaded
 
-class SinglyLinkedList(LinkedList, Reversible):
-    """
-    This is the simple singly linked list:
-
-    * have only one head point, no tail pointer
+        :param iterable:
+        :type iterable: Iterable[Any]
+        :param frozen: Freeze the singly linked list created
+        :type frozen: bool
+        :param kwargs: The keyword arguments of the singly linked list class
+        :return:
+        :rtype: SinglyLinkedList
+        """
+        linked_list: SinglyLinkedList = super().from_iterable(iterable, **kwargs)
+        if frozen:
+            linked_list.freeze()
+        return linked_list
 
-    """
+    def _pickle_kwargs(self) -> Dict[str, Any]:
+        """
+        The keyword arguments to create a singly linked list like this one when
+        unpickled, a frozen one is frozen again, so a pickled or copied reference list
+        stays read-only
 
-    def _init(self, *args) -> None:
-        if args:
-            self.head = SinglyNode(value=args[0])
-            current_node = self.head
-            for i in args[1:]:
-                current_node = SinglyNode.after_node(i, current_node)
+        :return:
+        :rtype: Dict[str, Any]
+        """
+        kwargs: Dict[str, Any] = super()._pickle_kwargs()
+        if self._frozen:
+            kwargs["frozen"] = True
+        return kwargs
 
-    def __iter__(self) -> SinglyLinkedListIterator:
+    def __iter__(self) -> Generator[SinglyNode, None, None]:
         """
+        Iterate the nodes of this singly linked list, the next node is fetched before
+        the current one is yielded, so the current node can be relinked or removed
 
         :return:
-        :rtype: SinglyLinkedListIterator
+        :rtype: Generator[SinglyNode, None, None]
         """
-        return SinglyLinkedListIterator(self)
+        node: Optional[SinglyNode] = self.head
+        while node is not None:
+            next_: Optional[SinglyNode] = node.next
+            yield node
+            node = next_
 
-    def __reversed__(self) -> SinglyLinkedListReversedIterator:
+    def __reversed__(self) -> Generator[SinglyNode, None, None]:
         """
+        Iterate the nodes of this singly linked list from the tail, with Θ(√n) memory,
+        see reversed_iter
 
         :return:
-        :rtype: SinglyLinkedListReversedIterator
+        :rtype: Generator[SinglyNode, None, None]
         """
-        return SinglyLinkedListReversedIterator(self)
+        return self.reversed_iter()
 
     def append(self, value: Any) -> None:
         """
         Append a node after the tail of this singly linked list
 
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1)
+
         :param value:
         :type value: Any
         :return:
         :rtype: None
         """
-        _ = SinglyNode.after_node(value, self.tail)
+        self._check_frozen()
+        node: SinglyNode = self.node_class(value)
+        if self._index is not None:
+            self._index_add(node)
+
+        if self:
+            self._tail.next = node
+        else:
+            self.head = node
+        self._tail = node
+        self._size += 1
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """
+        Append the values of the given iterable after the tail of this singly linked
+        list, the iterable is consumed lazily and the nodes are linked in one loop
+
+        Complexity:
+          - Space: Θ(k), Ο(k), Ω(k)
+          - Time: Θ(k), Ο(k), Ω(k)
+
+        :param iterable:
+        :type iterable: Iterable[Any]
+        :return:
+        :rtype: None
+        """
+        self._check_frozen()
+        if self._index is not None:  # index every node before it is linked
+            LinkedList.extend(self, iterable)
+            return
+
+        node_class: Type[SinglyNode] = self.node_class
+        values = iter(iterable)
+        tail: Optional[SinglyNode] = self._tail
+        size: int = self._size
+
+        try:
+            if tail is None:
+                for value in values:
+                    self.head = tail = node_class(value)
+                    size += 1
+                    break
+            for value in values:
+                tail.next = tail = node_class(value)
+                size += 1
+        finally:  # keep this singly linked list consistent if the iterable raises
+            self._tail = tail
+            self._size = size
+
+    def concat(self, other: SinglyLinkedList) -> None:
+        """
+        Move all nodes of the given singly linked list after the tail of this one, the
+        given linked list is left empty
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), or Θ(k) with the hash index
+
+        :param other:
+        :type other: SinglyLinkedList
+        :return:
+        :rtype: None
+        :raise LinkedListReadOnlyError: If either singly linked list is frozen
+        """
+        self._check_frozen()
+        head, tail, size = self._take(other)
+        if head is None:
+            return
+
+        if self._tail is None:
+            self.head = head
+        else:
+            self._tail.next = head
+        self._tail = tail
+        self._size += size
+
+    def split_after(self, node: Optional[SinglyNode] = None) -> SinglyLinkedList:
+        """
+        Move the nodes after the given node into a new singly linked list, the links
+        are cut in Θ(1), and the moved nodes are counted for the size of both lists
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(k), k is the number of the nodes moved
+
+        :param node: If node is not provided, all nodes are moved
+        :type node: Optional[SinglyNode]
+        :return: The new singly linked list
+        :rtype: SinglyLinkedList
+        """
+        self._check_frozen()
+        head: Optional[SinglyNode] = self.head if node is None else node.next
+        if head is None:
+            return self._split_off(None, None, 0)
+
+        tail: SinglyNode = self._tail
+        size: int = 1
+        cursor: SinglyNode = head
+        while cursor is not tail:
+            cursor = cursor.next
+            size += 1
+
+        if node is None:
+            self.head = None
+        else:
+            node.next = None
+        self._tail = node
+        return self._split_off(head, tail, size)
 
     def insert_after(
             self, value: Union[SinglyNode, Any], node: Optional[SinglyNode] = None
@@ -161,13 +345,21 @@ class SinglyLinkedList(LinkedList, Reversible):
         :return:
         :rtype: None
         """
+        self._check_frozen()
         if not isinstance(value, SinglyNode):
-            value = SinglyNode(value)
+            value = self.node_class(value)
+        if self._index is not None:
+            self._index_add(value)
 
         if node:
             value.next, node.next = node.next, value
+            if node is self._tail:
+                self._tail = value
         else:
             value.next, self.head = self.head, value
+            if self._tail is None:
+                self._tail = value
+        self._size += 1
 
     def pop(self) -> SinglyNode:
         """
@@ -176,67 +368,107 @@ class SinglyLinkedList(LinkedList, Reversible):
         :return:
         :rtype: SinglyNode
         """
-        last_two_nodes: List[Optional[SinglyNode]] = [None, None]
-        for node in self:
-            last_two_nodes = [last_two_nodes[1], node]
+        self._check_frozen()
+        if not self:  # check the singly linked list is empty or not
+            raise LinkedListIndexError
 
-        last_two_nodes[0].next = None
+        tail: SinglyNode = self._tail
+        if self._index is not None:
+            self._index_discard(tail)
+        self._size -= 1
+        if self.head is tail:
+            self.head = self._tail = None
+            return tail
 
-        return last_two_nodes[1]
+        node: SinglyNode = self.head
+        while node.next is not tail:
+            node = node.next
+
+        node.next = None
+        self._tail = node
+
+        return tail
 
     def remove_after(self, node: Optional[SinglyNode] = None) -> None:
         """
-        Remove one node after the give node
+        Remove one node after the give node, the given node is trusted to be in this
+        singly linked list, which is only checked in debug mode
 
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1), or Θ(n) in debug mode
 
         :param node: If after_node is not provided, the first node of this singly linked
                      list will be removed
         :type node: Optional[Node]
         :return:
         :rtype: None
+        :raise LinkedListIndexError: In debug mode, if the given node is not in this
+                                     singly linked list
         """
+        self._check_frozen()
         if not self:  # for empty linked list nothing happens
             return
 
         if node is None:  # remove the first node
+            if self._index is not None:
+                self._index_discard(self.head)
             self.head = self.head.next
-        else:
-            for node_ in self:
-                if node is node_:
-                    if node.next is None:
-                        # the give node is the last node in singly linked list, nothing
-                        # is removed
-                        return
-                    node.next = node.next.next
+            if self.head is None:
+                self._tail = None
+            self._size -= 1
+            return
 
-    def replace(self, old: Any, new: Any, max_: Optional[int] = None) -> None:
-        """
-        In-place replace the node old value with the given new one
+        if self.debug and not any(node is node_ for node_ in self):
+            raise LinkedListIndexError(f"{node!r} is not in the singly linked list")
 
-        Complexity:
-          - Space: Θ(n), Ο(n), Ω(1)
-          - Time: Θ(n), Ο(n), Ω(1)
+        removed: Optional[SinglyNode] = node.next
+        if removed is None:
+            # the give node is the last node in singly linked list, nothing is removed
+            return
+        if self._index is not None:
+            self._index_discard(removed)
+        if removed is self._tail:
+            self._tail = node
+        node.next = removed.next
+        self._size -= 1
 
-        :param old: The old value to be replaced
-        :type old: Any
-        :param new: The new value to replace the old one
-        :type new: Any
-        :param max_: if max is not provided all of nodes equaled to old will be changed to new
-        :type max_: Optional[int]
-        :return: This method is a in-place change and returns None
-        :rtype: None
+    def remove_if(self, predicate: Callable[[Any], bool]) -> int:
         """
-        for node in self:
-            if max_ == 0:
-                break
+        Remove all nodes whose value the given predicate returns True for, in one pass
 
-            if node.value == old:
-                node.value = new
-
-            if max_ is None:
-                continue
-            else:
-                max_ -= 1
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(n), Ο(n), Ω(n)
+
+        :param predicate:
+        :type predicate: Callable[[Any], bool]
+        :return: The number of nodes removed
+        :rtype: int
+        """
+        self._check_frozen()
+        index: Optional[Dict[Any, Dict[SinglyNode, None]]] = self._index
+        previous: Optional[SinglyNode] = None
+        node: Optional[SinglyNode] = self.head
+        removed: int = 0
+        try:
+            while node is not None:
+                next_: Optional[SinglyNode] = node.next
+                if predicate(node.value):
+                    if index is not None:
+                        self._index_discard(node)
+                    if previous is None:
+                        self.head = next_
+                    else:
+                        previous.next = next_
+                    removed += 1
+                else:
+                    previous = node
+                node = next_
+            self._tail = previous
+        finally:  # keep the size counter right even if the predicate raises
+            self._size -= removed
+        return removed
 
     def reverse(self) -> None:
         """
@@ -245,147 +477,330 @@ class SinglyLinkedList(LinkedList, Reversible):
         :return:
         :rtype: None
         """
+        self._check_frozen()
         _: Optional[SinglyNode] = None
         node: Optional[SinglyNode] = None
 
+        self._tail = self.head
+
         for node in self:
             node.next, _ = _, node
 
         self.head = node
 
-    def search_iter(self, value: Any) -> SinglyLinkedListSearchIterator:
+    def replace(self, old: Any, new: Any, max_: Optional[int] = None) -> None:
         """
-        Search for a given value, return a iterator
+        In-place replace the node old value with the given new one, see
+        LinkedList.replace
 
-        :param value:
-        :type value: Any
+        :param old: The old value to be replaced
+        :type old: Any
+        :param new: The new value to replace the old one
+        :type new: Any
+        :param max_: if max is not provided all of nodes equaled to old will be changed
+                     to new
+        :type max_: Optional[int]
         :return:
-        :rtype: Iterator
+        :rtype: None
         """
-        return SinglyLinkedListSearchIterator(self, value)
+        self._check_frozen()
+        super().replace(old, new, max_)
 
+    def replace_many(
+            self, mapping: Mapping[Any, Any], max_: Optional[int] = None
+    ) -> None:
+        """
+        In-place replace the values of the nodes found in the given mapping with the
+        values they are mapped to, see LinkedList.replace_many
 
-class CircularSinglyLinkedListIterator(Iterator):
-    """
+        :param mapping: The mapping from old values to new values
+        :type mapping: Mapping[Any, Any]
+        :param max_: if max is not provided all of nodes are checked, otherwise only the
+                     first max_ nodes
+        :type max_: Optional[int]
+        :return:
+        :rtype: None
+        """
+        self._check_frozen()
+        super().replace_many(mapping, max_)
 
-    """
+    def replace_if(
+            self, predicate: Callable[[Any], bool], func: Callable[[Any], Any]
+    ) -> None:
+        """
+        In-place replace the value of every node matching the given predicate with the
+        value returned by func for it, see LinkedList.replace_if
 
-    def __init__(self, circular_singly_linked_list: CircularSinglyLinkedList):
+        :param predicate: The function checking a value to be replaced
+        :type predicate: Callable[[Any], bool]
+        :param func: The function returning the new value for an old value
+        :type func: Callable[[Any], Any]
+        :return:
+        :rtype: None
         """
+        self._check_frozen()
+        super().replace_if(predicate, func)
 
-        :param circular_singly_linked_list:
+    def search_iter(self, value: Any) -> Generator[SinglyNode, None, None]:
         """
-        self.circular_singly_linked_list = circular_singly_linked_list
+        Search for a given value, return a iterator
 
-        self.head = self.circular_singly_linked_list.head
-        self.cursor = self.head
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: Generator[SinglyNode, None, None]
+        """
+        if self._index is not None:
+            yield from self._index_lookup(value)
+            return
 
-        self._stop_iteration: bool = False if self.head else True
+        node: Optional[SinglyNode] = self.head
+        while node is not None:
+            if node.value == value:
+                next_: Optional[SinglyNode] = node.next
+                yield node
+                node = next_
+            else:
+                node = node.next
 
-    def __next__(self) -> SinglyNode:
+    def reversed_iter(self, levels: int = 2) -> Generator[SinglyNode, None, None]:
         """
+        Iterate the nodes of this singly linked list from the tail without copying it
 
+        The nodes are visited forward once per level, and about levels * n^(1/levels)
+        checkpoint nodes are kept: 1 level keeps all nodes in one pass, the default 2
+        levels keep Θ(√n) nodes in two passes, more levels keep fewer nodes in more
+        passes.
+
+        Complexity:
+          - Space: Θ(levels * n^(1/levels))
+          - Time: Θ(levels * n)
+
+        :param levels: The number of levels to split this linked list
+        :type levels: int
         :return:
+        :rtype: Generator[SinglyNode, None, None]
         """
+        return _reversed_segment(self.head, self._size, levels)
 
-        if self._stop_iteration:
-            raise StopIteration
-        else:
-            cursor = self.cursor
-            self.cursor = cursor.next
-
-            if cursor.next is self.head:
-                self._stop_iteration = True
+    def values(self) -> Generator[Any, None, None]:
+        """
+        Iterate the values of this singly linked list without the node wrapper
 
-            return cursor
+        :return:
+        :rtype: Generator[Any, None, None]
+        """
+        node: Optional[SinglyNode] = self.head
+        while node is not None:
+            yield node.value
+            node = node.next
 
 
-class CircularSinglyLinkedListReversedIterator(Iterator):
+class CircularSinglyLinkedList(LinkedList):
     """
-    An reversed iterator of CircularSinglyLinkedList
+    The singly linked list whose tail node links back to the head node
+
+    The nodes are created from `node_class`, which can be overridden by a subclass to
+    use any other SinglyNode class
     """
 
-    # TODO: this class needs to improve the code quality
+    node_class: Type[SinglyNode] = SinglyNode
 
-    def __init__(self, circular_singly_linked_list: CircularSinglyLinkedList):
+    def __iter__(self) -> Generator[SinglyNode, None, None]:
         """
+        Iterate the nodes of this circular singly linked list once from the head, the
+        next node is fetched before the current one is yielded, so the current node can
+        be relinked
 
-        :param circular_singly_linked_list:
-        :type circular_singly_linked_list: CircularSinglyLinkedList
+        :return:
+        :rtype: Generator[SinglyNode, None, None]
         """
+        head: Optional[SinglyNode] = self.head
+        node: Optional[SinglyNode] = head
+        while node is not None:
+            next_: Optional[SinglyNode] = node.next
+            yield node
+            if next_ is head:
+                return
+            node = next_
 
-        _: Optional[SinglyNode] = None
-        node: Optional[SinglyNode] = None
-
-        for i in circular_singly_linked_list:
-            node = SinglyNode(i)
-            node.next, _ = _, node
-
-        self.linked_list = CircularSinglyLinkedList()
-        self.linked_list.head = node
+    def __reversed__(self) -> Generator[SinglyNode, None, None]:
+        """
+        Iterate the nodes of this circular singly linked list from the tail, with Θ(√n)
+        memory, see reversed_iter
 
-        self.iter_linked_list = iter(self.linked_list)
+        :return:
+        :rtype: Generator[SinglyNode, None, None]
+        """
+        return self.reversed_iter()
 
-    def __next__(self) -> SinglyNode:
+    def append(self, value: Any) -> None:
         """
 
+        :param value:
+        :type value: Any
         :return:
-        :rtype: SinglyNode
+        :rtype: None
         """
+        node: SinglyNode = self.node_class(value)
+        if self._index is not None:
+            self._index_add(node)
 
-        try:
-            node = next(self.iter_linked_list)
-        except AttributeError:
-            raise StopIteration
+        if self:  # check this circular linked list is empty or not
+            self._tail.next = node
         else:
-            return node.value
+            self.head = node
+        node.next = self.head
+        self._tail = node
+        self._size += 1
 
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """
+        Append the values of the given iterable after the tail of this circular singly
+        linked list, the iterable is consumed lazily and the nodes are linked in one
+        loop
 
-class CircularSinglyLinkedListSearchIterator(Iterator):
-    def __init__(self, circular_singly_linked_list: CircularSinglyLinkedList, value: Any):
-        self.circular_singly_linked_list = circular_singly_linked_list
-        self.value = value
-        self.iter_circular_singly_linked_list = iter(self.circular_singly_linked_list)
+        Complexity:
+          - Space: Θ(k), Ο(k), Ω(k)
+          - Time: Θ(k), Ο(k), Ω(k)
 
-    def __next__(self) -> SinglyNode:
-        while True:
-            node = next(self.iter_circular_singly_linked_list)
-            if node.value == self.value:
-                return node
+        :param iterable:
+        :type iterable: Iterable[Any]
+        :return:
+        :rtype: None
+        """
+        if self._index is not None:  # index every node before it is linked
+            LinkedList.extend(self, iterable)
+            return
 
+        node_class: Type[SinglyNode] = self.node_class
+        values = iter(iterable)
+        tail: Optional[SinglyNode] = self._tail
+        size: int = self._size
 
-class CircularSinglyLinkedList(LinkedList):
-    """
-
-    """
+        try:
+            if tail is None:
+                for value in values:
+                    self.head = tail = node_class(value)
+                    size += 1
+                    break
+            for value in values:
+                tail.next = tail = node_class(value)
+                size += 1
+        finally:  # close the ring even if the iterable raises
+            if tail is not None:
+                tail.next = self.head
+            self._tail = tail
+            self._size = size
+
+    def concat(self, other: CircularSinglyLinkedList) -> None:
+        """
+        Move all nodes of the given circular singly linked list after the tail of this
+        one, the two rings are joined into one, and the given linked list is left empty
 
-    def _init(self, *args) -> None:
-        if args:
-            self.head = SinglyNode(value=args[0])
-            current_node = self.head
-            for i in args[1:]:
-                current_node = SinglyNode.after_node(i, current_node)
-            current_node.next = self.head
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), or Θ(k) with the hash index
 
-    def __iter__(self) -> CircularSinglyLinkedListIterator:
-        return CircularSinglyLinkedListIterator(self)
+        :param other:
+        :type other: CircularSinglyLinkedList
+        :return:
+        :rtype: None
+        """
+        head, tail, size = self._take(other)
+        if head is None:
+            return
 
-    def __reversed__(self) -> CircularSinglyLinkedListReversedIterator:
-        return CircularSinglyLinkedListReversedIterator(self)
+        if self._tail is None:
+            self.head = head
+        else:
+            self._tail.next = head
+        tail.next = self.head
+        self._tail = tail
+        self._size += size
 
-    def append(self, value: Any) -> None:
+    def split_after(
+            self, node: Optional[SinglyNode] = None
+    ) -> CircularSinglyLinkedList:
         """
+        Move the nodes after the given node, up to the tail, into a new circular singly
+        linked list, the given node stays in this one as its new tail; both rings are
+        closed again in Θ(1), and the moved nodes are counted for the size of both
+        lists
 
-        :param value:
-        :type value: Any
-        :return:
-        :rtype: None
-        """
-        if self:  # check this circular linked list is empty or not
-            SinglyNode.after_node(value, self.tail).next = self.head
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(k), k is the number of the nodes moved
+
+        :param node: If node is not provided, all nodes are moved
+        :type node: Optional[SinglyNode]
+        :return: The new circular singly linked list
+        :rtype: CircularSinglyLinkedList
+        """
+        if not self or node is self._tail:
+            return self._split_off(None, None, 0)
+
+        head: SinglyNode = self.head if node is None else node.next
+        tail: SinglyNode = self._tail
+        size: int = 1
+        cursor: SinglyNode = head
+        while cursor is not tail:
+            cursor = cursor.next
+            size += 1
+
+        tail.next = head
+        if node is None:
+            self.head = None
         else:
-            self.head = SinglyNode(value)
-            self.head.next = self.head
+            node.next = self.head
+        self._tail = node
+        return self._split_off(head, tail, size)
+
+    def remove_if(self, predicate: Callable[[Any], bool]) -> int:
+        """
+        Remove all nodes whose value the given predicate returns True for, in one pass
+        around the ring from the head
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(n), Ο(n), Ω(n)
+
+        :param predicate:
+        :type predicate: Callable[[Any], bool]
+        :return: The number of nodes removed
+        :rtype: int
+        """
+        if not self:
+            return 0
+
+        index: Optional[Dict[Any, Dict[SinglyNode, None]]] = self._index
+        previous: SinglyNode = self._tail
+        node: SinglyNode = self.head
+        head: Optional[SinglyNode] = None
+        removed: int = 0
+        try:
+            for _ in range(self._size):
+                next_: SinglyNode = node.next
+                if predicate(node.value):
+                    if index is not None:
+                        self._index_discard(node)
+                    previous.next = next_
+                    removed += 1
+                else:
+                    if head is None:
+                        head = node
+                    previous = node
+                node = next_
+        except BaseException:
+            # the node the predicate raised for is kept, and so is the tail after it
+            self.head = node if head is None else head
+            raise
+        finally:  # keep the size counter right even if the predicate raises
+            self._size -= removed
+
+        self.head = head
+        self._tail = None if head is None else previous
+        return removed
 
     def pop(self) -> SinglyNode:
         """
@@ -395,18 +810,25 @@ class CircularSinglyLinkedList(LinkedList):
         """
         if not self:  # check the circular linked list is emtpy or not
             raise LinkedListIndexError
-        elif len(self) == 1:
+
+        if self._index is not None:
+            self._index_discard(self._tail)
+        self._size -= 1
+        if self.head is self._tail:
             node = self.head
-            self.head = None
+            self.head = self._tail = None
             return node
         else:
-            last_two_nodes: List[Optional[SinglyNode]] = [None, None]
-            for node in self:
-                last_two_nodes = [last_two_nodes[1], node]
+            tail: SinglyNode = self._tail
+
+            node: SinglyNode = self.head
+            while node.next is not tail:
+                node = node.next
 
-            last_two_nodes[0].next = self.head
+            node.next = self.head
+            self._tail = node
 
-            return last_two_nodes[1]
+            return tail
 
     def reverse(self) -> None:
         """
@@ -418,10 +840,58 @@ class CircularSinglyLinkedList(LinkedList):
         _: Optional[SinglyNode] = None
         node: Optional[SinglyNode] = None
 
+        if not self:
+            return
+
         for node in self:
             node.next, _ = _, node
 
+        self._tail = self.head
         self.head.next, self.head = node, node
 
-    def search_iter(self, value: Any):
-        return CircularSinglyLinkedListSearchIterator(self, value)
+    def search_iter(self, value: Any) -> Generator[SinglyNode, None, None]:
+        """
+        Search for a given value, return a iterator
+
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: Generator[SinglyNode, None, None]
+        """
+        if self._index is not None:
+            yield from self._index_lookup(value)
+            return
+
+        for node in self:
+            if node.value == value:
+                yield node
+
+    def reversed_iter(self, levels: int = 2) -> Generator[SinglyNode, None, None]:
+        """
+        Iterate the nodes of this circular singly linked list from the tail without copying it
+
+        The nodes are visited forward once per level, and about levels * n^(1/levels)
+        checkpoint nodes are kept: 1 level keeps all nodes in one pass, the default 2
+        levels keep Θ(√n) nodes in two passes, more levels keep fewer nodes in more
+        passes.
+
+        Complexity:
+          - Space: Θ(levels * n^(1/levels))
+          - Time: Θ(levels * n)
+
+        :param levels: The number of levels to split this linked list
+        :type levels: int
+        :return:
+        :rtype: Generator[SinglyNode, None, None]
+        """
+        return _reversed_segment(self.head, self._size, levels)
+
+    def values(self) -> Generator[Any, None, None]:
+        """
+        Iterate the values of this circular singly linked list once from the head
+
+        :return:
+        :rtype: Generator[Any, None, None]
+        """
+        for node in self:
+            yield node.value
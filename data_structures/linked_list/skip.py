@@ -0,0 +1,475 @@
+"""
+The sorted linked list with multiple levels of forward links
+
+ * Skip List
+"""
+from __future__ import annotations
+
+import random
+from collections.abc import Collection, Reversible
+from typing import Any, Callable, Generator, Iterable, List, Optional, Tuple, Type
+
+from data_structures.exceptions import LinkedListIndexError
+from data_structures.linked_list import _pack_values, _unpickle
+from data_structures.linked_list.nodes import SkipNode
+from data_structures.linked_list.singly import _reversed_segment
+
+
+class SkipList(  # pylint: disable=too-many-instance-attributes
+        Collection, Reversible
+):
+    """
+    The skip list, a sorted singly linked list where every node is also linked at a
+    random number of higher levels, each level skipping over about `1 / probability`
+    nodes of the level below, so searching, inserting and removing walk Ο(log n) nodes
+    in expectation instead of the whole list:
+
+    * the lowest level is a singly linked list of all nodes in ascending order, equal
+      values are kept in the order they were inserted
+    * a node gets one more level with the given probability, up to `max_level`
+    * the levels are drawn from a random generator of its own, seeded by `seed`, so a
+      skip list built from the same values with the same seed has the same shape
+
+    The values must be comparable with each other.
+    """
+
+    node_class: Type[SkipNode] = SkipNode
+
+    def __init__(
+            self,
+            *args,
+            probability: float = 0.5,
+            max_level: int = 32,
+            seed: Optional[int] = None,
+    ):
+        """
+
+        :param args:
+        :param probability: The probability of a node to have one more level
+        :type probability: float
+        :param max_level: The maximal number of levels
+        :type max_level: int
+        :param seed: The seed of the random generator drawing the levels
+        :type seed: Optional[int]
+        """
+        if not 0 < probability < 1:
+            raise ValueError(f"probability must be between 0 and 1, got {probability}")
+        if max_level < 1:
+            raise ValueError(f"max_level must be at least 1, got {max_level}")
+
+        self.probability: float = probability
+        self.max_level: int = max_level
+        self._seed: Optional[int] = seed
+        self._random: random.Random = random.Random(seed)
+
+        # the header is a sentinel node with all levels, its value is never compared
+        self._header: SkipNode = self.node_class(None, height=max_level)
+        self._level: int = 1
+        self._tail: Optional[SkipNode] = None
+        self._size: int = 0
+
+        self.extend(args)
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[Any], **kwargs) -> SkipList:
+        """
+        Create a skip list from the values of the given iterable
+
+        :param iterable:
+        :type iterable: Iterable[Any]
+        :param kwargs: The keyword arguments of the skip list
+        :return:
+        :rtype: SkipList
+        """
+        skip_list = cls(**kwargs)
+        skip_list.extend(iterable)
+        return skip_list
+
+    def __reduce_ex__(self, protocol: int) -> Tuple[Callable, Tuple[Any, ...]]:
+        """
+        Pickle this skip list as the flat sequence of its values in order, like the
+        linked lists, instead of the graph of its nodes; the levels of the nodes are
+        drawn again when unpickled by a random generator of the same seed, which then
+        takes the state of the random generator of this skip list, so the nodes
+        inserted later draw the same levels in both
+
+        Complexity:
+          - Space: Θ(n), Ο(n), Ω(n)
+          - Time: Θ(n), Ο(n), Ω(n)
+
+        :param protocol:
+        :type protocol: int
+        :return:
+        :rtype: Tuple[Callable, Tuple[Any, ...]]
+        """
+        return (
+            _unpickle,
+            (
+                type(self),
+                _pack_values(list(self.values()), protocol),
+                {
+                    "probability": self.probability,
+                    "max_level": self.max_level,
+                    "seed": self._seed,
+                },
+            ),
+            self._random.getstate(),
+        )
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        """
+        Restore the state of the random generator of an unpickled skip list
+
+        :param state: The state returned by `random.Random.getstate`
+        :type state: Tuple[Any, ...]
+        :return:
+        :rtype: None
+        """
+        self._random.setstate(state)
+
+    def __bool__(self) -> bool:
+        """
+        if this skip list is empty return False, otherwise return True
+
+        :return:
+        :rtype: bool
+        """
+        return self._header.next is not None
+
+    def __contains__(self, item) -> bool:
+        """
+        Check if the given node is in this skip list, the nodes holding a value equal to
+        the value of the given node are searched
+
+        Complexity:
+          - Space: Θ(1)
+          - Time: Θ(log n + k) expected
+
+        :param item:
+        :return:
+        :rtype: bool
+        """
+        if not isinstance(item, SkipNode):
+            return False
+
+        try:
+            for node in self.search_iter(item.value):
+                if node is item:
+                    return True
+        except TypeError:  # a value not comparable with the values of this skip list
+            pass
+        return False
+
+    def __iter__(self) -> Generator[SkipNode, None, None]:
+        """
+        Iterate the nodes of this skip list in ascending order, the next node is fetched
+        before the current node is yielded
+
+        :return:
+        :rtype: Generator[SkipNode, None, None]
+        """
+        node: Optional[SkipNode] = self._header.next
+        while node is not None:
+            next_: Optional[SkipNode] = node.forward[0]
+            yield node
+            node = next_
+
+    def __len__(self) -> int:
+        """
+        Return the number of nodes in this skip list
+
+        :return:
+        :rtype: int
+        """
+        return self._size
+
+    def __reversed__(self) -> Generator[SkipNode, None, None]:
+        """
+        Iterate the nodes of this skip list in descending order, the lowest level is
+        reversed with checkpoints as SinglyLinkedList.reversed_iter does
+
+        Complexity:
+          - Space: Θ(√n)
+          - Time: Θ(n)
+
+        :return:
+        :rtype: Generator[SkipNode, None, None]
+        """
+        yield from _reversed_segment(self._header.next, self._size)
+
+    @property
+    def head(self) -> Optional[SkipNode]:
+        """
+        The node with the smallest value
+
+        :return:
+        :rtype: Optional[SkipNode]
+        """
+        return self._header.next
+
+    @property
+    def tail(self) -> Optional[SkipNode]:
+        """
+        The node with the largest value
+
+        :return:
+        :rtype: Optional[SkipNode]
+        """
+        return self._tail
+
+    def _random_height(self) -> int:
+        """
+        Draw the number of levels of a new node
+
+        :return:
+        :rtype: int
+        """
+        height: int = 1
+        random_: Any = self._random.random
+        while height < self.max_level and random_() < self.probability:
+            height += 1
+        return height
+
+    def _last_before(self, value: Any, inclusive: bool = False) -> SkipNode:
+        """
+        Find the last node with a value less than, or less than or equal to when
+        inclusive, the given value, which is the header if there is no such node
+
+        :param value:
+        :type value: Any
+        :param inclusive:
+        :type inclusive: bool
+        :return:
+        :rtype: SkipNode
+        """
+        node: SkipNode = self._header
+        for level in range(self._level - 1, -1, -1):
+            forward: Optional[SkipNode] = node.forward[level]
+            if inclusive:
+                while forward is not None and forward.value <= value:
+                    node, forward = forward, forward.forward[level]
+            else:
+                while forward is not None and forward.value < value:
+                    node, forward = forward, forward.forward[level]
+        return node
+
+    def _predecessors(self, value: Any, inclusive: bool = False) -> List[SkipNode]:
+        """
+        Find the last node before the given value at every level, as _last_before does
+
+        :param value:
+        :type value: Any
+        :param inclusive:
+        :type inclusive: bool
+        :return: The predecessor at every level, from the lowest level
+        :rtype: List[SkipNode]
+        """
+        predecessors: List[SkipNode] = [self._header] * self.max_level
+        node: SkipNode = self._header
+        for level in range(self._level - 1, -1, -1):
+            forward: Optional[SkipNode] = node.forward[level]
+            if inclusive:
+                while forward is not None and forward.value <= value:
+                    node, forward = forward, forward.forward[level]
+            else:
+                while forward is not None and forward.value < value:
+                    node, forward = forward, forward.forward[level]
+            predecessors[level] = node
+        return predecessors
+
+    def insert(self, value: Any) -> SkipNode:
+        """
+        Insert a node with the given value after all nodes with a less or equal value
+
+        Complexity:
+          - Space: Θ(1) expected
+          - Time: Θ(log n) expected
+
+        :param value:
+        :type value: Any
+        :return: The node inserted
+        :rtype: SkipNode
+        """
+        predecessors: List[SkipNode] = self._predecessors(value, inclusive=True)
+        height: int = self._random_height()
+        self._level = max(self._level, height)
+
+        node: SkipNode = self.node_class(value, height=height)
+        for level in range(height):
+            predecessor: SkipNode = predecessors[level]
+            node.forward[level] = predecessor.forward[level]
+            predecessor.forward[level] = node
+
+        if node.next is None:
+            self._tail = node
+        self._size += 1
+        return node
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """
+        Insert the values of the given iterable
+
+        Complexity:
+          - Space: Θ(k) expected
+          - Time: Θ(k log(n + k)) expected
+
+        :param iterable:
+        :type iterable: Iterable[Any]
+        :return:
+        :rtype: None
+        """
+        insert = self.insert
+        for value in iterable:
+            insert(value)
+
+    def remove(self, value: Any) -> SkipNode:
+        """
+        Remove the first node with the given value
+
+        Complexity:
+          - Space: Θ(1)
+          - Time: Θ(log n) expected
+
+        :param value:
+        :type value: Any
+        :return: The node removed
+        :rtype: SkipNode
+        :raise LinkedListIndexError: If no node holds the given value
+        """
+        predecessors: List[SkipNode] = self._predecessors(value)
+        node: Optional[SkipNode] = predecessors[0].next
+        if node is None or node.value != value:
+            raise LinkedListIndexError(f"{value!r} is not in the skip list")
+
+        for level, forward in enumerate(node.forward):
+            predecessors[level].forward[level] = forward
+            node.forward[level] = None
+
+        header: SkipNode = self._header
+        while self._level > 1 and header.forward[self._level - 1] is None:
+            self._level -= 1
+        if node is self._tail:
+            self._tail = None if predecessors[0] is header else predecessors[0]
+        self._size -= 1
+        return node
+
+    def search(self, value: Any) -> Optional[SkipNode]:
+        """
+        Search for the first node with the given value
+
+        Complexity:
+          - Space: Θ(1)
+          - Time: Θ(log n) expected
+
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: Optional[SkipNode]
+        """
+        node: Optional[SkipNode] = self._last_before(value).next
+        if node is not None and node.value == value:
+            return node
+        return None
+
+    def search_iter(self, value: Any) -> Generator[SkipNode, None, None]:
+        """
+        Search for a given value, return a iterator of all nodes with the value
+
+        Complexity:
+          - Space: Θ(1)
+          - Time: Θ(log n + k) expected
+
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: Generator[SkipNode, None, None]
+        """
+        node: Optional[SkipNode] = self._last_before(value).next
+        while node is not None and node.value == value:
+            next_: Optional[SkipNode] = node.forward[0]
+            yield node
+            node = next_
+
+    def contains_value(self, value: Any) -> bool:
+        """
+        Check if any node of this skip list holds the given value
+
+        Complexity:
+          - Space: Θ(1)
+          - Time: Θ(log n) expected
+
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: bool
+        """
+        return self.search(value) is not None
+
+    def floor(self, value: Any) -> Optional[SkipNode]:
+        """
+        Find the last node with a value less than or equal to the given value
+
+        Complexity:
+          - Space: Θ(1)
+          - Time: Θ(log n) expected
+
+        :param value:
+        :type value: Any
+        :return: The node found, or None if all values are greater
+        :rtype: Optional[SkipNode]
+        """
+        node: SkipNode = self._last_before(value, inclusive=True)
+        return None if node is self._header else node
+
+    def ceiling(self, value: Any) -> Optional[SkipNode]:
+        """
+        Find the first node with a value greater than or equal to the given value
+
+        Complexity:
+          - Space: Θ(1)
+          - Time: Θ(log n) expected
+
+        :param value:
+        :type value: Any
+        :return: The node found, or None if all values are less
+        :rtype: Optional[SkipNode]
+        """
+        return self._last_before(value).next
+
+    def range_iter(
+            self, start: Any = None, stop: Any = None
+    ) -> Generator[SkipNode, None, None]:
+        """
+        Iterate the nodes with a value in the half-open range [start, stop) in ascending
+        order, a missing bound does not limit the range
+
+        Complexity:
+          - Space: Θ(1)
+          - Time: Θ(log n + k) expected
+
+        :param start: The smallest value included
+        :type start: Any
+        :param stop: The smallest value excluded
+        :type stop: Any
+        :return:
+        :rtype: Generator[SkipNode, None, None]
+        """
+        node: Optional[SkipNode] = (
+            self._header.next if start is None else self._last_before(start).next
+        )
+        while node is not None and (stop is None or node.value < stop):
+            next_: Optional[SkipNode] = node.forward[0]
+            yield node
+            node = next_
+
+    def values(self) -> Generator[Any, None, None]:
+        """
+        Iterate the values of this skip list in ascending order
+
+        :return:
+        :rtype: Generator[Any, None, None]
+        """
+        node: Optional[SkipNode] = self._header.next
+        while node is not None:
+            yield node.value
+            node = node.forward[0]
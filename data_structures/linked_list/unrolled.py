@@ -0,0 +1,524 @@
+"""
+The linked list with a block of values in every node
+
+ * Unrolled Linked List
+"""
+from __future__ import annotations
+
+from collections.abc import Reversible
+from itertools import chain, islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from data_structures.exceptions import LinkedListIndexError, LinkedListSizeError
+from data_structures.linked_list import LinkedList
+from data_structures.linked_list.nodes import SinglyNode, UnrolledNode
+
+
+class UnrolledLinkedList(LinkedList, Reversible):
+    """
+    The unrolled linked list, every node holds a block of up to `capacity` values in a
+    list, so the link and the object overhead are paid once per block instead of once
+    per value, and a traversal walks the values of a block as a plain list:
+
+    * `append` and `extend` fill the tail block before creating a new block
+    * `insert` splits a full block into two halves before inserting
+    * `remove` merges a block less than half full with the next block when the values
+      of both fit into one block
+
+    The nodes of this linked list are the blocks: iterating, searching and `head` /
+    `tail` return UnrolledNode, while `values` iterates the values themselves and the
+    length of this linked list is the number of values.
+    """
+
+    node_class: Type[UnrolledNode] = UnrolledNode
+
+    def __init__(self, *args, capacity: int = 16):
+        """
+
+        :param args:
+        :param capacity: The maximal number of values in one block
+        :type capacity: int
+        """
+        if capacity < 2:
+            raise ValueError(f"capacity must be at least 2, got {capacity}")
+        self.capacity: int = capacity
+        super().__init__(*args)
+
+    def _pickle_kwargs(self) -> Dict[str, Any]:
+        """
+        The keyword arguments to create an empty unrolled linked list with the same
+        capacity of blocks when unpickled
+
+        :return:
+        :rtype: Dict[str, Any]
+        """
+        return {"capacity": self.capacity}
+
+    def __iter__(self) -> Generator[UnrolledNode, None, None]:
+        """
+        Iterate the nodes, the blocks, of this unrolled linked list, the next node is
+        fetched before the current node is yielded
+
+        :return:
+        :rtype: Generator[UnrolledNode, None, None]
+        """
+        node: Optional[UnrolledNode] = self.head
+        while node is not None:
+            next_: Optional[UnrolledNode] = node.next
+            yield node
+            node = next_
+
+    def __len__(self) -> int:
+        """
+        Return the number of values in this unrolled linked list
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1), or Θ(n/capacity) in debug mode
+
+        :return:
+        :rtype: int
+        :raise LinkedListSizeError: In debug mode, if the size counter does not match
+                                    the number of values in the blocks
+        """
+        if self.debug:
+            length: int = 0
+            for node in self:
+                length += len(node.value)
+            if length != self._size:
+                raise LinkedListSizeError(
+                    f"size counter is {self._size}, but {length} values are linked"
+                )
+        return self._size
+
+    def __reversed__(self) -> Generator[UnrolledNode, None, None]:
+        """
+        Iterate the nodes, the blocks, of this unrolled linked list from the tail, the
+        blocks are collected into a list first
+
+        Complexity:
+          - Space: Θ(n/capacity)
+          - Time: Θ(n/capacity)
+
+        :return:
+        :rtype: Generator[UnrolledNode, None, None]
+        """
+        yield from reversed(list(self))
+
+    def _locate(self, index: int) -> Tuple[UnrolledNode, int]:
+        """
+        Find the block holding the value at the given index, the index is clamped into
+        the range of this linked list as `list.insert` does
+
+        :param index:
+        :type index: int
+        :return: The node and the offset of the value in the node
+        :rtype: Tuple[UnrolledNode, int]
+        """
+        if index < 0:
+            index = max(0, index + self._size)
+
+        node: UnrolledNode = self.head
+        while index > len(node.value) and node.next is not None:
+            index -= len(node.value)
+            node = node.next
+        return node, min(index, len(node.value))
+
+    def _unlink(self, previous: Optional[UnrolledNode], node: UnrolledNode) -> None:
+        """
+        Unlink the given empty node after the given previous node
+
+        :param previous:
+        :type previous: Optional[UnrolledNode]
+        :param node:
+        :type node: UnrolledNode
+        :return:
+        :rtype: None
+        """
+        if previous is None:
+            self.head = node.next
+        else:
+            previous.next = node.next
+        if node is self._tail:
+            self._tail = previous
+
+    def _merge_next(self, node: UnrolledNode) -> None:
+        """
+        Merge the next node into the given node, if the given node is less than half
+        full and the values of both nodes fit into one block
+
+        :param node:
+        :type node: UnrolledNode
+        :return:
+        :rtype: None
+        """
+        next_: Optional[UnrolledNode] = node.next
+        if (
+                next_ is not None
+                and len(node.value) < self.capacity // 2
+                and len(node.value) + len(next_.value) <= self.capacity
+        ):
+            node.value.extend(next_.value)
+            node.next = next_.next
+            if next_ is self._tail:
+                self._tail = node
+
+    def append(self, value: Any) -> None:
+        """
+        Append a value after the tail of this unrolled linked list, a new block is
+        created when the tail block is full
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), Ο(1), Ω(1)
+
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: None
+        """
+        tail: Optional[UnrolledNode] = self._tail
+        if tail is None:
+            self.head = self._tail = self.node_class([value])
+        elif len(tail.value) < self.capacity:
+            tail.value.append(value)
+        else:
+            self._tail = self.node_class.after_node([value], tail)
+        self._size += 1
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """
+        Append the values of the given iterable after the tail of this unrolled linked
+        list, the tail block is filled first and the rest of the values are sliced into
+        full blocks
+
+        Complexity:
+          - Space: Θ(k), Ο(k), Ω(k)
+          - Time: Θ(k), Ο(k), Ω(k)
+
+        :param iterable:
+        :type iterable: Iterable[Any]
+        :return:
+        :rtype: None
+        """
+        capacity: int = self.capacity
+        node_class: Type[UnrolledNode] = self.node_class
+        iterator: Iterator[Any] = iter(iterable)
+
+        tail: Optional[UnrolledNode] = self._tail
+        if tail is not None and len(tail.value) < capacity:
+            block: List[Any] = list(islice(iterator, capacity - len(tail.value)))
+            tail.value.extend(block)
+            self._size += len(block)
+
+        while True:
+            block = list(islice(iterator, capacity))
+            if not block:
+                break
+            if tail is None:
+                self.head = tail = node_class(block)
+            else:
+                tail = node_class.after_node(block, tail)
+            self._tail = tail
+            self._size += len(block)
+
+    def insert(self, index: int, value: Any) -> None:
+        """
+        Insert a value before the given index as `list.insert` does, a full block is
+        split into two halves first
+
+        Complexity:
+          - Space: Θ(capacity)
+          - Time: Θ(n/capacity + capacity)
+
+        :param index:
+        :type index: int
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: None
+        """
+        if self.head is None:
+            self.append(value)
+            return
+
+        node, offset = self._locate(index)
+        if len(node.value) >= self.capacity:
+            half: int = len(node.value) // 2
+            new: UnrolledNode = self.node_class.after_node(node.value[half:], node)
+            del node.value[half:]
+            if node is self._tail:
+                self._tail = new
+            if offset > half:
+                node, offset = new, offset - half
+        node.value.insert(offset, value)
+        self._size += 1
+
+    def pop(self) -> SinglyNode:
+        """
+        Pop the last value of this unrolled linked list, the value is returned in a
+        detached SinglyNode, and the tail block is unlinked when it becomes empty
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(1), or Θ(n/capacity) when the tail block is unlinked
+
+        :return:
+        :rtype: SinglyNode
+        """
+        tail: Optional[UnrolledNode] = self._tail
+        if tail is None:
+            raise LinkedListIndexError
+
+        value: Any = tail.value.pop()
+        self._size -= 1
+        if not tail.value:
+            previous: Optional[UnrolledNode] = None
+            node: UnrolledNode = self.head
+            while node is not tail:
+                previous, node = node, node.next
+            self._unlink(previous, tail)
+        return SinglyNode(value)
+
+    def remove(self, value: Any) -> None:
+        """
+        Remove the first occurrence of the given value, the block is merged with the
+        next block when it becomes less than half full and both of them fit into one
+        block
+
+        Complexity:
+          - Space: Θ(1), Ο(1), Ω(1)
+          - Time: Θ(n), Ο(n), Ω(1)
+
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: None
+        :raise LinkedListIndexError: If no value is equal to the given value
+        """
+        previous: Optional[UnrolledNode] = None
+        node: Optional[UnrolledNode] = self.head
+        while node is not None:
+            if value in node.value:
+                node.value.remove(value)
+                self._size -= 1
+                if node.value:
+                    self._merge_next(node)
+                else:
+                    self._unlink(previous, node)
+                return
+            previous, node = node, node.next
+
+        raise LinkedListIndexError(f"{value!r} is not in the linked list")
+
+    def remove_if(self, predicate: Callable[[Any], bool]) -> int:
+        """
+        Remove all values the given predicate returns True for, in one pass, each block
+        is filtered at once, an emptied block is unlinked and a block is merged into the
+        previous block when the previous block is less than half full and both of them
+        fit into one block
+
+        Complexity:
+          - Space: Θ(b), b is the capacity
+          - Time: Θ(n), Ο(n), Ω(n)
+
+        :param predicate:
+        :type predicate: Callable[[Any], bool]
+        :return: The number of values removed
+        :rtype: int
+        """
+        previous: Optional[UnrolledNode] = None
+        node: Optional[UnrolledNode] = self.head
+        removed: int = 0
+        try:
+            while node is not None:
+                next_: Optional[UnrolledNode] = node.next
+                values: List[Any] = node.value
+                kept: List[Any] = [value for value in values if not predicate(value)]
+                if len(kept) != len(values):
+                    removed += len(values) - len(kept)
+                    values[:] = kept
+
+                if not values:
+                    self._unlink(previous, node)
+                else:
+                    if previous is not None:
+                        self._merge_next(previous)
+                    if previous is None or previous.next is node:
+                        previous = node
+                node = next_
+        finally:  # keep the size counter right even if the predicate raises
+            self._size -= removed
+        return removed
+
+    def _rewrite(
+            self, rewrite: Callable[[List[Any]], List[Any]], max_: Optional[int] = None
+    ) -> None:
+        """
+        Replace the values of every block, or of the first max_ values, with the list
+        returned by rewrite for them
+
+        :param rewrite: The function returning the new values for a list of values
+        :type rewrite: Callable[[List[Any]], List[Any]]
+        :param max_: if max is not provided all of values are rewritten
+        :type max_: Optional[int]
+        :return:
+        :rtype: None
+        """
+        for node in self:
+            block: List[Any] = node.value
+            if max_ is None:
+                block[:] = rewrite(block)
+                continue
+            if max_ <= 0:
+                break
+            block[:max_] = rewrite(block[:max_])
+            max_ -= len(block)
+
+    def replace(self, old: Any, new: Any, max_: Optional[int] = None) -> None:
+        """
+        In-place replace the old value with the given new one, block by block
+
+        Complexity:
+          - Space: Θ(capacity)
+          - Time: Θ(n), Ο(n), Ω(1)
+
+        :param old: The old value to be replaced
+        :type old: Any
+        :param new: The new value to replace the old one
+        :type new: Any
+        :param max_: if max is not provided all of values equaled to old will be
+                     changed to new, otherwise only the first max_ values are checked
+        :type max_: Optional[int]
+        :return: This method is a in-place change and returns None
+        :rtype: None
+        """
+        self._rewrite(
+            lambda values: [new if value == old else value for value in values], max_
+        )
+
+    def replace_many(
+            self, mapping: Mapping[Any, Any], max_: Optional[int] = None
+    ) -> None:
+        """
+        In-place replace the values found in the given mapping with the values they are
+        mapped to, in one pass; the values of a block are looked up by mapping.get
+        mapped over the block at the C level
+
+        Complexity:
+          - Space: Θ(capacity)
+          - Time: Θ(n), Ο(n), Ω(1)
+
+        :param mapping: The mapping from old values to new values
+        :type mapping: Mapping[Any, Any]
+        :param max_: if max is not provided all of values are checked, otherwise only
+                     the first max_ values
+        :type max_: Optional[int]
+        :return: This method is a in-place change and returns None
+        :rtype: None
+        """
+        get = mapping.get
+
+        def lookup(value: Any) -> Any:
+            try:
+                return get(value, value)
+            except TypeError:  # an unhashable value cannot be in the mapping
+                return value
+
+        def rewrite(values: List[Any]) -> List[Any]:
+            try:
+                return list(map(get, values, values))
+            except TypeError:
+                return list(map(lookup, values))
+
+        self._rewrite(rewrite, max_)
+
+    def replace_if(
+            self, predicate: Callable[[Any], bool], func: Callable[[Any], Any]
+    ) -> None:
+        """
+        In-place replace every value matching the given predicate with the value
+        returned by func for it, in one pass
+
+        Complexity:
+          - Space: Θ(capacity)
+          - Time: Θ(n), Ο(n), Ω(n)
+
+        :param predicate: The function checking a value to be replaced
+        :type predicate: Callable[[Any], bool]
+        :param func: The function returning the new value for an old value
+        :type func: Callable[[Any], Any]
+        :return: This method is a in-place change and returns None
+        :rtype: None
+        """
+        self._rewrite(
+            lambda values: [
+                func(value) if predicate(value) else value for value in values
+            ]
+        )
+
+    def reverse(self) -> None:
+        """
+        In-place reverse, the order of the blocks and the values in every block are
+        reversed
+
+        :return:
+        :rtype: None
+        """
+        previous: Optional[UnrolledNode] = None
+        node: Optional[UnrolledNode] = self.head
+        while node is not None:
+            node.value.reverse()
+            node.next, previous, node = previous, node, node.next
+
+        self.head, self._tail = self._tail, self.head
+
+    def search_iter(self, value: Any) -> Generator[UnrolledNode, None, None]:
+        """
+        Search for a given value, return a iterator of the nodes, the blocks, holding
+        the value, every block is yielded once however many times it holds the value
+
+        :param value:
+        :type value: Any
+        :return:
+        :rtype: Generator[UnrolledNode, None, None]
+        """
+        node: Optional[UnrolledNode] = self.head
+        while node is not None:
+            if value in node.value:
+                next_: Optional[UnrolledNode] = node.next
+                yield node
+                node = next_
+            else:
+                node = node.next
+
+    def values(self) -> Iterator[Any]:
+        """
+        Iterate the values of this unrolled linked list, the blocks are chained at the
+        C level instead of yielding every value from a generator
+
+        :return:
+        :rtype: Iterator[Any]
+        """
+        return chain.from_iterable(node.value for node in self)
+
+    def reversed_values(self) -> Iterator[Any]:
+        """
+        Iterate the values of this unrolled linked list from the tail
+
+        :return:
+        :rtype: Iterator[Any]
+        """
+        return chain.from_iterable(reversed(node.value) for node in reversed(self))
@@ -5,7 +5,7 @@ from setuptools import find_packages, setup
 
 import versioneer
 
-extras_require = {}
+extras_require = {"numpy": ["numpy"]}
 
 with open("README.rst", "r") as fh:
     LONG_DESCRIPTION = fh.read()
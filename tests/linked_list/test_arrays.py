@@ -0,0 +1,250 @@
+from collections.abc import Iterator
+from unittest import TestCase
+
+from data_structures.exceptions import LinkedListIndexError
+from data_structures.linked_list.arrays import ArraySinglyLinkedList
+from data_structures.linked_list.nodes import ArrayNode, SinglyNode
+
+
+class TestArraySinglyLinkedList(TestCase):
+    def setUp(self) -> None:
+        self.node_values = ["a", "b", "c"]
+
+    def test_array_singly_linked_list(self) -> None:
+        linked_list = ArraySinglyLinkedList(*self.node_values)
+
+        node = linked_list.head
+        self.assertIsInstance(node, ArrayNode)
+        self.assertIs(node.value, self.node_values[0])
+
+        node = node.next
+        self.assertIs(node.value, self.node_values[1])
+
+        node = node.next
+        self.assertIs(node.value, self.node_values[2])
+
+        self.assertIsNone(node.next)
+
+        linked_list = ArraySinglyLinkedList()
+        self.assertIsNone(linked_list.head)
+        self.assertIsNone(linked_list.tail)
+        self.assertFalse(bool(linked_list))
+
+    def test_from_iterable(self) -> None:
+        linked_list = ArraySinglyLinkedList.from_iterable(iter(self.node_values))
+        linked_list.extend(value for value in "de")
+        self.assertEqual(
+            [node.value for node in linked_list], self.node_values + ["d", "e"]
+        )
+        self.assertEqual(len(linked_list), len(self.node_values) + 2)
+
+    def test_capacity(self) -> None:
+        linked_list = ArraySinglyLinkedList(*self.node_values, capacity=4)
+        self.assertEqual(len(linked_list.value_slots), 4)
+
+        linked_list.append("d")
+        linked_list.append("e")
+        self.assertEqual(len(linked_list.value_slots), 5)
+        self.assertEqual(
+            [node.value for node in linked_list], self.node_values + ["d", "e"]
+        )
+
+    def test_contains(self) -> None:
+        linked_list = ArraySinglyLinkedList(*self.node_values)
+
+        self.assertIn(linked_list.head, linked_list)
+        self.assertNotIn(SinglyNode("a"), linked_list)
+        self.assertNotIn(ArraySinglyLinkedList("a").head, linked_list)
+
+    def test_iter(self) -> None:
+        linked_list = ArraySinglyLinkedList(*self.node_values)
+        for node, value in zip(linked_list, self.node_values):
+            self.assertIs(node.value, value)
+
+    def test_values(self) -> None:
+        linked_list = ArraySinglyLinkedList(*self.node_values)
+        self.assertEqual(list(linked_list.values()), self.node_values)
+
+    def test_len(self) -> None:
+        linked_list = ArraySinglyLinkedList(*self.node_values)
+        linked_list.debug = True
+        self.assertEqual(len(linked_list), len(self.node_values))
+
+        linked_list.pop()
+        linked_list.remove_after()
+        self.assertEqual(len(linked_list), len(self.node_values) - 2)
+
+    def test_reversed(self) -> None:
+        linked_list = ArraySinglyLinkedList(*self.node_values)
+        reversed_linked_list = reversed(linked_list)
+
+        self.assertIsInstance(reversed_linked_list, Iterator)
+        self.assertEqual(
+            [node.value for node in reversed_linked_list], self.node_values[::-1]
+        )
+
+    def test_append(self) -> None:
+        linked_list = ArraySinglyLinkedList(*self.node_values)
+        self.assertIsNone(linked_list.append("d"))
+        self.assertEqual(len(linked_list), len(self.node_values) + 1)
+        self.assertIs(linked_list.tail.value, "d")
+
+    def test_insert_after(self) -> None:
+        linked_list = ArraySinglyLinkedList(*self.node_values)
+
+        head = linked_list.head
+        linked_list.insert_after("d", head)
+        self.assertIs(head.next.value, "d")
+
+        linked_list.insert_after("f")
+        self.assertIs(linked_list.head.value, "f")
+
+        linked_list.insert_after("g", linked_list.tail)
+        self.assertIs(linked_list.tail.value, "g")
+
+        node = ArrayNode.after_node("h", linked_list.head)
+        self.assertIs(node.value, "h")
+        self.assertEqual(
+            [node.value for node in linked_list], ["f", "h", "a", "d", "b", "c", "g"]
+        )
+
+    def test_is_head_and_is_tail(self) -> None:
+        linked_list = ArraySinglyLinkedList(*self.node_values)
+        self.assertTrue(linked_list.is_head(linked_list.head))
+        self.assertFalse(linked_list.is_head(linked_list.tail))
+        self.assertTrue(linked_list.is_tail(linked_list.tail))
+        self.assertFalse(linked_list.is_tail(linked_list.head))
+
+    def test_pop(self) -> None:
+        linked_list = ArraySinglyLinkedList(*self.node_values)
+
+        node = linked_list.pop()
+        self.assertIsInstance(node, SinglyNode)
+        self.assertIs(node.value, self.node_values[-1])
+        self.assertIs(linked_list.tail.value, self.node_values[-2])
+        self.assertIsNone(linked_list.tail.next)
+
+        linked_list.pop()
+        linked_list.pop()
+        self.assertIsNone(linked_list.head)
+        self.assertIsNone(linked_list.tail)
+
+        with self.assertRaises(LinkedListIndexError):
+            linked_list.pop()
+
+    def test_remove_after(self) -> None:
+        linked_list = ArraySinglyLinkedList(*self.node_values)
+        head = linked_list.head
+
+        linked_list.remove_after(head)
+        self.assertIs(head.next.value, "c")
+        self.assertEqual(len(linked_list), len(self.node_values) - 1)
+
+        linked_list.remove_after(linked_list.tail)
+        self.assertEqual(len(linked_list), len(self.node_values) - 1)
+
+        linked_list.remove_after(head)
+        self.assertTrue(linked_list.is_tail(head))
+
+        linked_list.remove_after()
+        self.assertIsNone(linked_list.head)
+        self.assertIsNone(linked_list.tail)
+
+        linked_list.remove_after()
+        self.assertFalse(bool(linked_list))
+
+    def test_remove_if(self) -> None:
+        linked_list = ArraySinglyLinkedList(*"abcab", indexed=True)
+
+        self.assertEqual(linked_list.remove_if(lambda value: value == "b"), 2)
+        self.assertEqual(list(linked_list.values()), ["a", "c", "a"])
+        self.assertEqual(linked_list.tail.value, "a")
+        self.assertFalse(linked_list.contains_value("b"))
+
+        # the slots removed are reused
+        linked_list.extend("de")
+        self.assertEqual(len(linked_list.value_slots), 5)
+
+        self.assertEqual(linked_list.remove_values(["a", "e"]), 3)
+        self.assertEqual(list(linked_list.values()), ["c", "d"])
+        self.assertEqual(linked_list.remove_if(lambda value: True), 2)
+        self.assertIsNone(linked_list.head)
+        self.assertIsNone(linked_list.tail)
+        self.assertEqual(len(linked_list), 0)
+
+    def test_free_slots(self) -> None:
+        linked_list = ArraySinglyLinkedList(*self.node_values)
+
+        linked_list.remove_after()
+        linked_list.pop()
+        linked_list.append("d")
+        linked_list.insert_after("e")
+        self.assertEqual(len(linked_list.value_slots), len(self.node_values))
+        self.assertEqual([node.value for node in linked_list], ["e", "b", "d"])
+
+    def test_replace(self) -> None:
+        linked_list = ArraySinglyLinkedList(*self.node_values)
+
+        self.assertIsNone(linked_list.replace("b", "a"))
+        self.assertIs(linked_list.head.next.value, "a")
+
+        linked_list.replace("a", "b", 1)
+        self.assertIs(linked_list.head.value, "b")
+        self.assertIs(linked_list.head.next.value, "a")
+
+    def test_indexed(self) -> None:
+        linked_list = ArraySinglyLinkedList(*self.node_values, indexed=True)
+
+        self.assertTrue(linked_list.is_tail(linked_list.search("c")))
+        self.assertIn(linked_list.head, linked_list)
+        self.assertTrue(linked_list.contains_value("b"))
+
+        linked_list.remove_after(linked_list.head)
+        self.assertFalse(linked_list.contains_value("b"))
+
+        linked_list.insert_after("c")
+        linked_list.replace("c", "d")
+        self.assertEqual(len(list(linked_list.search_iter("d"))), 2)
+
+        linked_list.pop()
+        self.assertTrue(linked_list.is_head(linked_list.search("d")))
+
+        with self.assertRaises(TypeError):
+            linked_list.append(["unhashable"])
+        self.assertEqual(len(linked_list), 2)
+        self.assertEqual(list(linked_list.values()), ["d", "a"])
+
+        linked_list.append("e")
+        self.assertIs(linked_list.search("e").value, "e")
+
+    def test_reverse(self) -> None:
+        linked_list = ArraySinglyLinkedList(*self.node_values)
+        head = linked_list.head
+        self.assertIsNone(linked_list.reverse())
+
+        self.assertEqual([node.value for node in linked_list], self.node_values[::-1])
+        self.assertTrue(linked_list.is_tail(head))
+
+        linked_list = ArraySinglyLinkedList()
+        linked_list.reverse()
+        self.assertIsNone(linked_list.head)
+
+    def test_search(self) -> None:
+        linked_list = ArraySinglyLinkedList(*self.node_values)
+
+        self.assertIs(linked_list.search("b").value, "b")
+        self.assertIsNone(linked_list.search("d"))
+
+    def test_search_iter(self) -> None:
+        linked_list = ArraySinglyLinkedList("a", "b", "a")
+
+        search_iter = linked_list.search_iter("a")
+        self.assertIsInstance(search_iter, Iterator)
+        self.assertTrue(linked_list.is_head(next(search_iter)))
+        self.assertTrue(linked_list.is_tail(next(search_iter)))
+        with self.assertRaises(StopIteration):
+            _ = next(search_iter)
+
+        search_iter = ArraySinglyLinkedList().search_iter("a")
+        with self.assertRaises(StopIteration):
+            _ = next(search_iter)
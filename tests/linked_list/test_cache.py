@@ -0,0 +1,301 @@
+import functools
+from unittest import TestCase
+
+from data_structures.linked_list.cache import (
+    ARCCache,
+    CacheInfo,
+    LFUCache,
+    LRUCache,
+    lru_cache,
+)
+
+CACHES = (LRUCache, LFUCache, ARCCache)
+
+
+def replay(cache, keys) -> None:
+    """
+    Look up every key, and put the missing ones
+    """
+    for key in keys:
+        if cache.get(key) is None:
+            cache.put(key, str(key))
+
+
+class TestCache(TestCase):
+    def test_interface(self) -> None:
+        for cache_class in CACHES:
+            cache = cache_class(maxsize=2)
+            self.assertEqual(cache.maxsize, 2)
+            self.assertEqual(cache.hit_ratio, 0.0)
+            self.assertIsNone(cache.get("a"))
+
+            cache.put("a", 1)
+            cache.put("b", 2)
+            self.assertEqual(cache.get("a"), 1)
+            cache.put("c", 3)
+            self.assertEqual(len(cache), 2)
+            self.assertEqual(cache.size, 2)
+            self.assertEqual(cache.evictions, 1)
+            self.assertEqual(sorted(cache), ["a", "c"])
+            self.assertEqual(cache.peek("c"), 3)
+            self.assertIsNone(cache.peek("b"))
+            self.assertEqual(cache.info(), CacheInfo(1, 1, 2, 2))
+            self.assertEqual(cache.hit_ratio, 0.5)
+
+            cache.put("a", 4)
+            self.assertEqual(cache.pop("a"), 4)
+            self.assertNotIn("a", cache)
+            self.assertIsNone(cache.pop("a", None))
+            with self.assertRaises(KeyError):
+                cache.pop("a")
+            self.assertEqual(cache.evictions, 1)
+
+            cache.clear()
+            self.assertEqual(len(cache), 0)
+            self.assertEqual(cache.info(), CacheInfo(0, 0, 2, 0))
+            cache.put("a", 1)
+            self.assertEqual(list(cache), ["a"])
+
+            cache = cache_class(maxsize=0)
+            cache.put("a", 1)
+            self.assertEqual(len(cache), 0)
+            with self.assertRaises(ValueError):
+                cache_class(-1)
+
+            @cache_class(maxsize=8)
+            def square(value: int) -> int:
+                return value * value
+
+            self.assertEqual([square(value % 4) for value in range(8)], [0, 1, 4, 9] * 2)
+            self.assertEqual(square.cache_info(), CacheInfo(4, 4, 8, 4))
+            self.assertTrue(square.invalidate(3))
+            self.assertEqual(square.cache_info().currsize, 3)
+
+    def test_scan(self) -> None:
+        hot = list(range(5))
+        for cache_class, kept in ((LRUCache, False), (LFUCache, True), (ARCCache, True)):
+            cache = cache_class(maxsize=10)
+            replay(cache, hot * 3)
+            # a scan of more keys than the cache holds, each used once
+            replay(cache, range(100, 200))
+            self.assertEqual(all(key in cache for key in hot), kept)
+            self.assertEqual(len(cache), 10)
+
+
+class TestLRUCache(TestCase):
+    def test_lru_cache(self) -> None:
+        cache = LRUCache(maxsize=2)
+        self.assertEqual(cache.maxsize, 2)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("a", 0), 0)
+
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        # "b" is the least recently used
+        cache.put("c", 3)
+        self.assertNotIn("b", cache)
+        self.assertEqual(list(cache), ["a", "c"])
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.size, 2)
+
+        # an update marks the key as the most recently used too
+        cache.put("a", 4)
+        cache.put("d", 5)
+        self.assertEqual(list(cache), ["a", "d"])
+        self.assertEqual(cache.peek("a"), 4)
+        self.assertIsNone(cache.peek("c"))
+
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 2)
+        self.assertEqual(cache.evictions, 2)
+        self.assertEqual(cache.info(), CacheInfo(1, 2, 2, 2))
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.info(), CacheInfo(0, 0, 2, 0))
+
+        with self.assertRaises(ValueError):
+            LRUCache(-1)
+
+    def test_pop(self) -> None:
+        cache = LRUCache()
+        for key in "abc":
+            cache.put(key, key.upper())
+
+        self.assertEqual(cache.pop("b"), "B")
+        self.assertEqual(list(cache), ["a", "c"])
+        self.assertEqual(cache.pop("b", None), None)
+        with self.assertRaises(KeyError):
+            cache.pop("b")
+        self.assertEqual(cache.pop("a"), "A")
+        self.assertEqual(cache.pop("c"), "C")
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.evictions, 0)
+
+        cache.put("d", "D")
+        self.assertEqual(list(cache), ["d"])
+
+    def test_weigher(self) -> None:
+        cache = LRUCache(maxsize=10, weigher=len)
+        cache.put("a", "xxxx")
+        cache.put("b", "yyyy")
+        self.assertEqual(cache.size, 8)
+        cache.put("c", "zzz")
+        self.assertEqual(list(cache), ["b", "c"])
+        self.assertEqual(cache.size, 7)
+
+        cache.put("b", "y")
+        self.assertEqual(cache.size, 4)
+        # a value heavier than the cache is not cached, nor kept stale
+        cache.put("b", "y" * 11)
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.size, 3)
+
+        cache.put("d", "")
+        self.assertEqual(cache.size, 3)
+        with self.assertRaises(ValueError):
+            LRUCache(weigher=lambda value: -1).put("a", 1)
+
+    def test_unbounded(self) -> None:
+        cache = LRUCache(maxsize=None)
+        for key in range(1000):
+            cache.put(key, key)
+        self.assertEqual(len(cache), 1000)
+        self.assertEqual(cache.evictions, 0)
+
+        cache = LRUCache(maxsize=0)
+        cache.put("a", 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_decorator(self) -> None:
+        calls = []
+
+        @lru_cache(maxsize=2)
+        def square(value: int, power: int = 2) -> int:
+            """Square the value"""
+            calls.append(value)
+            return value ** power
+
+        self.assertEqual(square.__name__, "square")
+        self.assertEqual(square.__doc__, "Square the value")
+        self.assertEqual(square(2), 4)
+        self.assertEqual(square(2), 4)
+        self.assertEqual(square(2, power=3), 8)
+        self.assertEqual(square(3), 9)
+        self.assertEqual(calls, [2, 2, 3])
+        self.assertEqual(square.cache_info(), CacheInfo(1, 3, 2, 2))
+        self.assertEqual(square.cache_parameters(), {"maxsize": 2, "typed": False})
+        self.assertEqual(square.cache.evictions, 1)
+
+        self.assertTrue(square.invalidate(3))
+        self.assertFalse(square.invalidate(3))
+        self.assertEqual(square(3), 9)
+        self.assertEqual(calls, [2, 2, 3, 3])
+
+        square.cache_clear()
+        self.assertEqual(square.cache_info(), CacheInfo(0, 0, 2, 0))
+
+    def test_decorator_forms(self) -> None:
+        @lru_cache
+        def identity(value):
+            return value
+
+        self.assertEqual(identity(1), 1)
+        self.assertEqual(identity.cache_info().maxsize, 128)
+
+        @lru_cache(typed=True)
+        def kind(value):
+            return type(value)
+
+        self.assertIs(kind(1), int)
+        self.assertIs(kind(1.0), float)
+        self.assertEqual(kind.cache_info().currsize, 2)
+
+        cache = LRUCache(maxsize=None)
+
+        @cache
+        def double(value):
+            return 2 * value
+
+        self.assertEqual(double(2), 4)
+        self.assertEqual(cache.get((2,)), 4)
+
+        # the same results and statistics as functools.lru_cache
+        results = []
+        for decorator in (functools.lru_cache(maxsize=8), lru_cache(maxsize=8)):
+
+            @decorator
+            def fibonacci(value):
+                return value if value < 2 else fibonacci(value - 1) + fibonacci(value - 2)
+
+            values = [fibonacci(value) for value in range(30)]
+            results.append((values, tuple(fibonacci.cache_info())))
+        self.assertEqual(results[0], results[1])
+
+
+class TestLFUCache(TestCase):
+    def test_lfu_cache(self) -> None:
+        cache = LFUCache(maxsize=3)
+        replay(cache, ["a", "a", "a", "b", "b", "c"])
+        self.assertEqual(list(cache), ["c", "b", "a"])
+        self.assertEqual([cache.frequency(key) for key in "abcd"], [3, 2, 1, 0])
+
+        # the least recently used of the least frequently used is evicted
+        cache.put("d", "D")
+        self.assertEqual(list(cache), ["d", "b", "a"])
+        cache.get("d")
+        cache.put("e", "E")
+        self.assertEqual(list(cache), ["e", "d", "a"])
+        self.assertEqual(cache.evictions, 2)
+
+        # a put of a cached key counts one more use
+        cache.put("e", "F")
+        self.assertEqual(cache.frequency("e"), 2)
+        self.assertEqual(cache.peek("e"), "F")
+        self.assertEqual(list(cache), ["d", "e", "a"])
+
+        self.assertEqual(cache.pop("a"), "a")
+        self.assertEqual(list(cache), ["d", "e"])
+        self.assertEqual([frequency for frequency, _ in cache._buckets.values()], [2])
+
+    def test_unbounded(self) -> None:
+        cache = LFUCache(maxsize=None)
+        replay(cache, range(1000))
+        self.assertEqual(len(cache), 1000)
+        self.assertEqual(cache.evictions, 0)
+
+
+class TestARCCache(TestCase):
+    def test_arc_cache(self) -> None:
+        cache = ARCCache(maxsize=4)
+        replay(cache, ["a", "b", "a", "b", "c", "d"])
+        self.assertEqual(list(cache), ["c", "d", "a", "b"])
+        self.assertEqual(cache.target, 0)
+
+        # "c" is evicted from the recency list, its key is kept as a ghost
+        cache.put("e", "e")
+        self.assertEqual(list(cache), ["d", "e", "a", "b"])
+        self.assertEqual(cache.evictions, 1)
+
+        # a ghost of the recency list makes it longer
+        cache.put("c", "c")
+        self.assertEqual(cache.target, 1)
+        self.assertEqual(list(cache), ["e", "a", "b", "c"])
+
+        # the frequency list is evicted now, a ghost of it makes it longer again
+        cache.put("f", "f")
+        self.assertEqual(list(cache), ["e", "f", "b", "c"])
+        cache.put("a", "A")
+        self.assertEqual(cache.target, 0)
+        self.assertEqual(cache.peek("a"), "A")
+        self.assertEqual(list(cache), ["f", "b", "c", "a"])
+        self.assertEqual(cache.evictions, 4)
+
+        # a ghost is not cached
+        self.assertNotIn("d", cache)
+        self.assertIsNone(cache.get("d"))
+        self.assertIsNone(cache.pop("d", None))
+
+        with self.assertRaises(ValueError):
+            ARCCache(maxsize=None)
@@ -0,0 +1,409 @@
+import sys
+import threading
+from unittest import TestCase
+
+from data_structures.exceptions import LinkedListIndexError, LinkedListReadOnlyError
+from data_structures.linked_list.concurrent import (
+    ConcurrentDoublyLinkedList,
+    ConcurrentSinglyLinkedList,
+)
+from data_structures.linked_list.nodes import (
+    DoublyNode,
+    LockedDoublyNode,
+    LockedSinglyNode,
+    SinglyNode,
+)
+from data_structures.linked_list.singly import SinglyLinkedList
+
+
+def run_threads(target, count: int, timeout: float = 60) -> None:
+    """
+    Run the target in the given number of threads, switching between them as often as
+    possible, a thread still running after the timeout is taken as deadlocked
+    """
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [
+            threading.Thread(target=target, args=(index,), daemon=True)
+            for index in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout)
+            if thread.is_alive():
+                raise AssertionError(f"{thread.name} is deadlocked")
+    finally:
+        sys.setswitchinterval(interval)
+
+
+def search_and_change(linked_list, doubly: bool):
+    """
+    Return a target appending the nodes searched by the other threads at the same time,
+    and changing the linked list around the nodes found in the hash index
+    """
+
+    def work(index: int) -> None:
+        for step in range(300):
+            if step % 2:
+                linked_list.extend([(index, step)] * 2)
+            else:
+                linked_list.append((index, step))
+            for other in range(8):
+                node = linked_list.search((other, step))
+                if node is None:
+                    continue
+                try:
+                    linked_list.insert_after((other, step), node)
+                    linked_list.remove_after(node)
+                    if doubly:
+                        linked_list.remove_node(node)
+                except LinkedListIndexError:  # removed by another thread
+                    pass
+
+    return work
+
+
+class TestConcurrentSinglyLinkedList(TestCase):
+    def setUp(self) -> None:
+        self.node_values = ["a", "b", "c"]
+
+    def test_concurrent_singly_linked_list(self) -> None:
+        linked_list = ConcurrentSinglyLinkedList(*self.node_values)
+        self.assertIsInstance(linked_list.head, LockedSinglyNode)
+        self.assertEqual(list(linked_list.values()), self.node_values)
+        self.assertEqual(
+            [node.value for node in reversed(linked_list)], self.node_values[::-1]
+        )
+        self.assertEqual(linked_list.tail.value, "c")
+        self.assertEqual(len(linked_list), 3)
+
+        linked_list.extend("de")
+        linked_list.append("f")
+        linked_list.insert_after("z")
+        self.assertEqual(list(linked_list.values()), list("zabcdef"))
+        self.assertEqual(linked_list.tail.value, "f")
+
+        linked_list = ConcurrentSinglyLinkedList()
+        linked_list.extend(())
+        self.assertIsNone(linked_list.head)
+        linked_list.insert_after("a")
+        self.assertIs(linked_list.tail, linked_list.head)
+
+    def test_insert_and_remove_after(self) -> None:
+        linked_list = ConcurrentSinglyLinkedList(*self.node_values)
+        head = linked_list.head
+
+        linked_list.insert_after("d", linked_list.tail)
+        linked_list.insert_after(LockedSinglyNode("e"), head)
+        self.assertEqual(list(linked_list.values()), ["a", "e", "b", "c", "d"])
+        self.assertEqual(linked_list.tail.value, "d")
+        with self.assertRaises(TypeError):
+            linked_list.insert_after(SinglyNode("f"), head)
+
+        node = head.next
+        linked_list.remove_after(head)
+        self.assertTrue(node.unlinked)
+        self.assertEqual(node.next.value, "b")
+        with self.assertRaises(LinkedListIndexError):
+            linked_list.insert_after("f", node)
+        with self.assertRaises(LinkedListIndexError):
+            linked_list.remove_after(node)
+
+        linked_list.remove_after(linked_list.search("c"))
+        self.assertEqual(linked_list.tail.value, "c")
+        linked_list.remove_after(linked_list.tail)
+        linked_list.remove_after()
+        self.assertEqual(list(linked_list.values()), ["b", "c"])
+        self.assertEqual(len(linked_list), 2)
+
+        self.assertEqual(linked_list.pop().value, "c")
+        self.assertEqual(linked_list.pop().value, "b")
+        self.assertIsNone(linked_list.head)
+        self.assertIsNone(linked_list.tail)
+        with self.assertRaises(LinkedListIndexError):
+            linked_list.pop()
+
+    def test_search(self) -> None:
+        for indexed in (False, True):
+            linked_list = ConcurrentSinglyLinkedList(*"abcb", indexed=indexed)
+            self.assertIs(linked_list.search("b"), linked_list.head.next)
+            self.assertIsNone(linked_list.search("d"))
+            self.assertEqual(len(list(linked_list.search_iter("b"))), 2)
+            self.assertTrue(linked_list.contains_value("c"))
+            self.assertIn(linked_list.tail, linked_list)
+
+    def test_remove_if(self) -> None:
+        linked_list = ConcurrentSinglyLinkedList(*"abcab", indexed=True)
+        nodes = list(linked_list)
+
+        self.assertEqual(linked_list.remove_if(lambda value: value == "b"), 2)
+        self.assertEqual(list(linked_list.values()), ["a", "c", "a"])
+        self.assertTrue(nodes[1].unlinked)
+        self.assertEqual(linked_list.tail.value, "a")
+
+        self.assertEqual(linked_list.remove_values(["a"]), 2)
+        self.assertEqual(list(linked_list.values()), ["c"])
+        self.assertIs(linked_list.head, linked_list.tail)
+        self.assertFalse(linked_list.contains_value("a"))
+
+        with self.assertRaises(TypeError):
+            linked_list.remove_if(lambda value: value > 1)
+        self.assertEqual(len(linked_list), 1)
+
+    def test_whole_list_operations(self) -> None:
+        linked_list = ConcurrentSinglyLinkedList(*self.node_values, indexed=True)
+
+        linked_list.reverse()
+        self.assertEqual(list(linked_list.values()), ["c", "b", "a"])
+        linked_list.replace_many({"a": "b", "b": "a"})
+        self.assertEqual(list(linked_list.values()), ["c", "a", "b"])
+
+        other = linked_list.split_after(linked_list.head)
+        self.assertIsInstance(other, ConcurrentSinglyLinkedList)
+        self.assertEqual(list(other.values()), ["a", "b"])
+        other.concat(linked_list)
+        self.assertEqual(list(other.values()), ["a", "b", "c"])
+        self.assertIsNone(linked_list.head)
+        with self.assertRaises(TypeError):
+            other.concat(SinglyLinkedList("d"))
+
+        # the locks are re-entrant, the thread holding them can change the nodes
+        with other.locked():
+            self.assertTrue(all(node.lock._is_owned() for node in other))
+            other.append("d")
+            other.remove_after()
+        self.assertFalse(any(node.lock._is_owned() for node in other))
+        self.assertEqual(list(other.values()), ["b", "c", "d"])
+
+        other.freeze()
+        for method, args in (
+                (other.append, ("e",)),
+                (other.extend, (["e"],)),
+                (other.insert_after, ("e",)),
+                (other.remove_after, ()),
+                (other.pop, ()),
+                (other.remove_if, (bool,)),
+                (other.reverse, ()),
+                (other.replace, ("b", "e")),
+        ):
+            with self.assertRaises(LinkedListReadOnlyError):
+                method(*args)
+        self.assertEqual(list(other.values()), ["b", "c", "d"])
+
+    def test_threads(self) -> None:
+        linked_list = ConcurrentSinglyLinkedList(*range(8), indexed=True)
+        anchors = list(linked_list)
+
+        def work(index: int) -> None:
+            anchor = anchors[index]
+            for value in range(500):
+                linked_list.insert_after(value, anchor)
+                linked_list.append(value)
+                if value % 2:
+                    linked_list.remove_after(anchor)
+                linked_list.search(-1)
+
+        run_threads(work, len(anchors))
+
+        nodes = list(linked_list)
+        self.assertEqual(len(nodes), len(linked_list))
+        self.assertEqual(len(linked_list), 8 + 8 * 750)
+        self.assertIs(linked_list.tail, nodes[-1])
+        self.assertEqual(sum(map(len, linked_list._index.values())), len(nodes))
+        self.assertEqual(linked_list.remove_if(lambda value: True), len(nodes))
+
+    def test_indexed_threads(self) -> None:
+        # the threads search and change the same nodes as soon as they are appended
+        linked_list = ConcurrentSinglyLinkedList(indexed=True)
+        run_threads(search_and_change(linked_list, doubly=False), 8)
+
+        nodes = list(linked_list)
+        self.assertEqual(len(nodes), len(linked_list))
+        self.assertEqual(
+            {node for bucket in linked_list._index.values() for node in bucket},
+            set(nodes),
+        )
+
+
+class TestConcurrentDoublyLinkedList(TestCase):
+    def setUp(self) -> None:
+        self.node_values = ["a", "b", "c"]
+
+    def assertLinks(self, linked_list, values) -> None:
+        """
+        Check the values both forward and backward
+        """
+        self.assertEqual(list(linked_list.values()), values)
+        self.assertEqual([node.value for node in reversed(linked_list)], values[::-1])
+        self.assertEqual(len(linked_list), len(values))
+        if values:
+            self.assertIsNone(linked_list.head.previous)
+            self.assertIsNone(linked_list.tail.next)
+
+    def test_concurrent_doubly_linked_list(self) -> None:
+        linked_list = ConcurrentDoublyLinkedList(*self.node_values)
+        self.assertIsInstance(linked_list.head, LockedDoublyNode)
+        self.assertLinks(linked_list, self.node_values)
+
+        linked_list.extend("de")
+        linked_list.append("f")
+        linked_list.appendleft("z")
+        self.assertLinks(linked_list, list("zabcdef"))
+
+        self.assertEqual(linked_list.pop().value, "f")
+        self.assertEqual(linked_list.popleft().value, "z")
+        self.assertLinks(linked_list, list("abcde"))
+
+        linked_list = ConcurrentDoublyLinkedList("a")
+        self.assertEqual(linked_list.pop().value, "a")
+        self.assertLinks(linked_list, [])
+        with self.assertRaises(LinkedListIndexError):
+            linked_list.pop()
+        with self.assertRaises(LinkedListIndexError):
+            linked_list.popleft()
+
+    def test_insert_and_remove_after(self) -> None:
+        linked_list = ConcurrentDoublyLinkedList(*self.node_values)
+        head = linked_list.head
+
+        linked_list.insert_after("d", linked_list.tail)
+        linked_list.insert_after("e", head)
+        linked_list.insert_after("z")
+        self.assertLinks(linked_list, ["z", "a", "e", "b", "c", "d"])
+        with self.assertRaises(TypeError):
+            linked_list.insert_after(DoublyNode("f"), head)
+
+        node = head.next
+        linked_list.remove_after(head)
+        self.assertTrue(node.unlinked)
+        with self.assertRaises(LinkedListIndexError):
+            linked_list.insert_after("f", node)
+
+        linked_list.remove_after(linked_list.search("c"))
+        linked_list.remove_after(linked_list.tail)
+        linked_list.remove_after()
+        self.assertLinks(linked_list, ["a", "b", "c"])
+
+        linked_list.move_to_end(linked_list.head)
+        self.assertLinks(linked_list, ["b", "c", "a"])
+        linked_list.move_to_end(linked_list.tail, last=False)
+        self.assertLinks(linked_list, ["a", "b", "c"])
+
+        linked_list.remove_node(linked_list.search("b"))
+        linked_list.remove_node(linked_list.head)
+        self.assertLinks(linked_list, ["c"])
+        with self.assertRaises(LinkedListIndexError):
+            linked_list.remove_node(head)
+        with self.assertRaises(LinkedListIndexError):
+            linked_list.move_to_end(head)
+        with self.assertRaises(LinkedListIndexError):
+            linked_list.remove_node(LockedDoublyNode("d"))
+        linked_list.remove_node(linked_list.tail)
+        self.assertLinks(linked_list, [])
+
+    def test_remove_foreign_node(self) -> None:
+        linked_list = ConcurrentDoublyLinkedList(3, 4)
+        other = ConcurrentDoublyLinkedList(1, 2)
+
+        with self.assertRaises(LinkedListIndexError):
+            linked_list.remove_node(other.head)
+        with self.assertRaises(LinkedListIndexError):
+            linked_list.remove_node(other.tail)
+        self.assertLinks(linked_list, [3, 4])
+        self.assertLinks(other, [1, 2])
+
+    def test_remove_if(self) -> None:
+        linked_list = ConcurrentDoublyLinkedList(*"abcab", indexed=True)
+
+        self.assertEqual(linked_list.remove_if(lambda value: value != "c"), 4)
+        self.assertLinks(linked_list, ["c"])
+        linked_list.extend("abc")
+        self.assertEqual(linked_list.remove_values(["c"]), 2)
+        self.assertLinks(linked_list, ["a", "b"])
+        self.assertFalse(linked_list.contains_value("c"))
+
+    def test_whole_list_operations(self) -> None:
+        linked_list = ConcurrentDoublyLinkedList(*self.node_values)
+
+        linked_list.rotate(1)
+        self.assertLinks(linked_list, ["c", "a", "b"])
+        linked_list.extendleft("ed")
+        self.assertLinks(linked_list, ["d", "e", "c", "a", "b"])
+        linked_list.reverse()
+        self.assertLinks(linked_list, ["b", "a", "c", "e", "d"])
+
+        other = linked_list.split_after(linked_list.head.next)
+        self.assertIsInstance(other, ConcurrentDoublyLinkedList)
+        self.assertLinks(other, ["c", "e", "d"])
+        linked_list.concat(other)
+        self.assertLinks(linked_list, ["b", "a", "c", "e", "d"])
+        self.assertLinks(other, [])
+
+    def test_threads(self) -> None:
+        # the last node keeps the nodes appended apart from the anchors
+        linked_list = ConcurrentDoublyLinkedList(*range(9))
+        anchors = list(linked_list)[:8]
+
+        def work(index: int) -> None:
+            anchor = anchors[index]
+            for value in range(500):
+                linked_list.insert_after(value, anchor)
+                linked_list.append(value)
+                linked_list.appendleft(value)
+                if value % 2:
+                    linked_list.remove_node(anchor.next)
+                    linked_list.pop()
+                    linked_list.popleft()
+
+        run_threads(work, len(anchors))
+
+        nodes = list(linked_list)
+        self.assertEqual(len(nodes), 9 + 8 * 3 * 250)
+        self.assertEqual(list(reversed(linked_list)), nodes[::-1])
+        self.assertTrue(all(node.next.previous is node for node in nodes[:-1]))
+        self.assertIs(linked_list.tail, nodes[-1])
+
+    def test_reverse_threads(self) -> None:
+        # the node before a node read without a lock may be moved after it meanwhile
+        linked_list = ConcurrentDoublyLinkedList(*range(64))
+
+        def work(index: int) -> None:
+            for step in range(300):
+                if index == 0:
+                    linked_list.reverse()
+                elif index == 1:
+                    linked_list.rotate(step % 5 - 2)
+                else:
+                    linked_list.extend([step] * 2)
+                    node = linked_list.head
+                    if node is not None:
+                        node = node.next or node
+                    try:
+                        if node is not None:
+                            linked_list.remove_node(node)
+                        linked_list.pop()
+                    except LinkedListIndexError:  # removed by another thread
+                        pass
+
+        run_threads(work, 8)
+
+        nodes = list(linked_list)
+        self.assertEqual(len(nodes), len(linked_list))
+        self.assertEqual(list(reversed(linked_list)), nodes[::-1])
+        self.assertTrue(all(node.next.previous is node for node in nodes[:-1]))
+        self.assertIs(linked_list.tail, nodes[-1])
+
+    def test_indexed_threads(self) -> None:
+        # the threads search and change the same nodes as soon as they are appended
+        linked_list = ConcurrentDoublyLinkedList(indexed=True)
+        run_threads(search_and_change(linked_list, doubly=True), 8)
+
+        nodes = list(linked_list)
+        self.assertEqual(len(nodes), len(linked_list))
+        self.assertEqual(list(reversed(linked_list)), nodes[::-1])
+        self.assertEqual(
+            {node for bucket in linked_list._index.values() for node in bucket},
+            set(nodes),
+        )
@@ -1,3 +1,7 @@
+import asyncio
+import pickle
+import sys
+from collections import deque
 from collections.abc import Iterator
 from typing import Optional
 from unittest import TestCase
@@ -55,6 +59,62 @@ class TestDoublyLinkedList(TestCase):
             self.assertIs(node.previous, previous)
             previous = node
 
+    def test_async_iter(self) -> None:
+        doubly_linked_list = DoublyLinkedList(*range(10))
+        doubly_linked_list.async_batch_size = 4
+        yields = []
+
+        async def count() -> None:
+            while True:
+                yields.append(len(nodes))
+                await asyncio.sleep(0)
+
+        async def walk() -> None:
+            task = asyncio.ensure_future(count())
+            await asyncio.sleep(0)
+            async for node in doubly_linked_list:
+                nodes.append(node)
+            task.cancel()
+
+        nodes = []
+        asyncio.run(walk())
+        self.assertEqual(nodes, list(doubly_linked_list))
+        # the other task runs after every batch of 4 nodes
+        self.assertEqual(yields, [0, 4, 8])
+
+        async def collect(batch_size: int) -> list:
+            return [
+                node.value async for node in doubly_linked_list.async_iter(batch_size)
+            ]
+
+        self.assertEqual(asyncio.run(collect(1)), list(range(10)))
+        with self.assertRaises(ValueError):
+            asyncio.run(collect(0))
+
+    def test_pickle(self) -> None:
+        # the previous links are not pickled either
+        size = 2 * sys.getrecursionlimit() + 1
+        doubly_linked_list = DoublyLinkedList.from_iterable(range(size), indexed=True)
+        other = pickle.loads(pickle.dumps(doubly_linked_list))
+        self.assertIsInstance(other, DoublyLinkedList)
+        self.assertTrue(other.indexed)
+        self.assertEqual(list(other.values()), list(range(size)))
+        self.assertEqual(
+            [node.value for node in reversed(other)], list(reversed(range(size)))
+        )
+
+        buffers = []
+        data = doubly_linked_list.to_bytes(buffers.append)
+        other = DoublyLinkedList.from_bytes(data, buffers)
+        self.assertEqual(len(buffers), 1)
+        self.assertEqual(list(other.values()), list(range(size)))
+        self.assertIs(other.search(size - 1), other.tail)
+
+    def test_values(self) -> None:
+        doubly_linked_list = DoublyLinkedList(*self.node_values)
+        self.assertIsInstance(doubly_linked_list.values(), Iterator)
+        self.assertEqual(list(doubly_linked_list.values()), self.node_values)
+
     def test_len(self) -> None:
         doubly_linked_list = DoublyLinkedList(*self.node_values)
         self.assertEqual(len(doubly_linked_list), len(self.node_values))
@@ -62,6 +122,14 @@ class TestDoublyLinkedList(TestCase):
         doubly_linked_list = DoublyLinkedList()
         self.assertEqual(len(doubly_linked_list), 0)
 
+        doubly_linked_list = DoublyLinkedList(*self.node_values)
+        doubly_linked_list.debug = True
+        doubly_linked_list.append("d")
+        doubly_linked_list.reverse()
+        doubly_linked_list.pop()
+        doubly_linked_list.pop()
+        self.assertEqual(len(doubly_linked_list), len(self.node_values) - 1)
+
     def test_reserved(self) -> None:
         doubly_linked_list = DoublyLinkedList(*self.node_values)
         reversed_doubly_linked_list = reversed(doubly_linked_list)
@@ -70,6 +138,10 @@ class TestDoublyLinkedList(TestCase):
         for node, i in zip(reversed_doubly_linked_list, reversed(self.node_values)):
             self.assertIs(node.value, i)
 
+        nodes = list(doubly_linked_list)
+        self.assertEqual(list(reversed(doubly_linked_list)), nodes[::-1])
+        self.assertEqual(list(reversed(DoublyLinkedList())), [])
+
     def test_append(self) -> None:
         linked_list = DoublyLinkedList(*self.node_values)
 
@@ -87,6 +159,148 @@ class TestDoublyLinkedList(TestCase):
         linked_list.append("d")
         self.assertIs(linked_list.tail.value, "d")
 
+    def test_extend(self) -> None:
+        linked_list = DoublyLinkedList.from_iterable(iter(self.node_values))
+        linked_list.debug = True
+
+        orig_tail = linked_list.tail
+        linked_list.extend(value for value in "de")
+
+        self.assertEqual(
+            [node.value for node in linked_list], self.node_values + ["d", "e"]
+        )
+        self.assertIs(orig_tail.next.previous, orig_tail)
+        self.assertEqual(linked_list.tail.value, "e")
+        self.assertEqual(linked_list.tail.previous.value, "d")
+        self.assertEqual(len(linked_list), len(self.node_values) + 2)
+
+        linked_list = DoublyLinkedList()
+        linked_list.extend([])
+        self.assertIsNone(linked_list.head)
+
+    def test_appendleft(self) -> None:
+        linked_list = DoublyLinkedList(*self.node_values)
+        linked_list.debug = True
+
+        orig_head = linked_list.head
+        linked_list.appendleft("z")
+
+        self.assertEqual(linked_list.head.value, "z")
+        self.assertIsNone(linked_list.head.previous)
+        self.assertIs(linked_list.head.next, orig_head)
+        self.assertIs(orig_head.previous, linked_list.head)
+        self.assertEqual(len(linked_list), len(self.node_values) + 1)
+
+        linked_list = DoublyLinkedList(indexed=True)
+        linked_list.appendleft("z")
+        self.assertIs(linked_list.head, linked_list.tail)
+        self.assertIs(linked_list.search("z"), linked_list.head)
+
+    def test_extendleft(self) -> None:
+        linked_list = DoublyLinkedList(*self.node_values)
+        linked_list.debug = True
+
+        orig_head = linked_list.head
+        linked_list.extendleft(value for value in "yz")
+
+        self.assertEqual(
+            [node.value for node in linked_list], ["z", "y"] + self.node_values
+        )
+        self.assertIs(orig_head.previous.next, orig_head)
+        self.assertIsNone(linked_list.head.previous)
+        self.assertEqual(len(linked_list), len(self.node_values) + 2)
+
+        for indexed in (False, True):
+            linked_list = DoublyLinkedList(indexed=indexed)
+            linked_list.extendleft("abc")
+            self.assertEqual(list(linked_list.values()), ["c", "b", "a"])
+            self.assertEqual(
+                [node.value for node in reversed(linked_list)], ["a", "b", "c"]
+            )
+            self.assertTrue(linked_list.contains_value("b"))
+
+    def test_rotate(self) -> None:
+        values = list(range(7))
+        for k in range(-10, 11):
+            linked_list = DoublyLinkedList(*values)
+            linked_list.debug = True
+            expected = deque(values)
+
+            linked_list.rotate(k)
+            expected.rotate(k)
+
+            self.assertEqual(list(linked_list.values()), list(expected))
+            self.assertEqual(
+                [node.value for node in reversed(linked_list)], list(reversed(expected))
+            )
+            self.assertIsNone(linked_list.head.previous)
+            self.assertIsNone(linked_list.tail.next)
+            self.assertEqual(len(linked_list), len(values))
+
+        linked_list = DoublyLinkedList()
+        linked_list.rotate(3)
+        self.assertIsNone(linked_list.head)
+
+        linked_list = DoublyLinkedList("a")
+        linked_list.rotate()
+        self.assertIs(linked_list.head, linked_list.tail)
+
+    def test_concat(self) -> None:
+        linked_list = DoublyLinkedList(*self.node_values)
+        linked_list.debug = True
+        orig_tail = linked_list.tail
+        other = DoublyLinkedList("d", "e")
+        other_head, other_tail = other.head, other.tail
+
+        linked_list.concat(other)
+        self.assertEqual(list(linked_list.values()), self.node_values + ["d", "e"])
+        self.assertIs(orig_tail.next, other_head)
+        self.assertIs(other_head.previous, orig_tail)
+        self.assertIs(linked_list.tail, other_tail)
+        self.assertEqual(
+            [node.value for node in reversed(linked_list)], ["e", "d", "c", "b", "a"]
+        )
+        self.assertEqual(len(linked_list), 5)
+        self.assertIsNone(other.head)
+        self.assertEqual(len(other), 0)
+
+        empty = DoublyLinkedList()
+        empty.concat(linked_list)
+        self.assertIsNone(empty.head.previous)
+        self.assertEqual(len(empty), 5)
+
+    def test_split_after(self) -> None:
+        values = list(range(7))
+        for position in range(len(values)):
+            linked_list = DoublyLinkedList(*values)
+            linked_list.debug = True
+            node = linked_list.head
+            for _ in range(position):
+                node = node.next
+
+            other = linked_list.split_after(node)
+            self.assertIsInstance(other, DoublyLinkedList)
+            self.assertEqual(list(linked_list.values()), values[: position + 1])
+            self.assertEqual(list(other.values()), values[position + 1:])
+            self.assertEqual(
+                [node.value for node in reversed(other)], values[:position:-1]
+            )
+            self.assertIs(linked_list.tail, node)
+            self.assertIsNone(node.next)
+            self.assertEqual(len(linked_list), position + 1)
+            self.assertEqual(len(other), len(values) - position - 1)
+            if other:
+                self.assertIsNone(other.head.previous)
+
+        linked_list = DoublyLinkedList(*self.node_values, indexed=True)
+        other = linked_list.split_after()
+        self.assertEqual(list(other.values()), self.node_values)
+        self.assertIsNone(linked_list.head)
+        self.assertIsNone(linked_list.tail)
+        self.assertEqual(len(linked_list), 0)
+        self.assertIs(other.search("c"), other.tail)
+        self.assertFalse(linked_list.contains_value("c"))
+
     def test_is_head(self) -> None:
         doubly_linked_list = DoublyLinkedList(*self.node_values)
 
@@ -113,7 +327,8 @@ class TestDoublyLinkedList(TestCase):
         node = linked_list.pop()
 
         self.assertIs(tail, node)
-        self.assertIs(tail.previous, previous_tail)
+        # the node popped is not linked any more
+        self.assertIsNone(tail.previous)
         self.assertIsNone(tail.next)
 
         self.assertIsNone(previous_tail.next)
@@ -132,6 +347,233 @@ class TestDoublyLinkedList(TestCase):
         with self.assertRaises(LinkedListIndexError):
             _ = linked_list.pop()
 
+    def test_popleft(self) -> None:
+        linked_list = DoublyLinkedList(*self.node_values)
+        linked_list.debug = True
+
+        head = linked_list.head
+        next_head = head.next
+
+        node = linked_list.popleft()
+
+        self.assertIs(node, head)
+        self.assertIs(linked_list.head, next_head)
+        self.assertIsNone(linked_list.head.previous)
+        self.assertEqual(len(linked_list), len(self.node_values) - 1)
+
+        self.assertIs(linked_list.popleft().value, "b")
+        self.assertIs(linked_list.popleft().value, "c")
+        self.assertIsNone(linked_list.head)
+        self.assertIsNone(linked_list.tail)
+
+        with self.assertRaises(LinkedListIndexError):
+            _ = linked_list.popleft()
+
+        linked_list = DoublyLinkedList(*self.node_values, indexed=True)
+        linked_list.popleft()
+        self.assertFalse(linked_list.contains_value("a"))
+
+    def test_replace(self) -> None:
+        linked_list = DoublyLinkedList("a", "b", "a", indexed=True)
+
+        linked_list.replace("a", "c", 1)
+        self.assertEqual(list(linked_list.values()), ["c", "b", "a"])
+        linked_list.replace("a", "c")
+        self.assertEqual(list(linked_list.values()), ["c", "b", "c"])
+        self.assertEqual(len(list(linked_list.search_iter("c"))), 2)
+
+        linked_list.replace_many({"c": "a", "b": "c"})
+        self.assertEqual(list(linked_list.values()), ["a", "c", "a"])
+        self.assertIs(linked_list.search("c"), linked_list.head.next)
+
+        linked_list.replace_if(lambda value: value == "a", str.upper)
+        self.assertEqual(list(linked_list.values()), ["A", "c", "A"])
+        self.assertEqual(
+            [node.value for node in reversed(linked_list)], ["A", "c", "A"]
+        )
+        self.assertFalse(linked_list.contains_value("a"))
+
+    def test_remove_if(self) -> None:
+        linked_list = DoublyLinkedList(*"abcab")
+
+        self.assertEqual(linked_list.remove_if(lambda value: value != "c"), 4)
+        self.assertEqual(list(linked_list.values()), ["c"])
+        self.assertIs(linked_list.head, linked_list.tail)
+        self.assertIsNone(linked_list.head.previous)
+        self.assertIsNone(linked_list.tail.next)
+
+        linked_list.extend("abc")
+        self.assertEqual(linked_list.remove_values(["c", "z"]), 2)
+        self.assertEqual(list(linked_list.values()), ["a", "b"])
+        self.assertEqual([node.value for node in reversed(linked_list)], ["b", "a"])
+        self.assertEqual(len(linked_list), 2)
+
+    def test_insert_after(self) -> None:
+        linked_list = DoublyLinkedList(indexed=True)
+        linked_list.insert_after("b")
+        linked_list.insert_after("a")
+        linked_list.insert_after("d", linked_list.tail)
+        linked_list.insert_after("c", linked_list.head.next)
+        self.assertEqual(list(linked_list.values()), ["a", "b", "c", "d"])
+        self.assertEqual(
+            [node.value for node in reversed(linked_list)], ["d", "c", "b", "a"]
+        )
+        self.assertEqual(len(linked_list), 4)
+        self.assertEqual(linked_list.search("c").value, "c")
+
+        # a node removed from another doubly linked list is moved as it is
+        other = DoublyLinkedList("e", "f")
+        node = other.head
+        other.remove_node(node)
+        linked_list.insert_after(node, linked_list.tail)
+        self.assertIs(linked_list.tail, node)
+        self.assertIs(linked_list.search("e"), node)
+        self.assertIsNone(node.next)
+        self.assertEqual(list(other.values()), ["f"])
+        self.assertEqual(len(linked_list), 5)
+
+    def test_remove_node(self) -> None:
+        linked_list = DoublyLinkedList(*"abcd", indexed=True)
+        nodes = list(linked_list)
+
+        linked_list.remove_node(nodes[1])
+        self.assertEqual(list(linked_list.values()), ["a", "c", "d"])
+        self.assertEqual([node.value for node in reversed(linked_list)], ["d", "c", "a"])
+        self.assertFalse(linked_list.contains_value("b"))
+        # the node removed keeps its next link, but cannot be removed again
+        self.assertIsNone(nodes[1].previous)
+        self.assertIs(nodes[1].next, nodes[2])
+        with self.assertRaises(LinkedListIndexError):
+            linked_list.remove_node(nodes[1])
+
+        linked_list.remove_node(nodes[0])
+        linked_list.remove_node(nodes[3])
+        self.assertIs(linked_list.head, nodes[2])
+        self.assertIs(linked_list.tail, nodes[2])
+        self.assertIsNone(nodes[2].previous)
+        self.assertIsNone(nodes[2].next)
+        linked_list.remove_node(nodes[2])
+        self.assertIsNone(linked_list.head)
+        self.assertIsNone(linked_list.tail)
+        self.assertEqual(len(linked_list), 0)
+
+        linked_list = DoublyLinkedList(*"ab")
+        with self.assertRaises(LinkedListIndexError):
+            linked_list.remove_node(linked_list.popleft())
+        linked_list.debug = True
+        with self.assertRaises(LinkedListIndexError):
+            linked_list.remove_node(DoublyLinkedList("c").tail)
+
+        # the nodes removed by any method cannot be removed again
+        linked_list = DoublyLinkedList(1, 2, 3)
+        with self.assertRaises(LinkedListIndexError):
+            linked_list.remove_node(linked_list.pop())
+        self.assertEqual(len(linked_list), 2)
+        self.assertEqual(list(linked_list.values()), [1, 2])
+
+        linked_list = DoublyLinkedList(1, 2, 3)
+        node = linked_list.head.next
+        linked_list.remove_if(lambda value: value == 2)
+        with self.assertRaises(LinkedListIndexError):
+            linked_list.remove_node(node)
+        self.assertEqual(len(linked_list), 2)
+        self.assertEqual(list(linked_list.values()), [1, 3])
+
+        linked_list = DoublyLinkedList(1, 2, 3, indexed=True)
+        node = linked_list.search(2)
+        linked_list.remove_values([2])
+        with self.assertRaises(LinkedListIndexError):
+            linked_list.remove_node(node)
+        self.assertEqual(list(linked_list.values()), [1, 3])
+
+        # so are the head and the tail of another doubly linked list
+        other = DoublyLinkedList(1, 2)
+        linked_list = DoublyLinkedList(3, 4)
+        for node in (other.head, other.tail):
+            with self.assertRaises(LinkedListIndexError):
+                linked_list.remove_node(node)
+        self.assertEqual(list(other.values()), [1, 2])
+        self.assertEqual(list(linked_list.values()), [3, 4])
+        self.assertIs(linked_list.tail.value, 4)
+
+    def test_move_to_end(self) -> None:
+        linked_list = DoublyLinkedList(*"abcd", indexed=True)
+        nodes = list(linked_list)
+
+        linked_list.move_to_end(nodes[1])
+        self.assertEqual(list(linked_list.values()), ["a", "c", "d", "b"])
+        self.assertEqual(
+            [node.value for node in reversed(linked_list)], ["b", "d", "c", "a"]
+        )
+        linked_list.move_to_end(nodes[3], last=False)
+        self.assertEqual(list(linked_list.values()), ["d", "a", "c", "b"])
+        linked_list.move_to_end(nodes[0], last=False)
+        linked_list.move_to_end(nodes[3])
+        self.assertEqual(list(linked_list.values()), ["a", "c", "b", "d"])
+        self.assertEqual(
+            [node.value for node in reversed(linked_list)], ["d", "b", "c", "a"]
+        )
+        self.assertIs(linked_list.head, nodes[0])
+        self.assertIsNone(nodes[0].previous)
+        self.assertIs(linked_list.tail, nodes[3])
+        self.assertIsNone(nodes[3].next)
+        self.assertEqual(len(linked_list), 4)
+        self.assertIs(linked_list.search("b"), nodes[1])
+
+        # the head and the tail stay where they are
+        linked_list.move_to_end(nodes[3])
+        linked_list.move_to_end(nodes[0], last=False)
+        self.assertEqual(list(linked_list.values()), ["a", "c", "b", "d"])
+
+        linked_list = DoublyLinkedList("a")
+        linked_list.move_to_end(linked_list.head, last=False)
+        self.assertIs(linked_list.head, linked_list.tail)
+
+        linked_list = DoublyLinkedList(*"ab")
+        with self.assertRaises(LinkedListIndexError):
+            linked_list.move_to_end(linked_list.popleft())
+        linked_list.debug = True
+        with self.assertRaises(LinkedListIndexError):
+            linked_list.move_to_end(DoublyLinkedList("c").tail)
+        self.assertEqual(list(linked_list.values()), ["b"])
+
+        # the nodes removed by any method, and the ends of another doubly linked list,
+        # are refused without the debug mode
+        linked_list = DoublyLinkedList(*"abcd")
+        popped = linked_list.pop()
+        removed = linked_list.head.next
+        linked_list.remove_if(lambda value: value == "b")
+        other = DoublyLinkedList(*"xy")
+        for node in (popped, removed, other.head, other.tail):
+            for last in (True, False):
+                with self.assertRaises(LinkedListIndexError):
+                    linked_list.move_to_end(node, last)
+        self.assertEqual(list(linked_list.values()), ["a", "c"])
+        self.assertEqual([node.value for node in reversed(linked_list)], ["c", "a"])
+        self.assertEqual(len(linked_list), 2)
+        self.assertEqual(list(other.values()), ["x", "y"])
+
+    def test_remove_values(self) -> None:
+        linked_list = DoublyLinkedList(*"abcabd", indexed=True)
+
+        # only the nodes holding the values are visited
+        self.assertEqual(linked_list.remove_values(iter("adz")), 3)
+        self.assertEqual(list(linked_list.values()), ["b", "c", "b"])
+        self.assertEqual(
+            [node.value for node in reversed(linked_list)], ["b", "c", "b"]
+        )
+        self.assertFalse(linked_list.contains_value("d"))
+        self.assertEqual(linked_list.tail.value, "b")
+
+        self.assertEqual(linked_list.remove_values(["b"]), 2)
+        self.assertIs(linked_list.head, linked_list.tail)
+        self.assertIsNone(linked_list.head.previous)
+        self.assertIsNone(linked_list.head.next)
+        self.assertEqual(linked_list.remove_values(["c"]), 1)
+        self.assertIsNone(linked_list.head)
+        self.assertIsNone(linked_list.tail)
+        self.assertEqual(len(linked_list), 0)
+
     def test_reverse(self) -> None:
         doubly_linked_list = DoublyLinkedList(*self.node_values)
         self.assertIsNone(doubly_linked_list.reverse())
@@ -167,9 +609,43 @@ class TestDoublyLinkedList(TestCase):
         with self.assertRaises(StopIteration):
             _ = next(search_iter)
 
+    def test_indexed(self) -> None:
+        doubly_linked_list = DoublyLinkedList(*self.node_values, indexed=True)
+
+        self.assertIs(doubly_linked_list.search("c"), doubly_linked_list.tail)
+        self.assertIn(doubly_linked_list.head, doubly_linked_list)
+        self.assertTrue(doubly_linked_list.contains_value("a"))
+
+        doubly_linked_list.append("c")
+        self.assertIs(doubly_linked_list.tail.previous.value, "c")
+        self.assertEqual(len(list(doubly_linked_list.search_iter("c"))), 2)
+
+        doubly_linked_list.pop()
+        doubly_linked_list.pop()
+        self.assertFalse(doubly_linked_list.contains_value("c"))
+
     def test_tail(self) -> None:
         doubly_linked_list = DoublyLinkedList(*self.node_values)
         self.assertIs(doubly_linked_list.tail.value, self.node_values[-1])
 
         doubly_linked_list = DoublyLinkedList()
         self.assertIsNone(doubly_linked_list.tail)
+
+    def test_tail_tracking(self) -> None:
+        doubly_linked_list = DoublyLinkedList(*self.node_values)
+        head = doubly_linked_list.head
+
+        doubly_linked_list.reverse()
+        self.assertIs(doubly_linked_list.tail, head)
+        self.assertIsNone(doubly_linked_list.tail.next)
+
+        doubly_linked_list.pop()
+        self.assertIs(doubly_linked_list.tail.value, "b")
+
+        doubly_linked_list.append("d")
+        self.assertIs(doubly_linked_list.tail.value, "d")
+        self.assertIs(doubly_linked_list.tail.previous.value, "b")
+
+        for _ in range(3):
+            doubly_linked_list.pop()
+        self.assertIsNone(doubly_linked_list.tail)
@@ -0,0 +1,152 @@
+import os
+import pickle
+import struct
+import tempfile
+from unittest import TestCase
+
+from data_structures.exceptions import LinkedListReadOnlyError, NodeFrozenError
+from data_structures.linked_list.doubly import DoublyLinkedList
+from data_structures.linked_list.mapped import MAGIC, MappedLinkedList
+from data_structures.linked_list.nodes import MappedNode
+from data_structures.linked_list.singly import SinglyLinkedList
+
+
+class TestMappedLinkedList(TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "linked_list")
+        self.node_values = ["a", "b", "c", "a"]
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_mapped_linked_list(self) -> None:
+        MappedLinkedList.dump(SinglyLinkedList(*self.node_values), self.path)
+        with MappedLinkedList(self.path) as linked_list:
+            self.assertEqual(linked_list.codec, "json")
+            self.assertEqual(list(linked_list.values()), self.node_values)
+            self.assertEqual([node.value for node in linked_list], self.node_values)
+            self.assertEqual(
+                [node.value for node in reversed(linked_list)], self.node_values[::-1]
+            )
+            self.assertEqual(len(linked_list), 4)
+            self.assertTrue(linked_list)
+
+            head = linked_list.head
+            self.assertIsInstance(head, MappedNode)
+            self.assertEqual(head.next.value, "b")
+            self.assertEqual(linked_list.tail.value, "a")
+            self.assertIsNone(linked_list.tail.next)
+            self.assertIn(head, linked_list)
+            self.assertNotIn(SinglyLinkedList("a").head, linked_list)
+            self.assertTrue(linked_list.is_tail(linked_list.tail))
+
+        MappedLinkedList.dump(iter(()), self.path)
+        with MappedLinkedList(self.path) as linked_list:
+            self.assertFalse(linked_list)
+            self.assertIsNone(linked_list.head)
+            self.assertIsNone(linked_list.tail)
+            self.assertEqual(list(linked_list), [])
+
+    def test_codecs(self) -> None:
+        values = {
+            "json": [1, 2.5, [1, "été", None], 1],
+            "pickle": [1, 2.5, (1, "a"), 1],
+            "bytes": [b"x", b"", bytearray(b"yz"), b"x"],
+            "str": ["x", "", "été", "x"],
+        }
+        for codec, node_values in values.items():
+            MappedLinkedList.dump(DoublyLinkedList(*node_values), self.path, codec)
+            allow_pickle = codec == "pickle"
+            with MappedLinkedList(self.path, allow_pickle) as linked_list:
+                self.assertEqual(linked_list.codec, codec)
+                self.assertEqual(list(linked_list.values()), node_values)
+
+                nodes = list(linked_list.search_iter(node_values[0]))
+                self.assertEqual([node.index for node in nodes], [0, 3])
+                self.assertEqual(linked_list.search(node_values[0]), nodes[0])
+                self.assertEqual(linked_list.search(node_values[2]).index, 2)
+                self.assertFalse(linked_list.contains_value(object()))
+
+        with self.assertRaises(TypeError):
+            MappedLinkedList.dump([1], self.path, "bytes")
+        with self.assertRaises(TypeError):
+            MappedLinkedList.dump([object()], self.path)
+        with self.assertRaises(ValueError):
+            MappedLinkedList.dump([1], self.path, "marshal")
+
+        # a tuple is a list in JSON
+        MappedLinkedList.dump([(1, 2)], self.path)
+        with MappedLinkedList(self.path) as linked_list:
+            self.assertEqual(list(linked_list.values()), [[1, 2]])
+            self.assertEqual(linked_list.search([1, 2]).index, 0)
+
+    def test_pickle_codec(self) -> None:
+        # unpickling a file of an unknown source can run any code, it is opted in
+        MappedLinkedList.dump([(1, "a")], self.path, "pickle")
+        with self.assertRaises(ValueError):
+            MappedLinkedList(self.path)
+        with MappedLinkedList(self.path, allow_pickle=True) as linked_list:
+            self.assertEqual(list(linked_list.values()), [(1, "a")])
+            with pickle.loads(pickle.dumps(linked_list)) as other:
+                self.assertEqual(list(other.values()), [(1, "a")])
+
+    def test_read_only(self) -> None:
+        MappedLinkedList.dump(self.node_values, self.path)
+        with MappedLinkedList(self.path) as linked_list:
+            for method, args in (
+                    (linked_list.append, ("d",)),
+                    (linked_list.extend, ("d",)),
+                    (linked_list.pop, ()),
+                    (linked_list.reverse, ()),
+                    (linked_list.remove_if, (bool,)),
+                    (linked_list.remove_values, (["a"],)),
+                    (linked_list.replace, ("a", "d")),
+                    (linked_list.replace_many, ({"a": "d"},)),
+                    (linked_list.replace_if, (bool, "d")),
+            ):
+                with self.assertRaises(LinkedListReadOnlyError):
+                    method(*args)
+
+            with self.assertRaises(NodeFrozenError):
+                linked_list.head.value = "d"
+            with self.assertRaises(NodeFrozenError):
+                linked_list.head.next = None
+            self.assertEqual(list(linked_list.values()), self.node_values)
+
+    def test_file_format(self) -> None:
+        MappedLinkedList.dump(["a", "bc"], self.path, "str")
+        with open(self.path, "rb") as file:
+            data = file.read()
+
+        header = struct.unpack_from("<8sIIqqqq", data)
+        self.assertEqual(header, (MAGIC, 1, 2, 0, 1, 2, 48 + 2 * 24))
+        self.assertEqual(struct.unpack_from("<6q", data, 48), (1, 0, 1, -1, 1, 2))
+        self.assertEqual(data[96:], b"abc")
+
+        # the records can be linked in any order
+        with open(self.path, "r+b") as file:
+            file.write(struct.pack("<8sIIqqqq", MAGIC, 1, 2, 1, 0, 2, 96))
+            file.write(struct.pack("<6q", -1, 0, 1, 0, 1, 2))
+        with MappedLinkedList(self.path) as linked_list:
+            self.assertEqual(list(linked_list.values()), ["bc", "a"])
+            self.assertEqual([node.index for node in reversed(linked_list)], [0, 1])
+
+        for data in (b"", b"not a linked list", data.replace(MAGIC, b"X" * 8)):
+            with open(self.path, "wb") as file:
+                file.write(data)
+            with self.assertRaises(ValueError):
+                MappedLinkedList(self.path)
+
+    def test_pickle(self) -> None:
+        MappedLinkedList.dump(self.node_values, self.path)
+        with MappedLinkedList(self.path) as linked_list:
+            data = pickle.dumps(linked_list)
+            with pickle.loads(data) as other:
+                self.assertEqual(other.path, self.path)
+                self.assertEqual(list(other.values()), self.node_values)
+
+        # only the path is pickled, the file is mapped again when unpickled
+        MappedLinkedList.dump(["d"], self.path)
+        with pickle.loads(data) as other:
+            self.assertEqual(list(other.values()), ["d"])
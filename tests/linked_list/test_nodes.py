@@ -1,10 +1,21 @@
 """
 Test Cases for all Node classes
 """
+import struct
+import sys
 from unittest import TestCase
 
 from data_structures.exceptions import NodeFrozenError
-from data_structures.linked_list.nodes import DoublyNode, SecureSinglyNode, SinglyNode
+from data_structures.linked_list import Node
+from data_structures.linked_list.nodes import (
+    ArrayNode,
+    DoublyNode,
+    LockedDoublyNode,
+    LockedSinglyNode,
+    MappedNode,
+    SecureSinglyNode,
+    SinglyNode,
+)
 
 
 class TestNode(TestCase):
@@ -36,6 +47,34 @@ class TestNode(TestCase):
         node_b = SinglyNode.after_node(self.node_value, node_a)
         self.assertIs(node_a.next, node_b)
 
+    def test_slots(self) -> None:
+        """
+        test the node carries no per-instance __dict__
+        """
+        for node in (
+                SinglyNode(self.node_value),
+                SecureSinglyNode(self.node_value),
+                DoublyNode(self.node_value),
+                LockedSinglyNode(self.node_value),
+                LockedDoublyNode(self.node_value),
+                ArrayNode(None, 0),
+                MappedNode(None, 0),
+        ):
+            self.assertFalse(hasattr(node, "__dict__"))
+            self.assertIsInstance(node, Node)
+
+        # a node carries only the slots it uses, a handle none for value and next
+        size = sys.getsizeof(SinglyNode(self.node_value))
+        pointer = struct.calcsize("P")
+        self.assertEqual(sys.getsizeof(ArrayNode(None, 0)), size)
+        self.assertEqual(sys.getsizeof(MappedNode(None, 0)), size)
+        self.assertEqual(
+            sys.getsizeof(SecureSinglyNode(self.node_value)), size + pointer
+        )
+        self.assertEqual(
+            sys.getsizeof(LockedSinglyNode(self.node_value)), size + 2 * pointer
+        )
+
 
 class TestSecureNode(TestCase):
     def setUp(self) -> None:
@@ -0,0 +1,278 @@
+import pickle
+from unittest import TestCase, skipIf
+
+from data_structures.exceptions import LinkedListIndexError
+from data_structures.linked_list.nodes import ArrayNode, SinglyNode
+
+try:
+    import numpy as np
+
+    from data_structures.linked_list.numeric import NumericLinkedList
+except ImportError:  # numpy is an optional dependency
+    np = None
+
+
+@skipIf(np is None, "numpy is not installed")
+class TestNumericLinkedList(TestCase):
+    def setUp(self) -> None:
+        self.node_values = [3.0, 1.0, 4.0, 1.0, 5.0]
+
+    def assertLinks(self, linked_list, values) -> None:
+        """
+        Check the values both by walking the links and by the vectorized path
+        """
+        self.assertEqual([node.value for node in linked_list], values)
+        self.assertEqual(list(linked_list.values()), values)
+        self.assertEqual(linked_list.to_numpy().tolist(), values)
+        self.assertEqual(len(linked_list), len(values))
+
+    def test_numeric_linked_list(self) -> None:
+        linked_list = NumericLinkedList(*self.node_values)
+        self.assertLinks(linked_list, self.node_values)
+        self.assertEqual(linked_list.value_slots.dtype, np.float64)
+        self.assertIsInstance(linked_list.head, ArrayNode)
+        self.assertTrue(linked_list._contiguous)
+
+        linked_list = NumericLinkedList(1, 2, dtype=np.int32, capacity=100)
+        self.assertEqual(linked_list.value_slots.dtype, np.int32)
+        self.assertEqual(len(linked_list.value_slots), 100)
+        self.assertEqual(list(linked_list.values()), [1, 2])
+
+        linked_list = NumericLinkedList()
+        self.assertIsNone(linked_list.head)
+        self.assertFalse(bool(linked_list))
+        self.assertEqual(linked_list.to_numpy().tolist(), [])
+
+    def test_extend(self) -> None:
+        linked_list = NumericLinkedList.from_iterable(iter(self.node_values))
+        linked_list.extend(range(3))
+        linked_list.append(9)
+        self.assertLinks(linked_list, self.node_values + [0.0, 1.0, 2.0, 9.0])
+        self.assertTrue(linked_list._contiguous)
+        self.assertEqual(linked_list.tail.value, 9.0)
+
+        linked_list.insert_after(7, None)
+        linked_list.extend([8])
+        self.assertFalse(linked_list._contiguous)
+        self.assertLinks(linked_list, [7.0] + self.node_values + [0, 1, 2, 9, 8])
+
+    def test_pop(self) -> None:
+        linked_list = NumericLinkedList(*self.node_values)
+
+        node = linked_list.pop()
+        self.assertIsInstance(node, SinglyNode)
+        self.assertIsInstance(node.value, float)
+        self.assertEqual(node.value, 5.0)
+        self.assertTrue(linked_list._contiguous)
+        self.assertLinks(linked_list, self.node_values[:-1])
+
+        # the slots after the nodes are reused by the next appends
+        linked_list.extend([6, 7])
+        self.assertTrue(linked_list._contiguous)
+        self.assertEqual(linked_list._used, 6)
+        self.assertLinks(linked_list, self.node_values[:-1] + [6.0, 7.0])
+
+        linked_list.reverse()
+        self.assertEqual(linked_list.pop().value, 3.0)
+        while linked_list:
+            linked_list.pop()
+        self.assertTrue(linked_list._contiguous)
+        with self.assertRaises(LinkedListIndexError):
+            linked_list.pop()
+
+        # the links read back from the slots are Python integers
+        linked_list = NumericLinkedList(1.0, 2.0, 3.0)
+        linked_list.reverse()
+        linked_list.insert_after(4.0)
+        values = [linked_list.pop().value for _ in range(4)]
+        self.assertEqual(values, [1.0, 2.0, 3.0, 4.0])
+        self.assertFalse(linked_list)
+
+    def test_remove_after(self) -> None:
+        linked_list = NumericLinkedList(1.0, 2.0, 3.0)
+        linked_list.remove_after()
+        self.assertIsInstance(linked_list.head_index, int)
+        self.assertLinks(linked_list, [2.0, 3.0])
+        linked_list.remove_after(linked_list.head)
+        self.assertLinks(linked_list, [2.0])
+        linked_list.remove_after()
+        self.assertLinks(linked_list, [])
+        self.assertIsNone(linked_list.tail)
+
+    def test_link_order(self) -> None:
+        linked_list = NumericLinkedList(*self.node_values)
+
+        linked_list.remove_after(linked_list.head)
+        linked_list.insert_after(9, linked_list.tail)
+        linked_list.insert_after(2, linked_list.head)
+        self.assertFalse(linked_list._contiguous)
+        self.assertLinks(linked_list, [3.0, 2.0, 4.0, 1.0, 5.0, 9.0])
+        self.assertEqual(linked_list.positions(1).tolist(), [3])
+
+        # the order is cached until the links change
+        order = linked_list._link_order()
+        self.assertIs(linked_list._link_order(), order)
+        linked_list.replace(9, 8)
+        self.assertIs(linked_list._link_order(), order)
+        linked_list.reverse()
+        self.assertIsNot(linked_list._link_order(), order)
+        self.assertLinks(linked_list, [8.0, 5.0, 1.0, 4.0, 2.0, 3.0])
+
+        linked_list.compact()
+        self.assertTrue(linked_list._contiguous)
+        self.assertEqual(linked_list.head_index, 0)
+        self.assertEqual(linked_list.free_index, -1)
+        self.assertLinks(linked_list, [8.0, 5.0, 1.0, 4.0, 2.0, 3.0])
+        linked_list.append(0)
+        self.assertTrue(linked_list._contiguous)
+        self.assertLinks(linked_list, [8.0, 5.0, 1.0, 4.0, 2.0, 3.0, 0.0])
+
+        # an empty linked list is compacted too
+        linked_list = NumericLinkedList(1.0, 2.0)
+        linked_list.remove_values([2.0])
+        linked_list.pop()
+        linked_list.compact()
+        self.assertEqual(linked_list.head_index, -1)
+        self.assertEqual(linked_list.free_index, -1)
+        self.assertLinks(linked_list, [])
+        linked_list.append(3.0)
+        self.assertLinks(linked_list, [3.0])
+
+    def test_search(self) -> None:
+        for reverse in (False, True):
+            linked_list = NumericLinkedList(*self.node_values)
+            values = self.node_values[:]
+            if reverse:  # the links are no longer in slot order
+                linked_list.reverse()
+                values.reverse()
+
+            node = linked_list.search(1)
+            self.assertEqual(node.value, 1.0)
+            self.assertEqual(node.next.value, values[values.index(1.0) + 1])
+            self.assertIsNone(linked_list.search(2))
+
+            nodes = list(linked_list.search_iter(1))
+            self.assertEqual(len(nodes), 2)
+            self.assertEqual(nodes[0], node)
+            self.assertEqual([node.value for node in nodes], [1.0, 1.0])
+            self.assertEqual(list(linked_list.search_iter(2)), [])
+
+            self.assertEqual(
+                linked_list.positions(1).tolist(),
+                [i for i, value in enumerate(values) if value == 1],
+            )
+            self.assertTrue(linked_list.contains_value(5))
+            self.assertFalse(linked_list.contains_value(6))
+
+    def test_replace(self) -> None:
+        for reverse in (False, True):
+            linked_list = NumericLinkedList(*self.node_values)
+            if reverse:
+                linked_list.reverse()
+            values = list(linked_list.values())
+
+            linked_list.replace(1, 2, max_=values.index(1) + 1)
+            values[values.index(1)] = 2.0
+            self.assertLinks(linked_list, values)
+
+            linked_list.replace(1, 2, max_=0)
+            self.assertLinks(linked_list, values)
+
+            linked_list.replace(1, 2)
+            self.assertLinks(
+                linked_list, [2.0 if value == 1 else value for value in values]
+            )
+
+    def test_replace_many(self) -> None:
+        for reverse in (False, True):
+            linked_list = NumericLinkedList(*self.node_values)
+            if reverse:
+                linked_list.reverse()
+            values = list(linked_list.values())
+
+            # a value is replaced at most once, 1 is not replaced again by 4
+            linked_list.replace_many({1: 4, 4: 9, 2.5: 0})
+            values = [{1.0: 4.0, 4.0: 9.0}.get(value, value) for value in values]
+            self.assertLinks(linked_list, values)
+
+            linked_list.replace_many({9: 1}, max_=2)
+            values[:2] = [1.0 if value == 9 else value for value in values[:2]]
+            self.assertLinks(linked_list, values)
+
+            # keys which are not numbers are applied node by node
+            linked_list.replace_many({"a": 0, 3: 7})
+            self.assertLinks(
+                linked_list, [7.0 if value == 3 else value for value in values]
+            )
+
+    def test_remove_values(self) -> None:
+        linked_list = NumericLinkedList(*self.node_values)
+
+        # removing the last nodes keeps the nodes in the first slots
+        self.assertEqual(linked_list.remove_values([5]), 1)
+        self.assertTrue(linked_list._contiguous)
+        self.assertEqual(linked_list.remove_values([1, 7]), 2)
+        self.assertFalse(linked_list._contiguous)
+        self.assertLinks(linked_list, [3.0, 4.0])
+
+        # the slots removed are reused
+        linked_list.append(1)
+        linked_list.append(2)
+        self.assertEqual(linked_list._used, 5)
+        self.assertLinks(linked_list, [3.0, 4.0, 1.0, 2.0])
+
+        linked_list.reverse()
+        self.assertEqual(linked_list.remove_values(["a", 4]), 1)
+        self.assertLinks(linked_list, [2.0, 1.0, 3.0])
+        self.assertEqual(linked_list.remove_values([]), 0)
+        self.assertEqual(linked_list.remove_values([1, 2, 3]), 3)
+        self.assertTrue(linked_list._contiguous)
+        self.assertLinks(linked_list, [])
+
+    def test_remove_if(self) -> None:
+        linked_list = NumericLinkedList(*self.node_values)
+        values = []
+        self.assertEqual(
+            linked_list.remove_if(lambda value: values.append(value) or value < 2), 2
+        )
+        self.assertLinks(linked_list, [3.0, 4.0, 5.0])
+        self.assertEqual(values, self.node_values)
+        self.assertIsInstance(values[0], float)
+
+        # nothing is removed if the predicate raises
+        with self.assertRaises(ZeroDivisionError):
+            linked_list.remove_if(lambda value: 1 / (value - 5))
+        self.assertLinks(linked_list, [3.0, 4.0, 5.0])
+
+    def test_reductions(self) -> None:
+        linked_list = NumericLinkedList(*self.node_values)
+        linked_list.reverse()
+        self.assertEqual(linked_list.sum(), sum(self.node_values))
+        self.assertEqual(linked_list.min(), 1.0)
+        self.assertEqual(linked_list.max(), 5.0)
+        self.assertIsInstance(linked_list.sum(), float)
+
+        linked_list = NumericLinkedList()
+        self.assertEqual(linked_list.sum(), 0)
+        with self.assertRaises(ValueError):
+            linked_list.min()
+        with self.assertRaises(ValueError):
+            linked_list.max()
+
+    def test_pickle(self) -> None:
+        linked_list = NumericLinkedList(*self.node_values)
+        linked_list.reverse()
+        other = pickle.loads(pickle.dumps(linked_list))
+        self.assertIsInstance(other, NumericLinkedList)
+        self.assertLinks(other, self.node_values[::-1])
+        self.assertTrue(other._contiguous)
+
+        # the dtype is kept and the values are sent out-of-band
+        linked_list = NumericLinkedList.from_iterable(range(1000), dtype=np.int32)
+        buffers = []
+        data = linked_list.to_bytes(buffers.append)
+        self.assertEqual(len(buffers), 1)
+        self.assertEqual(buffers[0].raw().nbytes, 4000)
+        other = NumericLinkedList.from_bytes(data, buffers)
+        self.assertEqual(other.value_slots.dtype, np.int32)
+        self.assertLinks(other, list(range(1000)))
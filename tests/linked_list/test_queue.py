@@ -0,0 +1,155 @@
+import asyncio
+from unittest import TestCase
+
+from data_structures.exceptions import LinkedListIndexError
+from data_structures.linked_list.nodes import DoublyNode
+from data_structures.linked_list.queue import AsyncLinkedQueue
+
+
+class TestAsyncLinkedQueue(TestCase):
+    def test_async_linked_queue(self) -> None:
+        async def run() -> None:
+            queue = AsyncLinkedQueue()
+            self.assertTrue(queue.empty())
+            self.assertFalse(queue.full())
+            self.assertEqual(queue.maxsize, 0)
+
+            node = await queue.put("a")
+            self.assertIsInstance(node, DoublyNode)
+            self.assertEqual(node.value, "a")
+            queue.put_nowait("b")
+            self.assertEqual(queue.qsize(), 2)
+            self.assertEqual(len(queue), 2)
+
+            self.assertEqual(await queue.get(), "a")
+            self.assertEqual(queue.get_nowait(), "b")
+            with self.assertRaises(asyncio.QueueEmpty):
+                queue.get_nowait()
+
+        asyncio.run(run())
+
+    def test_get_waits(self) -> None:
+        async def run() -> None:
+            queue = AsyncLinkedQueue()
+            getters = [asyncio.ensure_future(queue.get()) for _ in range(3)]
+            await asyncio.sleep(0)
+            self.assertFalse(any(getter.done() for getter in getters))
+
+            # a cancelled getter is removed and the next one gets the value
+            getters[0].cancel()
+            await asyncio.sleep(0)
+            self.assertEqual(len(queue._getters), 2)
+            queue.put_nowait("a")
+            queue.put_nowait("b")
+            self.assertEqual(await getters[1], "a")
+            self.assertEqual(await getters[2], "b")
+            self.assertTrue(getters[0].cancelled())
+            self.assertTrue(queue.empty())
+
+            # a getter cancelled after being woken up passes the wakeup on
+            getters = [asyncio.ensure_future(queue.get()) for _ in range(2)]
+            await asyncio.sleep(0)
+            queue.put_nowait("c")
+            getters[0].cancel()
+            self.assertEqual(await getters[1], "c")
+
+        asyncio.run(run())
+
+    def test_maxsize(self) -> None:
+        async def run() -> None:
+            queue = AsyncLinkedQueue(maxsize=2)
+            await queue.put("a")
+            await queue.put("b")
+            self.assertTrue(queue.full())
+            with self.assertRaises(asyncio.QueueFull):
+                queue.put_nowait("c")
+
+            putter = asyncio.ensure_future(queue.put("c"))
+            await asyncio.sleep(0)
+            self.assertFalse(putter.done())
+            self.assertEqual(await queue.get(), "a")
+            node = await putter
+            self.assertEqual(node.value, "c")
+            self.assertEqual([await queue.get(), await queue.get()], ["b", "c"])
+
+        asyncio.run(run())
+
+    def test_remove(self) -> None:
+        async def run() -> None:
+            queue = AsyncLinkedQueue(maxsize=3)
+            nodes = [await queue.put(value) for value in "abc"]
+            putter = asyncio.ensure_future(queue.put("d"))
+            await asyncio.sleep(0)
+
+            # removing an item frees a place for the waiting putter
+            queue.remove(nodes[1])
+            self.assertEqual((await putter).value, "d")
+            with self.assertRaises(LinkedListIndexError):
+                queue.remove(nodes[1])
+
+            self.assertEqual(await queue.get(), "a")
+            with self.assertRaises(LinkedListIndexError):
+                queue.remove(nodes[0])
+            queue.remove(nodes[2])
+            self.assertEqual(queue.qsize(), 1)
+            self.assertEqual(await queue.get(), "d")
+            self.assertTrue(queue.empty())
+
+        asyncio.run(run())
+
+    def test_join(self) -> None:
+        async def run() -> None:
+            queue = AsyncLinkedQueue()
+            await queue.join()  # no task is unfinished
+            with self.assertRaises(ValueError):
+                queue.task_done()
+
+            nodes = [await queue.put(value) for value in "abc"]
+            joiners = [asyncio.ensure_future(queue.join()) for _ in range(2)]
+            self.assertEqual(await queue.get(), "a")
+            queue.task_done()
+            queue.remove(nodes[1])  # a removed item is never got, its task is done
+            await asyncio.sleep(0)
+            self.assertFalse(any(joiner.done() for joiner in joiners))
+
+            self.assertEqual(await queue.get(), "c")
+            await asyncio.sleep(0)
+            self.assertFalse(any(joiner.done() for joiner in joiners))
+            queue.task_done()
+            await asyncio.gather(*joiners)
+            with self.assertRaises(ValueError):
+                queue.task_done()
+
+            # the queue can be joined again once more items are put
+            await queue.put("d")
+            joiner = asyncio.ensure_future(queue.join())
+            await asyncio.sleep(0)
+            self.assertFalse(joiner.done())
+            queue.get_nowait()
+            queue.task_done()
+            await joiner
+
+        asyncio.run(run())
+
+    def test_producer_consumer(self) -> None:
+        async def run() -> list:
+            queue = AsyncLinkedQueue(maxsize=4)
+            values = []
+
+            async def produce() -> None:
+                for value in range(100):
+                    await queue.put(value)
+                    self.assertLessEqual(queue.qsize(), 4)
+                await queue.put(None)
+
+            async def consume() -> None:
+                while True:
+                    value = await queue.get()
+                    if value is None:
+                        return
+                    values.append(value)
+
+            await asyncio.gather(produce(), consume())
+            return values
+
+        self.assertEqual(asyncio.run(run()), list(range(100)))
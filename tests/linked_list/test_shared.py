@@ -0,0 +1,143 @@
+import multiprocessing
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from unittest import TestCase, skipIf
+
+from data_structures.exceptions import LinkedListFullError
+from data_structures.linked_list.nodes import ArrayNode
+
+try:
+    from data_structures.linked_list.shared import SharedArrayLinkedList
+except ImportError:  # multiprocessing.shared_memory is new in Python 3.8
+    SharedArrayLinkedList = None
+
+
+def search(linked_list, value: float) -> tuple:
+    """
+    Search the linked list in a worker process
+    """
+    node = linked_list.search(value)
+    return list(linked_list.values()), None if node is None else node.index
+
+
+def write(linked_list, value: int) -> None:
+    """
+    Append to the linked list in a worker process
+    """
+    linked_list.append(value)
+
+
+@skipIf(SharedArrayLinkedList is None, "multiprocessing.shared_memory is unavailable")
+class TestSharedArrayLinkedList(TestCase):
+    def setUp(self) -> None:
+        self.node_values = [3.0, 1.0, 4.0]
+
+    def test_shared_array_linked_list(self) -> None:
+        with SharedArrayLinkedList(*self.node_values, capacity=4) as linked_list:
+            self.assertEqual(list(linked_list.values()), self.node_values)
+            self.assertEqual(len(linked_list), 3)
+            self.assertEqual(linked_list.capacity, 4)
+            self.assertEqual(linked_list.typecode, "d")
+            self.assertIsInstance(linked_list.head, ArrayNode)
+
+            linked_list.append(1)
+            with self.assertRaises(LinkedListFullError):
+                linked_list.append(5)
+            self.assertEqual(linked_list.pop().value, 1.0)
+
+            # a value not fitting the typecode leaves the slots unchanged
+            with self.assertRaises(TypeError):
+                linked_list.append("a")
+            linked_list.insert_after(9, linked_list.head)
+            self.assertEqual(list(linked_list.values()), [3.0, 9.0, 1.0, 4.0])
+
+            linked_list.remove_after(linked_list.head)
+            linked_list.reverse()
+            linked_list.replace(1, 2)
+            self.assertEqual(linked_list.remove_values([4]), 1)
+            self.assertEqual(list(linked_list.values()), [2.0, 3.0])
+            self.assertEqual(linked_list.tail.value, 3.0)
+
+        with self.assertRaises(ValueError):
+            SharedArrayLinkedList(typecode="u")
+        with self.assertRaises(ValueError):
+            SharedArrayLinkedList(capacity=0)
+
+    def test_failed_init(self) -> None:
+        # the block of a linked list failing to be created is removed
+        with SharedArrayLinkedList(capacity=1) as linked_list:
+            name = linked_list.name
+        with self.assertRaises(LinkedListFullError):
+            SharedArrayLinkedList(1, 2, capacity=1, name=name)
+        with self.assertRaises(FileNotFoundError):
+            SharedArrayLinkedList.attach(name)
+        with SharedArrayLinkedList(1, capacity=1, name=name) as linked_list:
+            self.assertEqual(list(linked_list.values()), [1.0])
+
+    def test_attach(self) -> None:
+        with SharedArrayLinkedList(1, 2, 3, typecode="q", capacity=8) as linked_list:
+            other = SharedArrayLinkedList.attach(linked_list.name)
+            self.assertEqual(other.typecode, "q")
+            self.assertEqual(other.capacity, 8)
+            self.assertEqual(list(other.values()), [1, 2, 3])
+
+            # the slots are shared both ways
+            linked_list.append(4)
+            other.remove_after()
+            self.assertEqual(list(other.values()), [2, 3, 4])
+            self.assertEqual(list(linked_list.values()), [2, 3, 4])
+            self.assertEqual(len(linked_list), 3)
+            other.close()
+
+            # only the name is pickled
+            other = pickle.loads(pickle.dumps(linked_list))
+            self.assertEqual(other.name, linked_list.name)
+            self.assertEqual(other.search(3).index, linked_list.search(3).index)
+            other.close()
+
+        with self.assertRaises(FileNotFoundError):
+            SharedArrayLinkedList.attach(linked_list.name)
+
+    def test_processes(self) -> None:
+        with SharedArrayLinkedList(*range(100), capacity=200) as linked_list:
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                results = list(
+                    executor.map(search, [linked_list] * 3, [50, 150, 99])
+                )
+                self.assertEqual(
+                    results,
+                    [
+                        (list(range(100)), linked_list.search(50).index),
+                        (list(range(100)), None),
+                        (list(range(100)), linked_list.tail.index),
+                    ],
+                )
+
+    def test_lock(self) -> None:
+        lock = multiprocessing.Lock()
+        with SharedArrayLinkedList(typecode="q", capacity=64, lock=lock) as linked_list:
+            processes = [
+                multiprocessing.Process(target=write, args=(linked_list, value))
+                for value in range(8)
+            ]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
+
+            with linked_list.locked():
+                self.assertEqual(sorted(linked_list.values()), list(range(8)))
+            self.assertEqual(len(linked_list), 8)
+
+            # extend waits for the lock, which is not reentrant, and holds it once
+            with linked_list.locked():
+                thread = threading.Thread(target=linked_list.extend, args=([8, 9],))
+                thread.start()
+                thread.join(0.1)
+                self.assertTrue(thread.is_alive())
+                self.assertEqual(len(linked_list), 8)
+            thread.join()
+            self.assertEqual(len(linked_list), 10)
+            self.assertTrue(lock.acquire(block=False))
+            lock.release()
@@ -1,9 +1,19 @@
+import copy
+import functools
+import pickle
+import sys
 from collections.abc import Iterator
 from typing import Optional
 from unittest import TestCase
 
-from data_structures.exceptions import LinkedListIndexError
-from data_structures.linked_list.nodes import SinglyNode
+from data_structures.exceptions import (
+    LinkedListIndexError,
+    LinkedListReadOnlyError,
+    LinkedListSizeError,
+    NodeFrozenError,
+)
+from data_structures.linked_list.doubly import DoublyLinkedList
+from data_structures.linked_list.nodes import SecureSinglyNode, SinglyNode
 from data_structures.linked_list.singly import (
     CircularSinglyLinkedList,
     SinglyLinkedList,
@@ -34,6 +44,19 @@ class TestSinglyLinkedList(TestCase):
         with self.assertRaises(AttributeError):
             _ = singly_linked_list.head.next
 
+    def test_node_class(self) -> None:
+        class MySinglyNode(SinglyNode):
+            __slots__ = ()
+
+        class MySinglyLinkedList(SinglyLinkedList):
+            node_class = MySinglyNode
+
+        singly_linked_list = MySinglyLinkedList(*self.node_values)
+        singly_linked_list.append("d")
+        singly_linked_list.insert_after("e")
+        for node in singly_linked_list:
+            self.assertIsInstance(node, MySinglyNode)
+
     def test_bool(self) -> None:
         singly_linked_list = SinglyLinkedList(*self.node_values)
         self.assertTrue(bool(singly_linked_list))
@@ -58,6 +81,13 @@ class TestSinglyLinkedList(TestCase):
         for i, node in enumerate(singly_linked_list):
             self.assertIs(self.node_values[i], node.value)
 
+    def test_values(self) -> None:
+        singly_linked_list = SinglyLinkedList(*self.node_values)
+        self.assertIsInstance(singly_linked_list.values(), Iterator)
+        self.assertEqual(list(singly_linked_list.values()), self.node_values)
+
+        self.assertEqual(list(SinglyLinkedList().values()), [])
+
     def test_len(self) -> None:
         singly_linked_list = SinglyLinkedList(*self.node_values)
         self.assertEqual(len(singly_linked_list), len(self.node_values))
@@ -65,6 +95,31 @@ class TestSinglyLinkedList(TestCase):
         singly_linked_list = SinglyLinkedList()
         self.assertEqual(len(singly_linked_list), 0)
 
+    def test_len_tracking(self) -> None:
+        singly_linked_list = SinglyLinkedList(*self.node_values)
+        singly_linked_list.debug = True
+
+        singly_linked_list.append("d")
+        singly_linked_list.insert_after("e")
+        singly_linked_list.insert_after("f", singly_linked_list.head)
+        self.assertEqual(len(singly_linked_list), 6)
+
+        singly_linked_list.remove_after()
+        singly_linked_list.remove_after(singly_linked_list.head)
+        singly_linked_list.remove_after(singly_linked_list.tail)
+        self.assertEqual(len(singly_linked_list), 4)
+
+        singly_linked_list.reverse()
+        singly_linked_list.pop()
+        self.assertEqual(len(singly_linked_list), 3)
+
+        singly_linked_list.head.next = None
+        with self.assertRaises(LinkedListSizeError):
+            _ = len(singly_linked_list)
+
+        singly_linked_list.debug = False
+        self.assertEqual(len(singly_linked_list), 3)
+
     def test_reserved(self) -> None:
         singly_linked_list = SinglyLinkedList(*self.node_values)
         reversed_singly_linked_list = reversed(singly_linked_list)
@@ -73,12 +128,65 @@ class TestSinglyLinkedList(TestCase):
         for node, i in zip(reversed_singly_linked_list, reversed(self.node_values)):
             self.assertIs(node.value, i)
 
+        self.assertEqual(
+            [node.value for node in reversed(singly_linked_list)],
+            self.node_values[::-1],
+        )
+        self.assertEqual(list(reversed(SinglyLinkedList())), [])
+
+    def test_reversed_iter(self) -> None:
+        values = list(range(50))
+        singly_linked_list = SinglyLinkedList(*values)
+        nodes = list(singly_linked_list)
+
+        for levels in range(1, 5):
+            self.assertEqual(
+                list(singly_linked_list.reversed_iter(levels)), nodes[::-1]
+            )
+
     def test_append(self) -> None:
         singly_linked_list = SinglyLinkedList(*self.node_values)
         self.assertIsNone(singly_linked_list.append("d"))
         self.assertEqual(len(singly_linked_list), len(self.node_values) + 1)
         self.assertIs(singly_linked_list.tail.value, "d")
 
+    def test_extend(self) -> None:
+        singly_linked_list = SinglyLinkedList(*self.node_values)
+        singly_linked_list.debug = True
+
+        self.assertIsNone(singly_linked_list.extend(value for value in "de"))
+        self.assertEqual(
+            [node.value for node in singly_linked_list], self.node_values + ["d", "e"]
+        )
+        self.assertEqual(singly_linked_list.tail.value, "e")
+        self.assertEqual(len(singly_linked_list), len(self.node_values) + 2)
+
+        singly_linked_list.extend([])
+        self.assertEqual(len(singly_linked_list), len(self.node_values) + 2)
+
+        def values():
+            yield "a"
+            raise ValueError
+
+        singly_linked_list = SinglyLinkedList()
+        singly_linked_list.debug = True
+        with self.assertRaises(ValueError):
+            singly_linked_list.extend(values())
+        self.assertIs(singly_linked_list.tail.value, "a")
+        self.assertEqual(len(singly_linked_list), 1)
+
+    def test_from_iterable(self) -> None:
+        singly_linked_list = SinglyLinkedList.from_iterable(iter(self.node_values))
+        self.assertIsInstance(singly_linked_list, SinglyLinkedList)
+        self.assertEqual(
+            [node.value for node in singly_linked_list], self.node_values
+        )
+        self.assertEqual(len(singly_linked_list), len(self.node_values))
+
+        singly_linked_list = SinglyLinkedList.from_iterable([])
+        self.assertIsNone(singly_linked_list.head)
+        self.assertIsNone(singly_linked_list.tail)
+
     def test_insert_after(self) -> None:
         singly_linked_list = SinglyLinkedList(*self.node_values)
 
@@ -135,6 +243,110 @@ class TestSinglyLinkedList(TestCase):
         self.assertEqual(len(singly_linked_list), len(self.node_values) - 1)
         self.assertTrue(singly_linked_list.is_head(node_2nd))
 
+    def test_remove_after_debug(self) -> None:
+        singly_linked_list = SinglyLinkedList(*self.node_values)
+        singly_linked_list.debug = True
+
+        # in debug mode the given node is checked to be in the singly linked list
+        node = SinglyNode("a", singly_linked_list.head.next)
+        with self.assertRaises(LinkedListIndexError):
+            singly_linked_list.remove_after(node)
+        self.assertEqual(list(singly_linked_list.values()), self.node_values)
+
+        singly_linked_list.remove_after(singly_linked_list.head)
+        self.assertEqual(list(singly_linked_list.values()), ["a", "c"])
+        self.assertEqual(len(singly_linked_list), 2)
+
+    def test_pickle(self) -> None:
+        # longer than the recursion limit, the nodes are not pickled recursively
+        size = 2 * sys.getrecursionlimit() + 1
+        linked_list = SinglyLinkedList.from_iterable(range(size))
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            other = pickle.loads(pickle.dumps(linked_list, protocol=protocol))
+            self.assertIsInstance(other, SinglyLinkedList)
+            self.assertEqual(list(other.values()), list(range(size)))
+            self.assertEqual(len(other), size)
+            self.assertEqual(other.tail.value, size - 1)
+
+        linked_list = SinglyLinkedList(*self.node_values, indexed=True)
+        other = copy.copy(linked_list)
+        self.assertTrue(other.indexed)
+        self.assertEqual(other.search("b").value, "b")
+        self.assertIsNot(other.head, linked_list.head)
+        self.assertEqual(list(copy.deepcopy(linked_list).values()), self.node_values)
+
+    def test_to_bytes(self) -> None:
+        for values in ([1, -2, 3], [1.5, 2.0], [1, 2.0], [True, 1], [2 ** 64, 1]):
+            linked_list = SinglyLinkedList(*values)
+            other = SinglyLinkedList.from_bytes(linked_list.to_bytes())
+            self.assertEqual(list(other.values()), values)
+            self.assertEqual(
+                [type(value) for value in other.values()],
+                [type(value) for value in values],
+            )
+
+        # the numeric values are sent out-of-band, not copied into the bytes
+        values = list(range(1000))
+        buffers = []
+        data = SinglyLinkedList.from_iterable(values).to_bytes(buffers.append)
+        self.assertEqual(len(buffers), 1)
+        self.assertEqual(buffers[0].raw().nbytes, 8000)
+        self.assertLess(len(data), 1000)
+        other = SinglyLinkedList.from_bytes(data, buffers=buffers)
+        self.assertEqual(list(other.values()), values)
+        other = SinglyLinkedList.from_bytes(
+            data, buffers=[bytes(buffer.raw()) for buffer in buffers]
+        )
+        self.assertEqual(list(other.values()), values)
+
+        buffers = []
+        data = SinglyLinkedList(*self.node_values).to_bytes(buffers.append)
+        self.assertEqual(buffers, [])
+        self.assertEqual(
+            list(SinglyLinkedList.from_bytes(data).values()), self.node_values
+        )
+        with self.assertRaises(TypeError):
+            DoublyLinkedList.from_bytes(data)
+
+    def test_remove_if(self) -> None:
+        singly_linked_list = SinglyLinkedList(*"abcabc")
+        self.assertEqual(singly_linked_list.remove_if(lambda value: value != "b"), 4)
+        self.assertEqual(list(singly_linked_list.values()), ["b", "b"])
+        self.assertEqual(len(singly_linked_list), 2)
+        self.assertIs(singly_linked_list.tail, singly_linked_list.head.next)
+
+        self.assertEqual(singly_linked_list.remove_if(lambda value: False), 0)
+        self.assertEqual(singly_linked_list.remove_if(lambda value: True), 2)
+        self.assertIsNone(singly_linked_list.head)
+        self.assertIsNone(singly_linked_list.tail)
+        self.assertEqual(singly_linked_list.remove_if(lambda value: True), 0)
+
+        # the nodes removed before the predicate raises stay removed
+        singly_linked_list = SinglyLinkedList("a", 1, "b", 2)
+        with self.assertRaises(TypeError):
+            singly_linked_list.remove_if(lambda value: value > 1)
+        self.assertEqual(list(singly_linked_list.values()), ["a", 1, "b", 2])
+        singly_linked_list = SinglyLinkedList(2, 1, "b")
+        with self.assertRaises(TypeError):
+            singly_linked_list.remove_if(lambda value: value > 1)
+        self.assertEqual(list(singly_linked_list.values()), [1, "b"])
+        self.assertEqual(len(singly_linked_list), 2)
+        self.assertEqual(singly_linked_list.tail.value, "b")
+
+    def test_remove_values(self) -> None:
+        singly_linked_list = SinglyLinkedList("a", "b", ["c"], "a", "d")
+        self.assertEqual(singly_linked_list.remove_values(iter("az")), 2)
+        self.assertEqual(list(singly_linked_list.values()), ["b", ["c"], "d"])
+        self.assertEqual(singly_linked_list.remove_values(["d"]), 1)
+        self.assertEqual(singly_linked_list.tail.value, ["c"])
+        self.assertEqual(singly_linked_list.remove_values([]), 0)
+
+        singly_linked_list = SinglyLinkedList(*"abcabc", indexed=True)
+        self.assertEqual(singly_linked_list.remove_values({"a", "c"}), 4)
+        self.assertEqual(list(singly_linked_list.values()), ["b", "b"])
+        self.assertFalse(singly_linked_list.contains_value("a"))
+        self.assertEqual(len(list(singly_linked_list.search_iter("b"))), 2)
+
     def test_replace(self) -> None:
         singly_linked_list = SinglyLinkedList(*self.node_values)
 
@@ -157,6 +369,40 @@ class TestSinglyLinkedList(TestCase):
         self.assertIsNone(singly_linked_list.head)
         self.assertFalse(bool(singly_linked_list))
 
+    def test_replace_many(self) -> None:
+        linked_list = SinglyLinkedList("a", "b", "c", "a", ["x"])
+
+        # a value is replaced at most once, "a" is not replaced again by "b"
+        linked_list.replace_many({"a": "b", "b": "c", "z": "y"})
+        self.assertEqual(list(linked_list.values()), ["b", "c", "c", "b", ["x"]])
+
+        linked_list.replace_many({"b": "a"}, max_=3)
+        self.assertEqual(list(linked_list.values()), ["a", "c", "c", "b", ["x"]])
+
+        linked_list.replace_many({"c": "d"}, max_=0)
+        self.assertEqual(list(linked_list.values()), ["a", "c", "c", "b", ["x"]])
+
+        linked_list = SinglyLinkedList("a", "b", "c", "a", indexed=True)
+        linked_list.replace_many({"a": "b", "b": "c"})
+        self.assertEqual(list(linked_list.values()), ["b", "c", "c", "b"])
+        self.assertFalse(linked_list.contains_value("a"))
+        self.assertEqual(len(list(linked_list.search_iter("c"))), 2)
+
+        linked_list.replace_many({"c": "a"}, max_=2)
+        self.assertEqual(list(linked_list.values()), ["b", "a", "c", "b"])
+        self.assertIs(linked_list.search("a"), linked_list.head.next)
+
+    def test_replace_if(self) -> None:
+        linked_list = SinglyLinkedList(1, 2, 3, 4)
+        linked_list.replace_if(lambda value: value % 2 == 0, lambda value: value * 10)
+        self.assertEqual(list(linked_list.values()), [1, 20, 3, 40])
+
+        linked_list = SinglyLinkedList(1, 2, 3, 4, indexed=True)
+        linked_list.replace_if(lambda value: value > 2, str)
+        self.assertEqual(list(linked_list.values()), [1, 2, "3", "4"])
+        self.assertTrue(linked_list.contains_value("3"))
+        self.assertFalse(linked_list.contains_value(3))
+
     def test_reverse(self) -> None:
         singly_linked_list = SinglyLinkedList(*self.node_values)
         self.assertIsNone(singly_linked_list.reverse())
@@ -192,6 +438,194 @@ class TestSinglyLinkedList(TestCase):
         with self.assertRaises(StopIteration):
             _ = next(search_iter)
 
+    def test_indexed(self) -> None:
+        singly_linked_list = SinglyLinkedList(*self.node_values, indexed=True)
+        self.assertTrue(singly_linked_list.indexed)
+        self.assertFalse(SinglyLinkedList().indexed)
+
+        node_b = singly_linked_list.head.next
+        self.assertIs(singly_linked_list.search("b"), node_b)
+        self.assertIn(node_b, singly_linked_list)
+        self.assertNotIn(SinglyNode("b"), singly_linked_list)
+        self.assertNotIn("b", singly_linked_list)
+        self.assertTrue(singly_linked_list.contains_value("b"))
+        self.assertFalse(singly_linked_list.contains_value("d"))
+        self.assertFalse(singly_linked_list.contains_value(["b"]))
+        self.assertEqual(list(singly_linked_list.search_iter(["b"])), [])
+
+        singly_linked_list.append("b")
+        singly_linked_list.insert_after("b")
+        self.assertEqual(len(list(singly_linked_list.search_iter("b"))), 3)
+
+        singly_linked_list.remove_after()
+        singly_linked_list.pop()
+        self.assertEqual(list(singly_linked_list.search_iter("b")), [node_b])
+
+        singly_linked_list.remove_after(singly_linked_list.head)
+        self.assertIsNone(singly_linked_list.search("b"))
+        self.assertNotIn(node_b, singly_linked_list)
+
+        singly_linked_list.extend(value for value in "bcb")
+        singly_linked_list.replace("b", "d")
+        self.assertFalse(singly_linked_list.contains_value("b"))
+        self.assertEqual(len(list(singly_linked_list.search_iter("d"))), 2)
+
+        singly_linked_list.replace("c", "e", 3)
+        self.assertEqual(list(singly_linked_list.values()), ["a", "e", "d", "c", "d"])
+        self.assertEqual(len(list(singly_linked_list.search_iter("c"))), 1)
+
+        with self.assertRaises(TypeError):
+            singly_linked_list.append(["unhashable"])
+        self.assertEqual(len(singly_linked_list), 5)
+
+        singly_linked_list = SinglyLinkedList.from_iterable("abc", indexed=True)
+        self.assertIs(singly_linked_list.search("c"), singly_linked_list.tail)
+
+    def test_concat(self) -> None:
+        linked_list = SinglyLinkedList(*self.node_values)
+        linked_list.debug = True
+        other = SinglyLinkedList("d", "e")
+        other_head, other_tail = other.head, other.tail
+
+        linked_list.concat(other)
+        self.assertEqual(list(linked_list.values()), self.node_values + ["d", "e"])
+        self.assertIs(linked_list.head.next.next.next, other_head)
+        self.assertIs(linked_list.tail, other_tail)
+        self.assertEqual(len(linked_list), 5)
+        self.assertIsNone(other.head)
+        self.assertIsNone(other.tail)
+        self.assertEqual(len(other), 0)
+
+        linked_list.concat(SinglyLinkedList())
+        self.assertEqual(len(linked_list), 5)
+
+        empty = SinglyLinkedList()
+        empty.concat(linked_list)
+        self.assertEqual(list(empty.values()), self.node_values + ["d", "e"])
+        self.assertIs(empty.tail, other_tail)
+
+        with self.assertRaises(ValueError):
+            empty.concat(empty)
+        with self.assertRaises(TypeError):
+            empty.concat(CircularSinglyLinkedList("a"))
+
+        # the nodes taken are indexed, or none of them if a value is unhashable
+        linked_list = SinglyLinkedList("a", indexed=True)
+        linked_list.concat(SinglyLinkedList("b", indexed=True))
+        self.assertIs(linked_list.search("b"), linked_list.tail)
+        with self.assertRaises(TypeError):
+            linked_list.concat(SinglyLinkedList("c", []))
+        self.assertFalse(linked_list.contains_value("c"))
+        self.assertEqual(len(linked_list), 2)
+
+    def test_split_after(self) -> None:
+        linked_list = SinglyLinkedList(*self.node_values, "d")
+        linked_list.debug = True
+        node_b = linked_list.head.next
+
+        other = linked_list.split_after(node_b)
+        self.assertIsInstance(other, SinglyLinkedList)
+        self.assertEqual(list(linked_list.values()), ["a", "b"])
+        self.assertEqual(list(other.values()), ["c", "d"])
+        self.assertIs(linked_list.tail, node_b)
+        self.assertIsNone(node_b.next)
+        self.assertEqual(len(linked_list), 2)
+        self.assertEqual(len(other), 2)
+
+        self.assertEqual(len(linked_list.split_after(node_b)), 0)
+        self.assertEqual(len(linked_list), 2)
+
+        other = linked_list.split_after()
+        self.assertEqual(list(other.values()), ["a", "b"])
+        self.assertIsNone(linked_list.head)
+        self.assertIsNone(linked_list.tail)
+        self.assertEqual(len(linked_list), 0)
+
+        linked_list = SinglyLinkedList(*self.node_values, indexed=True)
+        other = linked_list.split_after(linked_list.head)
+        self.assertTrue(other.indexed)
+        self.assertFalse(linked_list.contains_value("b"))
+        self.assertIs(other.search("b"), other.head)
+
+    def test_freeze(self) -> None:
+        linked_list = SinglyLinkedList(*self.node_values)
+        self.assertFalse(linked_list.frozen)
+        self.assertIsNone(linked_list.freeze())
+        self.assertTrue(linked_list.frozen)
+
+        other = SinglyLinkedList("d")
+        for method, args in (
+                (linked_list.append, ("d",)),
+                (linked_list.extend, (["d"],)),
+                (linked_list.insert_after, ("d",)),
+                (linked_list.pop, ()),
+                (linked_list.remove_after, ()),
+                (linked_list.remove_if, (bool,)),
+                (linked_list.remove_values, (["a"],)),
+                (linked_list.replace, ("a", "d")),
+                (linked_list.replace_many, ({"a": "d"},)),
+                (linked_list.replace_if, (bool, str.upper)),
+                (linked_list.reverse, ()),
+                (linked_list.split_after, ()),
+                (linked_list.concat, (other,)),
+                (other.concat, (linked_list,)),
+        ):
+            with self.assertRaises(LinkedListReadOnlyError):
+                method(*args)
+
+        # the reads are not changed, and a frozen linked list still reads as before
+        self.assertEqual(list(linked_list.values()), self.node_values)
+        self.assertEqual(len(linked_list), 3)
+        self.assertIs(linked_list.search("b"), linked_list.head.next)
+        self.assertIs(type(linked_list.head), SinglyNode)
+        self.assertEqual(list(other.values()), ["d"])
+
+        linked_list.unfreeze()
+        self.assertFalse(linked_list.frozen)
+        linked_list.append("d")
+        self.assertEqual(list(linked_list.values()), ["a", "b", "c", "d"])
+
+        # the secure nodes are still frozen and unfrozen one by one
+        class SecureSinglyLinkedList(SinglyLinkedList):
+            node_class = functools.partial(SecureSinglyNode, frozen=False)
+
+        linked_list = SecureSinglyLinkedList(*self.node_values)
+        linked_list.freeze()
+        linked_list.head.freeze()
+        with self.assertRaises(NodeFrozenError):
+            linked_list.head.value = "z"
+        linked_list.head.next.value = "z"
+        self.assertEqual(list(linked_list.values()), ["a", "z", "c"])
+        self.assertFalse(SinglyLinkedList().frozen)
+
+    def test_freeze_copy(self) -> None:
+        linked_list = SinglyLinkedList.from_iterable(self.node_values, frozen=True)
+        self.assertTrue(linked_list.frozen)
+        self.assertEqual(list(linked_list.values()), self.node_values)
+
+        # a frozen singly linked list stays frozen when pickled or copied
+        for copied in (
+                pickle.loads(pickle.dumps(linked_list)),
+                SinglyLinkedList.from_bytes(linked_list.to_bytes()),
+                copy.copy(linked_list),
+                copy.deepcopy(linked_list),
+        ):
+            self.assertIsNot(copied, linked_list)
+            self.assertTrue(copied.frozen)
+            self.assertEqual(list(copied.values()), self.node_values)
+            with self.assertRaises(LinkedListReadOnlyError):
+                copied.append("d")
+
+        linked_list = SinglyLinkedList(*self.node_values, indexed=True)
+        linked_list.freeze()
+        copied = copy.copy(linked_list)
+        self.assertTrue(copied.frozen)
+        self.assertTrue(copied.indexed)
+        self.assertIs(copied.search("b"), copied.head.next)
+
+        linked_list.unfreeze()
+        self.assertFalse(copy.copy(linked_list).frozen)
+
     def test_tail(self) -> None:
         singly_linked_list = SinglyLinkedList(*self.node_values)
         self.assertIs(singly_linked_list.tail.value, self.node_values[-1])
@@ -199,6 +633,40 @@ class TestSinglyLinkedList(TestCase):
         singly_linked_list = SinglyLinkedList()
         self.assertIsNone(singly_linked_list.tail)
 
+    def test_tail_tracking(self) -> None:
+        singly_linked_list = SinglyLinkedList()
+        singly_linked_list.append("a")
+        self.assertIs(singly_linked_list.tail, singly_linked_list.head)
+
+        singly_linked_list.insert_after("b", singly_linked_list.tail)
+        self.assertIs(singly_linked_list.tail.value, "b")
+
+        singly_linked_list.insert_after("z")
+        self.assertIs(singly_linked_list.tail.value, "b")
+
+        singly_linked_list.remove_after(singly_linked_list.head.next)
+        self.assertIs(singly_linked_list.tail.value, "a")
+        self.assertIsNone(singly_linked_list.tail.next)
+
+        head = singly_linked_list.head
+        singly_linked_list.reverse()
+        self.assertIs(singly_linked_list.tail, head)
+
+        singly_linked_list.pop()
+        self.assertIs(singly_linked_list.tail, singly_linked_list.head)
+
+        singly_linked_list.remove_after()
+        self.assertIsNone(singly_linked_list.head)
+        self.assertIsNone(singly_linked_list.tail)
+
+        singly_linked_list.insert_after("c")
+        self.assertIs(singly_linked_list.tail.value, "c")
+
+        self.assertIs(singly_linked_list.pop().value, "c")
+        self.assertIsNone(singly_linked_list.tail)
+        with self.assertRaises(LinkedListIndexError):
+            singly_linked_list.pop()
+
 
 class TestCircularSinglyLinkedList(TestCase):
     def setUp(self) -> None:
@@ -260,6 +728,12 @@ class TestCircularSinglyLinkedList(TestCase):
         with self.assertRaises(StopIteration):
             next(iter_linked_list)
 
+    def test_values(self) -> None:
+        linked_list = CircularSinglyLinkedList(*self.node_values)
+        self.assertEqual(list(linked_list.values()), self.node_values)
+
+        self.assertEqual(list(CircularSinglyLinkedList().values()), [])
+
     def test_len(self) -> None:
         linked_list = CircularSinglyLinkedList(*self.node_values)
         self.assertEqual(len(linked_list), len(self.node_values))
@@ -267,6 +741,13 @@ class TestCircularSinglyLinkedList(TestCase):
         linked_list = CircularSinglyLinkedList()
         self.assertEqual(len(linked_list), 0)
 
+        linked_list = CircularSinglyLinkedList(*self.node_values)
+        linked_list.debug = True
+        linked_list.append("d")
+        linked_list.reverse()
+        linked_list.pop()
+        self.assertEqual(len(linked_list), len(self.node_values))
+
     def test_reserved(self) -> None:
         linked_list = CircularSinglyLinkedList(*self.node_values)
         iter_reversed_linked_list = reversed(linked_list)
@@ -275,6 +756,11 @@ class TestCircularSinglyLinkedList(TestCase):
         for node, i in zip(iter_reversed_linked_list, reversed(self.node_values)):
             self.assertIs(node.value, i)
 
+        nodes = list(linked_list)
+        self.assertEqual(list(reversed(linked_list)), nodes[::-1])
+        self.assertEqual(list(linked_list.reversed_iter(3)), nodes[::-1])
+        self.assertEqual(list(reversed(CircularSinglyLinkedList())), [])
+
     def test_append(self) -> None:
         linked_list = CircularSinglyLinkedList(*self.node_values)
         head = linked_list.head
@@ -296,6 +782,20 @@ class TestCircularSinglyLinkedList(TestCase):
         self.assertIs(tail.value, "d")
         self.assertIs(tail.next, head)
 
+    def test_extend(self) -> None:
+        linked_list = CircularSinglyLinkedList.from_iterable(iter("ab"))
+        linked_list.debug = True
+
+        linked_list.extend(value for value in "cd")
+        self.assertEqual([node.value for node in linked_list], ["a", "b", "c", "d"])
+        self.assertEqual(linked_list.tail.value, "d")
+        self.assertIs(linked_list.tail.next, linked_list.head)
+        self.assertEqual(len(linked_list), 4)
+
+        linked_list = CircularSinglyLinkedList()
+        linked_list.extend([])
+        self.assertIsNone(linked_list.head)
+
     def test_pop(self) -> None:
         linked_list = CircularSinglyLinkedList(*self.node_values)
 
@@ -366,3 +866,133 @@ class TestCircularSinglyLinkedList(TestCase):
 
         linked_list = SinglyLinkedList()
         self.assertIsNone(linked_list.tail)
+
+    def test_indexed(self) -> None:
+        linked_list = CircularSinglyLinkedList(*self.node_values, indexed=True)
+
+        self.assertIs(linked_list.search("c"), linked_list.tail)
+        self.assertTrue(linked_list.contains_value("a"))
+
+        linked_list.extend("dd")
+        self.assertEqual(len(list(linked_list.search_iter("d"))), 2)
+
+        linked_list.pop()
+        self.assertEqual(list(linked_list.search_iter("d")), [linked_list.tail])
+
+    def test_tail_tracking(self) -> None:
+        linked_list = CircularSinglyLinkedList(*self.node_values)
+        head = linked_list.head
+
+        linked_list.reverse()
+        self.assertIs(linked_list.tail, head)
+        self.assertIs(linked_list.tail.next, linked_list.head)
+
+        linked_list.pop()
+        self.assertIs(linked_list.tail.value, "b")
+        self.assertIs(linked_list.tail.next, linked_list.head)
+
+        linked_list.pop()
+        linked_list.pop()
+        self.assertIsNone(linked_list.tail)
+
+        linked_list.reverse()
+        self.assertIsNone(linked_list.head)
+
+    def test_concat(self) -> None:
+        linked_list = CircularSinglyLinkedList(*self.node_values)
+        linked_list.debug = True
+        other = CircularSinglyLinkedList("d", "e")
+        other_tail = other.tail
+
+        linked_list.concat(other)
+        self.assertEqual(list(linked_list.values()), self.node_values + ["d", "e"])
+        self.assertIs(linked_list.tail, other_tail)
+        self.assertIs(linked_list.tail.next, linked_list.head)
+        self.assertEqual(len(linked_list), 5)
+        self.assertIsNone(other.head)
+        self.assertEqual(len(other), 0)
+
+        empty = CircularSinglyLinkedList()
+        empty.concat(linked_list)
+        self.assertEqual(list(empty.values()), self.node_values + ["d", "e"])
+        self.assertIs(empty.tail.next, empty.head)
+
+        with self.assertRaises(TypeError):
+            empty.concat(SinglyLinkedList("a"))
+
+    def test_split_after(self) -> None:
+        linked_list = CircularSinglyLinkedList(*self.node_values, "d")
+        linked_list.debug = True
+        node_b = linked_list.head.next
+
+        other = linked_list.split_after(node_b)
+        self.assertIsInstance(other, CircularSinglyLinkedList)
+        self.assertEqual(list(linked_list.values()), ["a", "b"])
+        self.assertEqual(list(other.values()), ["c", "d"])
+        self.assertIs(linked_list.tail, node_b)
+        self.assertIs(node_b.next, linked_list.head)
+        self.assertIs(other.tail.next, other.head)
+        self.assertEqual(len(linked_list), 2)
+        self.assertEqual(len(other), 2)
+
+        self.assertEqual(len(linked_list.split_after(node_b)), 0)
+        self.assertIs(node_b.next, linked_list.head)
+
+        other = linked_list.split_after()
+        self.assertEqual(list(other.values()), ["a", "b"])
+        self.assertIs(other.tail.next, other.head)
+        self.assertIsNone(linked_list.head)
+        self.assertIsNone(linked_list.tail)
+        self.assertEqual(len(linked_list.split_after()), 0)
+
+    def test_remove_if(self) -> None:
+        circular_linked_list = CircularSinglyLinkedList(*"abcab", indexed=True)
+
+        self.assertEqual(circular_linked_list.remove_if(lambda value: value == "a"), 2)
+        self.assertEqual(list(circular_linked_list.values()), ["b", "c", "b"])
+        self.assertEqual(circular_linked_list.head.value, "b")
+        self.assertIs(circular_linked_list.tail.next, circular_linked_list.head)
+        self.assertFalse(circular_linked_list.contains_value("a"))
+
+        self.assertEqual(circular_linked_list.remove_values(["b"]), 2)
+        self.assertIs(circular_linked_list.head, circular_linked_list.tail)
+        self.assertIs(circular_linked_list.head.next, circular_linked_list.head)
+
+        self.assertEqual(circular_linked_list.remove_if(lambda value: True), 1)
+        self.assertIsNone(circular_linked_list.head)
+        self.assertIsNone(circular_linked_list.tail)
+        self.assertEqual(len(circular_linked_list), 0)
+        self.assertEqual(circular_linked_list.remove_if(lambda value: True), 0)
+
+        circular_linked_list = CircularSinglyLinkedList(2, 3, "a", 4)
+        with self.assertRaises(TypeError):
+            circular_linked_list.remove_if(lambda value: value > 1)
+        self.assertEqual(list(circular_linked_list.values()), ["a", 4])
+        self.assertIs(circular_linked_list.tail.next, circular_linked_list.head)
+        self.assertEqual(len(circular_linked_list), 2)
+
+    def test_pickle(self) -> None:
+        circular_linked_list = CircularSinglyLinkedList(*self.node_values)
+        other = pickle.loads(pickle.dumps(circular_linked_list))
+        self.assertIsInstance(other, CircularSinglyLinkedList)
+        self.assertEqual(list(other.values()), self.node_values)
+        self.assertIs(other.tail.next, other.head)
+
+    def test_replace(self) -> None:
+        linked_list = CircularSinglyLinkedList("a", "b", "a")
+
+        linked_list.replace("a", "c", 2)
+        self.assertEqual(list(linked_list.values()), ["c", "b", "a"])
+        linked_list.replace("a", "c")
+        self.assertEqual(list(linked_list.values()), ["c", "b", "c"])
+        self.assertIs(linked_list.tail.next, linked_list.head)
+
+        linked_list.replace_many({"c": "a", "b": "c"})
+        self.assertEqual(list(linked_list.values()), ["a", "c", "a"])
+
+        linked_list.replace_if(lambda value: value == "a", str.upper)
+        self.assertEqual(list(linked_list.values()), ["A", "c", "A"])
+
+        linked_list = CircularSinglyLinkedList()
+        linked_list.replace_many({"a": "b"})
+        self.assertIsNone(linked_list.head)
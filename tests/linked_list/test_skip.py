@@ -0,0 +1,175 @@
+import copy
+import pickle
+import random
+from unittest import TestCase
+
+from data_structures.exceptions import LinkedListIndexError
+from data_structures.linked_list.nodes import SinglyNode, SkipNode
+from data_structures.linked_list.skip import SkipList
+
+
+class TestSkipNode(TestCase):
+    def test_skip_node(self) -> None:
+        node_b = SkipNode("b", height=3)
+        node_a = SkipNode("a", node_b)
+
+        self.assertIsInstance(node_a, SinglyNode)
+        self.assertIs(node_a.next, node_b)
+        self.assertEqual(node_a.forward, [node_b])
+        self.assertEqual(node_b.forward, [None, None, None])
+
+        node_c = SkipNode.after_node("c", node_a)
+        self.assertIs(node_a.forward[0], node_c)
+        self.assertIs(node_c.next, node_b)
+
+
+class TestSkipList(TestCase):
+    def setUp(self) -> None:
+        self.node_values = list(range(0, 100, 2))
+        shuffled = self.node_values[:]
+        random.Random(0).shuffle(shuffled)
+        self.skip_list = SkipList(*shuffled, seed=0)
+
+    def test_skip_list(self) -> None:
+        self.assertEqual(list(self.skip_list.values()), self.node_values)
+        self.assertEqual([node.value for node in self.skip_list], self.node_values)
+        self.assertEqual(len(self.skip_list), len(self.node_values))
+        self.assertEqual(self.skip_list.head.value, 0)
+        self.assertEqual(self.skip_list.tail.value, 98)
+        self.assertIsNone(self.skip_list.tail.next)
+
+        skip_list = SkipList()
+        self.assertFalse(bool(skip_list))
+        self.assertIsNone(skip_list.head)
+        self.assertIsNone(skip_list.tail)
+        self.assertEqual(list(skip_list), [])
+
+        with self.assertRaises(ValueError):
+            SkipList(probability=1)
+        with self.assertRaises(ValueError):
+            SkipList(max_level=0)
+
+    def test_seed(self) -> None:
+        def heights(skip_list: SkipList) -> list:
+            return [len(node.forward) for node in skip_list]
+
+        skip_list = SkipList.from_iterable(range(100), seed=1)
+        self.assertEqual(heights(skip_list), heights(SkipList(*range(100), seed=1)))
+        self.assertNotEqual(heights(skip_list), heights(SkipList(*range(100), seed=2)))
+        self.assertEqual(set(heights(SkipList(*range(100), max_level=1))), {1})
+
+        # every level skips over about 1 / probability nodes of the level below
+        skip_list = SkipList.from_iterable(range(10_000), probability=0.25, seed=0)
+        self.assertAlmostEqual(
+            sum(height > 1 for height in heights(skip_list)) / 10_000, 0.25, delta=0.02
+        )
+
+    def test_reversed(self) -> None:
+        self.assertEqual(
+            [node.value for node in reversed(self.skip_list)], self.node_values[::-1]
+        )
+        self.assertEqual(list(reversed(SkipList())), [])
+
+    def test_insert(self) -> None:
+        node = self.skip_list.insert(51)
+        self.assertEqual(node.value, 51)
+        self.assertIs(self.skip_list.search(50).next, node)
+        self.assertIs(node.next, self.skip_list.search(52))
+
+        # equal values are kept in the order they were inserted
+        first, second = self.skip_list.insert(-1), self.skip_list.insert(-1)
+        self.assertIs(self.skip_list.head, first)
+        self.assertIs(first.next, second)
+
+        last = self.skip_list.insert(100)
+        self.assertIs(self.skip_list.tail, last)
+        self.assertEqual(
+            list(self.skip_list.values()), sorted(self.node_values + [51, -1, -1, 100])
+        )
+        self.assertEqual(len(self.skip_list), len(self.node_values) + 4)
+
+    def test_remove(self) -> None:
+        node = self.skip_list.remove(50)
+        self.assertEqual(node.value, 50)
+        self.assertNotIn(node, self.skip_list)
+        self.assertIsNone(self.skip_list.search(50))
+
+        self.assertEqual(self.skip_list.remove(98).value, 98)
+        self.assertEqual(self.skip_list.tail.value, 96)
+
+        with self.assertRaises(LinkedListIndexError):
+            self.skip_list.remove(1)
+        with self.assertRaises(LinkedListIndexError):
+            self.skip_list.remove(100)
+
+        for value in self.node_values:
+            if value not in (50, 98):
+                self.skip_list.remove(value)
+        self.assertFalse(bool(self.skip_list))
+        self.assertIsNone(self.skip_list.tail)
+        self.assertEqual(len(self.skip_list), 0)
+        self.assertEqual(self.skip_list._level, 1)
+
+    def test_search(self) -> None:
+        node = self.skip_list.search(42)
+        self.assertEqual(node.value, 42)
+        self.assertIn(node, self.skip_list)
+        self.assertNotIn(SkipNode(42), self.skip_list)
+        self.assertNotIn("42", self.skip_list)
+        self.assertIsNone(self.skip_list.search(43))
+        self.assertIsNone(self.skip_list.search(-1))
+        self.assertIsNone(self.skip_list.search(100))
+        self.assertTrue(self.skip_list.contains_value(0))
+        self.assertFalse(self.skip_list.contains_value(1))
+
+        nodes = [self.skip_list.insert(42) for _ in range(2)]
+        self.assertEqual(list(self.skip_list.search_iter(42)), [node] + nodes)
+        self.assertEqual(list(self.skip_list.search_iter(43)), [])
+
+    def test_floor_and_ceiling(self) -> None:
+        self.assertEqual(self.skip_list.floor(43).value, 42)
+        self.assertEqual(self.skip_list.floor(42).value, 42)
+        self.assertEqual(self.skip_list.floor(1000).value, 98)
+        self.assertIsNone(self.skip_list.floor(-1))
+
+        self.assertEqual(self.skip_list.ceiling(43).value, 44)
+        self.assertEqual(self.skip_list.ceiling(42).value, 42)
+        self.assertEqual(self.skip_list.ceiling(-1000).value, 0)
+        self.assertIsNone(self.skip_list.ceiling(99))
+
+    def test_range_iter(self) -> None:
+        self.assertEqual(
+            [node.value for node in self.skip_list.range_iter(41, 50)], [42, 44, 46, 48]
+        )
+        self.assertEqual(
+            [node.value for node in self.skip_list.range_iter(stop=5)], [0, 2, 4]
+        )
+        self.assertEqual(
+            [node.value for node in self.skip_list.range_iter(95)], [96, 98]
+        )
+        self.assertEqual(list(self.skip_list.range_iter(50, 50)), [])
+        self.assertEqual(len(list(self.skip_list.range_iter())), len(self.node_values))
+
+    def test_pickle(self) -> None:
+        skip_list = SkipList.from_iterable(range(5000), probability=0.25, max_level=8)
+        other = pickle.loads(pickle.dumps(skip_list))
+        self.assertIsInstance(other, SkipList)
+        self.assertEqual(other.probability, 0.25)
+        self.assertEqual(other.max_level, 8)
+        self.assertEqual(list(other.values()), list(range(5000)))
+        self.assertEqual(other.search(4999).value, 4999)
+
+        # the seed and the state of the random generator are kept
+        def heights(skip_list: SkipList) -> list:
+            return [len(node.forward) for node in skip_list]
+
+        skip_list = SkipList.from_iterable(range(100), seed=1)
+        other = pickle.loads(pickle.dumps(skip_list))
+        self.assertEqual(heights(other), heights(skip_list))
+        skip_list.extend(range(100, 200))
+        other.extend(range(100, 200))
+        self.assertEqual(heights(other), heights(skip_list))
+        other = copy.copy(skip_list)
+        skip_list.insert(200)
+        other.insert(200)
+        self.assertEqual(heights(other), heights(skip_list))
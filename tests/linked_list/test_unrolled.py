@@ -0,0 +1,223 @@
+import pickle
+from unittest import TestCase
+
+from data_structures.exceptions import LinkedListIndexError, LinkedListSizeError
+from data_structures.linked_list.nodes import SinglyNode, UnrolledNode
+from data_structures.linked_list.unrolled import UnrolledLinkedList
+
+
+class TestUnrolledLinkedList(TestCase):
+    def setUp(self) -> None:
+        self.node_values = list(range(10))
+
+    def test_unrolled_linked_list(self) -> None:
+        linked_list = UnrolledLinkedList(*self.node_values, capacity=4)
+
+        self.assertIsInstance(linked_list.head, UnrolledNode)
+        self.assertEqual(
+            [node.value for node in linked_list], [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+        )
+        self.assertIs(linked_list.tail, linked_list.head.next.next)
+        self.assertEqual(len(linked_list), len(self.node_values))
+
+        linked_list = UnrolledLinkedList()
+        self.assertIsNone(linked_list.head)
+        self.assertIsNone(linked_list.tail)
+        self.assertFalse(bool(linked_list))
+
+        with self.assertRaises(ValueError):
+            UnrolledLinkedList(capacity=1)
+
+    def test_extend(self) -> None:
+        linked_list = UnrolledLinkedList(0, capacity=4)
+        linked_list.extend(iter(self.node_values[1:]))
+        self.assertEqual(
+            [node.value for node in linked_list], [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+        )
+        self.assertIs(linked_list.tail.value, linked_list.head.next.next.value)
+        self.assertEqual(len(linked_list), len(self.node_values))
+
+        linked_list = UnrolledLinkedList.from_iterable(self.node_values, capacity=4)
+        self.assertEqual(list(linked_list.values()), self.node_values)
+
+    def test_values(self) -> None:
+        linked_list = UnrolledLinkedList(*self.node_values, capacity=4)
+        self.assertEqual(list(linked_list.values()), self.node_values)
+        self.assertEqual(
+            list(linked_list.reversed_values()), self.node_values[::-1]
+        )
+
+    def test_reversed(self) -> None:
+        linked_list = UnrolledLinkedList(*self.node_values, capacity=4)
+        self.assertEqual(
+            [node.value for node in reversed(linked_list)],
+            [[8, 9], [4, 5, 6, 7], [0, 1, 2, 3]],
+        )
+        self.assertEqual(list(reversed(UnrolledLinkedList())), [])
+
+    def test_insert(self) -> None:
+        linked_list = UnrolledLinkedList(*self.node_values, capacity=4)
+
+        # a full block is split into two halves
+        linked_list.insert(1, "a")
+        self.assertEqual(
+            [node.value for node in linked_list],
+            [[0, "a", 1], [2, 3], [4, 5, 6, 7], [8, 9]],
+        )
+        linked_list.insert(7, "b")
+        self.assertEqual(
+            [node.value for node in linked_list],
+            [[0, "a", 1], [2, 3], [4, 5, "b"], [6, 7], [8, 9]],
+        )
+
+        linked_list.insert(-1, "c")
+        linked_list.insert(100, "d")
+        linked_list.insert(-100, "e")
+        expected = ["e", 0, "a", 1, 2, 3, 4, 5, "b", 6, 7, 8, "c", 9, "d"]
+        self.assertEqual(list(linked_list.values()), expected)
+        self.assertEqual(linked_list.tail.value[-1], "d")
+        self.assertEqual(len(linked_list), len(expected))
+
+        linked_list = UnrolledLinkedList(capacity=4)
+        linked_list.insert(0, "a")
+        self.assertEqual(list(linked_list.values()), ["a"])
+
+    def test_pop(self) -> None:
+        linked_list = UnrolledLinkedList(*self.node_values, capacity=4)
+
+        for value in reversed(self.node_values):
+            node = linked_list.pop()
+            self.assertIsInstance(node, SinglyNode)
+            self.assertEqual(node.value, value)
+            self.assertEqual(list(linked_list.values()), list(range(value)))
+            self.assertEqual(len(linked_list), value)
+            if linked_list:
+                self.assertIs(linked_list.tail.next, None)
+                self.assertEqual(linked_list.tail.value[-1], value - 1)
+
+        self.assertIsNone(linked_list.head)
+        self.assertIsNone(linked_list.tail)
+        with self.assertRaises(LinkedListIndexError):
+            linked_list.pop()
+
+    def test_remove(self) -> None:
+        linked_list = UnrolledLinkedList(*self.node_values, capacity=4)
+
+        # a block less than half full is merged with the next block
+        linked_list.remove(8)
+        linked_list.remove(1)
+        linked_list.remove(2)
+        self.assertEqual(
+            [node.value for node in linked_list], [[0, 3], [4, 5, 6, 7], [9]]
+        )
+        linked_list.remove(0)
+        self.assertEqual(
+            [node.value for node in linked_list], [[3], [4, 5, 6, 7], [9]]
+        )
+        linked_list.remove(6)
+        linked_list.remove(7)
+        linked_list.remove(5)
+        self.assertEqual([node.value for node in linked_list], [[3], [4, 9]])
+        self.assertIs(linked_list.tail, linked_list.head.next)
+
+        # an empty block is unlinked
+        linked_list.remove(3)
+        linked_list.remove(9)
+        linked_list.remove(4)
+        self.assertIsNone(linked_list.head)
+        self.assertIsNone(linked_list.tail)
+        self.assertEqual(len(linked_list), 0)
+
+        with self.assertRaises(LinkedListIndexError):
+            linked_list.remove(0)
+
+    def test_remove_if(self) -> None:
+        linked_list = UnrolledLinkedList(*self.node_values, capacity=4)
+
+        # a block is merged into the previous block less than half full
+        self.assertEqual(linked_list.remove_values([1, 2, 3, 5, 6]), 5)
+        self.assertEqual([node.value for node in linked_list], [[0, 4, 7], [8, 9]])
+        self.assertEqual(len(linked_list), 5)
+
+        linked_list = UnrolledLinkedList(*self.node_values, capacity=4)
+        self.assertEqual(linked_list.remove_if(lambda value: value % 4), 7)
+        self.assertEqual([node.value for node in linked_list], [[0, 4], [8]])
+        self.assertIs(linked_list.tail, linked_list.head.next)
+
+        # an emptied block is unlinked
+        self.assertEqual(linked_list.remove_if(lambda value: value < 8), 2)
+        self.assertEqual([node.value for node in linked_list], [[8]])
+        self.assertEqual(linked_list.remove_values([8]), 1)
+        self.assertIsNone(linked_list.head)
+        self.assertIsNone(linked_list.tail)
+        self.assertEqual(len(linked_list), 0)
+
+    def test_replace(self) -> None:
+        linked_list = UnrolledLinkedList(*self.node_values, 1, capacity=4)
+
+        linked_list.replace(1, "a", 2)
+        linked_list.replace(9, "b")
+        linked_list.replace(0, "c", 0)
+        self.assertEqual(
+            list(linked_list.values()), [0, "a", 2, 3, 4, 5, 6, 7, 8, "b", 1]
+        )
+
+        linked_list.replace_many({"a": 1, 1: "a", 2: "b"}, max_=6)
+        linked_list.replace_many({8: [8], 3: 30})
+        self.assertEqual(
+            list(linked_list.values()), [0, 1, "b", 30, 4, 5, 6, 7, [8], "b", 1]
+        )
+
+        # an unhashable value is left alone
+        linked_list.replace_many({1: "a"})
+        self.assertEqual(
+            list(linked_list.values()), [0, "a", "b", 30, 4, 5, 6, 7, [8], "b", "a"]
+        )
+
+        linked_list.replace_if(lambda value: isinstance(value, str), str.upper)
+        self.assertEqual(
+            list(linked_list.values()), [0, "A", "B", 30, 4, 5, 6, 7, [8], "B", "A"]
+        )
+        self.assertEqual(len(linked_list), 11)
+
+    def test_reverse(self) -> None:
+        linked_list = UnrolledLinkedList(*self.node_values, capacity=4)
+        head, tail = linked_list.head, linked_list.tail
+
+        linked_list.reverse()
+        self.assertEqual(list(linked_list.values()), self.node_values[::-1])
+        self.assertIs(linked_list.head, tail)
+        self.assertIs(linked_list.tail, head)
+        self.assertIsNone(linked_list.tail.next)
+
+        linked_list.append(-1)
+        self.assertEqual(list(linked_list.values())[-2:], [0, -1])
+
+    def test_search(self) -> None:
+        linked_list = UnrolledLinkedList(*self.node_values, 5, capacity=4)
+
+        self.assertIs(linked_list.search(5), linked_list.head.next)
+        self.assertIsNone(linked_list.search("z"))
+        self.assertEqual(
+            list(linked_list.search_iter(5)), [linked_list.head.next, linked_list.tail]
+        )
+        self.assertTrue(linked_list.contains_value(9))
+        self.assertIn(linked_list.tail, linked_list)
+        self.assertNotIn(UnrolledNode([0]), linked_list)
+
+    def test_debug(self) -> None:
+        linked_list = UnrolledLinkedList(*self.node_values, capacity=4)
+        linked_list.debug = True
+        self.assertEqual(len(linked_list), len(self.node_values))
+
+        linked_list.head.value.append(10)
+        with self.assertRaises(LinkedListSizeError):
+            len(linked_list)
+
+    def test_pickle(self) -> None:
+        linked_list = UnrolledLinkedList(*self.node_values, capacity=4)
+        other = pickle.loads(pickle.dumps(linked_list))
+        self.assertIsInstance(other, UnrolledLinkedList)
+        self.assertEqual(other.capacity, 4)
+        self.assertEqual(list(other.values()), self.node_values)
+        self.assertEqual(len(other), len(self.node_values))